@@ -1,18 +1,35 @@
+import { Suspense, useEffect } from "react";
 import { Route, Router } from "wouter";
 import { queryClient } from "./lib/queryClient";
 import { QueryClientProvider } from "@tanstack/react-query";
 import { AuthProvider, useAuth } from "./hooks/use-auth";
 import LoginPage from "./pages/login-page";
-import TestLogin from "./pages/test-login";
-import SimpleAdminDashboard from "./pages/simple-admin-dashboard";
-import SuperAdminDashboard from "./pages/super-admin-dashboard";
-import EmployeeDashboard from "./pages/employee-dashboard";
-import AdminEmployeeManagement from "./pages/admin-employee-management";
-import { CollectorDashboard } from "./components/collector-dashboard";
-import MongoDBTest from "./pages/MongoDBTest";
+import {
+  AdminEmployeeManagement,
+  CollectorDashboard,
+  EmployeeDashboard,
+  MongoDBTest,
+  SimpleAdminDashboard,
+  SuperAdminDashboard,
+  TestLogin,
+  preloadDashboard,
+} from "./lib/lazy-routes";
+
+function RouteFallback() {
+  return (
+    <div className="min-h-screen flex items-center justify-center">
+      <div className="h-10 w-10 animate-spin rounded-full border-4 border-gray-300 border-t-blue-600" />
+    </div>
+  );
+}
 
 function AppRouter() {
   const { user } = useAuth();
+
+  // Restored sessions skip the login page, so fetch the dashboard right away
+  useEffect(() => {
+    preloadDashboard(user?.role);
+  }, [user?.role]);
   
   const handleLogout = () => {
     // Clear any stored user data and redirect to login
@@ -20,42 +37,44 @@ function AppRouter() {
   };
 
   return (
-    <Router>
-      <Route path="/" component={LoginPage} />
-      <Route path="/login" component={LoginPage} />
-      <Route path="/test-login" component={TestLogin} />
+    <Suspense fallback={<RouteFallback />}>
+      <Router>
+        <Route path="/" component={LoginPage} />
+        <Route path="/login" component={LoginPage} />
+        <Route path="/test-login" component={TestLogin} />
       
-      {/* Dashboard Routes */}
-      <Route path="/dashboard/super-admin">
-        <SuperAdminDashboard onLogout={handleLogout} />
-      </Route>
-      <Route path="/dashboard/admin">
-        <SimpleAdminDashboard onLogout={handleLogout} />
-      </Route>
-      <Route path="/dashboard/admin/employees">
-        <AdminEmployeeManagement />
-      </Route>
-      <Route path="/dashboard/employee">
-        <EmployeeDashboard onLogout={handleLogout} />
-      </Route>
-      <Route path="/dashboard/collector">
-        {user ? <CollectorDashboard user={user} /> : <LoginPage />}
-      </Route>
+        {/* Dashboard Routes */}
+        <Route path="/dashboard/super-admin">
+          <SuperAdminDashboard onLogout={handleLogout} />
+        </Route>
+        <Route path="/dashboard/admin">
+          <SimpleAdminDashboard onLogout={handleLogout} />
+        </Route>
+        <Route path="/dashboard/admin/employees">
+          <AdminEmployeeManagement />
+        </Route>
+        <Route path="/dashboard/employee">
+          <EmployeeDashboard onLogout={handleLogout} />
+        </Route>
+        <Route path="/dashboard/collector">
+          {user ? <CollectorDashboard user={user} /> : <LoginPage />}
+        </Route>
       
-      {/* MongoDB Test Page */}
-      <Route path="/mongodb-test" component={MongoDBTest} />
+        {/* MongoDB Test Page */}
+        <Route path="/mongodb-test" component={MongoDBTest} />
       
-      {/* Legacy Routes for backward compatibility */}
-      <Route path="/admin">
-        <SimpleAdminDashboard onLogout={handleLogout} />
-      </Route>
-      <Route path="/employee">
-        <EmployeeDashboard onLogout={handleLogout} />
-      </Route>
-      <Route path="/employee-dashboard">
-        <EmployeeDashboard onLogout={handleLogout} />
-      </Route>
-    </Router>
+        {/* Legacy Routes for backward compatibility */}
+        <Route path="/admin">
+          <SimpleAdminDashboard onLogout={handleLogout} />
+        </Route>
+        <Route path="/employee">
+          <EmployeeDashboard onLogout={handleLogout} />
+        </Route>
+        <Route path="/employee-dashboard">
+          <EmployeeDashboard onLogout={handleLogout} />
+        </Route>
+      </Router>
+    </Suspense>
   );
 }
 
@@ -1,9 +1,96 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useLayoutEffect, useMemo, memo } from "react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { PlayIcon, PauseIcon } from "lucide-react";
 import { Game } from "@/types/game";
+import { CalledNumbersStore, useCellState } from "@/lib/called-numbers";
+
+const BOARD_ROWS = [
+  { letter: "B", color: "bg-red-500", first: 1 },
+  { letter: "I", color: "bg-blue-500", first: 16 },
+  { letter: "N", color: "bg-green-500", first: 31 },
+  { letter: "G", color: "bg-yellow-500", first: 46 },
+  { letter: "O", color: "bg-purple-500", first: 61 },
+];
+
+interface BoardCellProps {
+  store: CalledNumbersStore;
+  num: number;
+  color: string;
+  shuffling: boolean;
+  label: number;
+}
+
+const BoardCell = memo(function BoardCell({ store, num, color, shuffling, label }: BoardCellProps) {
+  const state = useCellState(store, num);
+
+  const appearance = shuffling
+    ? "animate-pulse bg-yellow-200 text-black transform scale-110"
+    : state === "last"
+      ? `${color} text-white slow-blink`
+      : state === "called"
+        ? `${color} text-white`
+        : "bg-gray-100 text-black border";
+
+  return (
+    <div className={`h-16 w-16 rounded flex items-center justify-center text-2xl font-black transition-all duration-200 ${appearance}`}>
+      {label}
+    </div>
+  );
+});
+
+interface NumberBoardProps {
+  store: CalledNumbersStore;
+  // Shuffle animation: every cell pulses and shows shuffledPositions[n - 1]
+  shuffling?: boolean;
+  shuffledPositions?: number[];
+}
+
+/**
+ * Horizontal 75-number board (one B-I-N-G-O row of 15 per letter). Cells
+ * read their state from the store, so the board itself only re-renders for
+ * the shuffle animation.
+ */
+export const NumberBoard = memo(function NumberBoard({ store, shuffling = false, shuffledPositions }: NumberBoardProps) {
+  const shuffled = shuffling && shuffledPositions && shuffledPositions.length > 0 ? shuffledPositions : null;
+
+  return (
+    <div className="space-y-2">
+      {BOARD_ROWS.map(({ letter, color, first }) => (
+        <div key={letter} className="flex items-center gap-2">
+          <div className={`w-8 h-8 ${color} text-white rounded flex items-center justify-center font-bold text-sm`}>
+            {letter}
+          </div>
+          <div className="grid grid-cols-15 gap-1 flex-1">
+            {Array.from({ length: 15 }, (_, i) => first + i).map(num => (
+              <BoardCell
+                key={num}
+                store={store}
+                num={num}
+                color={color}
+                shuffling={shuffling}
+                label={shuffled ? shuffled[num - 1] : num}
+              />
+            ))}
+          </div>
+        </div>
+      ))}
+    </div>
+  );
+});
+
+/**
+ * A CalledNumbersStore kept in step with React state. Synced in a layout
+ * effect so the changed cells update in the same frame as the caller.
+ */
+export function useCalledNumbersStore(marked: number[], last: number | null = null): CalledNumbersStore {
+  const store = useMemo(() => new CalledNumbersStore(), []);
+  useLayoutEffect(() => {
+    store.sync(marked, last);
+  }, [store, marked, last]);
+  return store;
+}
 
 interface BingoBoardProps {
   game?: Game;
@@ -18,48 +105,12 @@ export function BingoBoard({ game, isConnected, onCallNumber }: BingoBoardProps)
   const calledNumbers = game?.calledNumbers || [];
   const lastCalledNumber = calledNumbers[calledNumbers.length - 1];
 
-  // Generate standard bingo board
-  const generateBoard = () => {
-    const board = [];
-    const ranges = {
-      B: [1, 15],
-      I: [16, 30],
-      N: [31, 45],
-      G: [46, 60],
-      O: [61, 75]
-    };
-
-    const letters = ['B', 'I', 'N', 'G', 'O'];
-    
-    for (let row = 0; row < 6; row++) {
-      const boardRow = [];
-      for (let col = 0; col < 5; col++) {
-        if (row === 0) {
-          // Header row
-          boardRow.push({ type: 'header', value: letters[col] });
-        } else if (row === 3 && col === 2) {
-          // Free space
-          boardRow.push({ type: 'free', value: 'FREE' });
-        } else {
-          // Regular number
-          const letter = letters[col];
-          const [min, max] = ranges[letter as keyof typeof ranges];
-          const number = min + (row - 1) * 3 + col;
-          const adjustedNumber = Math.min(number, max);
-          boardRow.push({ 
-            type: 'number', 
-            value: adjustedNumber,
-            called: calledNumbers.includes(`${letter}-${adjustedNumber}`)
-          });
-        }
-      }
-      board.push(boardRow);
-    }
-    
-    return board;
-  };
-
-  const board = generateBoard();
+  // Game numbers are stored as strings, either "12" or "B-12"
+  const calledValues = useMemo(
+    () => calledNumbers.map(value => parseInt(String(value).replace(/^[A-Z]-?/i, ""), 10)).filter(Number.isFinite),
+    [game?.calledNumbers]
+  );
+  const boardStore = useCalledNumbersStore(calledValues, calledValues[calledValues.length - 1] ?? null);
 
   const toggleAutoCall = () => {
     if (isAutoCall) {
@@ -85,13 +136,6 @@ export function BingoBoard({ game, isConnected, onCallNumber }: BingoBoardProps)
     };
   }, [autoCallInterval]);
 
-  const getCellClassName = (cell: any) => {
-    if (cell.type === 'header') return 'bingo-header';
-    if (cell.type === 'free') return 'bingo-cell free';
-    if (cell.called) return 'bingo-cell called';
-    return 'bingo-cell normal';
-  };
-
   return (
     <Card>
       <CardHeader>
@@ -109,14 +153,8 @@ export function BingoBoard({ game, isConnected, onCallNumber }: BingoBoardProps)
       </CardHeader>
       <CardContent>
         {/* Bingo Board Grid */}
-        <div className="grid grid-cols-5 gap-1 mb-6">
-          {board.map((row, rowIdx) => 
-            row.map((cell, colIdx) => (
-              <div key={`${rowIdx}-${colIdx}`} className={getCellClassName(cell)}>
-                {cell.value}
-              </div>
-            ))
-          )}
+        <div className="mb-6">
+          <NumberBoard store={boardStore} />
         </div>
 
         {/* Game Controls */}
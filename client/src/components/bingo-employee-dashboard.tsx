@@ -13,6 +13,13 @@ import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import { FIXED_CARTELAS, getCartelaNumbers, getFixedCartelaPattern } from "@/data/fixed-cartelas";
 import { EmployeeCollectorManagement } from "@/components/employee-collector-management";
 import { Volume2, Palette } from "lucide-react";
+import { voiceSprites, resolveVoiceClip } from "@/lib/voice-sprites";
+import { audioEngine, type PlaybackHandle } from "@/lib/audio-engine";
+import { NumberBoard, useCalledNumbersStore } from "@/components/bingo-board";
+import { getGameSession, hasPendingCalls } from "@/lib/offline-game";
+
+const MONEY_COUNTER_SOUND = '/attached_assets/money-counter-95830_1750063611267.mp3';
+const SHUFFLE_SOUND = '/voices/common/shuffle.mp3';
 
 interface BingoEmployeeDashboardProps {
   onLogout: () => void;
@@ -34,7 +41,7 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
   const [gameAmount, setGameAmount] = useState("20");
   const [activeGameId, setActiveGameId] = useState<number | null>(null);
   const [audioPlaying, setAudioPlaying] = useState(false);
-  const [currentAudioRef, setCurrentAudioRef] = useState<HTMLAudioElement | null>(null);
+  const [currentAudioRef, setCurrentAudioRef] = useState<PlaybackHandle | null>(null);
 
   
   // Voice selection
@@ -52,6 +59,29 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
     localStorage.setItem('bingoVoice', selectedVoice);
   }, [selectedVoice]);
 
+  // Voice directory under /voices for the selected voice
+  const getVoiceDirectory = (): string => {
+    return selectedVoice === 'melat' ? 'melat2' : selectedVoice;
+  };
+
+  // Load the voice sprite once per session so number calls never wait on the
+  // network; voices without a sprite have their single clips decoded instead
+  useEffect(() => {
+    const voiceDirectory = getVoiceDirectory();
+    const eventSounds = ['gameStart', 'winner', 'notWinner', 'disqualified', 'notSelected']
+      .map(getGameEventAudioPath)
+      .filter(Boolean);
+    audioEngine.warm([MONEY_COUNTER_SOUND, SHUFFLE_SOUND, ...eventSounds]);
+
+    voiceSprites.preload(voiceDirectory).then(sprite => {
+      if (sprite) return;
+      const numberClips = Array.from({ length: 75 }, (_, i) => i + 1).map(num =>
+        resolveVoiceClip(voiceDirectory, `${getLetterForNumber(num)}${num}`) ?? getAudioPath(num)
+      );
+      audioEngine.warm(numberClips);
+    });
+  }, [selectedVoice]);
+
   // Save theme preference to localStorage
   useEffect(() => {
     localStorage.setItem('employeeTheme', selectedTheme);
@@ -173,14 +203,14 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
   const [previewCartela, setPreviewCartela] = useState<number | null>(null);
   const [isBoardShuffling, setIsBoardShuffling] = useState(false);
   const [shuffledPositions, setShuffledPositions] = useState<number[]>([]);
+  // Board cells subscribe to this store instead of scanning markedNumbers on every render
+  const boardStore = useCalledNumbersStore(markedNumbers, blinkingNumber);
   
   // Auto-calling states
   const [isAutoCall, setIsAutoCall] = useState(false);
   const [autoCallInterval, setAutoCallInterval] = useState<NodeJS.Timeout | null>(null);
   const [isPaused, setIsPaused] = useState(false);
-  const [currentAudio, setCurrentAudio] = useState<HTMLAudioElement | null>(null);
-  const [pausedAudio, setPausedAudio] = useState<HTMLAudioElement | null>(null);
-  const [pausedAudioTime, setPausedAudioTime] = useState<number>(0);
+  const [currentAudio, setCurrentAudio] = useState<PlaybackHandle | null>(null);
   const [nextNumber, setNextNumber] = useState<number | null>(null);
   const [isHovering, setIsHovering] = useState(false);
   
@@ -308,6 +338,11 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
         console.log(`🚫 SKIPPING SYNC - pause operation in progress`);
         return;
       }
+
+      // Calls made locally are still syncing; the board is ahead of the server
+      if (hasPendingCalls(incomingGameId)) {
+        return;
+      }
       
       // Only update game state if it's a different game or if we're transitioning to a new state
       if (incomingGameId !== activeGameId || 
@@ -622,16 +657,7 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
       setIsShuffling(true);
       
       // Play calling sound
-      try {
-        const audio = new Audio('/attached_assets/money-counter-95830_1750063611267.mp3');
-        audio.volume = 0.6;
-        setCurrentAudio(audio);
-        audio.play().catch(() => {
-          console.log('Money counter sound not available');
-        });
-      } catch (error) {
-        console.log('Audio playback error for calling sound');
-      }
+      audioEngine.play(MONEY_COUNTER_SOUND, { volume: 0.6 }).then(setCurrentAudio);
 
       // Call the API to add the number
       setTimeout(async () => {
@@ -786,21 +812,12 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
     const allNumbers = Array.from({length: 75}, (_, i) => i + 1);
     
     // Play universal shuffle sound (independent of voice selection)
-    try {
-      const audio = new Audio('/voices/common/shuffle.mp3');
-      audio.volume = 0.7;
-      audio.play().catch((error) => {
-        console.log('Shuffle sound not available, trying fallback:', error);
+    audioEngine.play(SHUFFLE_SOUND, { volume: 0.7 }).then(handle => {
+      if (!handle) {
         // Fallback to money counter sound
-        const fallbackAudio = new Audio('/attached_assets/money-counter-95830_1750063611267.mp3');
-        fallbackAudio.volume = 0.7;
-        fallbackAudio.play().catch(() => {
-          console.log('Fallback shuffle sound also not available');
-        });
-      });
-    } catch (error) {
-      console.log('Error playing shuffle sound:', error);
-    }
+        audioEngine.play(MONEY_COUNTER_SOUND, { volume: 0.7 });
+      }
+    });
     
     // Shuffle animation phases - synchronized with 5-second audio
     let shuffleCount = 0;
@@ -837,15 +854,7 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
       });
     } else {
       // If no previous setup, just play shuffle sound for feedback
-      try {
-        const audio = new Audio('/attached_assets/money-counter-95830_1750063611267.mp3');
-        audio.volume = 0.6;
-        audio.play().catch(() => {
-          console.log('Money counter sound not available');
-        });
-      } catch (error) {
-        console.log('Audio playback error for shuffle sound');
-      }
+      audioEngine.play(MONEY_COUNTER_SOUND, { volume: 0.6 });
       
       toast({
         title: "No Previous Game",
@@ -861,15 +870,7 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
     setIsShuffling(true);
     
     // Play money counter sound effect for shuffle
-    try {
-      const audio = new Audio('/attached_assets/money-counter-95830_1750063611267.mp3');
-      audio.volume = 0.6;
-      audio.play().catch(() => {
-        console.log('Money counter sound not available');
-      });
-    } catch (error) {
-      console.log('Audio playback error for shuffle sound');
-    }
+    audioEngine.play(MONEY_COUNTER_SOUND, { volume: 0.6 });
     
     setTimeout(() => {
       setIsShuffling(false);
@@ -1016,17 +1017,9 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
       queryClient.invalidateQueries({ queryKey: ['/api/games/active'] });
       
       // Play game start sound
-      try {
-        const audioPath = getGameEventAudioPath('gameStart');
-        if (audioPath) {
-          const audio = new Audio(audioPath);
-          audio.volume = 0.8;
-          audio.play().catch(() => {
-            console.log('Start game sound not available');
-          });
-        }
-      } catch (error) {
-        console.log('Start audio playback error');
+      const startAudioPath = getGameEventAudioPath('gameStart');
+      if (startAudioPath) {
+        audioEngine.play(startAudioPath, { volume: 0.8 });
       }
       
       toast({
@@ -1049,14 +1042,47 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
     }
   });
 
+  // Keep the offline session primed: draw window, queued calls and the booked
+  // cartela patterns used for winner checks during an outage
+  useEffect(() => {
+    if (!activeGameId) return;
+    let cancelled = false;
+    let unsubscribe = () => {};
+    getGameSession(activeGameId).then(session => {
+      if (cancelled) return;
+      if (Array.isArray(cartelas)) {
+        session.cacheCartelas(cartelas.filter((c: any) => bookedCartelas.has(c.cartelaNumber)));
+      }
+      // Another device called for this game while we were offline: show the server's list
+      unsubscribe = session.onServerState(numbers => {
+        setCalledNumbers(numbers);
+        setMarkedNumbers(numbers.slice(0, -1));
+        setBlinkingNumber(numbers[numbers.length - 1] ?? null);
+        setLastCalledNumber(numbers[numbers.length - 1] ?? null);
+      });
+    });
+    return () => {
+      cancelled = true;
+      unsubscribe();
+    };
+  }, [activeGameId, cartelas, bookedCartelas]);
+
   // Call number mutation
   const callNumberMutation = useMutation({
     mutationFn: async () => {
+      // Called from the local draw window and synced in the background, so
+      // calling never waits on the network
+      const session = await getGameSession(activeGameId!);
+      const local = await session.callNext();
+      if (local) return local;
+
       const response = await fetch(`/api/games/${activeGameId}/numbers`, {
         method: 'PATCH'
       });
       if (!response.ok) throw new Error('Failed to call number');
-      return response.json();
+      const data = await response.json();
+      await session.adopt((data.calledNumbers || []).map((n: string) => parseInt(n)));
+      return data;
     },
     onSuccess: (data) => {
       const newNumber = data.calledNumber;
@@ -1116,55 +1142,20 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
         }, maxAudioTime);
         
         try {
-          const audioPath = getAudioPath(newNumber);
-          console.log(`🔊 AUDIO DEBUG: Playing ${letter}${newNumber} with path: ${audioPath} using voice: ${selectedVoice}`);
-          
-          // Special debugging for G49 specifically
-          if (newNumber === 49) {
-            console.log(`🎯 G49 DEBUG: About to play G49 audio`);
-            console.log(`🎯 G49 PATH: ${audioPath}`);
-            console.log(`🎯 G49 VOICE: ${selectedVoice}`);
-          }
-          
-          // Create audio element for each number
-          const audio = new Audio(audioPath);
-          audio.volume = 0.8;
-          
+          const clipName = `${letter}${newNumber}`;
+          // Processed, content-hashed clip when the voice pipeline has run
+          const audioPath = resolveVoiceClip(getVoiceDirectory(), clipName) ?? getAudioPath(newNumber);
+
           // Adjust playback rate based on speed setting for better synchronization
+          let playbackRate = 1;
           if (selectedVoice === 'arada' || selectedVoice === 'real-arada') {
-            // For Arada voice, adjust playback rate based on autoplay speed
             // Faster speeds = faster playback, slower speeds = normal playback
             const baseSpeed = 6; // Our reference speed in seconds
             const speedRatio = baseSpeed / autoPlaySpeed;
-            audio.playbackRate = Math.min(Math.max(speedRatio, 0.7), 1.8); // Limit between 0.7x and 1.8x
-            console.log(`🔊 ARADA SPEED: autoPlaySpeed=${autoPlaySpeed}s, playbackRate=${audio.playbackRate}x`);
+            playbackRate = Math.min(Math.max(speedRatio, 0.7), 1.8); // Limit between 0.7x and 1.8x
           }
-          
-          setCurrentAudioRef(audio);
-          
-          audio.onended = () => {
-            clearTimeout(audioResetTimer);
-            console.log(`🔊 AUDIO: Completed playing ${letter}${newNumber} naturally`);
-            // Clean up audio state immediately
-            setAudioPlaying(false);
-            setCurrentAudioRef(null);
-            // Mark the number after audio completes
-            setTimeout(() => {
-              setMarkedNumbers(prev => {
-                if (!prev.includes(newNumber)) {
-                  return [...prev, newNumber];
-                }
-                return prev;
-              });
-            }, 50); // Even faster marking for fast speeds
-          };
-          
-          audio.onerror = (error) => {
-            console.error(`🔊 AUDIO ERROR: Failed to load audio ${audioPath}:`, error);
-            clearTimeout(audioResetTimer);
-            setAudioPlaying(false);
-            setCurrentAudioRef(null);
-            // Mark immediately if audio fails
+
+          const markCurrentNumber = () => {
             setMarkedNumbers(prev => {
               if (!prev.includes(newNumber)) {
                 return [...prev, newNumber];
@@ -1172,51 +1163,47 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
               return prev;
             });
           };
-          
-          // Play audio after loading
-          {
-            audio.oncanplaythrough = () => {
-              console.log(`🔊 AUDIO: Ready to play ${letter}${newNumber}`);
-              
-              // Special G49 debugging
-              if (newNumber === 49) {
-                console.log(`🎯 G49 READY: About to play G49, playbackRate=${audio.playbackRate}`);
-              }
-              
-              audio.play().catch((error) => {
-                console.error(`🔊 AUDIO PLAY ERROR: Failed to play ${audioPath} for ${letter}${newNumber}:`, error);
-                
-                // Special G49 error debugging
-                if (newNumber === 49) {
-                  console.error(`🎯 G49 PLAY ERROR: Specific error with G49:`, error);
-                }
-                clearTimeout(audioResetTimer);
-                setAudioPlaying(false);
-                setCurrentAudioRef(null);
-                setMarkedNumbers(prev => {
-                  if (!prev.includes(newNumber)) {
-                    return [...prev, newNumber];
-                  }
-                  return prev;
-                });
-              });
-            };
-          audio.onerror = (error) => {
-            console.error(`🔊 AUDIO ERROR: Failed to load audio ${audioPath}:`, error);
+
+          const handleAudioEnded = () => {
+            clearTimeout(audioResetTimer);
+            // Clean up audio state immediately
+            setAudioPlaying(false);
+            setCurrentAudioRef(null);
+            // Mark the number after audio completes
+            setTimeout(markCurrentNumber, 50); // Even faster marking for fast speeds
+          };
+
+          const handleAudioFailed = (error: unknown) => {
+            console.error(`🔊 AUDIO ERROR: Failed to play ${audioPath} for ${letter}${newNumber}:`, error);
             clearTimeout(audioResetTimer);
             setAudioPlaying(false);
             setCurrentAudioRef(null);
             // Mark immediately if audio fails
-            setMarkedNumbers(prev => {
-              if (!prev.includes(newNumber)) {
-                return [...prev, newNumber];
+            markCurrentNumber();
+          };
+
+          // Prefer the preloaded voice sprite: no fetch or decode at call time
+          const spritePlayback = voiceSprites.play(getVoiceDirectory(), clipName, {
+            volume: 0.8,
+            playbackRate,
+            onEnded: handleAudioEnded
+          });
+
+          if (spritePlayback) {
+            setCurrentAudioRef(spritePlayback);
+          } else {
+            // No sprite for this voice: play the single clip, decoded once and cached
+            audioEngine.play(audioPath, {
+              volume: 0.8,
+              playbackRate,
+              onEnded: handleAudioEnded
+            }).then(handle => {
+              if (handle) {
+                setCurrentAudioRef(handle);
+              } else {
+                handleAudioFailed(new Error('Audio unavailable'));
               }
-              return prev;
             });
-          };
-          
-            // Start loading the audio immediately
-            audio.load();
           }
         } catch (error) {
           console.error(`🔊 AUDIO CATCH ERROR: Failed to create audio for ${letter}${newNumber}:`, error);
@@ -1445,39 +1432,8 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
       
       // Play disqualification audio immediately - user interaction is already present
       const disqualificationAudio = getGameEventAudioPath('disqualified');
-      console.log('🔊 Disqualification audio path:', disqualificationAudio);
-      console.log('🔊 Selected voice:', selectedVoice);
-      
       if (disqualificationAudio) {
-        // Create and play audio immediately using user interaction context
-        const audio = new Audio(disqualificationAudio);
-        audio.volume = 0.8;
-        
-        audio.onloadeddata = () => console.log('✅ Disqualification audio loaded successfully');
-        audio.oncanplaythrough = () => console.log('✅ Disqualification audio ready to play');
-        audio.onerror = (error) => console.error('❌ Disqualification audio error:', error);
-        
-        // Force immediate playback using user gesture context
-        const playPromise = audio.play();
-        
-        if (playPromise !== undefined) {
-          playPromise.then(() => {
-            console.log('✅ Disqualification audio started playing automatically');
-          }).catch(error => {
-            console.error('❌ Failed to play disqualification audio automatically:', error);
-            
-            // Fallback: Try playing with a very short delay
-            setTimeout(() => {
-              audio.play().then(() => {
-                console.log('✅ Disqualification audio started playing (delayed)');
-              }).catch(delayedError => {
-                console.error('❌ Delayed audio play also failed:', delayedError);
-              });
-            }, 100);
-          });
-        }
-      } else {
-        console.error('❌ No disqualification audio path found for voice:', selectedVoice);
+        audioEngine.play(disqualificationAudio, { volume: 0.8 });
       }
       
       // Add to disqualified cartelas
@@ -1501,65 +1457,10 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
       setShowWinnerResult(true);
       setShowWinnerChecker(false);
       
-      // Play "not selected" audio immediately with improved error handling
+      // Play "not selected" audio immediately
       const notSelectedAudio = getGameEventAudioPath('notSelected');
-      console.log('🔊 Not selected audio path:', notSelectedAudio);
-      console.log('🔊 Selected voice:', selectedVoice);
-      
       if (notSelectedAudio) {
-        const audio = new Audio();
-        audio.volume = 0.8;
-        // Removed preload for better performance
-        
-        // Enhanced error logging
-        audio.onloadstart = () => console.log('🔄 Not selected audio load started');
-        audio.onloadeddata = () => console.log('✅ Not selected audio data loaded');
-        audio.oncanplay = () => console.log('✅ Not selected audio can play');
-        audio.oncanplaythrough = () => console.log('✅ Not selected audio ready to play through');
-        
-        audio.onerror = (error) => {
-          console.error('❌ Not selected audio error details:', {
-            error: error,
-            code: audio.error?.code,
-            message: audio.error?.message,
-            src: audio.src,
-            readyState: audio.readyState,
-            networkState: audio.networkState
-          });
-        };
-        
-        // Set source and try to play
-        audio.src = notSelectedAudio;
-        
-        // Use a timeout to ensure audio is loaded before playing
-        setTimeout(() => {
-          const playPromise = audio.play();
-          
-          if (playPromise !== undefined) {
-            playPromise.then(() => {
-              console.log('✅ Not selected audio started playing automatically');
-            }).catch(error => {
-              console.error('❌ Failed to play not selected audio:', error);
-              
-              // Try alternative approach - create new audio instance
-              setTimeout(() => {
-                try {
-                  const fallbackAudio = new Audio(notSelectedAudio);
-                  fallbackAudio.volume = 0.8;
-                  fallbackAudio.play().then(() => {
-                    console.log('✅ Fallback not selected audio played successfully');
-                  }).catch(fallbackError => {
-                    console.error('❌ Fallback audio also failed:', fallbackError);
-                  });
-                } catch (err) {
-                  console.error('❌ Failed to create fallback audio:', err);
-                }
-              }, 200);
-            });
-          }
-        }, 100);
-      } else {
-        console.error('❌ No not selected audio path found for voice:', selectedVoice);
+        audioEngine.play(notSelectedAudio, { volume: 0.8 });
       }
       
       // Auto-close after 3 seconds
@@ -1571,20 +1472,29 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
 
     // Check winner using API with actual cartela data
     try {
-      const response = await fetch(`/api/games/${activeGameId}/check-winner`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          cartelaNumber: cartelaNum,
-          calledNumbers: calledNumbers
-        })
-      });
+      let result;
+      try {
+        const response = await fetch(`/api/games/${activeGameId}/check-winner`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            cartelaNumber: cartelaNum,
+            calledNumbers: calledNumbers
+          })
+        });
 
-      if (!response.ok) {
-        throw new Error('Failed to check winner');
-      }
+        if (!response.ok) {
+          throw Object.assign(new Error('Failed to check winner'), { status: response.status });
+        }
 
-      const result = await response.json();
+        result = await response.json();
+      } catch (error: any) {
+        // Server unreachable: apply the same rules to the cached cartela pattern
+        const offline = !error.status || error.status >= 500;
+        const local = offline && activeGameId ? (await getGameSession(activeGameId)).checkWinner(cartelaNum, calledNumbers) : null;
+        if (!local) throw error;
+        result = { ...local, winningPattern: local.pattern };
+      }
       
       if (!result.isWinner) {
         // NOT A WINNER - Show red popup but DON'T modify game state
@@ -1609,26 +1519,20 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
         // Play loser sound with proper state management
         if (!audioPlaying) {
           setAudioPlaying(true);
-          setTimeout(() => {
-            try {
-              const audioPath = getGameEventAudioPath('notWinner');
-              if (audioPath) {
-                const audio = new Audio(audioPath);
-                audio.volume = 0.8;
-                audio.onended = () => setAudioPlaying(false);
-                audio.onerror = () => setAudioPlaying(false);
-                audio.play().catch(() => {
-                  console.log('Loser sound not available');
-                  setAudioPlaying(false);
-                });
-              } else {
-                setAudioPlaying(false);
-              }
-            } catch (error) {
-              console.log('Loser audio playback error');
-              setAudioPlaying(false);
-            }
-          }, 500);
+          const audioPath = getGameEventAudioPath('notWinner');
+          if (audioPath) {
+            // Decoded ahead of time, so the half-second pause is scheduled on the audio clock
+            const context = audioEngine.context();
+            audioEngine.play(audioPath, {
+              volume: 0.8,
+              when: context ? context.currentTime + 0.5 : undefined,
+              onEnded: () => setAudioPlaying(false)
+            }).then(handle => {
+              if (!handle) setAudioPlaying(false);
+            });
+          } else {
+            setAudioPlaying(false);
+          }
         }
         
         setShowWinnerResult(true);
@@ -1689,6 +1593,18 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
             calledNumbers: calledNumbers.length
           };
           
+          // Queued calls must reach the server before the game is closed
+          const session = await getGameSession(activeGameId!);
+          await session.sync();
+          if (session.pendingCalls > 0) {
+            toast({
+              title: "Calls Not Synced",
+              description: `${session.pendingCalls} called numbers have not reached the server yet. Check the connection and declare the winner again.`,
+              variant: "destructive"
+            });
+            return;
+          }
+
           await fetch(`/api/games/${activeGameId}/declare-winner`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
@@ -1724,18 +1640,10 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
           queryClient.invalidateQueries({ queryKey: ['/api/analytics/trends'] });
           queryClient.invalidateQueries({ queryKey: ['/api/analytics/profit-distribution'] });
           
-          // Play winner sound
-          try {
-            const audioPath = getGameEventAudioPath('winner');
-            if (audioPath) {
-              const audio = new Audio(audioPath);
-              audio.volume = 0.8;
-              audio.play().catch(() => {
-                console.log('Winner sound not available');
-              });
-            }
-          } catch (error) {
-            console.log('Winner audio playback error');
+          // Play winner sound straight after the number still being announced
+          const winnerAudioPath = getGameEventAudioPath('winner');
+          if (winnerAudioPath) {
+            audioEngine.play(winnerAudioPath, { volume: 0.8, when: currentAudioRef?.endTime });
           }
           
           toast({
@@ -1810,14 +1718,12 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
         if (currentAudio) {
           currentAudio.pause();
           currentAudio.currentTime = 0;
-          currentAudio.remove && currentAudio.remove();
           setCurrentAudio(null);
         }
         
         if (currentAudioRef) {
           currentAudioRef.pause();
           currentAudioRef.currentTime = 0;
-          currentAudioRef.remove && currentAudioRef.remove();
           setCurrentAudioRef(null);
         }
         
@@ -1829,24 +1735,6 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
         // Reset all audio states immediately
         setAudioPlaying(false);
         
-        // Aggressively find and stop ALL audio elements
-        const allAudioElements = document.querySelectorAll('audio');
-        console.log(`🛑 Found ${allAudioElements.length} audio elements to stop`);
-        
-        allAudioElements.forEach((audio, index) => {
-          console.log(`🛑 Stopping audio element ${index + 1}: paused=${audio.paused}, currentTime=${audio.currentTime}`);
-          audio.pause();
-          audio.currentTime = 0;
-          audio.volume = 0; // Mute it completely
-          // Try to remove from DOM if possible
-          try {
-            audio.remove();
-          } catch (e) {
-            // If removal fails, just disable it
-            audio.src = '';
-          }
-        });
-        
         console.log('🛑 AUDIO STOP COMPLETE: All audio should be silent now');
         
         // Stop all animations immediately
@@ -1893,20 +1781,6 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
         console.log(`✅ RESUME API SUCCESS - Setting gamePaused=false`);
         setGamePaused(false);
         
-        // Resume paused audio if it exists
-        if (pausedAudio && pausedAudioTime > 0) {
-          pausedAudio.currentTime = pausedAudioTime;
-          pausedAudio.play().then(() => {
-            setCurrentAudio(pausedAudio);
-            setPausedAudio(null);
-            setPausedAudioTime(0);
-          }).catch((error) => {
-            console.log('Failed to resume audio:', error);
-            setPausedAudio(null);
-            setPausedAudioTime(0);
-          });
-        }
-        
         // Force refresh active game state to prevent state corruption
         queryClient.invalidateQueries({ queryKey: ['/api/games/active'] });
         
@@ -1915,8 +1789,8 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
           description: "Game has been resumed"
         });
         
-        // Resume calling numbers if game is still active and no audio is playing
-        if (gameActive && !gameFinished && activeGameId && !pausedAudio) {
+        // Resume calling numbers if game is still active
+        if (gameActive && !gameFinished && activeGameId) {
           setTimeout(() => {
             callNumberMutation.mutate();
           }, 500);
@@ -2463,168 +2337,13 @@ export default function BingoEmployeeDashboard({ onLogout }: BingoEmployeeDashbo
             </CardHeader>
             <CardContent>
               {/* Horizontal BINGO Board */}
-              <div className="space-y-2">
-                {/* B Row */}
-                <div className="flex items-center gap-2">
-                  <div className="w-8 h-8 bg-red-500 text-white rounded flex items-center justify-center font-bold text-sm">
-                    B
-                  </div>
-                  <div className="grid grid-cols-15 gap-1 flex-1">
-                    {Array.from({length: 15}, (_, i) => i + 1).map((num, index) => {
-                      const shuffledNum = isBoardShuffling && shuffledPositions.length > 0 ? shuffledPositions[index] : num;
-                      return (
-                        <div 
-                          key={num} 
-                          className={`h-16 w-16 rounded flex items-center justify-center text-2xl font-black transition-all duration-200 ${
-                            isBoardShuffling 
-                              ? 'animate-pulse bg-yellow-200 text-black transform scale-110' 
-                              : blinkingNumber === num
-                                ? 'bg-red-500 text-white slow-blink' 
-                              : markedNumbers.includes(num) 
-                                ? 'bg-red-500 text-white' 
-                                : 'bg-gray-100 text-black border'
-                          }`}
-                        >
-                          {shuffledNum}
-                        </div>
-                      );
-                    })}
-                  </div>
-                </div>
-
-                {/* I Row */}
-                <div className="flex items-center gap-2">
-                  <div className="w-8 h-8 bg-blue-500 text-white rounded flex items-center justify-center font-bold text-sm">
-                    I
-                  </div>
-                  <div className="grid grid-cols-15 gap-1 flex-1">
-                    {Array.from({length: 15}, (_, i) => i + 16).map((num, index) => {
-                      const shuffledNum = isBoardShuffling && shuffledPositions.length > 0 ? shuffledPositions[index + 15] : num;
-                      return (
-                        <div 
-                          key={num} 
-                          className={`h-16 w-16 rounded flex items-center justify-center text-2xl font-black transition-all duration-200 ${
-                            isBoardShuffling 
-                              ? 'animate-pulse bg-yellow-200 text-black transform scale-110' 
-                              : blinkingNumber === num
-                                ? 'bg-blue-500 text-white slow-blink' 
-                              : markedNumbers.includes(num) 
-                                ? 'bg-blue-500 text-white' 
-                                : 'bg-gray-100 text-black border'
-                          }`}
-                        >
-                          {shuffledNum}
-                        </div>
-                      );
-                    })}
-                  </div>
-                </div>
-
-                {/* N Row */}
-                <div className="flex items-center gap-2">
-                  <div className="w-8 h-8 bg-green-500 text-white rounded flex items-center justify-center font-bold text-sm">
-                    N
-                  </div>
-                  <div className="grid grid-cols-15 gap-1 flex-1">
-                    {Array.from({length: 15}, (_, i) => i + 31).map((num, index) => {
-                      const shuffledNum = isBoardShuffling && shuffledPositions.length > 0 ? shuffledPositions[index + 30] : num;
-                      return (
-                        <div 
-                          key={num} 
-                          className={`h-16 w-16 rounded flex items-center justify-center text-2xl font-black transition-all duration-200 ${
-                            isBoardShuffling 
-                              ? 'animate-pulse bg-yellow-200 text-black transform scale-110' 
-                              : blinkingNumber === num
-                                ? 'bg-green-500 text-white slow-blink' 
-                              : markedNumbers.includes(num) 
-                                ? 'bg-green-500 text-white' 
-                                : 'bg-gray-100 text-black border'
-                          }`}
-                        >
-                          {shuffledNum}
-                        </div>
-                      );
-                    })}
-                  </div>
-                </div>
-
-                {/* G Row */}
-                <div className="flex items-center gap-2">
-                  <div className="w-8 h-8 bg-yellow-500 text-white rounded flex items-center justify-center font-bold text-sm">
-                    G
-                  </div>
-                  <div className="grid grid-cols-15 gap-1 flex-1">
-                    {Array.from({length: 15}, (_, i) => i + 46).map((num, index) => {
-                      const shuffledNum = isBoardShuffling && shuffledPositions.length > 0 ? shuffledPositions[index + 45] : num;
-                      return (
-                        <div 
-                          key={num} 
-                          className={`h-16 w-16 rounded flex items-center justify-center text-2xl font-black transition-all duration-200 ${
-                            isBoardShuffling 
-                              ? 'animate-pulse bg-yellow-200 text-black transform scale-110' 
-                              : blinkingNumber === num
-                                ? 'bg-yellow-500 text-white slow-blink' 
-                              : markedNumbers.includes(num) 
-                                ? 'bg-yellow-500 text-white' 
-                                : 'bg-gray-100 text-black border'
-                          }`}
-                        >
-                          {shuffledNum}
-                        </div>
-                      );
-                    })}
-                  </div>
-                </div>
-
-                {/* O Row */}
-                <div className="flex items-center gap-2">
-                  <div className="w-8 h-8 bg-purple-500 text-white rounded flex items-center justify-center font-bold text-sm">
-                    O
-                  </div>
-                  <div className="grid grid-cols-15 gap-1 flex-1">
-                    {Array.from({length: 15}, (_, i) => i + 61).map((num, index) => {
-                      const shuffledNum = isBoardShuffling && shuffledPositions.length > 0 ? shuffledPositions[index + 60] : num;
-                      return (
-                        <div 
-                          key={num} 
-                          className={`h-16 w-16 rounded flex items-center justify-center text-2xl font-black transition-all duration-200 ${
-                            isBoardShuffling 
-                              ? 'animate-pulse bg-yellow-200 text-black transform scale-110' 
-                              : blinkingNumber === num
-                                ? 'bg-purple-500 text-white slow-blink' 
-                              : markedNumbers.includes(num) 
-                                ? 'bg-purple-500 text-white' 
-                                : 'bg-gray-100 text-black border'
-                          }`}
-                        >
-                          {shuffledNum}
-                        </div>
-                      );
-                    })}
-                  </div>
-                </div>
-              </div>
+              <NumberBoard store={boardStore} shuffling={isBoardShuffling} shuffledPositions={shuffledPositions} />
 
               {/* Action Buttons */}
               <div className="mt-6 flex gap-4 justify-center">
                 <Button 
                   onClick={() => {
-                    // IMMEDIATE AUDIO STOP - before any other processing
-                    console.log('🛑 CHECK WINNER BUTTON: Immediate audio kill');
-                    
-                    // Kill all audio elements immediately and aggressively
-                    const allAudioElements = document.querySelectorAll('audio');
-                    allAudioElements.forEach((audio, index) => {
-                      if (!audio.paused) {
-                        console.log(`🛑 KILLING audio ${index + 1} mid-playback`);
-                        audio.pause();
-                        audio.currentTime = 0;
-                        audio.volume = 0;
-                        audio.src = '';
-                      }
-                    });
-                    
-                    // Stop all timers and intervals FIRST
+                    // Stop all timers and intervals FIRST; pauseGame stops the playing clips
                     if (autoCallInterval) {
                       clearInterval(autoCallInterval);
                       setAutoCallInterval(null);
@@ -8,6 +8,7 @@ import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from "@/components/ui/dialog";
 import { useToast } from "@/hooks/use-toast";
 import { apiRequest } from "@/lib/queryClient";
+import { useRealtimeInvalidation, LIVE_FALLBACK_INTERVAL, OFFLINE_POLL_INTERVAL } from "@/lib/realtime";
 import { Search, CheckCircle, Clock, Users, TrendingUp, Eye, LogOut } from "lucide-react";
 
 interface User {
@@ -86,6 +87,12 @@ export function CollectorDashboard({ user }: { user: User }) {
     }
   };
 
+  // Cartela bookings and game changes are pushed over the realtime socket
+  const live = useRealtimeInvalidation({
+    [`cartelas:${user.shopId}`]: [[`/api/cartelas/${user.shopId}`], [`/api/collectors/${user.id}/stats`]],
+    [`shop:${user.shopId}`]: [[`/api/games/active`]],
+  });
+
   // Get supervisor (employee) information
   const { data: supervisor } = useQuery({
     queryKey: [`/api/users/${user.supervisorId}`],
@@ -95,19 +102,19 @@ export function CollectorDashboard({ user }: { user: User }) {
   // Fetch cartelas for this shop
   const { data: cartelas = [], isLoading: cartelasLoading } = useQuery({
     queryKey: [`/api/cartelas/${user.shopId}`],
-    refetchInterval: 3000, // Refresh every 3 seconds for real-time updates
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
   });
 
   // Fetch collector stats
   const { data: stats } = useQuery<CollectorStats>({
     queryKey: [`/api/collectors/${user.id}/stats`],
-    refetchInterval: 5000,
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
   });
 
   // Check for active games (collectors cannot mark cartelas during active games)  
   const { data: activeGame } = useQuery({
     queryKey: [`/api/games/active`],
-    refetchInterval: 2000,
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
     retry: false
   });
 
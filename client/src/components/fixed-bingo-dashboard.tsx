@@ -9,6 +9,7 @@ import { useToast } from "@/hooks/use-toast";
 import { useAuth } from "@/hooks/use-auth";
 import { useMutation, useQuery } from "@tanstack/react-query";
 import { queryClient } from "@/lib/queryClient";
+import { useRealtimeInvalidation, LIVE_FALLBACK_INTERVAL, OFFLINE_POLL_INTERVAL } from "@/lib/realtime";
 import { FIXED_CARTELAS, getCartelaNumbers, getFixedCartelaPattern } from "@/data/fixed-cartelas";
 
 interface EmployeeBingoDashboardProps {
@@ -49,10 +50,12 @@ export default function EmployeeBingoDashboard({ onLogout }: EmployeeBingoDashbo
   const [nextNumber, setNextNumber] = useState<number | null>(null);
   const [isHovering, setIsHovering] = useState(false);
   
+  const live = useRealtimeInvalidation({ [`shop:${user?.shopId}`]: [['/api/games/active']] });
+
   // Active game query
   const { data: activeGame } = useQuery({
     queryKey: ['/api/games/active'],
-    refetchInterval: 2000
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL
   });
 
   // Shop data query
@@ -8,6 +8,7 @@ import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, Di
 import { Checkbox } from '@/components/ui/checkbox';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { useToast } from '@/hooks/use-toast';
+import { useRealtimeInvalidation, LIVE_FALLBACK_INTERVAL, OFFLINE_POLL_INTERVAL } from '@/lib/realtime';
 
 interface User {
   id: number;
@@ -57,23 +58,28 @@ export default function BingoHorizontalDashboard({ onLogout }: BingoHorizontalDa
     queryKey: ['/api/auth/me'],
   }) as { data: { id: number; shopId: number; role: string } | undefined };
 
+  const live = useRealtimeInvalidation({
+    [`shop:${user?.shopId}`]: [['/api/admin/shop-stats'], ['/api/games/active']],
+    [`cartelas:${user?.shopId}`]: [[`/api/cartelas/${user?.shopId}`]],
+  });
+
   // Fetch admin stats for profit margin
   const { data: adminStats } = useQuery({
     queryKey: ['/api/admin/shop-stats'],
-    refetchInterval: 5000,
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
   });
 
   // Fetch active game
   const { data: activeGame } = useQuery({
     queryKey: ['/api/games/active'],
-    refetchInterval: 2000,
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
   });
 
   // Fetch cartelas to get collector-marked ones
   const { data: cartelas } = useQuery({
     queryKey: [`/api/cartelas/${user?.shopId}`],
     enabled: !!user?.shopId,
-    refetchInterval: 2000,
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
   });
 
   // Update bookedCartelas to include both collector-marked and employee-booked cartelas
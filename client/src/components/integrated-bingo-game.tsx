@@ -6,6 +6,7 @@ import { Input } from "@/components/ui/input";
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from "@/components/ui/dialog";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { apiRequest } from "@/lib/queryClient";
+import { useRealtimeInvalidation, LIVE_FALLBACK_INTERVAL, OFFLINE_POLL_INTERVAL } from "@/lib/realtime";
 import { useToast } from "@/hooks/use-toast";
 
 interface IntegratedBingoGameProps {
@@ -53,11 +54,13 @@ export default function IntegratedBingoGame({ employeeName, employeeId, shopId,
   const { toast } = useToast();
   const queryClient = useQueryClient();
   
+  // Shop changes (e.g. profit margin) are pushed over the realtime socket
+  const live = useRealtimeInvalidation({ [`shop:${shopId}`]: [["/api/shops"]] });
+
   // Fetch ALL shops and find the employee's shop for real-time profit margin
   const { data: allShops } = useQuery({
     queryKey: ["/api/shops"],
-    refetchInterval: 1000,
-    refetchIntervalInBackground: true,
+    refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL,
     staleTime: 0,
   });
 
@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useState, useEffect, useMemo, useCallback, memo } from "react";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
@@ -6,11 +6,79 @@ import { Textarea } from "@/components/ui/textarea";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from "@/components/ui/dialog";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
-import { Plus, Edit2, Trash2, Upload, Grid3X3, Save, X } from "lucide-react";
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { Plus, Edit2, Trash2, Upload, Grid3X3, Save, X, Search } from "lucide-react";
+import { useInfiniteQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { useToast } from "@/hooks/use-toast";
+import { useVirtualGrid } from "@/hooks/use-virtual-grid";
 import type { Cartela } from "@shared/schema";
 
+// Shops can import thousands of cartelas, so the list is fetched a page at a
+// time from /api/cartelas/:shopId/page and only the visible rows are rendered.
+const PAGE_SIZE = 120;
+const ROW_HEIGHT = 256;
+const ROW_GAP = 16;
+const MIN_CARD_WIDTH = 320;
+
+interface CartelaPage {
+  items: Cartela[];
+  total: number;
+  nextCursor: number | null;
+}
+
+const COLUMN_COLORS = ["bg-blue-50", "bg-red-50", "bg-green-50", "bg-yellow-50", "bg-purple-50"];
+
+interface CartelaCardProps {
+  cartela: Cartela;
+  onEdit: (cartela: Cartela) => void;
+  onDelete: (cartela: Cartela) => void;
+  deleting: boolean;
+}
+
+const CartelaCard = memo(function CartelaCard({ cartela, onEdit, onDelete, deleting }: CartelaCardProps) {
+  const pattern = cartela.pattern || [];
+  return (
+    <Card className="p-4 h-full overflow-hidden">
+      <div className="flex justify-between items-start">
+        <div className="flex-1 min-w-0">
+          <div className="flex items-center gap-2 mb-2">
+            <h4 className="font-medium truncate">{cartela.name}</h4>
+            {cartela.isHardcoded && (
+              <span className="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded whitespace-nowrap">
+                Originally Hardcoded
+              </span>
+            )}
+          </div>
+          <p className="text-sm text-gray-600 font-mono mb-2 truncate">
+            {cartela.cartelaNumber}: {pattern.flat().join(",")}
+          </p>
+          <div className="grid grid-cols-5 gap-1 text-xs">
+            {pattern.map((row, rowIndex) =>
+              (row || []).map((value, colIndex) => (
+                <div
+                  key={`${rowIndex}-${colIndex}`}
+                  className={`text-center p-1 rounded ${
+                    rowIndex === 2 && colIndex === 2 ? "bg-green-100 font-bold" : COLUMN_COLORS[colIndex]
+                  }`}
+                >
+                  {rowIndex === 2 && colIndex === 2 ? "FREE" : value}
+                </div>
+              ))
+            )}
+          </div>
+        </div>
+        <div className="flex gap-2 ml-2">
+          <Button size="sm" variant="outline" onClick={() => onEdit(cartela)}>
+            <Edit2 className="h-4 w-4" />
+          </Button>
+          <Button size="sm" variant="outline" onClick={() => onDelete(cartela)} disabled={deleting}>
+            <Trash2 className="h-4 w-4" />
+          </Button>
+        </div>
+      </div>
+    </Card>
+  );
+});
+
 interface UnifiedCartelaManagerProps {
   shopId: number;
   adminId: number;
@@ -30,18 +98,46 @@ export default function UnifiedCartelaManager({ shopId, adminId }: UnifiedCartel
   const { toast } = useToast();
   const queryClient = useQueryClient();
 
-  // Load all cartelas for this shop
-  const { data: cartelas = [], refetch, isLoading } = useQuery({
-    queryKey: ["/api/cartelas", shopId],
-    queryFn: async () => {
-      const response = await fetch(`/api/cartelas/${shopId}`);
+  const [searchText, setSearchText] = useState("");
+  const [searchMode, setSearchMode] = useState<"number" | "contains">("number");
+  const [search, setSearch] = useState("");
+
+  // Debounce typing so every keystroke does not start a request
+  useEffect(() => {
+    const timer = setTimeout(() => setSearch(searchText.trim()), 250);
+    return () => clearTimeout(timer);
+  }, [searchText]);
+
+  // Load cartelas page by page; keys start with ["/api/cartelas", shopId] so
+  // the invalidations below refresh every loaded page
+  const { data, isLoading, hasNextPage, isFetchingNextPage, fetchNextPage } = useInfiniteQuery({
+    queryKey: ["/api/cartelas", shopId, "page", searchMode, search],
+    initialPageParam: undefined as number | undefined,
+    queryFn: async ({ pageParam }): Promise<CartelaPage> => {
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+      if (search) params.set(searchMode, search);
+      if (pageParam !== undefined) params.set("after", String(pageParam));
+      const response = await fetch(`/api/cartelas/${shopId}/page?${params}`);
       if (!response.ok) throw new Error("Failed to load cartelas");
-      const data = await response.json();
-      console.log('Fetched cartelas:', data.length, 'items');
-      return data;
+      return response.json();
     },
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
   });
 
+  const cartelas = useMemo(() => data?.pages.flatMap(page => page.items) ?? [], [data]);
+  const total = data?.pages[0]?.total ?? 0;
+
+  const grid = useVirtualGrid({ itemCount: total, rowHeight: ROW_HEIGHT, minColumnWidth: MIN_CARD_WIDTH });
+  const firstIndex = grid.firstRow * grid.columns;
+  const lastIndex = Math.min(grid.lastRow * grid.columns, total);
+
+  // Fetch further pages as the visible window reaches the end of what is loaded
+  useEffect(() => {
+    if (hasNextPage && !isFetchingNextPage && lastIndex > cartelas.length) {
+      fetchNextPage();
+    }
+  }, [hasNextPage, isFetchingNextPage, lastIndex, cartelas.length, fetchNextPage]);
+
   // Create or update cartela
   const saveCartelaMutation = useMutation({
     mutationFn: async (data: any) => {
@@ -116,13 +212,20 @@ export default function UnifiedCartelaManager({ shopId, adminId }: UnifiedCartel
     setIsCreateOpen(false);
   };
 
-  const handleEdit = (cartela: Cartela) => {
+  const handleEdit = useCallback((cartela: Cartela) => {
     setEditingCartela(cartela);
     setCartelaName(cartela.name || "");
     setCartelaNumber(cartela.cartelaNumber?.toString() || "");
     setPattern(cartela.pattern || Array(5).fill(null).map(() => Array(5).fill(0)));
     setIsCreateOpen(true);
-  };
+  }, []);
+
+  const { mutate: deleteCartela } = deleteCartelaMutation;
+  const handleDelete = useCallback((cartela: Cartela) => {
+    if (confirm(`Are you sure you want to delete cartela ${cartela.cartelaNumber}?`)) {
+      deleteCartela(cartela.id);
+    }
+  }, [deleteCartela]);
 
   const handleSave = () => {
     if (!cartelaName.trim() || !cartelaNumber.trim()) {
@@ -163,11 +266,6 @@ export default function UnifiedCartelaManager({ shopId, adminId }: UnifiedCartel
     bulkImportMutation.mutate(bulkInput);
   };
 
-  const formatCartelaDisplay = (cartela: Cartela) => {
-    const numbers = cartela.numbers || [];
-    return `${cartela.cartelaNumber}: ${Array.isArray(numbers) ? numbers.join(",") : "No numbers"}`;
-  };
-
   return (
     <div className="space-y-6">
       <div className="flex justify-between items-center">
@@ -341,81 +439,69 @@ export default function UnifiedCartelaManager({ shopId, adminId }: UnifiedCartel
         </div>
       </div>
 
+      {/* Search */}
+      <div className="flex flex-wrap items-center gap-2">
+        <div className="relative w-64">
+          <Search className="absolute left-2 top-1/2 -translate-y-1/2 h-4 w-4 text-gray-400" />
+          <Input
+            type="number"
+            min="1"
+            value={searchText}
+            onChange={(e) => setSearchText(e.target.value)}
+            placeholder={searchMode === "number" ? "Cartela number" : "Number on card (1-75)"}
+            className="pl-8"
+          />
+        </div>
+        <Tabs value={searchMode} onValueChange={(value) => setSearchMode(value as "number" | "contains")}>
+          <TabsList>
+            <TabsTrigger value="number">Cartela #</TabsTrigger>
+            <TabsTrigger value="contains">Contains number</TabsTrigger>
+          </TabsList>
+        </Tabs>
+        <span className="text-sm text-gray-500">
+          {isLoading ? "Loading..." : `${total} cartela${total === 1 ? "" : "s"}`}
+        </span>
+      </div>
+
       {/* Cartelas List */}
-      <div className="space-y-4">
-        {cartelas.length === 0 ? (
+      <div ref={grid.ref} className="h-[70vh] overflow-y-auto">
+        {!isLoading && total === 0 ? (
           <Card>
             <CardContent className="text-center py-8">
-              <p className="text-gray-500">No cartelas found. Create your first cartela or load hardcoded ones.</p>
+              <p className="text-gray-500">
+                {search
+                  ? "No cartelas match this search."
+                  : "No cartelas found. Create your first cartela or load hardcoded ones."}
+              </p>
             </CardContent>
           </Card>
         ) : (
-          cartelas.map((cartela: Cartela) => (
-            <Card key={cartela.id} className="p-4">
-              <div className="flex justify-between items-start">
-                <div className="flex-1">
-                  <div className="flex items-center gap-2 mb-2">
-                    <h4 className="font-medium">{cartela.name}</h4>
-                    {cartela.isHardcoded && (
-                      <span className="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded">
-                        Originally Hardcoded
-                      </span>
-                    )}
-                  </div>
-                  <div className="mt-2">
-                    <p className="text-sm text-gray-600 font-mono mb-2">
-                      {formatCartelaDisplay(cartela)}
-                    </p>
-                    <div className="grid grid-cols-5 gap-1 text-xs">
-                      {(cartela.pattern || []).map((row, rowIndex) =>
-                        (row || []).map((value, colIndex) => (
-                          <div
-                            key={`${rowIndex}-${colIndex}`}
-                            className={`text-center p-1 rounded ${
-                              rowIndex === 2 && colIndex === 2 
-                                ? "bg-green-100 font-bold" 
-                                : colIndex === 0 
-                                  ? "bg-blue-50" 
-                                  : colIndex === 1 
-                                    ? "bg-red-50" 
-                                    : colIndex === 2 
-                                      ? "bg-green-50" 
-                                      : colIndex === 3 
-                                        ? "bg-yellow-50" 
-                                        : "bg-purple-50"
-                            }`}
-                          >
-                            {rowIndex === 2 && colIndex === 2 ? "FREE" : value}
-                          </div>
-                        ))
-                      )}
-                    </div>
-                  </div>
-                </div>
-                <div className="flex gap-2">
-                  <Button
-                    size="sm"
-                    variant="outline"
-                    onClick={() => handleEdit(cartela)}
-                  >
-                    <Edit2 className="h-4 w-4" />
-                  </Button>
-                  <Button
-                    size="sm"
-                    variant="outline"
-                    onClick={() => {
-                      if (confirm(`Are you sure you want to delete cartela ${cartela.cartelaNumber}?`)) {
-                        deleteCartelaMutation.mutate(cartela.id);
-                      }
-                    }}
-                    disabled={deleteCartelaMutation.isPending}
-                  >
-                    <Trash2 className="h-4 w-4" />
-                  </Button>
-                </div>
-              </div>
-            </Card>
-          ))
+          <div style={{ height: grid.totalHeight, position: "relative" }}>
+            <div
+              className="grid"
+              style={{
+                transform: `translateY(${grid.offsetTop}px)`,
+                gridTemplateColumns: `repeat(${grid.columns}, minmax(0, 1fr))`,
+                gridAutoRows: ROW_HEIGHT - ROW_GAP,
+                gap: ROW_GAP,
+              }}
+            >
+              {Array.from({ length: Math.max(0, lastIndex - firstIndex) }, (_, i) => {
+                const cartela = cartelas[firstIndex + i];
+                return cartela ? (
+                  <CartelaCard
+                    key={cartela.id}
+                    cartela={cartela}
+                    onEdit={handleEdit}
+                    onDelete={handleDelete}
+                    deleting={deleteCartelaMutation.isPending}
+                  />
+                ) : (
+                  <div key={`placeholder-${firstIndex + i}`} className="rounded-lg bg-gray-100 animate-pulse" />
+                );
+              })}
+            </div>
+          </div>
         )}
       </div>
     </div>
@@ -0,0 +1,72 @@
+import { useEffect, useRef, useState } from "react";
+
+interface VirtualGridOptions {
+  itemCount: number;
+  // Fixed height of one row of items, including the gap below it
+  rowHeight: number;
+  // Columns are as many as fit at this width, at least one
+  minColumnWidth: number;
+  // Extra rows rendered above and below the viewport
+  overscan?: number;
+}
+
+/**
+ * Windowing for a scrollable grid of fixed-height items. Attach `ref` to the
+ * scroll container, give its content a height of `totalHeight`, and render
+ * only items in rows `firstRow` to `lastRow` (exclusive), offset by
+ * `firstRow * rowHeight`. Scroll handling is throttled to animation frames.
+ */
+export function useVirtualGrid<T extends HTMLElement = HTMLDivElement>({
+  itemCount,
+  rowHeight,
+  minColumnWidth,
+  overscan = 2,
+}: VirtualGridOptions) {
+  const ref = useRef<T>(null);
+  const [viewport, setViewport] = useState({ scrollTop: 0, height: 0, width: 0 });
+
+  useEffect(() => {
+    const element = ref.current;
+    if (!element) return;
+
+    let frame = 0;
+    const measure = () => {
+      frame = 0;
+      setViewport(previous =>
+        previous.scrollTop === element.scrollTop &&
+        previous.height === element.clientHeight &&
+        previous.width === element.clientWidth
+          ? previous
+          : { scrollTop: element.scrollTop, height: element.clientHeight, width: element.clientWidth }
+      );
+    };
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(measure);
+    };
+
+    measure();
+    element.addEventListener("scroll", schedule, { passive: true });
+    const observer = new ResizeObserver(schedule);
+    observer.observe(element);
+
+    return () => {
+      element.removeEventListener("scroll", schedule);
+      observer.disconnect();
+      if (frame) cancelAnimationFrame(frame);
+    };
+  }, []);
+
+  const columns = Math.max(1, Math.floor(viewport.width / minColumnWidth));
+  const rowCount = Math.ceil(itemCount / columns);
+  const firstRow = Math.max(0, Math.floor(viewport.scrollTop / rowHeight) - overscan);
+  const lastRow = Math.min(rowCount, Math.ceil((viewport.scrollTop + viewport.height) / rowHeight) + overscan);
+
+  return {
+    ref,
+    columns,
+    firstRow,
+    lastRow,
+    totalHeight: rowCount * rowHeight,
+    offsetTop: firstRow * rowHeight,
+  };
+}
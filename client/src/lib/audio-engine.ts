@@ -0,0 +1,193 @@
+// Shared Web Audio engine for the caller screens. Each URL is fetched and
+// decoded once; decoded buffers are kept in an LRU bounded by memory, so
+// after warm-up announcements and effects play with no network or decode.
+// Playback is scheduled on the AudioContext clock, which lets callers queue
+// clips back to back with sample-accurate timing via `when`/`endTime`.
+
+// Decoded PCM is large (4 bytes per sample per channel); keep it bounded
+const MAX_CACHE_BYTES = 64 * 1024 * 1024;
+// Parallel fetches while warming so the caller's own requests are not starved
+const WARM_CONCURRENCY = 4;
+
+export interface PlaybackHandle {
+  // Mirrors the parts of HTMLAudioElement the dashboard uses to stop playback
+  pause(): void;
+  currentTime: number;
+  // AudioContext time at which playback finishes, for back-to-back scheduling
+  endTime?: number;
+}
+
+export interface PlayOptions {
+  volume?: number;
+  playbackRate?: number;
+  // Offset and duration within the buffer, for sprite clips
+  offset?: number;
+  duration?: number;
+  // AudioContext time to start at; defaults to now
+  when?: number;
+  onEnded?: () => void;
+}
+
+function bufferBytes(buffer: AudioBuffer): number {
+  return buffer.length * buffer.numberOfChannels * 4;
+}
+
+class AudioEngine {
+  private ctx: AudioContext | null = null;
+  private unsupported = false;
+  private buffers = new Map<string, AudioBuffer>();
+  private cachedBytes = 0;
+  private loading = new Map<string, Promise<AudioBuffer | null>>();
+
+  context(): AudioContext | null {
+    if (!this.ctx && !this.unsupported) {
+      const Context = window.AudioContext || (window as any).webkitAudioContext;
+      if (!Context) {
+        this.unsupported = true;
+        return null;
+      }
+      this.ctx = new Context();
+    }
+    return this.ctx;
+  }
+
+  /**
+   * Returns a decoded buffer if it is already cached, refreshing its LRU slot.
+   */
+  peek(url: string): AudioBuffer | undefined {
+    const buffer = this.buffers.get(url);
+    if (buffer) {
+      this.buffers.delete(url);
+      this.buffers.set(url, buffer);
+    }
+    return buffer;
+  }
+
+  /**
+   * Fetches and decodes a URL once. Concurrent callers share the request;
+   * resolves to null if the file is missing or cannot be decoded.
+   */
+  load(url: string): Promise<AudioBuffer | null> {
+    const cached = this.peek(url);
+    if (cached) return Promise.resolve(cached);
+
+    let pending = this.loading.get(url);
+    if (!pending) {
+      const context = this.context();
+      if (!context) return Promise.resolve(null);
+
+      pending = fetch(url)
+        .then(response => {
+          if (!response.ok) throw new Error(`HTTP ${response.status}`);
+          return response.arrayBuffer();
+        })
+        .then(data => context.decodeAudioData(data))
+        .then(buffer => {
+          this.remember(url, buffer);
+          return buffer;
+        })
+        .catch(error => {
+          console.warn(`Audio ${url} could not be loaded`, error);
+          return null;
+        })
+        .finally(() => {
+          this.loading.delete(url);
+        });
+      this.loading.set(url, pending);
+    }
+    return pending;
+  }
+
+  /**
+   * Loads URLs in the background with limited concurrency.
+   */
+  async warm(urls: string[]): Promise<void> {
+    const queue = urls.filter(url => url && !this.buffers.has(url));
+    const worker = async () => {
+      for (let url = queue.shift(); url; url = queue.shift()) {
+        await this.load(url);
+      }
+    };
+    await Promise.all(Array.from({ length: WARM_CONCURRENCY }, worker));
+  }
+
+  /**
+   * Schedules a decoded buffer (or a slice of it) on the context clock.
+   */
+  start(buffer: AudioBuffer, options: PlayOptions = {}): PlaybackHandle | null {
+    const context = this.context();
+    if (!context) return null;
+
+    if (context.state === 'suspended') {
+      context.resume().catch(() => {});
+    }
+
+    const rate = options.playbackRate ?? 1;
+    const offset = options.offset ?? 0;
+    const duration = options.duration ?? buffer.duration - offset;
+    const when = Math.max(options.when ?? 0, context.currentTime);
+
+    const source = context.createBufferSource();
+    source.buffer = buffer;
+    source.playbackRate.value = rate;
+
+    const gain = context.createGain();
+    gain.gain.value = options.volume ?? 1;
+    source.connect(gain).connect(context.destination);
+
+    let stopped = false;
+    source.onended = () => {
+      gain.disconnect();
+      if (!stopped) options.onEnded?.();
+    };
+    source.start(when, offset, duration);
+
+    return {
+      currentTime: 0,
+      endTime: when + duration / rate,
+      pause() {
+        if (stopped) return;
+        stopped = true;
+        try {
+          source.stop();
+        } catch {
+          // Already finished
+        }
+      },
+    };
+  }
+
+  /**
+   * Plays a URL through Web Audio, decoding it on first use. Falls back to
+   * an HTMLAudioElement when Web Audio is unavailable or decoding fails.
+   */
+  async play(url: string, options: PlayOptions = {}): Promise<PlaybackHandle | null> {
+    const buffer = await this.load(url);
+    if (buffer) {
+      return this.start(buffer, options);
+    }
+    return this.playElement(url, options);
+  }
+
+  private playElement(url: string, options: PlayOptions): Promise<PlaybackHandle | null> {
+    const audio = new Audio(url);
+    audio.volume = options.volume ?? 1;
+    audio.playbackRate = options.playbackRate ?? 1;
+    audio.onended = () => options.onEnded?.();
+    return audio.play().then(() => audio, () => null);
+  }
+
+  private remember(url: string, buffer: AudioBuffer): void {
+    this.buffers.set(url, buffer);
+    this.cachedBytes += bufferBytes(buffer);
+
+    // Evict least recently used buffers, but never the one just added
+    for (const [key, cached] of this.buffers) {
+      if (this.cachedBytes <= MAX_CACHE_BYTES || key === url) break;
+      this.buffers.delete(key);
+      this.cachedBytes -= bufferBytes(cached);
+    }
+  }
+}
+
+export const audioEngine = new AudioEngine();
@@ -0,0 +1,86 @@
+import { useCallback, useSyncExternalStore } from 'react';
+
+// Called numbers for a 75-ball board, held outside React state as a bitset.
+// Cells subscribe to their own number, so marking a number or moving the
+// "last called" highlight re-renders exactly the cells whose state changed,
+// however often the surrounding dashboard re-renders.
+
+export const BOARD_SIZE = 75;
+
+export type CellState = 'idle' | 'called' | 'last';
+
+export class CalledNumbersStore {
+  // Bit (n - 1) is set when number n has been called
+  private bits = new Uint32Array(Math.ceil(BOARD_SIZE / 32));
+  private last: number | null = null;
+  private listeners = new Map<number, Set<() => void>>();
+
+  has(num: number): boolean {
+    const index = num - 1;
+    return index >= 0 && index < BOARD_SIZE && (this.bits[index >>> 5] & (1 << (index & 31))) !== 0;
+  }
+
+  get lastCalled(): number | null {
+    return this.last;
+  }
+
+  cellState(num: number): CellState {
+    if (num === this.last) return 'last';
+    return this.has(num) ? 'called' : 'idle';
+  }
+
+  /**
+   * Replaces the marked numbers and the highlighted last number, notifying
+   * only the cells whose state differs from before.
+   */
+  sync(marked: Iterable<number>, last: number | null = null): void {
+    const next = new Uint32Array(this.bits.length);
+    for (const num of marked) {
+      const index = num - 1;
+      if (index >= 0 && index < BOARD_SIZE) next[index >>> 5] |= 1 << (index & 31);
+    }
+
+    const changed: number[] = [];
+    for (let word = 0; word < next.length; word++) {
+      let diff = next[word] ^ this.bits[word];
+      while (diff !== 0) {
+        const bit = 31 - Math.clz32(diff);
+        changed.push(word * 32 + bit + 1);
+        diff &= ~(1 << bit);
+      }
+    }
+    if (last !== this.last) {
+      if (this.last !== null) changed.push(this.last);
+      if (last !== null) changed.push(last);
+    }
+
+    this.bits = next;
+    this.last = last;
+    changed.forEach(num => this.listeners.get(num)?.forEach(listener => listener()));
+  }
+
+  clear(): void {
+    this.sync([], null);
+  }
+
+  subscribe(num: number, listener: () => void): () => void {
+    let set = this.listeners.get(num);
+    if (!set) {
+      set = new Set();
+      this.listeners.set(num, set);
+    }
+    set.add(listener);
+    return () => {
+      set!.delete(listener);
+    };
+  }
+}
+
+/**
+ * State of one board cell; the calling component re-renders only when this
+ * number's state changes.
+ */
+export function useCellState(store: CalledNumbersStore, num: number): CellState {
+  const subscribe = useCallback((listener: () => void) => store.subscribe(num, listener), [store, num]);
+  return useSyncExternalStore(subscribe, () => store.cellState(num));
+}
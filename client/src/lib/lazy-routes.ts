@@ -0,0 +1,81 @@
+import { lazy, type ComponentType, type LazyExoticComponent } from 'react';
+
+// Route-level code splitting. Every dashboard is its own chunk so a shop
+// tablet only downloads the caller screen, not the admin panels and charts.
+// Each route can be preloaded ahead of navigation, e.g. while the login form
+// is on screen, so switching to the dashboard does not wait on the network.
+
+type Loader<P> = () => Promise<{ default: ComponentType<P> }>;
+
+export type PreloadableComponent<P> = LazyExoticComponent<ComponentType<P>> & {
+  preload: () => Promise<unknown>;
+};
+
+function lazyRoute<P>(loader: Loader<P>): PreloadableComponent<P> {
+  let pending: Promise<{ default: ComponentType<P> }> | null = null;
+  const load = () => {
+    if (!pending) {
+      pending = loader().catch(error => {
+        // Allow a retry after a failed fetch (e.g. a deploy replaced the chunk)
+        pending = null;
+        throw error;
+      });
+    }
+    return pending;
+  };
+  return Object.assign(lazy(load), { preload: load });
+}
+
+export const EmployeeDashboard = lazyRoute<{ onLogout?: () => void }>(() => import('@/pages/employee-dashboard'));
+export const SimpleAdminDashboard = lazyRoute<{ onLogout: () => void }>(() => import('@/pages/simple-admin-dashboard'));
+export const SuperAdminDashboard = lazyRoute<{ onLogout: () => void }>(() => import('@/pages/super-admin-dashboard'));
+export const AdminEmployeeManagement = lazyRoute<{}>(() => import('@/pages/admin-employee-management'));
+export const CollectorDashboard = lazyRoute<{ user: any }>(() =>
+  import('@/components/collector-dashboard').then(module => ({ default: module.CollectorDashboard }))
+);
+export const TestLogin = lazyRoute<{}>(() => import('@/pages/test-login'));
+export const MongoDBTest = lazyRoute<{}>(() => import('@/pages/MongoDBTest'));
+
+const DASHBOARD_BY_ROLE: Record<string, { preload: () => Promise<unknown> }> = {
+  super_admin: SuperAdminDashboard,
+  admin: SimpleAdminDashboard,
+  employee: EmployeeDashboard,
+  collector: CollectorDashboard,
+};
+
+const LAST_ROLE_KEY = 'bingo:lastRole';
+
+/**
+ * Starts downloading the dashboard chunk for a role. Failures are ignored
+ * here; the route retries when it actually renders.
+ */
+export function preloadDashboard(role: string | undefined | null): void {
+  const route = role ? DASHBOARD_BY_ROLE[role] : undefined;
+  route?.preload().catch(() => {});
+}
+
+export function rememberRole(role: string): void {
+  try {
+    localStorage.setItem(LAST_ROLE_KEY, role);
+  } catch {
+    // Private mode or storage disabled
+  }
+}
+
+/**
+ * Preloads the dashboard of whoever last signed in on this device once the
+ * browser is idle. Shop tablets are used by the same role every day, so the
+ * chunk is usually cached by the time the login form is submitted.
+ */
+export function preloadLastDashboard(): void {
+  let role: string | null = null;
+  try {
+    role = localStorage.getItem(LAST_ROLE_KEY);
+  } catch {
+    return;
+  }
+  if (!role) return;
+
+  const idle = (window as any).requestIdleCallback ?? ((callback: () => void) => setTimeout(callback, 200));
+  idle(() => preloadDashboard(role));
+}
@@ -0,0 +1,291 @@
+import { findWinningLine, type WinResult } from '@shared/bingo-rules';
+
+// Local-first number calling for the caller screen. The server sends a short
+// window of the game's upcoming draw order (GET /api/games/:id/draw-ahead);
+// calls are taken from it immediately, appended to an event log in IndexedDB
+// with their position in the called list, and synced in the background
+// (POST /api/games/:id/events). Replays are idempotent on the server, so a
+// call is never lost or applied twice when the connection drops mid-sync.
+// Booked cartela patterns are cached too, so winner checks work offline.
+
+const DB_NAME = 'bingo-offline';
+const DB_VERSION = 1;
+const GAMES = 'games';
+const EVENTS = 'events';
+
+// Refill the look-ahead window once fewer than this many numbers are left
+const REFILL_BELOW = 10;
+const MAX_RETRY_DELAY = 30000;
+
+interface CachedGame {
+  gameId: number;
+  calledNumbers: number[];
+  upcoming: number[];
+  cartelas: Record<number, number[][]>;
+}
+
+interface CallEvent {
+  gameId: number;
+  seq: number;
+  number: number;
+}
+
+export interface LocalCallResult {
+  calledNumber: number;
+  calledNumbers: number[];
+}
+
+export interface LocalWinResult extends WinResult {
+  cartelaPattern: number[][];
+}
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+function openDb(): Promise<IDBDatabase | null> {
+  if (!dbPromise) {
+    dbPromise = new Promise(resolve => {
+      if (typeof indexedDB === 'undefined') return resolve(null);
+      const request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = () => {
+        const db = request.result;
+        if (!db.objectStoreNames.contains(GAMES)) db.createObjectStore(GAMES, { keyPath: 'gameId' });
+        if (!db.objectStoreNames.contains(EVENTS)) db.createObjectStore(EVENTS, { keyPath: ['gameId', 'seq'] });
+      };
+      request.onsuccess = () => resolve(request.result);
+      // Private browsing or storage disabled: keep working from memory
+      request.onerror = () => resolve(null);
+    });
+  }
+  return dbPromise;
+}
+
+function promisify<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+async function withStore<T>(name: string, mode: IDBTransactionMode, run: (store: IDBObjectStore) => IDBRequest<T>): Promise<T | undefined> {
+  const db = await openDb();
+  if (!db) return undefined;
+  try {
+    return await promisify(run(db.transaction(name, mode).objectStore(name)));
+  } catch (error) {
+    console.warn(`Offline store ${name} unavailable`, error);
+    return undefined;
+  }
+}
+
+const gameRange = (gameId: number) => IDBKeyRange.bound([gameId, 0], [gameId, Infinity]);
+
+// 4xx answers other than a conflict, a timeout or rate limiting never change on retry
+const isRejected = (status: number) => status >= 400 && status < 500 && ![408, 409, 429].includes(status);
+
+export class GameSession {
+  private state: CachedGame;
+  private pending: CallEvent[] = [];
+  private syncing: Promise<void> | null = null;
+  private retryDelay = 1000;
+  private retryTimer: ReturnType<typeof setTimeout> | null = null;
+  private listeners = new Set<(calledNumbers: number[]) => void>();
+
+  constructor(readonly gameId: number) {
+    this.state = { gameId, calledNumbers: [], upcoming: [], cartelas: {} };
+  }
+
+  /** Restores cached state and queued calls left over from a previous page load. */
+  async restore(): Promise<void> {
+    const cached = await withStore<CachedGame>(GAMES, 'readonly', store => store.get(this.gameId));
+    if (cached) this.state = cached;
+    this.pending = (await withStore<CallEvent[]>(EVENTS, 'readonly', store => store.getAll(gameRange(this.gameId)))) ?? [];
+  }
+
+  get calledNumbers(): number[] {
+    return this.state.calledNumbers;
+  }
+
+  get pendingCalls(): number {
+    return this.pending.length;
+  }
+
+  /** Notified when the server's called list replaces the local one after a conflict. */
+  onServerState(listener: (calledNumbers: number[]) => void): () => void {
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
+  }
+
+  /**
+   * Calls the next number from the local window. Returns null when the
+   * window is empty, in which case the caller falls back to the server.
+   */
+  async callNext(): Promise<LocalCallResult | null> {
+    const upcoming = this.state.upcoming.filter(num => !this.state.calledNumbers.includes(num));
+    const number = upcoming.shift();
+    if (number === undefined) return null;
+
+    const calledNumbers = [...this.state.calledNumbers, number];
+    const event: CallEvent = { gameId: this.gameId, seq: calledNumbers.length, number };
+    this.state = { ...this.state, calledNumbers, upcoming };
+    this.pending.push(event);
+
+    await Promise.all([
+      withStore(EVENTS, 'readwrite', store => store.put(event)),
+      this.persist(),
+    ]);
+    this.sync();
+    return { calledNumber: number, calledNumbers };
+  }
+
+  /** Adopts the called list from a server response (e.g. a fallback PATCH). */
+  async adopt(calledNumbers: number[], upcoming?: number[]): Promise<void> {
+    const pendingNumbers = this.pending.filter(event => event.seq > calledNumbers.length).map(event => event.number);
+    this.state = {
+      ...this.state,
+      calledNumbers: [...calledNumbers, ...pendingNumbers],
+      upcoming: upcoming ?? this.state.upcoming,
+    };
+    await this.persist();
+  }
+
+  async cacheCartelas(cartelas: { cartelaNumber: number; pattern: number[][] }[]): Promise<void> {
+    const patterns: Record<number, number[][]> = {};
+    cartelas.forEach(cartela => {
+      patterns[cartela.cartelaNumber] = cartela.pattern;
+    });
+    this.state = { ...this.state, cartelas: patterns };
+    await this.persist();
+  }
+
+  /** Same result as POST /api/games/:id/check-winner, or null if the cartela is not cached. */
+  checkWinner(cartelaNumber: number, calledNumbers: number[] = this.state.calledNumbers): LocalWinResult | null {
+    const pattern = this.state.cartelas[cartelaNumber];
+    if (!pattern) return null;
+    return { ...findWinningLine(pattern, calledNumbers), cartelaPattern: pattern };
+  }
+
+  /** Fetches a fresh look-ahead window and the server's called list. */
+  async refresh(): Promise<void> {
+    const response = await fetch(`/api/games/${this.gameId}/draw-ahead`, { credentials: 'include' });
+    if (!response.ok) throw new Error(`draw-ahead failed: ${response.status}`);
+    const data = await response.json();
+    if (this.pending.length === 0) {
+      await this.adopt(data.calledNumbers, data.upcoming);
+    } else {
+      this.state = { ...this.state, upcoming: data.upcoming };
+      await this.persist();
+    }
+  }
+
+  /**
+   * Sends queued calls in order. Safe to call at any time; concurrent calls
+   * share one request and failures retry with backoff.
+   */
+  sync(): Promise<void> {
+    if (!this.syncing) {
+      this.syncing = this.flush().finally(() => {
+        this.syncing = null;
+      });
+    }
+    return this.syncing;
+  }
+
+  private async flush(): Promise<void> {
+    if (this.retryTimer) {
+      clearTimeout(this.retryTimer);
+      this.retryTimer = null;
+    }
+
+    try {
+      while (this.pending.length > 0) {
+        const batch = [...this.pending];
+        const response = await fetch(`/api/games/${this.gameId}/events`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          credentials: 'include',
+          body: JSON.stringify({ events: batch.map(({ seq, number }) => ({ seq, number })) }),
+        });
+        if (isRejected(response.status)) {
+          // Bad input, signed out or another shop's game: retrying cannot
+          // succeed, so the server's list replaces the queued calls
+          console.warn(`Game ${this.gameId}: server rejected ${batch.length} calls (${response.status}), dropping them`);
+          await this.dropPending();
+          await this.refresh().catch(error => console.warn(`Game ${this.gameId}: could not reload called numbers`, error));
+          this.listeners.forEach(listener => listener(this.state.calledNumbers));
+          return;
+        }
+        if (!response.ok && response.status !== 409) throw new Error(`sync failed: ${response.status}`);
+        const data = await response.json();
+
+        // Acknowledged or superseded, either way these events are done
+        const sent = new Set(batch.map(event => event.seq));
+        this.pending = this.pending.filter(event => !sent.has(event.seq));
+        await Promise.all(batch.map(event => withStore(EVENTS, 'readwrite', store => store.delete([event.gameId, event.seq]))));
+
+        if (data.conflict) {
+          // Another device called for this game; the server's list wins
+          await this.dropPending();
+          await this.adopt(data.calledNumbers, data.upcoming);
+          this.listeners.forEach(listener => listener(data.calledNumbers));
+        } else {
+          await this.adopt(data.calledNumbers, data.upcoming);
+        }
+      }
+
+      this.retryDelay = 1000;
+      if (this.state.upcoming.length < REFILL_BELOW) {
+        await this.refresh();
+      }
+    } catch (error) {
+      console.warn(`Game ${this.gameId}: ${this.pending.length} calls waiting to sync`, error);
+      this.retryTimer = setTimeout(() => this.sync(), this.retryDelay);
+      this.retryDelay = Math.min(this.retryDelay * 2, MAX_RETRY_DELAY);
+    }
+  }
+
+  private async dropPending(): Promise<void> {
+    this.pending = [];
+    await withStore(EVENTS, 'readwrite', store => store.delete(gameRange(this.gameId)));
+  }
+
+  private persist(): Promise<unknown> {
+    return withStore(GAMES, 'readwrite', store => store.put(this.state));
+  }
+}
+
+const sessions = new Map<number, Promise<GameSession>>();
+const restored = new Map<number, GameSession>();
+
+/**
+ * Whether calls for a game are still waiting to sync. While they are, the
+ * server's called list lags behind the board and must not replace it.
+ */
+export function hasPendingCalls(gameId: number): boolean {
+  return (restored.get(gameId)?.pendingCalls ?? 0) > 0;
+}
+
+/**
+ * The session for a game, restored from IndexedDB and refreshed from the
+ * server in the background on first use.
+ */
+export function getGameSession(gameId: number): Promise<GameSession> {
+  let session = sessions.get(gameId);
+  if (!session) {
+    session = (async () => {
+      const created = new GameSession(gameId);
+      await created.restore();
+      created.sync().catch(() => {});
+      created.refresh().catch(error => console.warn(`Game ${gameId}: using cached draw order`, error));
+      restored.set(gameId, created);
+      return created;
+    })();
+    sessions.set(gameId, session);
+  }
+  return session;
+}
+
+if (typeof window !== 'undefined') {
+  window.addEventListener('online', () => {
+    sessions.forEach(session => session.then(active => active.sync()));
+  });
+}
@@ -0,0 +1,126 @@
+import { useEffect, useState } from 'react';
+import type { QueryKey } from '@tanstack/react-query';
+import { queryClient } from './queryClient';
+
+// One shared /game-ws connection per tab carrying topic subscriptions
+// (see server/realtime.ts). The server pushes `{ type: 'invalidate', topic }`
+// after writes and subscribed components invalidate the matching queries,
+// so polling is only needed as a slow fallback while disconnected.
+
+// Polling intervals for queries that are also kept fresh by pushes
+export const LIVE_FALLBACK_INTERVAL = 30000;
+export const OFFLINE_POLL_INTERVAL = 3000;
+
+type TopicHandler = () => void;
+
+const handlers = new Map<string, Set<TopicHandler>>();
+const connectionListeners = new Set<(connected: boolean) => void>();
+let socket: WebSocket | null = null;
+let connected = false;
+let reconnectDelay = 1000;
+let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+
+function setConnected(value: boolean) {
+  connected = value;
+  connectionListeners.forEach(listener => listener(value));
+}
+
+function send(message: object) {
+  if (socket?.readyState === WebSocket.OPEN) {
+    socket.send(JSON.stringify(message));
+  }
+}
+
+function connect() {
+  if (socket || handlers.size === 0) return;
+
+  const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+  const ws = new WebSocket(`${protocol}//${window.location.host}/game-ws`);
+  socket = ws;
+
+  ws.onopen = () => {
+    reconnectDelay = 1000;
+    setConnected(true);
+    send({ type: 'subscribe', topics: [...handlers.keys()] });
+    // Anything could have changed while we were away
+    handlers.forEach(topicHandlers => topicHandlers.forEach(handler => handler()));
+  };
+
+  ws.onmessage = event => {
+    try {
+      const message = JSON.parse(event.data);
+      if (message.type === 'invalidate') {
+        handlers.get(message.topic)?.forEach(handler => handler());
+      }
+    } catch {
+      // Ignore frames meant for other listeners
+    }
+  };
+
+  ws.onclose = event => {
+    socket = null;
+    setConnected(false);
+    // 1012: the server is handing over to a new release, which is already up
+    const delay = event.code === 1012 ? 250 : reconnectDelay;
+    if (handlers.size > 0 && !reconnectTimer) {
+      reconnectTimer = setTimeout(() => {
+        reconnectTimer = null;
+        connect();
+      }, delay);
+      if (event.code !== 1012) reconnectDelay = Math.min(reconnectDelay * 2, 30000);
+    }
+  };
+}
+
+export function subscribeTopic(topic: string, handler: TopicHandler): () => void {
+  let topicHandlers = handlers.get(topic);
+  if (!topicHandlers) {
+    topicHandlers = new Set();
+    handlers.set(topic, topicHandlers);
+    send({ type: 'subscribe', topics: [topic] });
+  }
+  topicHandlers.add(handler);
+  connect();
+
+  return () => {
+    topicHandlers!.delete(handler);
+    if (topicHandlers!.size === 0) {
+      handlers.delete(topic);
+      send({ type: 'unsubscribe', topics: [topic] });
+    }
+    if (handlers.size === 0 && socket) {
+      socket.close();
+    }
+  };
+}
+
+/**
+ * Invalidates the given React Query keys whenever one of the topics is
+ * pushed. Returns whether the live connection is up, so callers can pick
+ * a polling interval: `refetchInterval: live ? LIVE_FALLBACK_INTERVAL : OFFLINE_POLL_INTERVAL`.
+ */
+export function useRealtimeInvalidation(topics: Record<string, QueryKey[]>): boolean {
+  const [live, setLive] = useState(connected);
+  // Stable dependency for the effect regardless of object identity
+  const signature = JSON.stringify(topics);
+
+  useEffect(() => {
+    connectionListeners.add(setLive);
+    setLive(connected);
+
+    const unsubscribers = Object.entries(topics)
+      .filter(([topic]) => !/:(undefined|null)$/.test(topic))
+      .map(([topic, queryKeys]) =>
+        subscribeTopic(topic, () => {
+          queryKeys.forEach(queryKey => queryClient.invalidateQueries({ queryKey }));
+        })
+      );
+
+    return () => {
+      connectionListeners.delete(setLive);
+      unsubscribers.forEach(unsubscribe => unsubscribe());
+    };
+  }, [signature]);
+
+  return live;
+}
@@ -0,0 +1,108 @@
+// Voice pack sprites built by tools/build_voice_sprites.py: each voice directory
+// is packed into one audio file, and the manifest maps clip names (B1 … O75,
+// start_game, winner, …) to offsets inside it. A sprite is fetched and decoded
+// once per session, after which a number is just a buffer source started at an
+// offset, with no network round trip or decode on the calling path.
+
+import { audioEngine, type PlaybackHandle, type PlayOptions } from './audio-engine';
+
+const MANIFEST_URL = '/voices/sprites/manifest.json';
+
+export interface SpriteClip {
+  start: number;
+  duration: number;
+}
+
+export interface VoiceSprite {
+  url: string;
+  clips: Record<string, SpriteClip>;
+}
+
+export interface VoiceSpriteManifest {
+  version: number;
+  voices: Record<string, VoiceSprite>;
+}
+
+export type SpritePlayback = PlaybackHandle;
+
+// Processed single clips from tools/voice_pipeline.py, keyed by voice then clip
+interface VoiceClipManifest {
+  version: number;
+  voices: Record<string, Record<string, { opus: string; mp3: string; duration: number }>>;
+}
+
+const CLIP_MANIFEST_URL = '/voices/dist/manifest.json';
+
+let manifestPromise: Promise<VoiceSpriteManifest | null> | null = null;
+let clipManifest: VoiceClipManifest | null = null;
+let clipManifestPromise: Promise<VoiceClipManifest | null> | null = null;
+
+export function loadVoiceClipManifest(): Promise<VoiceClipManifest | null> {
+  if (!clipManifestPromise) {
+    clipManifestPromise = fetch(CLIP_MANIFEST_URL)
+      .then(response => (response.ok ? response.json() : null))
+      .catch(() => null)
+      .then(manifest => (clipManifest = manifest));
+  }
+  return clipManifestPromise;
+}
+
+let opusSupported: boolean | null = null;
+
+/**
+ * Hashed URL of the processed clip for a voice, preferring Opus where the
+ * browser can play it. Returns null until the manifest has loaded or when
+ * the clip was never processed, so callers keep their original path.
+ */
+export function resolveVoiceClip(voice: string, clip: string): string | null {
+  const entry = clipManifest?.voices[voice]?.[clip];
+  if (!entry) return null;
+  if (opusSupported === null) {
+    opusSupported = new Audio().canPlayType('audio/webm; codecs="opus"') !== '';
+  }
+  return opusSupported ? entry.opus : entry.mp3;
+}
+
+export function loadVoiceManifest(): Promise<VoiceSpriteManifest | null> {
+  if (!manifestPromise) {
+    manifestPromise = fetch(MANIFEST_URL)
+      .then(response => (response.ok ? response.json() : null))
+      .catch(() => null);
+  }
+  return manifestPromise;
+}
+
+class VoiceSpritePlayer {
+  private manifest: VoiceSpriteManifest | null = null;
+
+  /**
+   * Fetches and decodes the sprite for a voice directory. Safe to call
+   * repeatedly; resolves to null when no sprite exists for the voice.
+   */
+  async preload(voice: string): Promise<AudioBuffer | null> {
+    const [manifest] = await Promise.all([loadVoiceManifest(), loadVoiceClipManifest()]);
+    this.manifest = manifest;
+    const sprite = this.manifest?.voices[voice];
+    return sprite ? audioEngine.load(sprite.url) : null;
+  }
+
+  isReady(voice: string, clip: string): boolean {
+    const sprite = this.manifest?.voices[voice];
+    return !!sprite?.clips[clip] && !!audioEngine.peek(sprite.url);
+  }
+
+  /**
+   * Plays one clip from an already decoded sprite. Returns null when the
+   * sprite is not loaded yet so callers can fall back to the plain file.
+   */
+  play(voice: string, clip: string, options: PlayOptions = {}): SpritePlayback | null {
+    const sprite = this.manifest?.voices[voice];
+    const entry = sprite?.clips[clip];
+    const buffer = sprite && audioEngine.peek(sprite.url);
+    if (!entry || !buffer) return null;
+
+    return audioEngine.start(buffer, { ...options, offset: entry.start, duration: entry.duration });
+  }
+}
+
+export const voiceSprites = new VoiceSpritePlayer();
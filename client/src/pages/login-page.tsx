@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
@@ -7,6 +7,7 @@ import { useLocation } from "wouter";
 import { useToast } from "@/hooks/use-toast";
 import { apiRequest } from "@/lib/queryClient";
 import { useMutation } from "@tanstack/react-query";
+import { preloadDashboard, preloadLastDashboard, rememberRole } from "@/lib/lazy-routes";
 
 export default function LoginPage() {
   const [username, setUsername] = useState("");
@@ -14,6 +15,10 @@ export default function LoginPage() {
   const [, setLocation] = useLocation();
   const { toast } = useToast();
 
+  useEffect(() => {
+    preloadLastDashboard();
+  }, []);
+
   const loginMutation = useMutation({
     mutationFn: async (credentials: { username: string; password: string }) => {
       console.log("Attempting login with:", { username: credentials.username, password: "***" });
@@ -24,6 +29,8 @@ export default function LoginPage() {
     },
     onSuccess: (data: any) => {
       const user = data.user;
+      rememberRole(user.role);
+      preloadDashboard(user.role);
       toast({
         title: "Login successful",
         description: `Welcome back, ${user.name}!`,
@@ -135,6 +135,11 @@ const GameSchema = new mongoose.Schema({
   createdAt: { type: Date, default: Date.now }
 });
 
+UserSchema.index({ role: 1, createdAt: -1 });
+UserSchema.index({ shopId: 1, role: 1 });
+CartelaSchema.index({ isActive: 1, createdAt: 1 });
+GameSchema.index({ isActive: 1, createdAt: -1 });
+
 const User = mongoose.model('User', UserSchema);
 const Shop = mongoose.model('Shop', ShopSchema);
 const Cartela = mongoose.model('Cartela', CartelaSchema);
@@ -152,11 +157,16 @@ async function connectMongoDB() {
     if (!process.env.MONGODB_URI) {
       throw new Error('MONGODB_URI environment variable required');
     }
-    await mongoose.connect(process.env.MONGODB_URI);
+    await mongoose.connect(process.env.MONGODB_URI, {
+      maxPoolSize: Number(process.env.MONGODB_MAX_POOL_SIZE) || 50,
+      minPoolSize: Number(process.env.MONGODB_MIN_POOL_SIZE) || 5,
+      maxIdleTimeMS: 60000,
+      serverSelectionTimeoutMS: 5000
+    });
     console.log('🍃 MongoDB connected successfully');
     
     // Create super admin if not exists
-    const superAdmin = await User.findOne({ username: 'superadmin' });
+    const superAdmin = await User.exists({ username: 'superadmin' });
     if (!superAdmin) {
       const hashedPassword = await bcrypt.hash('password', 10);
       await User.create({
@@ -245,7 +255,9 @@ const requireRole = (roles) => (req, res, next) => {
 app.post('/api/auth/login', async (req, res) => {
   try {
     const { username, password } = req.body;
-    const user = await User.findOne({ username }).populate('shopId');
+    const user = await User.findOne({ username })
+      .select('username password role name email shopId creditBalance')
+      .lean();
     
     if (!user || !await bcrypt.compare(password, user.password)) {
       return res.status(401).json({ message: 'Invalid credentials' });
@@ -257,7 +269,7 @@ app.post('/api/auth/login', async (req, res) => {
       role: user.role,
       name: user.name,
       email: user.email,
-      shopId: user.shopId?._id,
+      shopId: user.shopId,
       creditBalance: user.creditBalance
     };
 
@@ -313,7 +325,9 @@ app.post('/api/super-admin/admins', requireAuth, requireRole(['super_admin']), a
 
 app.get('/api/super-admin/admins', requireAuth, requireRole(['super_admin']), async (req, res) => {
   try {
-    const admins = await User.find({ role: 'admin' }).select('-password');
+    const admins = await User.find({ role: 'admin' })
+      .select('username role name email isBlocked shopId creditBalance accountNumber commissionRate createdAt')
+      .lean();
     res.json(admins);
   } catch (error) {
     res.status(500).json({ message: 'Failed to get admins' });
@@ -323,7 +337,9 @@ app.get('/api/super-admin/admins', requireAuth, requireRole(['super_admin']), as
 // Cartela routes
 app.get('/api/cartelas', requireAuth, async (req, res) => {
   try {
-    const cartelas = await Cartela.find({ isActive: true });
+    const cartelas = await Cartela.find({ isActive: true })
+      .select('name numbers price isActive createdAt')
+      .lean();
     res.json(cartelas);
   } catch (error) {
     res.status(500).json({ message: 'Failed to get cartelas' });
@@ -348,7 +364,10 @@ app.post('/api/cartelas', requireAuth, requireRole(['super_admin', 'admin']), as
 // Game routes
 app.get('/api/games/active', async (req, res) => {
   try {
-    const game = await Game.findOne({ isActive: true });
+    const game = await Game.findOne({ isActive: true })
+      .select('name calledNumbers isActive createdBy createdAt')
+      .sort({ createdAt: -1 })
+      .lean();
     res.json(game || null);
   } catch (error) {
     res.status(500).json({ message: 'Failed to get active game' });
@@ -0,0 +1,26 @@
+"""BingoMaster deploy tool.
+
+One SSH connection per host, multiplexed for every command and transfer
+of a deploy, replacing the per-task *-vps-*.py scripts.
+
+    python3 -m deploy status
+    python3 -m deploy deploy [--skip-build] [--verify]
+    python3 -m deploy diff
+    python3 -m deploy releases
+    python3 -m deploy rollback [--to <id>]
+    python3 -m deploy run "df -h"
+    python3 -m deploy logs -n 200
+    python3 -m deploy restart
+    python3 -m deploy smoke
+
+The host is configured through DEPLOY_HOST, DEPLOY_USER, DEPLOY_APP_DIR,
+DEPLOY_SERVICE, DEPLOY_PORT (the pre blue/green service) and
+DEPLOY_BLUE_PORT/DEPLOY_GREEN_PORT. With DEPLOY_PASSWORD set, sshpass is used
+for the first login; otherwise the usual SSH keys and agent apply.
+
+With --fleet (or DEPLOY_FLEET) pointing at an inventory like
+fleet.example.json, every command fans out over the hosts, narrowed with
+--only <names or regions>, --parallel hosts at a time and an optional
+--host-timeout, and ends with a per-host result table. A deploy builds once
+locally and ships the same release id everywhere.
+"""
@@ -0,0 +1,258 @@
+"""Command line entry point: python3 -m deploy <command>."""
+import argparse
+import os
+import shlex
+import subprocess
+import time
+
+from deploy.config import host_from_env, load_inventory
+from deploy.cutover import Cutover
+from deploy.release import NODE_PLATFORM, Releases, release_id
+from deploy.fleet import DEFAULT_PARALLEL, print_table, run_fleet
+from deploy.ssh import RemoteError
+from deploy.sync import Tree, print_summary, sync_trees
+from deploy.timing import StepTimer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIST_DIR = os.path.join(REPO_ROOT, "dist")
+PACKAGE_FILES = ["package.json", "package-lock.json"]
+
+
+def deploy_trees(host, release_dir):
+    """What a deploy ships; dist/ holds index.js and public/, which the unit runs from `current`.
+    The voice packs in public/voices are not part of the client build; releases see them as media/voices"""
+    return [
+        Tree("app", DIST_DIR, release_dir),
+        Tree("package", REPO_ROOT, release_dir, PACKAGE_FILES),
+        Tree("assets", os.path.join(REPO_ROOT, "attached_assets"), f"{host.app_dir}/shared/attached_assets"),
+        Tree("voices", os.path.join(REPO_ROOT, "public", "voices"), f"{host.app_dir}/shared/voices"),
+    ]
+
+
+def status_probes(host):
+    """Independent read-only checks, safe to run as parallel channels"""
+    app_dir = shlex.quote(host.app_dir)
+    return {
+        "slot": f"cat {app_dir}/active-slot",
+        "service": f"systemctl is-active {host.service}@$(cat {app_dir}/active-slot)",
+        "release": f"basename $(readlink {app_dir}/current)",
+        "nginx": "systemctl is-active nginx",
+        "ready": "curl -s -o /dev/null -w '%{http_code}' --max-time 5 http://127.0.0.1/api/health/ready | grep -x 200",
+        "disk": f"df -h {app_dir} | awk 'NR==2 {{print $4\" free of \"$2}}'",
+        "memory": "free -m | awk '/^Mem:/ {print $7\" MB available of \"$2\" MB\"}'",
+        "uptime": "uptime -p",
+    }
+
+
+def report_cutover(host, result, timer):
+    if result.ok:
+        print(f"✅ {host.name}: {result.release} live on {result.slot}, "
+              f"{result.drained_from} WebSocket clients drained, {result.connected_after} connected")
+    else:
+        print(f"❌ {host.name}: {result.detail}; traffic stays on the previous release")
+    timer.report()
+    return 0 if result.ok else 1
+
+
+def cmd_status(session, args):
+    results = session.run_parallel(status_probes(session.host))
+    print(f"📊 {session.host.name}")
+    for name, result in results.items():
+        value = result.stdout.strip() or result.stderr.strip()
+        icon = "✅" if result.ok else "❌"
+        print(f"   {icon} {name.ljust(10)} {value}")
+    return 0 if all(result.ok for result in results.values()) else 1
+
+
+def cmd_run(session, args):
+    result = session.run(args.command, timeout=args.timeout)
+    print(result.stdout, end="")
+    if result.stderr:
+        print(result.stderr, end="")
+    return result.code
+
+
+def cmd_logs(session, args):
+    service = session.host.service
+    result = session.run(f"journalctl -u {service}@blue -u {service}@green -n {args.lines} --no-pager")
+    print(result.stdout, end="")
+    return result.code
+
+
+def cmd_restart(session, args):
+    """Restart without downtime: the active release is started on the other slot and cut over to"""
+    releases = Releases(session)
+    current = releases.current()
+    if not current:
+        print("❌ No active release, run deploy first")
+        return 1
+    timer = StepTimer()
+    return report_cutover(session.host, Cutover(session, releases).run(current, timer), timer)
+
+
+def prepare_deploy(args):
+    """Local work done once, however many hosts the release goes to"""
+    args.release = release_id()
+    if not args.skip_build:
+        print("▶️  build")
+        subprocess.run(["npm", "run", "build"], cwd=REPO_ROOT, check=True)
+    if not os.path.exists(os.path.join(DIST_DIR, "index.js")):
+        raise SystemExit("❌ dist/index.js missing, run npm run build first")
+
+
+def cmd_deploy(session, args):
+    host = session.host
+    releases = Releases(session)
+    release = args.release
+    timer = StepTimer()
+
+    with timer.step("connect"):
+        session.open()
+
+    with timer.step("prechecks"):
+        app_dir = shlex.quote(host.app_dir)
+        checks = session.run_parallel({
+            "node": NODE_PLATFORM,
+            "app dir": f"mkdir -p {app_dir}",
+            "disk": f"test $(df --output=avail -k {app_dir} | tail -1) -gt 512000",
+            "current": f"readlink {app_dir}/current || true",
+        })
+        failed = [name for name, result in checks.items() if not result.ok]
+        if failed:
+            print(f"❌ Prechecks failed: {', '.join(failed)}")
+            return 1
+        platform = checks["node"].stdout.strip()
+        base = os.path.basename(checks["current"].stdout.strip()) or None
+
+    with timer.step("dependencies"):
+        deps_key, how = releases.ensure_deps(REPO_ROOT, REPO_ROOT, platform)
+    print(f"   📦 deps {deps_key}: {how}")
+
+    with timer.step("stage release"):
+        releases.stage(release, deps_key, base)
+        synced = sync_trees(session, deploy_trees(host, releases.path("releases", release)), REPO_ROOT, verify=args.verify)
+        releases.write_metadata(release, deps_key)
+    print_summary(synced)
+
+    result = Cutover(session, releases).run(release, timer)
+    if result.ok:
+        with timer.step("prune"):
+            pruned = releases.prune()
+        if pruned:
+            print(f"   🧹 removed {', '.join(pruned)}")
+    code = report_cutover(host, result, timer)
+    if code == 0 and args.smoke:
+        return cmd_smoke(session, args)
+    return code
+
+
+def cmd_rollback(session, args):
+    releases = Releases(session)
+    current = releases.current()
+    target = args.to or releases.previous(current)
+    if not target or target not in releases.list():
+        print(f"❌ No release to roll back to (active: {current})")
+        return 1
+    print(f"↩️  {current} -> {target}")
+    timer = StepTimer()
+    return report_cutover(session.host, Cutover(session, releases).run(target, timer), timer)
+
+
+def cmd_smoke(session, args):
+    # Imported here so the SSH commands keep working without requests installed
+    from deploy.smoke import run as run_smoke
+    return 0 if run_smoke(f"http://{session.host.address}", record=args.record) else 1
+
+
+def cmd_releases(session, args):
+    releases = Releases(session)
+    current = releases.current()
+    for name in releases.list():
+        print(f"{'→' if name == current else ' '} {name}")
+    return 0
+
+
+def cmd_diff(session, args):
+    """What the next deploy would send, compared with the active release"""
+    releases = Releases(session)
+    current = releases.current()
+    release_dir = releases.path("releases", current) if current else "/nonexistent"
+    synced = sync_trees(session, deploy_trees(session.host, release_dir), REPO_ROOT, verify=args.verify, dry_run=True)
+    print_summary(synced)
+    for result in synced:
+        for path in result.changed:
+            print(f"     + {result.tree}/{path}")
+        for path in result.deleted:
+            print(f"     - {result.tree}/{path}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python3 -m deploy", description="Deploy and operate BingoMaster hosts")
+    parser.add_argument("--host", help="Host address (defaults to DEPLOY_HOST)")
+    parser.add_argument("--fleet", default=os.environ.get("DEPLOY_FLEET"),
+                        help="Fleet inventory JSON (defaults to DEPLOY_FLEET); see fleet.example.json")
+    parser.add_argument("--only", help="Comma separated host names or regions from the inventory")
+    parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLEL, help="Hosts worked on at once")
+    parser.add_argument("--host-timeout", type=int, help="Seconds before a host is given up on")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help="Service, port, nginx, HTTP and resource checks").set_defaults(func=cmd_status)
+
+    run = commands.add_parser("run", help="Run a shell command on the host")
+    run.add_argument("command")
+    run.add_argument("--timeout", type=int, default=300)
+    run.set_defaults(func=cmd_run)
+
+    logs = commands.add_parser("logs", help="Show recent service logs")
+    logs.add_argument("-n", "--lines", type=int, default=100)
+    logs.set_defaults(func=cmd_logs)
+
+    commands.add_parser("restart", help="Restart the active release through a blue/green cutover").set_defaults(func=cmd_restart)
+
+    deploy = commands.add_parser("deploy", help="Build, stage a release and cut over to it once it is ready")
+    deploy.add_argument("--skip-build", action="store_true", help="Upload the existing dist/ as is")
+    deploy.add_argument("--verify", action="store_true", help="Rehash remote files instead of trusting the stored manifest")
+    deploy.add_argument("--smoke", action="store_true", help="Run the smoke suite against the host after the cutover")
+    deploy.set_defaults(func=cmd_deploy, prepare=prepare_deploy, record=False)
+
+    diff = commands.add_parser("diff", help="List what the next deploy would send")
+    diff.add_argument("--verify", action="store_true", help="Rehash remote files instead of trusting the stored manifest")
+    diff.set_defaults(func=cmd_diff)
+
+    rollback = commands.add_parser("rollback", help="Reactivate the previous release")
+    rollback.add_argument("--to", help="Release id to activate instead of the previous one")
+    rollback.set_defaults(func=cmd_rollback)
+
+    commands.add_parser("releases", help="List releases on the host").set_defaults(func=cmd_releases)
+
+    smoke = commands.add_parser("smoke", help="Run the smoke suite against the host through nginx")
+    smoke.add_argument("--record", action="store_true", help="Write measured latencies as the new budgets")
+    smoke.set_defaults(func=cmd_smoke)
+    return parser
+
+
+def handle_errors(call):
+    try:
+        return call()
+    except (ConnectionError, RemoteError, subprocess.CalledProcessError) as e:
+        print(f"❌ {e}")
+        return 1
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.fleet and not args.host:
+        hosts = load_inventory(args.fleet, args.only.split(",") if args.only else None)
+    else:
+        hosts = [host_from_env(args.host)]
+
+    prepare = getattr(args, "prepare", None)
+    if prepare and handle_errors(lambda: prepare(args)):
+        return 1
+
+    start = time.monotonic()
+    results = run_fleet(hosts, args.func, args, handle_errors, args.parallel, args.host_timeout)
+    if len(results) > 1:
+        print_table(results, time.monotonic() - start)
+    return 0 if all(result.ok for result in results) else 1
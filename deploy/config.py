@@ -0,0 +1,79 @@
+"""Deploy target settings: a single host from DEPLOY_* variables or a fleet inventory."""
+import json
+import os
+from dataclasses import dataclass, fields
+
+
+@dataclass
+class Host:
+    name: str
+    address: str
+    user: str = "root"
+    # Only used for the first login of a session, passed to sshpass via SSHPASS
+    password: str | None = None
+    app_dir: str = "/var/www/bingomaster"
+    service: str = "bingomaster"
+    # Port of the pre blue/green single service, drained on the first cutover
+    port: int = 5000
+    # Blue/green slots run side by side on these ports; nginx points at one of them
+    blue_port: int = 5001
+    green_port: int = 5002
+    region: str = ""
+
+    @property
+    def target(self):
+        return f"{self.user}@{self.address}"
+
+
+def host_from_env(address=None):
+    """Build the deploy target from DEPLOY_* environment variables"""
+    address = address or os.environ.get("DEPLOY_HOST")
+    if not address:
+        raise SystemExit("❌ No host: set DEPLOY_HOST or pass --host")
+    return Host(
+        name=address,
+        address=address,
+        user=os.environ.get("DEPLOY_USER", "root"),
+        password=os.environ.get("DEPLOY_PASSWORD") or None,
+        app_dir=os.environ.get("DEPLOY_APP_DIR", "/var/www/bingomaster"),
+        service=os.environ.get("DEPLOY_SERVICE", "bingomaster"),
+        port=int(os.environ.get("DEPLOY_PORT", "5000")),
+        blue_port=int(os.environ.get("DEPLOY_BLUE_PORT", "5001")),
+        green_port=int(os.environ.get("DEPLOY_GREEN_PORT", "5002")),
+    )
+
+
+def load_inventory(path, only=None):
+    """Hosts from a fleet inventory, optionally narrowed to names or regions.
+
+    {"defaults": {"user": "root"},
+     "hosts": [{"name": "addis-1", "address": "203.0.113.10", "region": "addis",
+                "password_env": "ADDIS_1_PASSWORD"}]}
+
+    Passwords never live in the file: password_env names the environment
+    variable to read, falling back to DEPLOY_PASSWORD.
+    """
+    with open(path) as f:
+        inventory = json.load(f)
+    known = {field.name for field in fields(Host)}
+    defaults = inventory.get("defaults", {})
+    hosts = []
+    for entry in inventory.get("hosts", []):
+        merged = {**defaults, **entry}
+        password_env = merged.pop("password_env", None)
+        unknown = set(merged) - known
+        if unknown:
+            raise SystemExit(f"❌ {path}: unknown host settings {', '.join(sorted(unknown))}")
+        merged.setdefault("name", merged.get("address"))
+        merged["password"] = os.environ.get(password_env or "DEPLOY_PASSWORD") or None
+        hosts.append(Host(**merged))
+
+    names = [host.name for host in hosts]
+    if len(set(names)) != len(names):
+        raise SystemExit(f"❌ {path}: host names must be unique")
+    if only:
+        wanted = set(only)
+        hosts = [host for host in hosts if host.name in wanted or host.region in wanted]
+        if not hosts:
+            raise SystemExit(f"❌ No host or region in {path} matches {', '.join(only)}")
+    return hosts
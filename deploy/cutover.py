@@ -0,0 +1,245 @@
+"""Health-gated blue/green cutover.
+
+Two systemd instances, <service>@blue and <service>@green, each run the
+release their symlink points at, on their own port. A cutover:
+
+  1. points the idle slot at the new release and starts it beside the live one,
+  2. polls /api/health/ready on the idle port until it reports ready
+     (database reachable, warmups done); on timeout it stops there and the
+     live slot keeps serving,
+  3. rewrites the nginx upstream to the new port and reloads gracefully,
+     so in-flight requests finish on the old workers,
+  4. stops the old slot, which closes its WebSockets with 1012 so clients
+     reconnect through nginx to the new one, and watches them move over.
+
+The first cutover on a host also retires the single pre blue/green service.
+"""
+import json
+import shlex
+import time
+from dataclasses import dataclass
+
+from deploy.ssh import RemoteError
+
+SLOTS = ("blue", "green")
+# Site names the deploy scripts before blue/green enabled, all proxying to a fixed port
+LEGACY_NGINX_SITES = ("bingomaster", "bingomaster-mongo", "bingo-app", "aradabingo")
+READY_TIMEOUT = 90
+DRAIN_TIMEOUT = 45
+
+# Installed only when no enabled site routes to the upstream yet; never rewritten after that
+NGINX_SITE = """# Installed by python3 -m deploy; the upstream lives in conf.d/{service}-upstream.conf
+server {{
+    listen 80 default_server;
+    server_name _;
+    client_max_body_size 10m;
+
+    location / {{
+        proxy_pass http://{service}_app;
+        proxy_http_version 1.1;
+        proxy_set_header Upgrade $http_upgrade;
+        proxy_set_header Connection $connection_upgrade;
+        proxy_set_header Host $host;
+        proxy_set_header X-Real-IP $remote_addr;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto $scheme;
+        proxy_read_timeout 3600s;
+    }}
+}}
+"""
+
+NGINX_UPSTREAM = """# Managed by python3 -m deploy: active slot {slot}
+map $http_upgrade $connection_upgrade {{
+    default upgrade;
+    ''      '';
+}}
+
+upstream {service}_app {{
+    server 127.0.0.1:{port};
+    keepalive 32;
+}}
+"""
+
+UNIT_TEMPLATE = """[Unit]
+Description=BingoMaster ({app_dir}/%i)
+After=network.target
+
+[Service]
+Type=simple
+WorkingDirectory={app_dir}/%i
+EnvironmentFile=-{app_dir}/.env
+EnvironmentFile={app_dir}/%i.env
+Environment=NODE_ENV=production
+ExecStart=/usr/bin/env node {app_dir}/%i/index.js
+Restart=always
+RestartSec=2
+KillSignal=SIGTERM
+TimeoutStopSec={stop_timeout}
+
+[Install]
+WantedBy=multi-user.target
+"""
+
+
+@dataclass
+class CutoverResult:
+    release: str
+    slot: str
+    ok: bool
+    detail: str = ""
+    drained_from: int = 0
+    connected_after: int = 0
+
+
+class Cutover:
+    """Blue/green activation for one host"""
+
+    def __init__(self, session, releases):
+        self.session = session
+        self.releases = releases
+        self.host = session.host
+        self.service = self.host.service
+
+    def port(self, slot):
+        return self.host.blue_port if slot == "blue" else self.host.green_port
+
+    def unit(self, slot):
+        return f"{self.service}@{slot}"
+
+    def active_slot(self):
+        result = self.session.run(f"cat {self.releases.q('active-slot')} 2>/dev/null")
+        slot = result.stdout.strip()
+        return slot if slot in SLOTS else None
+
+    def _write_if_changed(self, path, content, after):
+        """Write a root-owned config file; runs `after` only when the content changed"""
+        quoted = shlex.quote(path)
+        if self.session.run(f"cat {quoted} 2>/dev/null").stdout == content:
+            return False
+        self.session.run(f"cat > {quoted}.tmp && mv {quoted}.tmp {quoted} && {after}", check=True, stdin=content)
+        return True
+
+    def ensure_unit(self):
+        unit = UNIT_TEMPLATE.format(app_dir=self.releases.root, stop_timeout=DRAIN_TIMEOUT)
+        self._write_if_changed(f"/etc/systemd/system/{self.service}@.service", unit, "systemctl daemon-reload")
+
+    def ensure_nginx_site(self):
+        """Route an enabled site to the {service}_app upstream, leaving TLS blocks and unrelated sites alone"""
+        enabled = "/etc/nginx/sites-enabled"
+        proxy = f"proxy_pass http://{self.service}_app;"
+        routed = f"grep -RlsF {shlex.quote(proxy)} {enabled} >/dev/null"
+        # A site already on the upstream stays as it is, including certbot's edits
+        if self.session.run(routed).ok:
+            return
+
+        # Sites of the old deploy scripts proxy to a fixed port; switching them
+        # over in place keeps the TLS server blocks certbot added to them
+        rewrite = shlex.quote(r"s#proxy_pass http://(localhost|127\.0\.0\.1):[0-9]+;#" + proxy + "#")
+        legacy = " ".join(shlex.quote(f"{enabled}/{name}") for name in LEGACY_NGINX_SITES)
+        self.session.run(
+            f"for site in {legacy}; do if [ -e $site ]; then sed --follow-symlinks -i -E {rewrite} $site; fi; done"
+            f" && rm -f {enabled}/default",
+            check=True,
+        )
+        if self.session.run(routed).ok:
+            return
+
+        site = f"/etc/nginx/sites-available/{self.service}-app"
+        self._write_if_changed(site, NGINX_SITE.format(service=self.service), f"ln -sfn {shlex.quote(site)} {enabled}/")
+
+    def switch_upstream(self, slot):
+        """Point nginx at a slot and reload gracefully, restoring the old upstream if the config is rejected"""
+        path = shlex.quote(f"/etc/nginx/conf.d/{self.service}-upstream.conf")
+        content = NGINX_UPSTREAM.format(service=self.service, slot=slot, port=self.port(slot))
+        self.session.run(f"cp -a {path} {path}.prev 2>/dev/null; cat > {path}", check=True, stdin=content)
+        self.ensure_nginx_site()
+        # reload starts new workers on the new upstream; old ones finish their requests first
+        result = self.session.run("nginx -t -q && systemctl reload nginx")
+        if not result.ok:
+            self.session.run(f"mv {path}.prev {path} && nginx -t -q && systemctl reload nginx")
+            raise RemoteError(self.host.name, result)
+
+    def start(self, slot, release):
+        """Point a slot at a release and (re)start it; the slot must not be receiving traffic"""
+        self.releases.link(slot, release)
+        self.session.run(
+            f"echo PORT={self.port(slot)} > {self.releases.q(slot + '.env')}"
+            f" && systemctl restart {self.unit(slot)}",
+            check=True,
+        )
+
+    def wait_ready(self, port, timeout=READY_TIMEOUT):
+        """Poll the readiness endpoint; returns (ready, last response body)"""
+        url = f"http://127.0.0.1:{port}/api/health/ready"
+        deadline = time.monotonic() + timeout
+        body = ""
+        while time.monotonic() < deadline:
+            result = self.session.run(f"curl -s --max-time 3 -w '\\n%{{http_code}}' {url}")
+            body, _, code = result.stdout.rpartition("\n")
+            if code == "200":
+                return True, body
+            time.sleep(0.5)
+        return False, body or "no answer"
+
+    def ws_connections(self, port):
+        """Open WebSockets on a port from /api/metrics, or None when nothing answers"""
+        env = self.releases.q(".env")
+        result = self.session.run(
+            f"tok=$(grep -s '^METRICS_TOKEN=' {env} | cut -d= -f2-); "
+            f"curl -sf --max-time 2 ${{tok:+-H \"Authorization: Bearer $tok\"}} http://127.0.0.1:{port}/api/metrics"
+            " | awk '$1 == \"ws_connections_active\" {print $2}'"
+        )
+        value = result.stdout.strip()
+        return int(float(value)) if result.ok and value else None
+
+    def drain(self, unit, old_port, new_port, timeout=DRAIN_TIMEOUT):
+        """Stop the old process and wait for its WebSocket clients to reach the new one"""
+        before = self.ws_connections(old_port) or 0
+        self.session.run(f"systemctl stop --no-block {unit} && systemctl disable -q {unit} 2>/dev/null; true")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.session.run(f"systemctl is-active -q {unit}").code != 0:
+                break
+            time.sleep(0.5)
+        return before, self.ws_connections(new_port) or 0
+
+    def run(self, release, timer):
+        """Cut traffic over to `release`; the live slot is untouched unless the new one is ready"""
+        live = self.active_slot()
+        slot = "green" if live == "blue" else "blue"
+        port = self.port(slot)
+
+        with timer.step(f"start {slot} on :{port}"):
+            self.ensure_unit()
+            self.start(slot, release)
+        with timer.step("readiness"):
+            ready, body = self.wait_ready(port)
+        if not ready:
+            self.session.run(f"systemctl stop {self.unit(slot)}")
+            return CutoverResult(release, slot, False, f"{slot} never became ready: {body}")
+
+        with timer.step("switch nginx"):
+            self.switch_upstream(slot)
+            through_nginx = self.session.run(
+                "curl -s -o /dev/null -w '%{http_code}' --max-time 5 http://127.0.0.1/api/health/ready"
+            ).stdout.strip()
+            if through_nginx != "200":
+                # Put traffic back where it was; the new slot keeps running for inspection
+                if live:
+                    self.switch_upstream(live)
+                return CutoverResult(release, slot, False, f"nginx answered {through_nginx} after the switch")
+            self.session.run(
+                f"echo {slot} > {self.releases.q('active-slot')} && systemctl enable -q {self.unit(slot)}",
+                check=True,
+            )
+            self.releases.link("current", release)
+
+        with timer.step("drain old"):
+            if live:
+                drained, connected = self.drain(self.unit(live), self.port(live), port)
+            else:
+                # First cutover on this host: retire the single-instance service
+                drained, connected = self.drain(self.service, self.host.port, port)
+
+        status = json.loads(body) if body.startswith("{") else {}
+        return CutoverResult(release, slot, True, status.get("status", "ready"), drained, connected)
@@ -0,0 +1,121 @@
+"""Fan a command out over many hosts.
+
+Each host gets its own SSHSession and runs on a worker of a bounded pool,
+so a fleet operation takes about as long as its slowest host rather than
+the sum of all of them. Output lines are prefixed with the host name as
+they are printed, and an aggregated table is printed at the end. A host
+that runs past its timeout has its SSH connection torn down, which fails
+whatever it was doing on that host without affecting the others.
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from deploy.ssh import SSHSession
+
+DEFAULT_PARALLEL = 4
+
+
+@dataclass
+class HostResult:
+    host: str
+    code: int
+    seconds: float
+    summary: str = ""
+    timed_out: bool = False
+
+    @property
+    def ok(self):
+        return self.code == 0 and not self.timed_out
+
+
+class _PrefixedOutput:
+    """Stand-in for sys.stdout that tags each line with the current thread's host"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.last_lines = {}
+
+    def bind(self, name):
+        self.local.name = name
+        self.local.partial = ""
+
+    def write(self, text):
+        name = getattr(self.local, "name", None)
+        if name is None:
+            return self.stream.write(text)
+        lines = (self.local.partial + text).split("\n")
+        self.local.partial = lines.pop()
+        with self.lock:
+            for line in lines:
+                self.stream.write(f"[{name}] {line}\n")
+                if line.strip():
+                    self.last_lines[name] = line.strip()
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_fleet(hosts, func, args, on_error, parallel=DEFAULT_PARALLEL, timeout=None):
+    """Run func(session, args) on every host; returns one HostResult per host in inventory order"""
+    if len(hosts) == 1:
+        # A single host keeps the plain, unprefixed output
+        session = SSHSession(hosts[0])
+        start = time.monotonic()
+        try:
+            code = on_error(lambda: func(session, args))
+        finally:
+            session.close()
+        return [HostResult(hosts[0].name, code, time.monotonic() - start)]
+
+    output = _PrefixedOutput(sys.stdout)
+
+    def on_host(host):
+        output.bind(host.name)
+        session = SSHSession(host)
+        timed_out = threading.Event()
+
+        def expire():
+            output.bind(host.name)
+            timed_out.set()
+            print(f"⏰ timed out after {timeout}s")
+            session.abort()
+
+        watchdog = threading.Timer(timeout, expire) if timeout else None
+        if watchdog:
+            watchdog.daemon = True
+            watchdog.start()
+        start = time.monotonic()
+        try:
+            code = on_error(lambda: func(session, args))
+        finally:
+            if watchdog:
+                watchdog.cancel()
+            session.close()
+        return HostResult(host.name, code, time.monotonic() - start,
+                          output.last_lines.get(host.name, ""), timed_out.is_set())
+
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(parallel, len(hosts)))) as pool:
+            return list(pool.map(on_host, hosts))
+    finally:
+        sys.stdout = output.stream
+
+
+def print_table(results, total_seconds):
+    width = max(len(result.host) for result in results)
+    print(f"\n{'host'.ljust(width)}  status     time  summary")
+    for result in results:
+        status = "timeout" if result.timed_out else "ok" if result.ok else f"exit {result.code}"
+        icon = "✅" if result.ok else "❌"
+        print(f"{result.host.ljust(width)}  {icon} {status:<7} {result.seconds:6.1f}s  {result.summary[:80]}")
+    failed = sum(not result.ok for result in results)
+    serial = sum(result.seconds for result in results)
+    print(f"\n{len(results) - failed}/{len(results)} hosts ok in {total_seconds:.1f}s "
+          f"(sequential would take about {serial:.1f}s)")
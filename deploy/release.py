@@ -0,0 +1,161 @@
+"""Build-once releases with atomic activation.
+
+Layout under the app directory on each host:
+
+    releases/<id>/      index.js, public/, package*.json, RELEASE.json
+                        node_modules -> ../../deps/<key>/node_modules
+                        attached_assets -> ../../shared/attached_assets
+                        media/voices -> ../../../shared/voices
+    deps/<key>/         pruned production node_modules for one lockfile
+    shared/             files that outlive releases (attached_assets, voices)
+    blue, green -> releases/<id>
+    current -> releases/<id>    the release nginx sends traffic to
+
+Each slot is a systemd instance running from its symlink (see cutover.py),
+so activating a release is a symlink flip plus a start, and rolling back is
+the same cutover to an older release.
+
+A new release starts as a hard-link copy of the current one and then gets
+the delta sync, so unchanged files cost neither upload nor disk space.
+Dependencies are keyed by lockfile hash and platform; they are built once,
+locally when the host matches this machine and on the host otherwise, and
+reused by every release with the same lockfile.
+"""
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+
+KEEP_RELEASES = 5
+# Hosts of one fleet deploy share the locally built node_modules
+_local_deps_lock = threading.Lock()
+NODE_PLATFORM = "node -p \"process.platform + '-' + process.arch + '-abi' + process.versions.modules\""
+
+
+def release_id():
+    """Sortable id: UTC timestamp plus the git commit when available"""
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+    commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+    return f"{stamp}-{commit.stdout.strip()}" if commit.returncode == 0 else stamp
+
+
+def lockfile_hash(repo_root):
+    with open(os.path.join(repo_root, "package-lock.json"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def local_platform():
+    result = subprocess.run(NODE_PLATFORM, shell=True, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+class Releases:
+    """Release operations for one host over an open SSHSession"""
+
+    def __init__(self, session):
+        self.session = session
+        self.root = session.host.app_dir.rstrip("/")
+
+    def path(self, *parts):
+        return "/".join([self.root, *parts])
+
+    def q(self, *parts):
+        return shlex.quote(self.path(*parts))
+
+    def list(self):
+        result = self.session.run(f"ls -1 {self.q('releases')} 2>/dev/null")
+        return sorted(line for line in result.stdout.split() if line)
+
+    def current(self):
+        result = self.session.run(f"readlink {self.q('current')}")
+        return os.path.basename(result.stdout.strip()) if result.ok and result.stdout.strip() else None
+
+    def remote_platform(self):
+        result = self.session.run(NODE_PLATFORM)
+        return result.stdout.strip() if result.ok else None
+
+    def ensure_deps(self, repo_root, cache_root, platform):
+        """Make deps/<key>/node_modules exist on the host and return the key"""
+        key = f"{lockfile_hash(repo_root)}-{platform}"
+        deps = self.q("deps", key)
+        if self.session.run(f"test -d {deps}/node_modules").ok:
+            return key, "reused"
+
+        staging = self.path("deps", f"{key}.tmp")
+        self.session.run(f"rm -rf {shlex.quote(staging)} && mkdir -p {shlex.quote(staging)}", check=True)
+        if platform == local_platform():
+            local = os.path.join(cache_root, ".deploy-cache", "deps", key)
+            with _local_deps_lock:
+                if not os.path.isdir(os.path.join(local, "node_modules")):
+                    os.makedirs(local, exist_ok=True)
+                    for name in ("package.json", "package-lock.json"):
+                        shutil.copy2(os.path.join(repo_root, name), local)
+                    subprocess.run(["npm", "ci", "--omit=dev", "--no-audit", "--no-fund"], cwd=local, check=True)
+            self.session.put_tree(local, staging, ["node_modules"])
+            how = "uploaded"
+        else:
+            # Different OS, arch or Node ABI: native modules have to be built on the host.
+            # This happens beside the running release, so the service stays up.
+            for name in ("package.json", "package-lock.json"):
+                self.session.put_file(os.path.join(repo_root, name), f"{staging}/{name}")
+            self.session.run(
+                f"cd {shlex.quote(staging)} && npm ci --omit=dev --no-audit --no-fund",
+                check=True, timeout=900,
+            )
+            how = "built on host"
+        self.session.run(f"mv -T {shlex.quote(staging)} {deps}", check=True)
+        return key, how
+
+    def stage(self, release, deps_key, base=None):
+        """Create releases/<release>, hard-linked from base so the delta sync only adds what changed"""
+        target = self.q("releases", release)
+        seed = f"cp -al {self.q('releases', base)} {target}" if base else f"mkdir -p {target}"
+        self.session.run(
+            f"mkdir -p {self.q('releases')} {self.q('shared', 'attached_assets')} {self.q('shared', 'voices')} && {seed}"
+            f" && ln -sfn ../../deps/{shlex.quote(deps_key)}/node_modules {target}/node_modules"
+            f" && ln -sfn ../../shared/attached_assets {target}/attached_assets"
+            f" && mkdir -p {target}/media && ln -sfn ../../../shared/voices {target}/media/voices",
+            check=True,
+        )
+
+    def write_metadata(self, release, deps_key):
+        metadata = {"id": release, "deps": deps_key, "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+        self.session.run(f"cat > {self.q('releases', release, 'RELEASE.json')}", check=True, stdin=json.dumps(metadata))
+
+    def link(self, name, release):
+        """Atomically point the `name` symlink in the app directory at a release"""
+        link = self.q(name)
+        self.session.run(
+            f"test -d {self.q('releases', release)}"
+            f" && ln -sfn releases/{shlex.quote(release)} {link}.tmp && mv -Tf {link}.tmp {link}",
+            check=True,
+        )
+
+    def linked(self):
+        """Releases referenced by `current` or a blue/green slot; these are never pruned"""
+        result = self.session.run(f"cd {shlex.quote(self.root)} && for l in current blue green; do readlink $l; done")
+        return {os.path.basename(line) for line in result.stdout.split() if line}
+
+    def previous(self, release=None):
+        """The release before `release` (default: the active one)"""
+        release = release or self.current()
+        older = [name for name in self.list() if release is None or name < release]
+        return older[-1] if older else None
+
+    def prune(self, keep=KEEP_RELEASES):
+        """Remove old releases and any deps no remaining release links to"""
+        releases, linked = self.list(), self.linked()
+        doomed = [name for name in releases[:-keep] if name not in linked]
+        if doomed:
+            self.session.run("rm -rf " + " ".join(self.q("releases", name) for name in doomed), check=True)
+        self.session.run(
+            f"cd {self.q('deps')} 2>/dev/null || exit 0; "
+            f"used=$(readlink {self.q('releases')}/*/node_modules | xargs -rn1 dirname | xargs -rn1 basename | sort -u); "
+            "for d in *; do case \"$d\" in *.tmp) continue;; esac; "
+            "echo \"$used\" | grep -qxF \"$d\" || rm -rf \"$d\"; done"
+        )
+        return doomed
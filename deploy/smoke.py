@@ -0,0 +1,291 @@
+"""Post-deploy smoke suite.
+
+Checks are plain functions taking a Smoke context and asserting on the
+responses, like pytest tests. Each role (superadmin, admin, employee,
+collector) logs in once and shares one pooled requests.Session across all
+checks, and the checks run in parallel. Every request is timed per
+endpoint; the run fails when an endpoint's slowest call exceeds its budget
+in smoke-budgets.json (DEFAULT_BUDGET_MS when unlisted). --record rewrites
+the budgets from the measured latencies with headroom.
+
+    python3 -m deploy.smoke --base-url http://203.0.113.10
+    python3 -m deploy.smoke --local            # node dist/index.js on the in-memory backend
+    python3 -m deploy smoke                     # every host of the fleet
+
+Credentials default to the in-memory seed accounts; set SMOKE_<ROLE>_USER
+and SMOKE_<ROLE>_PASSWORD (or SMOKE_PASSWORD for all) for real hosts.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "smoke-budgets.json")
+DEFAULT_BUDGET_MS = 500
+# Recorded budgets are the slowest observed call times this, but never below the floor
+RECORD_HEADROOM = 2.0
+RECORD_FLOOR_MS = 50
+PARALLEL = 8
+ROLES = {"superadmin": "super_admin", "admin": "admin", "employee": "employee", "collector": "collector"}
+
+CHECKS = []
+
+
+def check(func):
+    """Register a smoke check"""
+    CHECKS.append(func)
+    return func
+
+
+class Smoke:
+    """Shared state for one run: the base URL, a logged-in session per role and latency samples"""
+
+    def __init__(self, base_url, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.sessions = {}
+        self.users = {}
+        self.latencies = {}
+        self._lock = threading.Lock()
+        self.anonymous = self._session()
+
+    def _session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=PARALLEL)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, method, path, role=None, endpoint=None, **kwargs):
+        """Timed request; `endpoint` groups paths with ids under one budget, e.g. "GET /api/cartelas/:shopId/page" """
+        session = self.sessions[role] if role else self.anonymous
+        start = time.perf_counter()
+        response = session.request(method, self.base_url + path, timeout=self.timeout, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        key = endpoint or f"{method} {path.split('?')[0]}"
+        with self._lock:
+            self.latencies.setdefault(key, []).append(elapsed)
+        return response
+
+    def get(self, path, role=None, endpoint=None, **kwargs):
+        return self.request("GET", path, role, endpoint, **kwargs)
+
+    def login(self, role):
+        env = role.upper()
+        username = os.environ.get(f"SMOKE_{env}_USER", role)
+        password = (os.environ.get(f"SMOKE_{env}_PASSWORD") or os.environ.get("SMOKE_PASSWORD")
+                    or os.environ.get("MEMORY_SEED_PASSWORD") or "123456")
+        self.sessions[role] = self._session()
+        response = self.request("POST", "/api/auth/login", role, json={"username": username, "password": password})
+        assert response.status_code == 200, f"{role} login: HTTP {response.status_code} {response.text[:200]}"
+        self.users[role] = response.json()["user"]
+
+    def user(self, role):
+        return self.users[role]
+
+
+def expect_ok(response, kind=None):
+    assert response.status_code == 200, f"{response.request.method} {response.url}: HTTP {response.status_code} {response.text[:200]}"
+    if kind is not None:
+        body = response.json()
+        assert isinstance(body, kind), f"{response.url}: expected {kind.__name__}, got {type(body).__name__}"
+        return body
+    return response
+
+
+@check
+def readiness(smoke):
+    body = expect_ok(smoke.get("/api/health/ready"), dict)
+    assert body["status"] == "ready", body
+
+
+@check
+def client_shell(smoke):
+    response = expect_ok(smoke.get("/"))
+    assert "<div id=\"root\">" in response.text, "index.html does not contain the app root"
+
+
+@check
+def who_am_i(smoke):
+    for role, expected in ROLES.items():
+        body = expect_ok(smoke.get("/api/auth/me", role), dict)
+        assert body["user"]["role"] == expected, f"{role} is {body['user']['role']}"
+
+
+@check
+def anonymous_is_rejected(smoke):
+    assert smoke.get("/api/auth/me").status_code == 401
+
+
+@check
+def superadmin_overview(smoke):
+    expect_ok(smoke.get("/api/super-admin/admins", "superadmin"), list)
+    expect_ok(smoke.get("/api/super-admin/revenue-total", "superadmin"))
+    expect_ok(smoke.get("/api/shops", "superadmin"), list)
+
+
+@check
+def admin_dashboard(smoke):
+    shop_id = smoke.user("admin")["shopId"]
+    expect_ok(smoke.get("/api/admin/employees", "admin"), list)
+    expect_ok(smoke.get("/api/admin/shop-stats", "admin"))
+    expect_ok(smoke.get("/api/credit/balance", "admin"))
+    expect_ok(smoke.get(f"/api/analytics/shop/{shop_id}", "admin", "GET /api/analytics/shop/:shopId"))
+
+
+@check
+def cartela_page(smoke):
+    shop_id = smoke.user("admin")["shopId"]
+    body = expect_ok(smoke.get(f"/api/cartelas/{shop_id}/page?limit=60", "admin", "GET /api/cartelas/:shopId/page"), dict)
+    assert {"items", "total"} <= body.keys(), body.keys()
+    assert len(body["items"]) <= 60
+
+
+@check
+def employee_dashboard(smoke):
+    shop_id = smoke.user("employee")["shopId"]
+    response = smoke.get("/api/games/active", "employee")
+    assert response.status_code in (200, 404), f"/api/games/active: HTTP {response.status_code}"
+    expect_ok(smoke.get(f"/api/stats/today/{shop_id}", "employee", "GET /api/stats/today/:shopId"))
+
+
+@check
+def collector_dashboard(smoke):
+    collector_id = smoke.user("collector")["id"]
+    expect_ok(smoke.get(f"/api/collectors/{collector_id}/stats", "collector", "GET /api/collectors/:collectorId/stats"))
+
+
+def load_budgets():
+    try:
+        with open(BUDGETS_FILE) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def record_budgets(latencies):
+    budgets = {**load_budgets()}
+    for endpoint, samples in latencies.items():
+        budgets[endpoint] = max(RECORD_FLOOR_MS, round(max(samples) * RECORD_HEADROOM))
+    with open(BUDGETS_FILE, "w") as f:
+        json.dump(dict(sorted(budgets.items())), f, indent=2)
+        f.write("\n")
+    print(f"📝 Recorded {len(latencies)} budgets in {os.path.relpath(BUDGETS_FILE, REPO_ROOT)}")
+
+
+def _run_check(smoke, func):
+    start = time.perf_counter()
+    try:
+        func(smoke)
+        return func.__name__, "ok", "", time.perf_counter() - start
+    except AssertionError as e:
+        return func.__name__, "fail", str(e) or traceback.format_exc(limit=1), time.perf_counter() - start
+    except Exception as e:
+        return func.__name__, "error", f"{type(e).__name__}: {e}", time.perf_counter() - start
+
+
+def run(base_url, record=False, selected=None):
+    """Run the suite against base_url; returns True when every check passed within budget"""
+    started = time.perf_counter()
+    smoke = Smoke(base_url)
+    checks = [func for func in CHECKS if not selected or func.__name__ in selected]
+
+    with ThreadPoolExecutor(max_workers=PARALLEL) as pool:
+        logins = list(pool.map(lambda role: _run_check(smoke, lambda s: s.login(role)), ROLES))
+        failed_logins = [(role, detail) for role, (_, status, detail, _) in zip(ROLES, logins) if status != "ok"]
+        for role, detail in failed_logins:
+            print(f"❌ login {role}: {detail}")
+        if failed_logins:
+            return False
+        results = list(pool.map(lambda func: _run_check(smoke, func), checks))
+
+    for name, status, detail, seconds in results:
+        icon = "✅" if status == "ok" else "❌"
+        print(f"{icon} {name.ljust(24)} {seconds * 1000:7.0f}ms  {detail}")
+
+    budgets = load_budgets()
+    over = []
+    for endpoint, samples in sorted(smoke.latencies.items()):
+        budget = budgets.get(endpoint, DEFAULT_BUDGET_MS)
+        if max(samples) > budget:
+            over.append(f"{endpoint}: {max(samples):.0f}ms > {budget}ms")
+    for line in over:
+        print(f"🐢 {line}")
+
+    if record:
+        record_budgets(smoke.latencies)
+
+    passed = all(status == "ok" for _, status, _, _ in results) and (record or not over)
+    print(f"{'✅' if passed else '❌'} {sum(s == 'ok' for _, s, _, _ in results)}/{len(results)} checks, "
+          f"{len(over)} over budget, {sum(map(len, smoke.latencies.values()))} requests "
+          f"in {time.perf_counter() - started:.2f}s")
+    return passed
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_local_server(timeout=60):
+    """Start the built server on the in-memory backend; returns (process, base URL)"""
+    entry = os.path.join(REPO_ROOT, "dist", "index.js")
+    if not os.path.exists(entry):
+        raise SystemExit("❌ dist/index.js missing, run npm run build first")
+    port = _free_port()
+    env = {**os.environ, "NODE_ENV": "production", "STORAGE_BACKEND": "memory", "PORT": str(port),
+           "SESSION_SECRET": os.environ.get("SESSION_SECRET", "smoke-test")}
+    # A file rather than a pipe: nobody reads stderr while the server runs, and a full pipe would block it
+    with tempfile.TemporaryFile() as log:
+        process = subprocess.Popen(["node", entry], cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log)
+        base_url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                log.seek(0)
+                raise SystemExit(f"❌ Local server exited: {log.read().decode(errors='replace')[-2000:]}")
+            try:
+                if requests.get(f"{base_url}/api/health/ready", timeout=1).status_code == 200:
+                    return process, base_url
+            except requests.ConnectionError:
+                pass
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit(f"❌ Local server not ready after {timeout}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m deploy.smoke", description="Smoke test a BingoMaster server")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="Server to test, e.g. http://203.0.113.10")
+    target.add_argument("--local", action="store_true", help="Start dist/index.js on the in-memory backend and test it")
+    parser.add_argument("--record", action="store_true", help="Write measured latencies as the new budgets")
+    parser.add_argument("-k", dest="only", help="Comma separated check names to run")
+    args = parser.parse_args(argv)
+
+    selected = set(args.only.split(",")) if args.only else None
+    if not args.local:
+        return 0 if run(args.base_url, args.record, selected) else 1
+
+    process, base_url = start_local_server()
+    try:
+        return 0 if run(base_url, args.record, selected) else 1
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
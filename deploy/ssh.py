@@ -0,0 +1,180 @@
+"""A single multiplexed SSH connection per host.
+
+The first command opens an OpenSSH ControlMaster; every later command and
+transfer runs as a new channel over that connection, so a deploy pays for
+one TCP and SSH handshake instead of one per step. Independent commands can
+be run concurrently with run_parallel(), which pipelines them as parallel
+channels of the same connection.
+"""
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# sshd allows 10 sessions per connection by default (MaxSessions)
+MAX_CHANNELS = 8
+
+
+@dataclass
+class Result:
+    command: str
+    code: int
+    stdout: str
+    stderr: str
+    seconds: float
+    sent_bytes: int = 0
+
+    @property
+    def ok(self):
+        return self.code == 0
+
+
+class RemoteError(RuntimeError):
+    def __init__(self, host, result):
+        super().__init__(f"{host}: `{result.command}` exited {result.code}: {result.stderr.strip() or result.stdout.strip()}")
+        self.result = result
+
+
+class SSHSession:
+    """Runs commands and transfers on one host over a shared connection"""
+
+    def __init__(self, host, connect_timeout=15):
+        self.host = host
+        self.connect_timeout = connect_timeout
+        self._control_dir = None
+        self._aborted = False
+        self.handshake_seconds = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def _control_path(self):
+        return os.path.join(self._control_dir, "master")
+
+    def _options(self):
+        return [
+            "-o", f"ControlPath={self._control_path}",
+            "-o", "ControlMaster=auto",
+            "-o", "ControlPersist=120",
+            "-o", "StrictHostKeyChecking=accept-new",
+            "-o", f"ConnectTimeout={self.connect_timeout}",
+            "-o", "ServerAliveInterval=15",
+        ]
+
+    def _env(self):
+        env = dict(os.environ)
+        if self.host.password:
+            env["SSHPASS"] = self.host.password
+        return env
+
+    def _ssh(self, *args):
+        # sshpass -e reads SSHPASS, so the password never shows up in `ps`
+        prefix = ["sshpass", "-e"] if self.host.password else []
+        return [*prefix, "ssh", *self._options(), *args]
+
+    def open(self):
+        """Start the master connection; later commands reuse it"""
+        if self._control_dir:
+            return
+        if self._aborted:
+            raise ConnectionError(f"{self.host.name}: session aborted")
+        if self.host.password and not shutil.which("sshpass"):
+            raise SystemExit("❌ DEPLOY_PASSWORD is set but sshpass is not installed")
+        # Unix socket paths are limited to ~100 bytes, so keep the directory short
+        self._control_dir = tempfile.mkdtemp(prefix="bm-ssh-")
+        start = time.monotonic()
+        result = subprocess.run(
+            self._ssh("-M", "-N", "-f", self.host.target),
+            capture_output=True, text=True, env=self._env(), timeout=self.connect_timeout + 30,
+        )
+        if result.returncode != 0:
+            shutil.rmtree(self._control_dir, ignore_errors=True)
+            self._control_dir = None
+            raise ConnectionError(f"{self.host.name}: ssh connection failed: {result.stderr.strip()}")
+        self.handshake_seconds = time.monotonic() - start
+
+    def close(self):
+        if not self._control_dir:
+            return
+        subprocess.run(self._ssh("-O", "exit", self.host.target), capture_output=True, env=self._env())
+        shutil.rmtree(self._control_dir, ignore_errors=True)
+        self._control_dir = None
+
+    def abort(self):
+        """Close the connection for good; running and later commands fail instead of reconnecting"""
+        self._aborted = True
+        self.close()
+
+    def run(self, command, check=False, timeout=300, stdin=None):
+        """Run a shell command on the host"""
+        self.open()
+        start = time.monotonic()
+        try:
+            completed = subprocess.run(
+                self._ssh(self.host.target, command),
+                input=stdin, capture_output=True, timeout=timeout, env=self._env(),
+                text=not isinstance(stdin, bytes),
+            )
+            stdout, stderr = completed.stdout, completed.stderr
+            if isinstance(stdout, bytes):
+                stdout, stderr = stdout.decode(errors="replace"), stderr.decode(errors="replace")
+            result = Result(command, completed.returncode, stdout, stderr, time.monotonic() - start)
+        except subprocess.TimeoutExpired:
+            result = Result(command, -1, "", f"timed out after {timeout}s", time.monotonic() - start)
+        if check and not result.ok:
+            raise RemoteError(self.host.name, result)
+        return result
+
+    def run_parallel(self, commands, check=False, timeout=300):
+        """Run independent commands concurrently; returns results keyed like `commands`"""
+        self.open()
+        with ThreadPoolExecutor(max_workers=min(MAX_CHANNELS, len(commands) or 1)) as pool:
+            futures = {key: pool.submit(self.run, command, False, timeout) for key, command in commands.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        failed = [result for result in results.values() if not result.ok]
+        if check and failed:
+            raise RemoteError(self.host.name, failed[0])
+        return results
+
+    def put_tree(self, local_dir, remote_dir, paths=None, timeout=900):
+        """Send files from local_dir into remote_dir as one compressed tar stream over the session"""
+        self.open()
+        paths = list(paths) if paths is not None else ["."]
+        remote = f"mkdir -p {shlex.quote(remote_dir)} && tar -xzf - -C {shlex.quote(remote_dir)}"
+        start = time.monotonic()
+        # Spool the archive so large path lists go through -T and the sent size is known
+        with tempfile.TemporaryFile() as archive:
+            subprocess.run(
+                ["tar", "-czf", "-", "-C", local_dir, "--null", "-T", "-"],
+                input="\0".join(paths).encode(), stdout=archive, check=True,
+            )
+            sent_bytes = archive.tell()
+            archive.seek(0)
+            completed = subprocess.run(
+                self._ssh(self.host.target, remote),
+                stdin=archive, capture_output=True, timeout=timeout, env=self._env(),
+            )
+        result = Result(f"put {local_dir} -> {remote_dir}", completed.returncode,
+                        completed.stdout.decode(errors="replace"), completed.stderr.decode(errors="replace"),
+                        time.monotonic() - start, sent_bytes)
+        if not result.ok:
+            raise RemoteError(self.host.name, result)
+        return result
+
+    def put_file(self, local_path, remote_path, mode=None):
+        """Upload one file through the session"""
+        with open(local_path, "rb") as f:
+            data = f.read()
+        command = f"cat > {shlex.quote(remote_path)}"
+        if mode:
+            command += f" && chmod {mode} {shlex.quote(remote_path)}"
+        return self.run(command, check=True, stdin=data)
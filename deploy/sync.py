@@ -0,0 +1,175 @@
+"""Content-addressed delta uploads.
+
+Every synced tree has a manifest of sha256 hashes by relative path. The
+local one is cached in .deploy-cache/ by size and mtime, so only touched
+files get rehashed. The remote one is stored next to the files it
+describes. A sync sends only new or changed files as one compressed tar
+stream, removes files that were dropped locally, and then writes the new
+remote manifest. Files outside the manifest, like node_modules or .env,
+are never touched.
+"""
+import hashlib
+import json
+import os
+import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+CACHE_DIR = ".deploy-cache"
+
+# A fleet deploy syncs the same local trees to every host; hash them once
+_manifest_lock = threading.Lock()
+_manifests = {}
+
+
+@dataclass
+class Tree:
+    name: str
+    local_root: str
+    remote_root: str
+    # Explicit file list relative to local_root; None means everything below it
+    files: list | None = None
+
+
+@dataclass
+class SyncResult:
+    tree: str
+    changed: list = field(default_factory=list)
+    deleted: list = field(default_factory=list)
+    total_files: int = 0
+    sent_bytes: int = 0
+
+    @property
+    def unchanged(self):
+        return not self.changed and not self.deleted
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _walk(tree):
+    if tree.files is not None:
+        yield from (path for path in tree.files if os.path.isfile(os.path.join(tree.local_root, path)))
+        return
+    for directory, _, names in os.walk(tree.local_root):
+        for name in names:
+            yield os.path.relpath(os.path.join(directory, name), tree.local_root).replace(os.sep, "/")
+
+
+def local_manifest(tree, cache_root):
+    """Map relative path to sha256, rehashing only files whose size or mtime changed"""
+    key = (tree.name, tree.local_root, tuple(tree.files or ()))
+    with _manifest_lock:
+        if key not in _manifests:
+            _manifests[key] = _hash_tree(tree, cache_root)
+        return _manifests[key]
+
+
+def _hash_tree(tree, cache_root):
+    cache_path = os.path.join(cache_root, CACHE_DIR, f"{tree.name}.json")
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    manifest, fresh = {}, {}
+    for path in sorted(_walk(tree)):
+        stat = os.stat(os.path.join(tree.local_root, path))
+        key = [stat.st_size, stat.st_mtime_ns]
+        cached = cache.get(path)
+        digest = cached[2] if cached and cached[:2] == key else file_hash(os.path.join(tree.local_root, path))
+        manifest[path] = digest
+        fresh[path] = [*key, digest]
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, "w") as f:
+        json.dump(fresh, f)
+    return manifest
+
+
+def _remote_manifest_path(tree):
+    return f"{tree.remote_root.rstrip('/')}/.manifest-{tree.name}.json"
+
+
+def remote_manifest(session, tree, verify=False):
+    """The manifest stored on the host, or hashes of the listed files with verify=True"""
+    result = session.run(f"cat {shlex.quote(_remote_manifest_path(tree))} 2>/dev/null")
+    try:
+        manifest = json.loads(result.stdout) if result.ok else {}
+    except ValueError:
+        manifest = {}
+    if not verify or not manifest:
+        return manifest
+
+    # Rehash what the manifest claims is there, in case someone edited files by hand
+    paths = "\0".join(manifest)
+    result = session.run(
+        f"cd {shlex.quote(tree.remote_root)} && xargs -0 sha256sum 2>/dev/null",
+        stdin=paths,
+    )
+    verified = {}
+    for line in result.stdout.splitlines():
+        digest, _, path = line.partition("  ")
+        verified[path] = digest
+    return verified
+
+
+def sync_tree(session, tree, cache_root, verify=False, dry_run=False):
+    """Bring tree.remote_root in line with the local tree, sending only the difference"""
+    local = local_manifest(tree, cache_root)
+    remote = remote_manifest(session, tree, verify)
+    result = SyncResult(
+        tree=tree.name,
+        changed=[path for path, digest in local.items() if remote.get(path) != digest],
+        deleted=[path for path in remote if path not in local],
+        total_files=len(local),
+    )
+    if dry_run or result.unchanged:
+        return result
+
+    remote_root = shlex.quote(tree.remote_root)
+    if result.changed:
+        result.sent_bytes = session.put_tree(tree.local_root, tree.remote_root, result.changed).sent_bytes
+    if result.deleted:
+        session.run(f"cd {remote_root} && xargs -0 rm -f", check=True, stdin="\0".join(result.deleted))
+
+    # Write the manifest last so an interrupted sync is simply redone next time
+    manifest_path = shlex.quote(_remote_manifest_path(tree))
+    session.run(
+        f"cat > {manifest_path}.tmp && mv {manifest_path}.tmp {manifest_path}",
+        check=True, stdin=json.dumps(local, sort_keys=True),
+    )
+    return result
+
+
+def sync_trees(session, trees, cache_root, verify=False, dry_run=False):
+    """Sync several trees concurrently, each on its own channel of the session"""
+    session.open()
+    with ThreadPoolExecutor(max_workers=len(trees) or 1) as pool:
+        return list(pool.map(lambda tree: sync_tree(session, tree, cache_root, verify, dry_run), trees))
+
+
+def format_bytes(count):
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+def print_summary(results):
+    for result in results:
+        if result.unchanged:
+            print(f"   = {result.tree}: {result.total_files} files unchanged")
+        else:
+            print(f"   ↑ {result.tree}: {len(result.changed)} changed, {len(result.deleted)} removed "
+                  f"of {result.total_files} ({format_bytes(result.sent_bytes)} sent)")
+
@@ -0,0 +1,31 @@
+"""Wall-clock timing of deploy steps."""
+import time
+from contextlib import contextmanager
+
+
+class StepTimer:
+    """Records how long each named step takes and prints a summary"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.steps = []
+
+    @contextmanager
+    def step(self, name):
+        print(f"▶️  {name}")
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.monotonic() - start))
+
+    @property
+    def total(self):
+        return time.monotonic() - self.started
+
+    def report(self):
+        print("\n⏱️  Timing")
+        width = max((len(name) for name, _ in self.steps), default=0)
+        for name, seconds in self.steps:
+            print(f"   {name.ljust(width)}  {seconds:7.2f}s")
+        print(f"   {'total'.ljust(width)}  {self.total:7.2f}s")
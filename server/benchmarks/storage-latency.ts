@@ -0,0 +1,189 @@
+/**
+ * Compares MongoDB and PostgreSQL latency for the same storage operations.
+ *
+ * Seeds an identical, tagged fixture (one shop, admin, employee, games and
+ * cartelas) into both backends, times each operation and removes the
+ * fixture again. Run against a local mongod and Postgres:
+ *
+ *   DATABASE_URL=postgres://... MONGODB_URI=mongodb://127.0.0.1:27017/bingomaster_bench \
+ *     npm run bench:storage -- --iterations 500 --games 200 --cartelas 500
+ */
+import { performance } from "perf_hooks";
+import { and, asc, eq, inArray } from "drizzle-orm";
+import { db, pool } from "../db";
+import { storage } from "../storage";
+import { connectMongoDB, mongoose } from "../mongodb-db";
+import { users, shops, games, cartelas } from "@shared/schema";
+import { User, Shop, Game, Cartela } from "@shared/mongodb-schema";
+import { getFixedCartelaPattern } from "../fixed-cartelas";
+
+interface Operation {
+  name: string;
+  postgres: () => Promise<unknown>;
+  mongodb: () => Promise<unknown>;
+}
+
+function parseArgs() {
+  const args = process.argv.slice(2);
+  const get = (flag: string, fallback: number) => {
+    const index = args.indexOf(flag);
+    return index >= 0 ? Number(args[index + 1]) : fallback;
+  };
+  return {
+    iterations: get("--iterations", 300),
+    warmup: get("--warmup", 30),
+    gameCount: get("--games", 100),
+    cartelaCount: get("--cartelas", 200),
+  };
+}
+
+function percentile(sorted: number[], p: number): number {
+  const index = Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length));
+  return sorted[index];
+}
+
+async function measure(fn: () => Promise<unknown>, iterations: number, warmup: number) {
+  for (let i = 0; i < warmup; i++) await fn();
+
+  const samples: number[] = [];
+  for (let i = 0; i < iterations; i++) {
+    const start = performance.now();
+    await fn();
+    samples.push(performance.now() - start);
+  }
+  samples.sort((a, b) => a - b);
+  const mean = samples.reduce((total, value) => total + value, 0) / samples.length;
+  return { mean, p50: percentile(samples, 50), p95: percentile(samples, 95), p99: percentile(samples, 99) };
+}
+
+async function main() {
+  const { iterations, warmup, gameCount, cartelaCount } = parseArgs();
+  const tag = `bench_${Date.now()}`;
+  const calledNumbers = Array.from({ length: 20 }, (_, i) => String(i + 1));
+
+  await connectMongoDB();
+  // Make sure compound indexes exist before timing anything
+  await Promise.all([User.syncIndexes(), Game.syncIndexes(), Cartela.syncIndexes()]);
+
+  console.log(`Seeding fixture ${tag}: ${gameCount} games, ${cartelaCount} cartelas per backend`);
+
+  // PostgreSQL fixture
+  const [pgAdmin] = await db.insert(users).values({
+    username: `${tag}_admin`, password: "x", role: "admin", name: "Bench Admin",
+  }).returning();
+  const [pgShop] = await db.insert(shops).values({ name: `${tag} shop`, adminId: pgAdmin.id }).returning();
+  const [pgEmployee] = await db.insert(users).values({
+    username: `${tag}_employee`, password: "x", role: "employee", name: "Bench Employee", shopId: pgShop.id,
+  }).returning();
+  const pgGames = await db.insert(games).values(Array.from({ length: gameCount }, () => ({
+    shopId: pgShop.id, employeeId: pgEmployee.id, status: "completed", entryFee: "20.00", calledNumbers,
+  }))).returning({ id: games.id });
+  await db.insert(cartelas).values(Array.from({ length: cartelaCount }, (_, i) => ({
+    shopId: pgShop.id, adminId: pgAdmin.id, cartelaNumber: i + 1, name: `Cartela ${i + 1}`,
+    pattern: getFixedCartelaPattern(i + 1),
+  })));
+
+  // MongoDB fixture
+  const mongoAdmin = await User.create({ username: `${tag}_admin`, password: "x", role: "admin", name: "Bench Admin" });
+  const mongoShop = await Shop.create({ name: `${tag} shop`, adminId: mongoAdmin._id });
+  const mongoEmployee = await User.create({
+    username: `${tag}_employee`, password: "x", role: "employee", name: "Bench Employee", shopId: mongoShop._id,
+  });
+  const mongoGames = await Game.insertMany(Array.from({ length: gameCount }, () => ({
+    shopId: mongoShop._id, employeeId: mongoEmployee._id, status: "completed", entryFee: 20, calledNumbers,
+  })), { lean: true });
+  await Cartela.bulkWrite(Array.from({ length: cartelaCount }, (_, i) => ({
+    insertOne: {
+      document: {
+        shopId: mongoShop._id, adminId: mongoAdmin._id, cartelaNumber: i + 1, name: `Cartela ${i + 1}`,
+        pattern: getFixedCartelaPattern(i + 1),
+      },
+    },
+  })), { ordered: false });
+
+  const pgGameId = pgGames[0].id;
+  const mongoGameId = mongoGames[0]._id;
+
+  const operations: Operation[] = [
+    {
+      name: "user by username",
+      postgres: () => storage.getUserByUsername(`${tag}_employee`),
+      mongodb: () => User.findOne({ username: `${tag}_employee` })
+        .select("username password role name shopId creditBalance").lean(),
+    },
+    {
+      name: "user by id",
+      postgres: () => storage.getUser(pgEmployee.id),
+      mongodb: () => User.findById(mongoEmployee._id)
+        .select("username role name shopId creditBalance").lean(),
+    },
+    {
+      name: "games by shop",
+      postgres: () => storage.getGamesByShop(pgShop.id),
+      mongodb: () => Game.find({ shopId: mongoShop._id })
+        .select("shopId employeeId status prizePool entryFee calledNumbers createdAt")
+        .sort({ createdAt: -1 }).lean(),
+    },
+    {
+      name: "cartelas by shop",
+      // Same filter, columns and order as the Mongo query (which also returns _id)
+      postgres: () => db.select({
+        id: cartelas.id,
+        cartelaNumber: cartelas.cartelaNumber,
+        name: cartelas.name,
+        pattern: cartelas.pattern,
+        isBooked: cartelas.isBooked,
+        bookedBy: cartelas.bookedBy,
+        collectorId: cartelas.collectorId,
+      }).from(cartelas)
+        .where(and(eq(cartelas.shopId, pgShop.id), eq(cartelas.isActive, true)))
+        .orderBy(asc(cartelas.cartelaNumber)),
+      mongodb: () => Cartela.find({ shopId: mongoShop._id, isActive: true })
+        .select("cartelaNumber name pattern isBooked bookedBy collectorId")
+        .sort({ cartelaNumber: 1 }).lean(),
+    },
+    {
+      name: "update called numbers",
+      postgres: () => storage.updateGameNumbers(pgGameId, calledNumbers),
+      mongodb: () => Game.updateOne({ _id: mongoGameId }, { $set: { calledNumbers } }),
+    },
+  ];
+
+  const rows: Record<string, string>[] = [];
+  try {
+    for (const operation of operations) {
+      for (const backend of ["postgres", "mongodb"] as const) {
+        const stats = await measure(operation[backend], iterations, warmup);
+        rows.push({
+          operation: operation.name,
+          backend,
+          "mean ms": stats.mean.toFixed(3),
+          "p50 ms": stats.p50.toFixed(3),
+          "p95 ms": stats.p95.toFixed(3),
+          "p99 ms": stats.p99.toFixed(3),
+        });
+      }
+    }
+    console.table(rows);
+  } finally {
+    console.log(`Removing fixture ${tag}`);
+    await db.delete(cartelas).where(eq(cartelas.shopId, pgShop.id));
+    await db.delete(games).where(eq(games.shopId, pgShop.id));
+    await db.update(shops).set({ adminId: null }).where(eq(shops.id, pgShop.id));
+    await db.delete(users).where(inArray(users.id, [pgAdmin.id, pgEmployee.id]));
+    await db.delete(shops).where(eq(shops.id, pgShop.id));
+
+    await Cartela.deleteMany({ shopId: mongoShop._id });
+    await Game.deleteMany({ shopId: mongoShop._id });
+    await User.deleteMany({ _id: { $in: [mongoAdmin._id, mongoEmployee._id] } });
+    await Shop.deleteOne({ _id: mongoShop._id });
+
+    await mongoose.disconnect();
+    await pool.end();
+  }
+}
+
+main().catch((error) => {
+  console.error("Storage benchmark failed:", error);
+  process.exit(1);
+});
@@ -1,7 +1,5 @@
 import { FIXED_CARTELAS } from "./fixed-cartelas";
-import { db } from "./db";
-import { cartelas } from "@shared/schema";
-import { eq, and } from "drizzle-orm";
+import { storage } from "./storage";
 
 // Convert hardcoded cartela to unified format
 function convertHardcodedCartela(hardcodedCartela: any): {
@@ -45,28 +43,19 @@ export async function loadHardcodedCartelas(shopId: number, adminId: number): Pr
     const cartelaNumber = hardcodedCartela.Board;
     
     // Check if cartela already exists for this shop
-    const existing = await db
-      .select()
-      .from(cartelas)
-      .where(
-        and(
-          eq(cartelas.shopId, shopId),
-          eq(cartelas.cartelaNumber, cartelaNumber)
-        )
-      )
-      .limit(1);
+    const existing = await storage.getShopCartela(shopId, cartelaNumber);
     
     const converted = convertHardcodedCartela(hardcodedCartela);
     
-    if (existing.length === 0) {
+    if (!existing) {
       // Insert new hardcoded cartela
-      await db.insert(cartelas).values({
+      await storage.createCartela({
         shopId,
         adminId,
         cartelaNumber,
         name: converted.name,
-        pattern: JSON.stringify(converted.pattern),
-        numbers: JSON.stringify(converted.numbers),
+        pattern: converted.pattern,
+        numbers: converted.numbers,
         isHardcoded: true,
         isActive: true,
       });
@@ -74,20 +63,12 @@ export async function loadHardcodedCartelas(shopId: number, adminId: number): Pr
       console.log(`Loaded hardcoded cartela ${cartelaNumber} for shop ${shopId}`);
     } else {
       // Update existing cartela if adding same cartela number
-      await db
-        .update(cartelas)
-        .set({
-          pattern: JSON.stringify(converted.pattern),
-          numbers: JSON.stringify(converted.numbers),
-          name: converted.name,
-          isHardcoded: true,
-        })
-        .where(
-          and(
-            eq(cartelas.shopId, shopId),
-            eq(cartelas.cartelaNumber, cartelaNumber)
-          )
-        );
+      await storage.updateCartela(existing.id, {
+        pattern: converted.pattern,
+        numbers: converted.numbers,
+        name: converted.name,
+        isHardcoded: true,
+      });
       
       console.log(`Updated existing cartela ${cartelaNumber} for shop ${shopId} with default values`);
     }
@@ -101,8 +82,7 @@ export async function ensureHardcodedCartelasLoaded(): Promise<void> {
   console.log("Loading hardcoded cartelas for all shops...");
   
   try {
-    const { shops } = await import("@shared/schema");
-    const allShops = await db.select().from(shops);
+    const allShops = await storage.getShops();
     
     for (const shop of allShops) {
       await loadHardcodedCartelas(shop.id, shop.adminId);
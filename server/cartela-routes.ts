@@ -1,14 +1,14 @@
 import { Router } from "express";
-import { db } from "./db";
-import { cartelas } from "@shared/schema";
-import { eq, and } from "drizzle-orm";
+import { storage } from "./storage";
 import { loadHardcodedCartelas } from "./cartela-loader";
+import { getLogger } from "./logger";
 
 const router = Router();
+const cartelaLog = getLogger("cartelas");
 
 // Function to log cartela updates (WebSocket temporarily disabled)
 function logCartelaUpdate(shopId: number) {
-  console.log(`Cartela updated for shop ${shopId} at ${new Date().toISOString()}`);
+  cartelaLog.info(`cartela updated for shop ${shopId}`);
 }
 
 // Parse bulk cartela input
@@ -93,13 +93,7 @@ router.get("/:shopId", async (req, res) => {
     res.set('Pragma', 'no-cache');
     res.set('Expires', '0');
     
-    const shopCartelas = await db
-      .select()
-      .from(cartelas)
-      .where(eq(cartelas.shopId, shopId))
-      .orderBy(cartelas.cartelaNumber);
-
-    console.log(`Fetched ${shopCartelas.length} cartelas for shop ${shopId}`);
+    const shopCartelas = await storage.getCartelasByShop(shopId);
 
     // Parse JSON strings back to arrays for frontend
     const parsedCartelas = shopCartelas.map(cartela => ({
@@ -108,61 +102,73 @@ router.get("/:shopId", async (req, res) => {
       numbers: typeof cartela.numbers === 'string' ? JSON.parse(cartela.numbers) : cartela.numbers,
     }));
 
-    // Debug: Log all cartelas to verify data structure and marked cartelas
-    console.log(`🔍 CARTELA API DEBUG - Total cartelas: ${parsedCartelas.length}`);
-    
-    const markedCartelas = parsedCartelas.filter(c => c.collectorId !== null || c.bookedBy !== null);
-    console.log(`📊 MARKED CARTELAS for shop ${shopId} (${markedCartelas.length} total):`, markedCartelas.map(c => ({
-      number: c.cartelaNumber,
-      collectorId: c.collectorId,
-      bookedBy: c.bookedBy,
-      source: c.collectorId !== null ? 'collector' : (c.bookedBy !== null ? 'employee' : 'none')
-    })));
-    
-    // Also log first few cartelas to verify data structure
-    console.log(`🔍 FIRST 3 CARTELAS structure:`, parsedCartelas.slice(0, 3).map(c => ({
-      id: c.id,
-      number: c.cartelaNumber,
-      collectorId: c.collectorId,
-      bookedBy: c.bookedBy
-    })));
+    cartelaLog.debug(`fetched ${parsedCartelas.length} cartelas for shop ${shopId}`, () => ({
+      marked: parsedCartelas
+        .filter(c => c.collectorId !== null || c.bookedBy !== null)
+        .map(c => ({
+          number: c.cartelaNumber,
+          source: c.collectorId !== null ? 'collector' : 'employee'
+        }))
+    }));
 
     res.json(parsedCartelas);
   } catch (error) {
-    console.error("Error fetching cartelas:", error);
+    cartelaLog.error("error fetching cartelas", { error });
     res.status(500).json({ error: "Failed to fetch cartelas" });
   }
 });
 
+// Parses an optional positive integer query parameter
+function queryInt(value: unknown): number | undefined {
+  if (typeof value !== "string" || value.trim() === "") return undefined;
+  const parsed = parseInt(value, 10);
+  return Number.isInteger(parsed) && parsed >= 0 ? parsed : undefined;
+}
+
+// GET /api/cartelas/:shopId/page - One page of a shop's cartelas, optionally
+// filtered by cartela number (?number=) or by a number on the card (?contains=).
+// Pages are keyed by cartela number: pass the previous nextCursor as ?after=.
+router.get("/:shopId/page", async (req, res) => {
+  try {
+    const shopId = parseInt(req.params.shopId);
+    const limit = Math.min(Math.max(queryInt(req.query.limit) ?? 60, 1), 200);
+    const contains = queryInt(req.query.contains);
+    if (contains !== undefined && (contains < 1 || contains > 75)) {
+      return res.status(400).json({ error: "contains must be between 1 and 75" });
+    }
+
+    res.set('Cache-Control', 'no-cache');
+
+    const page = await storage.searchCartelas(shopId, {
+      cartelaNumber: queryInt(req.query.number),
+      contains,
+      after: queryInt(req.query.after),
+      limit,
+    });
+
+    res.json(page);
+  } catch (error) {
+    cartelaLog.error("error searching cartelas", { error });
+    res.status(500).json({ error: "Failed to search cartelas" });
+  }
+});
+
 // POST /api/cartelas - Create new cartela
 router.post("/", async (req, res) => {
   try {
     const { shopId, adminId, cartelaNumber, name, pattern, numbers } = req.body;
 
     // Check if cartela number already exists for this shop
-    const existing = await db
-      .select()
-      .from(cartelas)
-      .where(
-        and(
-          eq(cartelas.shopId, shopId),
-          eq(cartelas.cartelaNumber, cartelaNumber)
-        )
-      )
-      .limit(1);
-
-    if (existing.length > 0) {
+    const existing = await storage.getShopCartela(shopId, cartelaNumber);
+
+    if (existing) {
       // Update existing cartela instead of creating new one
-      const [updatedCartela] = await db
-        .update(cartelas)
-        .set({
-          name,
-          pattern: JSON.stringify(pattern),
-          numbers: JSON.stringify(numbers),
-          isHardcoded: false, // Mark as custom when updated
-        })
-        .where(eq(cartelas.id, existing[0].id))
-        .returning();
+      const updatedCartela = await storage.updateCartela(existing.id, {
+        name,
+        pattern,
+        numbers,
+        isHardcoded: false, // Mark as custom when updated
+      });
 
       // Parse the response back to arrays
       const parsedCartela = {
@@ -177,19 +183,16 @@ router.post("/", async (req, res) => {
       return res.json(parsedCartela);
     }
 
-    const [newCartela] = await db
-      .insert(cartelas)
-      .values({
-        shopId,
-        adminId,
-        cartelaNumber,
-        name,
-        pattern: JSON.stringify(pattern),
-        numbers: JSON.stringify(numbers),
-        isHardcoded: false,
-        isActive: true,
-      })
-      .returning();
+    const newCartela = await storage.createCartela({
+      shopId,
+      adminId,
+      cartelaNumber,
+      name,
+      pattern,
+      numbers,
+      isHardcoded: false,
+      isActive: true,
+    });
 
     // Log cartela update
     logCartelaUpdate(shopId);
@@ -208,45 +211,28 @@ router.put("/:id", async (req, res) => {
     const { cartelaNumber, name, pattern, numbers } = req.body;
 
     // Get current cartela to check shop ownership
-    const currentCartela = await db
-      .select()
-      .from(cartelas)
-      .where(eq(cartelas.id, cartelaId))
-      .limit(1);
+    const currentCartela = await storage.getCartela(cartelaId);
 
-    if (currentCartela.length === 0) {
+    if (!currentCartela) {
       return res.status(404).json({ error: "Cartela not found" });
     }
 
     // Check if new cartela number conflicts with existing ones (excluding current)
-    if (cartelaNumber !== currentCartela[0].cartelaNumber) {
-      const existing = await db
-        .select()
-        .from(cartelas)
-        .where(
-          and(
-            eq(cartelas.shopId, currentCartela[0].shopId),
-            eq(cartelas.cartelaNumber, cartelaNumber)
-          )
-        )
-        .limit(1);
-
-      if (existing.length > 0) {
+    if (cartelaNumber !== currentCartela.cartelaNumber) {
+      const existing = await storage.getShopCartela(currentCartela.shopId, cartelaNumber);
+
+      if (existing) {
         return res.status(400).json({ error: "Cartela number already exists for this shop" });
       }
     }
 
-    const [updatedCartela] = await db
-      .update(cartelas)
-      .set({
-        cartelaNumber,
-        name,
-        pattern,
-        numbers,
-        updatedAt: new Date(),
-      })
-      .where(eq(cartelas.id, cartelaId))
-      .returning();
+    const updatedCartela = await storage.updateCartela(cartelaId, {
+      cartelaNumber,
+      name,
+      pattern,
+      numbers,
+      updatedAt: new Date(),
+    });
 
     res.json(updatedCartela);
   } catch (error) {
@@ -260,12 +246,9 @@ router.delete("/:id", async (req, res) => {
   try {
     const cartelaId = parseInt(req.params.id);
 
-    const deletedCartela = await db
-      .delete(cartelas)
-      .where(eq(cartelas.id, cartelaId))
-      .returning();
+    const deleted = await storage.deleteCartela(cartelaId);
 
-    if (deletedCartela.length === 0) {
+    if (!deleted) {
       return res.status(404).json({ error: "Cartela not found" });
     }
 
@@ -289,43 +272,29 @@ router.post("/bulk-import", async (req, res) => {
     for (const cartelaData of parsed.valid) {
       try {
         // Check if cartela exists
-        const existing = await db
-          .select()
-          .from(cartelas)
-          .where(
-            and(
-              eq(cartelas.shopId, shopId),
-              eq(cartelas.cartelaNumber, cartelaData.cartelaNumber)
-            )
-          )
-          .limit(1);
-
-        if (existing.length > 0) {
+        const existing = await storage.getShopCartela(shopId, cartelaData.cartelaNumber);
+
+        if (existing) {
           // Update existing
-          await db
-            .update(cartelas)
-            .set({
-              name: cartelaData.name,
-              pattern: cartelaData.pattern,
-              numbers: cartelaData.numbers,
-              updatedAt: new Date(),
-            })
-            .where(eq(cartelas.id, existing[0].id));
+          await storage.updateCartela(existing.id, {
+            name: cartelaData.name,
+            pattern: cartelaData.pattern,
+            numbers: cartelaData.numbers,
+            updatedAt: new Date(),
+          });
           updated++;
         } else {
           // Insert new
-          await db
-            .insert(cartelas)
-            .values({
-              shopId,
-              adminId,
-              cartelaNumber: cartelaData.cartelaNumber,
-              name: cartelaData.name,
-              pattern: cartelaData.pattern,
-              numbers: cartelaData.numbers,
-              isHardcoded: false,
-              isActive: true,
-            });
+          await storage.createCartela({
+            shopId,
+            adminId,
+            cartelaNumber: cartelaData.cartelaNumber,
+            name: cartelaData.name,
+            pattern: cartelaData.pattern,
+            numbers: cartelaData.numbers,
+            isHardcoded: false,
+            isActive: true,
+          });
           added++;
         }
       } catch (error) {
@@ -0,0 +1,47 @@
+// Run with `npm test` (node:test through tsx, on the in-memory backend)
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { storage } from "./storage";
+import { MemStorage, seedMemoryStorage } from "./memory-storage";
+import { loadHardcodedCartelas } from "./cartela-loader";
+import { FIXED_CARTELAS } from "./fixed-cartelas";
+
+const boardsWith = (number: number) =>
+  new Set(FIXED_CARTELAS.filter((board) => ["B", "I", "N", "G", "O"].some((col) => board[col].includes(number)))
+    .map((board) => board.Board));
+
+test("contains search over the seeded memory store", async (t) => {
+  // Same startup as server/index.ts with STORAGE_BACKEND=memory
+  const { shopId, adminId } = await seedMemoryStorage(storage as MemStorage);
+  await loadHardcodedCartelas(shopId, adminId);
+
+  await t.test("finds every fixed cartela holding the number", async () => {
+    const page = await storage.searchCartelas(shopId, { contains: 7, limit: 1000 });
+    const expected = boardsWith(7);
+    assert.equal(page.total, expected.size);
+    assert.deepEqual(new Set(page.items.map((c) => c.cartelaNumber)), expected);
+    for (const cartela of page.items) {
+      assert.ok(Array.isArray(cartela.pattern), `cartela ${cartela.cartelaNumber} pattern is not an array`);
+      assert.ok(cartela.pattern.flat().includes(7));
+    }
+  });
+
+  await t.test("matches and normalizes patterns stored as JSON strings", async () => {
+    const pattern = [[1, 16, 31, 46, 61], [2, 17, 32, 47, 62], [3, 18, 0, 48, 63], [4, 19, 34, 49, 64], [5, 20, 35, 50, 65]];
+    await storage.createCartela({
+      shopId, adminId, cartelaNumber: 9001, name: "Legacy", pattern: JSON.stringify(pattern) as any, isActive: true,
+    });
+
+    const page = await storage.searchCartelas(shopId, { contains: 34, cartelaNumber: 9001, limit: 10 });
+    assert.equal(page.total, 1);
+    assert.deepEqual(page.items[0].pattern, pattern);
+  });
+
+  await t.test("pages by cartela number", async () => {
+    const first = await storage.searchCartelas(shopId, { contains: 7, limit: 3 });
+    assert.equal(first.items.length, 3);
+    assert.notEqual(first.nextCursor, null);
+    const second = await storage.searchCartelas(shopId, { contains: 7, after: first.nextCursor!, limit: 3 });
+    assert.ok(second.items.every((c) => c.cartelaNumber > first.nextCursor!));
+  });
+});
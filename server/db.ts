@@ -2,14 +2,18 @@ import { Pool, neonConfig } from '@neondatabase/serverless';
 import { drizzle } from 'drizzle-orm/neon-serverless';
 import ws from "ws";
 import * as schema from "@shared/schema-simple";
+import { drizzleMetricsLogger, instrumentPool } from "./metrics";
 
 neonConfig.webSocketConstructor = ws;
 
-if (!process.env.DATABASE_URL) {
+// STORAGE_BACKEND=memory runs the app without a database (see memory-storage.ts)
+export const isMemoryStorage = process.env.STORAGE_BACKEND === "memory";
+
+if (!isMemoryStorage && !process.env.DATABASE_URL) {
   throw new Error(
     "DATABASE_URL must be set. Did you forget to provision a database?",
   );
 }
 
-export const pool = new Pool({ connectionString: process.env.DATABASE_URL });
-export const db = drizzle({ client: pool, schema });
\ No newline at end of file
+export const pool = isMemoryStorage ? null : instrumentPool(new Pool({ connectionString: process.env.DATABASE_URL }));
+export const db = isMemoryStorage ? null : drizzle({ client: pool, schema, logger: drizzleMetricsLogger });
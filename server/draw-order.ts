@@ -0,0 +1,75 @@
+import crypto from "crypto";
+
+// Each game draws its numbers in a fixed order derived from a random seed
+// stored on its row when the game is created. Online calls take the next number from it, and the caller
+// screen is sent a short look-ahead window so it can keep calling through a
+// brief outage and sync the calls afterwards (see the /events route).
+// Only the window is ever revealed, never the full order.
+
+// Calls the caller screen can make on its own before it has to reach the server
+export const LOOKAHEAD_WINDOW = 15;
+
+const orderCache = new Map<number, number[]>();
+const MAX_CACHED_ORDERS = 1000;
+
+/** Fresh secret for a new game's draw order */
+export function newDrawSeed(): string {
+  return crypto.randomBytes(32).toString("hex");
+}
+
+/**
+ * JSON replacer that keeps the draw seed out of API responses and socket
+ * messages; anyone holding it could compute the whole draw order.
+ */
+export function hideDrawSeed(key: string, value: unknown): unknown {
+  return key === "drawSeed" ? undefined : value;
+}
+
+/**
+ * Seeded permutation of 1-75 for a game: a Fisher-Yates shuffle driven by an
+ * HMAC-SHA256 stream keyed with the game's seed, so it is stable across
+ * restarts and processes.
+ */
+export function drawOrderFor(gameId: number, seed: string): number[] {
+  const cached = orderCache.get(gameId);
+  if (cached) return cached;
+
+  const order = Array.from({ length: 75 }, (_, i) => i + 1);
+  let block = Buffer.alloc(0);
+  let offset = 0;
+  let counter = 0;
+  const nextUint32 = () => {
+    if (offset + 4 > block.length) {
+      block = crypto.createHmac("sha256", seed).update(`game:${gameId}:${counter++}`).digest();
+      offset = 0;
+    }
+    const value = block.readUInt32BE(offset);
+    offset += 4;
+    return value;
+  };
+
+  for (let i = order.length - 1; i > 0; i--) {
+    const j = nextUint32() % (i + 1);
+    [order[i], order[j]] = [order[j], order[i]];
+  }
+
+  if (orderCache.size >= MAX_CACHED_ORDERS) {
+    orderCache.delete(orderCache.keys().next().value!);
+  }
+  orderCache.set(gameId, order);
+  return order;
+}
+
+/**
+ * The next `count` numbers of a game's draw order that have not been called.
+ * Numbers called out of order (older games, manual calls) are skipped.
+ */
+export function nextNumbersFor(gameId: number, seed: string, calledNumbers: (string | number)[], count: number): number[] {
+  const called = new Set(calledNumbers.map((n) => Number(n)));
+  const next: number[] = [];
+  for (const num of drawOrderFor(gameId, seed)) {
+    if (next.length >= count) break;
+    if (!called.has(num)) next.push(num);
+  }
+  return next;
+}
@@ -0,0 +1,142 @@
+import type { Express, Request, Response } from "express";
+import type { Server } from "http";
+import type { WebSocketServer } from "ws";
+import { pool, isMemoryStorage } from "./db";
+import { getLogger } from "./logger";
+
+/**
+ * Health endpoints and graceful shutdown for zero-downtime deploys.
+ *
+ *   GET /api/health/live    200 while the process is up
+ *   GET /api/health/ready   200 once startup warmups are done and the
+ *                           database answers; 503 before that and while
+ *                           the process is draining
+ *
+ * The deploy tool starts a new release on a second port, waits for it to be
+ * ready, points nginx at it and then stops the old process. On SIGTERM the
+ * old process stops accepting connections, asks its WebSocket clients to
+ * reconnect (close code 1012, spread over DRAIN_WINDOW_MS so they do not
+ * all arrive at once) and exits when the last one is gone or
+ * DRAIN_TIMEOUT_MS has passed.
+ */
+
+const healthLog = getLogger("health");
+
+const DRAIN_WINDOW_MS = Number(process.env.DRAIN_WINDOW_MS) || 5000;
+const DRAIN_TIMEOUT_MS = Number(process.env.DRAIN_TIMEOUT_MS) || 25000;
+const DB_CHECK_TIMEOUT_MS = 2000;
+// Connections opened before reporting ready, so the first requests skip the handshake
+const POOL_WARM_CONNECTIONS = 4;
+
+const warmups = new Map<string, "pending" | "done" | "failed">();
+let draining = false;
+
+/**
+ * Tracks a startup task that has to finish before the process is ready.
+ * A failed warmup is logged and does not block readiness.
+ */
+export function registerWarmup(name: string, task: Promise<unknown>): void {
+  warmups.set(name, "pending");
+  task.then(
+    () => warmups.set(name, "done"),
+    (error) => {
+      warmups.set(name, "failed");
+      healthLog.warn(`warmup ${name} failed`, { error: error?.message });
+    },
+  );
+}
+
+async function checkDatabase(): Promise<void> {
+  if (isMemoryStorage) return;
+  let timer: NodeJS.Timeout | undefined;
+  const timeout = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => reject(new Error(`no answer in ${DB_CHECK_TIMEOUT_MS}ms`)), DB_CHECK_TIMEOUT_MS);
+  });
+  try {
+    await Promise.race([pool!.query("select 1"), timeout]);
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+/** Opens a few pooled connections ahead of traffic */
+export function warmDatabase(): Promise<unknown> {
+  if (isMemoryStorage) return Promise.resolve();
+  return Promise.all(Array.from({ length: POOL_WARM_CONNECTIONS }, () => pool!.query("select 1")));
+}
+
+async function ready(_req: Request, res: Response) {
+  const pending = [...warmups].filter(([, state]) => state === "pending").map(([name]) => name);
+  let database = "ok";
+  try {
+    await checkDatabase();
+  } catch (error: any) {
+    database = error.message;
+  }
+
+  const ok = !draining && pending.length === 0 && database === "ok";
+  res.set("Cache-Control", "no-store");
+  res.status(ok ? 200 : 503).json({
+    status: ok ? "ready" : draining ? "draining" : "starting",
+    database,
+    pending,
+    uptime: Math.round(process.uptime()),
+  });
+}
+
+export function registerHealthRoutes(app: Express): void {
+  app.get("/api/health/live", (_req, res) => {
+    res.set("Cache-Control", "no-store");
+    res.json({ status: draining ? "draining" : "live" });
+  });
+  app.get("/api/health/ready", ready);
+}
+
+/**
+ * Stops taking new work on SIGTERM/SIGINT and exits once in-flight HTTP
+ * requests and WebSocket clients have moved on. `onExit` runs right before
+ * the process exits, for state that has to be flushed (the session cache).
+ */
+export function installGracefulShutdown(
+  server: Server,
+  wss: WebSocketServer,
+  onExit: () => Promise<void> = async () => {},
+): void {
+  let exiting = false;
+  const shutdown = (signal: string) => {
+    if (draining) return;
+    draining = true;
+    healthLog.info(`${signal}: draining ${wss.clients.size} WebSocket clients`);
+
+    server.close();
+    server.closeIdleConnections();
+
+    // Reconnecting clients land on the new release through nginx
+    wss.clients.forEach((ws) => {
+      setTimeout(() => ws.close(1012, "service restart"), Math.random() * DRAIN_WINDOW_MS).unref();
+    });
+
+    const exit = async (reason: string) => {
+      if (exiting) return;
+      exiting = true;
+      try {
+        await onExit();
+      } catch (error) {
+        healthLog.error("shutdown hook failed", { error });
+      }
+      // The logger flushes its buffer synchronously on exit
+      healthLog.info(`exiting: ${reason}`);
+      process.exit(0);
+    };
+    const poll = setInterval(() => {
+      if (wss.clients.size === 0) {
+        clearInterval(poll);
+        exit("all WebSocket clients drained");
+      }
+    }, 250);
+    setTimeout(() => exit(`drain timeout, ${wss.clients.size} clients left`), DRAIN_TIMEOUT_MS).unref();
+  };
+
+  process.on("SIGTERM", () => shutdown("SIGTERM"));
+  process.on("SIGINT", () => shutdown("SIGINT"));
+}
@@ -1,13 +1,28 @@
 import express, { type Request, Response, NextFunction } from "express";
 import session from "express-session";
 import ConnectPgSimple from "connect-pg-simple";
-import { pool } from "./db";
+import MemoryStore from "memorystore";
+import { pool, isMemoryStorage } from "./db";
+import { storage, backfillCartelaPatterns } from "./storage";
+import { MemStorage, seedMemoryStorage } from "./memory-storage";
+import { loadHardcodedCartelas } from "./cartela-loader";
+import { CachedSessionStore, type TouchEntry } from "./session-store";
+import { metricsMiddleware, metricsHandler } from "./metrics";
+import { getLogger } from "./logger";
+import { staticAssets } from "./static-assets";
+import { publishOnMutation } from "./realtime";
+import { hideDrawSeed } from "./draw-order";
+import { installGracefulShutdown, registerHealthRoutes, registerWarmup, warmDatabase } from "./health";
 import { registerRoutes } from "./routes";
 import { registerMongoDBRoutes } from "./mongodb-routes";
 import { initializeMongoDBData } from "./mongodb-setup";
 import { setupVite, serveStatic, log } from "./vite";
 
 const app = express();
+const httpLog = getLogger("http");
+
+// Draw seeds stay on the server, whichever route serializes a game
+app.set("json replacer", hideDrawSeed);
 
 // Add CORS headers for proper browser communication
 app.use((req, res, next) => {
@@ -23,30 +38,63 @@ app.use((req, res, next) => {
   next();
 });
 
+// Per-route latency histograms, scraped from /api/metrics (no session needed)
+app.use(metricsMiddleware);
+app.get('/api/metrics', metricsHandler);
+// Liveness and readiness for the deploy tool's blue/green cutover
+registerHealthRoutes(app);
+
 app.use(express.json({ limit: '10mb' }));
 app.use(express.urlencoded({ extended: false, limit: '10mb' }));
 
-// Serve static audio files with proper MIME types (before other routes)
+// Serve voice audio (before other routes): hashed files are immutable and
+// the shared event clips in voices/common are served from memory. A checkout
+// has the voice packs in public/voices; a deployed release links them in as
+// media/voices because its public/ is the client build.
+import fs from "fs";
 import path from "path";
-const publicPath = path.resolve(process.cwd(), "public");
-app.use(express.static(publicPath, {
-  setHeaders: (res, filePath) => {
-    if (filePath.endsWith('.mp3')) {
-      res.setHeader('Content-Type', 'audio/mpeg');
-    }
-  }
-}));
+const mediaPath = path.resolve(process.cwd(), "media");
+const publicPath = fs.existsSync(mediaPath) ? mediaPath : path.resolve(process.cwd(), "public");
+app.use(staticAssets(publicPath, { warmDirs: ['voices/common'] }));
 
 // Configure session store
 const PgSession = ConnectPgSimple(session);
+const MemSession = MemoryStore(session);
+const sessionTableName = 'session';
+
+function createSessionStore(): session.Store {
+  if (isMemoryStorage) {
+    return new MemSession({ checkPeriod: 60 * 60 * 1000 });
+  }
+
+  // Cache sessions in memory and coalesce the expiry touches caused by
+  // `rolling: true`, so dashboard polling doesn't rewrite the session table
+  // on every response. Postgres remains the source of truth across restarts.
+  return new CachedSessionStore({
+    store: new PgSession({
+      pool: pool,
+      tableName: sessionTableName,
+      createTableIfMissing: true
+    }),
+    touchInterval: Number(process.env.SESSION_TOUCH_INTERVAL_MS) || 5 * 60 * 1000,
+    flushInterval: Number(process.env.SESSION_FLUSH_INTERVAL_MS) || 30 * 1000,
+    cacheTtl: Number(process.env.SESSION_CACHE_TTL_MS) || 10 * 60 * 1000,
+    flushTouches: async (entries: TouchEntry[]) => {
+      await pool.query(
+        `UPDATE "${sessionTableName}" AS s SET expire = v.expire
+         FROM (SELECT unnest($1::text[]) AS sid, unnest($2::timestamptz[]) AS expire) AS v
+         WHERE s.sid = v.sid AND s.expire < v.expire`,
+        [entries.map((e) => e.sid), entries.map((e) => e.expire.toISOString())]
+      );
+    }
+  });
+}
+
+const sessionStore = createSessionStore();
 
 // Configure session middleware
-app.use(session({
-  store: new PgSession({
-    pool: pool,
-    tableName: 'session',
-    createTableIfMissing: true
-  }),
+const sessionMiddleware = session({
+  store: sessionStore,
   secret: 'bingo-session-secret-key-longer-for-security',
   resave: false,
   saveUninitialized: false,
@@ -60,32 +108,37 @@ app.use(session({
     domain: undefined
   },
   name: 'connect.sid'
-}));
+});
+app.use(sessionMiddleware);
+// Shared with the WebSocket server to authorize topic subscriptions
+app.locals.sessionMiddleware = sessionMiddleware;
+
+// Push topic invalidations to subscribed dashboards after successful writes
+app.use(publishOnMutation);
 
+// Request log: one line per API call, response bodies only when LOG_DEBUG includes "http"
 app.use((req, res, next) => {
+  if (!req.path.startsWith("/api")) {
+    return next();
+  }
+
   const start = Date.now();
-  const path = req.path;
   let capturedJsonResponse: Record<string, any> | undefined = undefined;
 
-  const originalResJson = res.json;
-  res.json = function (bodyJson, ...args) {
-    capturedJsonResponse = bodyJson;
-    return originalResJson.apply(res, [bodyJson, ...args]);
-  };
+  if (httpLog.isEnabled("debug")) {
+    const originalResJson = res.json;
+    res.json = function (bodyJson, ...args) {
+      capturedJsonResponse = bodyJson;
+      return originalResJson.apply(res, [bodyJson, ...args]);
+    };
+  }
 
   res.on("finish", () => {
-    const duration = Date.now() - start;
-    if (path.startsWith("/api")) {
-      let logLine = `${req.method} ${path} ${res.statusCode} in ${duration}ms`;
-      if (capturedJsonResponse) {
-        logLine += ` :: ${JSON.stringify(capturedJsonResponse)}`;
-      }
-
-      if (logLine.length > 80) {
-        logLine = logLine.slice(0, 79) + "…";
-      }
-
-      log(logLine);
+    const line = `${req.method} ${req.path} ${res.statusCode} in ${Date.now() - start}ms`;
+    if (capturedJsonResponse) {
+      httpLog.debug(line, () => ({ body: JSON.stringify(capturedJsonResponse, hideDrawSeed).slice(0, 500) }));
+    } else {
+      httpLog.info(line);
     }
   });
 
@@ -93,7 +146,17 @@ app.use((req, res, next) => {
 });
 
 (async () => {
-  const { server } = await registerRoutes(app);
+  if (isMemoryStorage) {
+    log("STORAGE_BACKEND=memory: running without a database, all data is lost on restart");
+    const { shopId, adminId } = await seedMemoryStorage(storage as MemStorage);
+    await loadHardcodedCartelas(shopId, adminId);
+  }
+
+  const { server, wss } = await registerRoutes(app);
+  // Persist pending session expiry touches before the process exits
+  installGracefulShutdown(server, wss, async () => {
+    if (sessionStore instanceof CachedSessionStore) await sessionStore.close();
+  });
   
   // Register MongoDB routes alongside PostgreSQL routes
   registerMongoDBRoutes(app);
@@ -115,13 +178,18 @@ app.use((req, res, next) => {
     serveStatic(app);
   }
 
-  // ALWAYS serve the app on port 5000
-  // this serves both the API and the client.
-  // It is the only port that is not firewalled.
-  const port = 5000;
+  // Serve the app on port 5000 unless PORT is set. Blue/green deploys run
+  // two releases side by side on fixed ports, so an explicit PORT never
+  // falls back to another one.
+  const explicitPort = Boolean(process.env.PORT);
+  const port = Number(process.env.PORT) || 5000;
   
   server.listen(port, "0.0.0.0", async () => {
     log(`serving on port ${port}`);
+    registerWarmup("database", warmDatabase());
+    registerWarmup("cartela patterns", backfillCartelaPatterns().then((fixed) => {
+      if (fixed) log(`converted ${fixed} string cartela patterns to jsonb arrays`);
+    }));
     
     // Initialize MongoDB data
     try {
@@ -133,7 +201,7 @@ app.use((req, res, next) => {
     // Hardcoded cartela loading disabled - admins manage their own cartelas
     console.log("Hardcoded cartela auto-loading is disabled. Admins can add cartelas manually.");
   }).on('error', (err: any) => {
-    if (err.code === 'EADDRINUSE') {
+    if (err.code === 'EADDRINUSE' && !explicitPort) {
       log(`Port ${port} is already in use. Trying to find an alternative port...`);
       // Try alternative ports
       const tryPort = (portToTry: number) => {
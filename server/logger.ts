@@ -0,0 +1,175 @@
+import fs from "fs";
+
+/**
+ * Leveled, per-category logger with sampling and buffered output.
+ *
+ * Configuration (environment):
+ *   LOG_LEVEL    default level for every category (error|warn|info|debug|trace), default "info"
+ *   LOG_DEBUG    comma separated categories raised to debug, e.g. "bingo,cartelas" or "*"
+ *   LOG_SAMPLE   per-category sample rates for info and below, e.g. "http:0.1,bingo:0.01"
+ *   LOG_FORMAT   "text" (default) or "json" for one JSON object per line
+ *
+ * Fields may be passed as a function; it is only called when the line will
+ * actually be written, so expensive debug detail costs nothing when disabled.
+ */
+
+export type LogLevel = "error" | "warn" | "info" | "debug" | "trace";
+type Fields = Record<string, unknown>;
+type LazyFields = Fields | (() => Fields);
+
+const LEVELS: Record<LogLevel, number> = { error: 0, warn: 1, info: 2, debug: 3, trace: 4 };
+
+// Flush once the buffer passes this size instead of waiting for the next tick
+const FLUSH_BYTES = 64 * 1024;
+// Beyond this, sampled levels are dropped rather than growing memory
+const MAX_BUFFER_BYTES = 4 * 1024 * 1024;
+
+function parseLevel(value: string | undefined, fallback: LogLevel): LogLevel {
+  return value && value in LEVELS ? (value as LogLevel) : fallback;
+}
+
+function parseList(value: string | undefined): Set<string> {
+  return new Set((value || "").split(",").map((item) => item.trim()).filter(Boolean));
+}
+
+function parseRates(value: string | undefined): Map<string, number> {
+  const rates = new Map<string, number>();
+  for (const item of (value || "").split(",")) {
+    const [category, rate] = item.split(":").map((part) => part.trim());
+    const parsed = Number(rate);
+    if (category && Number.isFinite(parsed)) {
+      rates.set(category, Math.min(1, Math.max(0, parsed)));
+    }
+  }
+  return rates;
+}
+
+const defaultLevel = parseLevel(process.env.LOG_LEVEL, "info");
+const debugCategories = parseList(process.env.LOG_DEBUG);
+const sampleRates = parseRates(process.env.LOG_SAMPLE);
+const jsonFormat = process.env.LOG_FORMAT === "json";
+
+let buffer: string[] = [];
+let bufferedBytes = 0;
+let flushScheduled = false;
+let dropped = 0;
+
+function flush(): void {
+  flushScheduled = false;
+  if (dropped > 0) {
+    buffer.push(formatLine("warn", "logger", `dropped ${dropped} log lines, output could not keep up`));
+    dropped = 0;
+  }
+  if (buffer.length === 0) return;
+
+  const chunk = buffer.join("");
+  buffer = [];
+  bufferedBytes = 0;
+  process.stdout.write(chunk);
+}
+
+function flushSync(): void {
+  if (buffer.length === 0) return;
+  const chunk = buffer.join("");
+  buffer = [];
+  bufferedBytes = 0;
+  try {
+    fs.writeSync(1, chunk);
+  } catch {
+    // stdout already closed
+  }
+}
+
+process.on("exit", flushSync);
+
+function enqueue(line: string, droppable: boolean): void {
+  if (droppable && bufferedBytes > MAX_BUFFER_BYTES) {
+    dropped++;
+    return;
+  }
+  buffer.push(line);
+  bufferedBytes += line.length;
+
+  if (bufferedBytes >= FLUSH_BYTES) {
+    flush();
+  } else if (!flushScheduled) {
+    flushScheduled = true;
+    setImmediate(flush);
+  }
+}
+
+function serialize(value: unknown): string {
+  try {
+    return JSON.stringify(value, (_key, field) =>
+      field instanceof Error ? { message: field.message, stack: field.stack } : field);
+  } catch {
+    return String(value);
+  }
+}
+
+function formatLine(level: LogLevel, category: string, message: string, fields?: Fields): string {
+  if (jsonFormat) {
+    return serialize({ time: new Date().toISOString(), level, category, msg: message, ...fields }) + "\n";
+  }
+  const suffix = fields && Object.keys(fields).length > 0 ? ` ${serialize(fields)}` : "";
+  return `${new Date().toISOString()} ${level.toUpperCase()} [${category}] ${message}${suffix}\n`;
+}
+
+export class Logger {
+  private readonly threshold: number;
+  private readonly sampleRate: number;
+
+  constructor(readonly category: string) {
+    const level = debugCategories.has(category) || debugCategories.has("*") ? "debug" : defaultLevel;
+    this.threshold = LEVELS[level];
+    this.sampleRate = sampleRates.get(category) ?? sampleRates.get("*") ?? 1;
+  }
+
+  isEnabled(level: LogLevel): boolean {
+    return LEVELS[level] <= this.threshold;
+  }
+
+  error(message: string, fields?: LazyFields): void {
+    this.write("error", message, fields);
+  }
+
+  warn(message: string, fields?: LazyFields): void {
+    this.write("warn", message, fields);
+  }
+
+  info(message: string, fields?: LazyFields): void {
+    this.write("info", message, fields);
+  }
+
+  debug(message: string, fields?: LazyFields): void {
+    this.write("debug", message, fields);
+  }
+
+  trace(message: string, fields?: LazyFields): void {
+    this.write("trace", message, fields);
+  }
+
+  private write(level: LogLevel, message: string, fields?: LazyFields): void {
+    if (LEVELS[level] > this.threshold) return;
+
+    // Errors and warnings are never sampled or dropped
+    const droppable = LEVELS[level] >= LEVELS.info;
+    if (droppable && this.sampleRate < 1 && Math.random() >= this.sampleRate) return;
+
+    const resolved = typeof fields === "function" ? fields() : fields;
+    enqueue(formatLine(level, this.category, message, resolved), droppable);
+  }
+}
+
+const loggers = new Map<string, Logger>();
+
+export function getLogger(category: string): Logger {
+  let logger = loggers.get(category);
+  if (!logger) {
+    logger = new Logger(category);
+    loggers.set(category, logger);
+  }
+  return logger;
+}
+
+export { flush as flushLogs };
@@ -0,0 +1,1194 @@
+import bcrypt from "bcrypt";
+import type {
+  User, InsertUser, Shop, InsertShop, Game, InsertGame, GamePlayer, InsertGamePlayer,
+  Transaction, InsertTransaction, CommissionPayment, InsertCommissionPayment,
+  GameHistory, InsertGameHistory, CreditTransfer, CreditLoad, InsertCreditLoad,
+  ReferralCommission, InsertReferralCommission, WithdrawalRequest,
+  SuperAdminRevenue, InsertSuperAdminRevenue, DailyRevenueSummary, InsertDailyRevenueSummary,
+  EmployeeProfitMargin, InsertEmployeeProfitMargin, Cartela, InsertCartela,
+  CustomCartela, InsertCustomCartela
+} from "@shared/schema";
+import type { IStorage, CartelaSearchOptions, CartelaPage } from "./storage";
+import { newDrawSeed } from "./draw-order";
+import { parsePattern } from "@shared/bingo-rules";
+
+type KeyFn<T> = (row: T) => unknown;
+
+/**
+ * A single in-memory table with a serial id and hash indexes on the
+ * columns that the storage queries filter by.
+ */
+class MemTable<T extends { id: number }> {
+  private rows = new Map<number, T>();
+  private nextId = 1;
+  private indexes = new Map<string, { key: KeyFn<T>; entries: Map<unknown, Set<number>> }>();
+
+  constructor(private defaults: () => Partial<T>, indexes: Record<string, KeyFn<T>> = {}) {
+    for (const [name, key] of Object.entries(indexes)) {
+      this.indexes.set(name, { key, entries: new Map() });
+    }
+  }
+
+  insert(values: Partial<T>): T {
+    const id = values.id ?? this.nextId;
+    this.nextId = Math.max(this.nextId, id + 1);
+    const row = { ...this.defaults(), ...withoutUndefined(values), id } as T;
+    this.rows.set(id, row);
+    this.addToIndexes(row);
+    return { ...row };
+  }
+
+  get(id: number): T | undefined {
+    const row = this.rows.get(id);
+    return row ? { ...row } : undefined;
+  }
+
+  find(index: string, key: unknown): T[] {
+    const ids = this.indexes.get(index)!.entries.get(key);
+    if (!ids) return [];
+    const result: T[] = [];
+    for (const id of ids) result.push({ ...this.rows.get(id)! });
+    return result;
+  }
+
+  first(index: string, key: unknown): T | undefined {
+    return this.find(index, key)[0];
+  }
+
+  all(): T[] {
+    return Array.from(this.rows.values(), (row) => ({ ...row }));
+  }
+
+  update(id: number, updates: Partial<T>): T | undefined {
+    const row = this.rows.get(id);
+    if (!row) return undefined;
+    this.removeFromIndexes(row);
+    // Like drizzle's .set(), undefined values leave the column unchanged
+    Object.assign(row, withoutUndefined(updates), { id });
+    this.addToIndexes(row);
+    return { ...row };
+  }
+
+  delete(id: number): boolean {
+    const row = this.rows.get(id);
+    if (!row) return false;
+    this.removeFromIndexes(row);
+    return this.rows.delete(id);
+  }
+
+  private addToIndexes(row: T): void {
+    for (const { key, entries } of this.indexes.values()) {
+      const value = key(row);
+      let ids = entries.get(value);
+      if (!ids) entries.set(value, (ids = new Set()));
+      ids.add(row.id);
+    }
+  }
+
+  private removeFromIndexes(row: T): void {
+    for (const { key, entries } of this.indexes.values()) {
+      const value = key(row);
+      const ids = entries.get(value);
+      ids?.delete(row.id);
+      if (ids && ids.size === 0) entries.delete(value);
+    }
+  }
+}
+
+function withoutUndefined<T extends object>(values: T): Partial<T> {
+  const result: Partial<T> = {};
+  for (const [key, value] of Object.entries(values)) {
+    if (value !== undefined) (result as any)[key] = value;
+  }
+  return result;
+}
+
+function time(value: Date | string | null | undefined): number {
+  return value ? new Date(value).getTime() : 0;
+}
+
+function byDesc<T>(key: (row: T) => number | string | Date | null | undefined) {
+  return (a: T, b: T) => {
+    const left = key(a), right = key(b);
+    const l = left instanceof Date ? left.getTime() : left ?? 0;
+    const r = right instanceof Date ? right.getTime() : right ?? 0;
+    return l < r ? 1 : l > r ? -1 : 0;
+  };
+}
+
+function inRange(value: Date | null | undefined, startDate?: Date, endDate?: Date): boolean {
+  if (!startDate || !endDate) return true;
+  const t = time(value);
+  return t >= startDate.getTime() && t <= endDate.getTime();
+}
+
+function sumAmounts(values: Array<string | null | undefined>): number {
+  return values.reduce((total, value) => total + parseFloat(value || "0"), 0);
+}
+
+// Same UTC+3 shift as DatabaseStorage.getCurrentEATDate
+function toEATDate(value: Date | string | null | undefined): string {
+  return new Date(time(value) + 3 * 60 * 60 * 1000).toISOString().split('T')[0];
+}
+
+/**
+ * In-memory IStorage backend with the same behaviour as DatabaseStorage.
+ *
+ * Selected with STORAGE_BACKEND=memory. State lives only for the lifetime
+ * of the process, which makes it suitable for hermetic tests and CPU-only
+ * benchmarks of the routes and game logic without database latency.
+ */
+export class MemStorage implements IStorage {
+  private users = new MemTable<User>(() => ({
+    email: null, isBlocked: false, shopId: null, supervisorId: null, creditBalance: "0.00",
+    accountNumber: null, referredBy: null, commissionRate: "25.00", createdAt: new Date(),
+  }), {
+    username: (u) => u.username,
+    accountNumber: (u) => u.accountNumber,
+    shopId: (u) => u.shopId,
+    supervisorId: (u) => u.supervisorId,
+    referredBy: (u) => u.referredBy,
+    role: (u) => u.role,
+  });
+
+  private shops = new MemTable<Shop>(() => ({
+    adminId: null, profitMargin: "20.00", superAdminCommission: "25.00", referralCommission: "3.00",
+    isBlocked: false, createdAt: new Date(), totalRevenue: "0.00",
+  }), { adminId: (s) => s.adminId });
+
+  private games = new MemTable<Game>(() => ({
+    prizePool: "0.00", calledNumbers: [], winnerId: null, drawSeed: null, startedAt: null, completedAt: null,
+    createdAt: new Date(),
+  }), { shopId: (g) => g.shopId, employeeId: (g) => g.employeeId });
+
+  private gamePlayers = new MemTable<GamePlayer>(() => ({ registeredAt: new Date() }), {
+    gameId: (p) => p.gameId,
+  });
+
+  private transactions = new MemTable<Transaction>(() => ({
+    gameId: null, shopId: null, employeeId: null, adminId: null, description: null,
+    referenceId: null, fromUserId: null, toUserId: null, createdAt: new Date(),
+  }), { shopId: (t) => t.shopId, employeeId: (t) => t.employeeId });
+
+  private commissionPayments = new MemTable<CommissionPayment>(() => ({ paidAt: new Date() }), {
+    shopId: (c) => c.shopId,
+  });
+
+  private gameHistory = new MemTable<GameHistory>(() => ({
+    winnerName: null, winningCartela: null, completedAt: new Date(),
+  }), { shopId: (h) => h.shopId, employeeId: (h) => h.employeeId });
+
+  private creditTransfers = new MemTable<CreditTransfer>(() => ({
+    description: null, status: "completed", createdAt: new Date(),
+  }), { fromAdminId: (t) => t.fromAdminId, toAdminId: (t) => t.toAdminId });
+
+  private creditLoads = new MemTable<CreditLoad>(() => ({
+    referenceNumber: null, transferScreenshot: null, adminAccountNumber: null, status: "pending",
+    notes: null, requestedAt: new Date(), processedAt: null, processedBy: null,
+  }), { adminId: (l) => l.adminId });
+
+  private referralCommissions = new MemTable<ReferralCommission>(() => ({
+    status: "pending", createdAt: new Date(), processedAt: null,
+  }), { referrerId: (c) => c.referrerId });
+
+  private withdrawalRequests = new MemTable<WithdrawalRequest>(() => ({
+    status: "pending", createdAt: new Date(), processedAt: null, processedBy: null, rejectionReason: null,
+  }), { adminId: (w) => w.adminId });
+
+  private superAdminRevenues = new MemTable<SuperAdminRevenue>(() => ({
+    gameId: null, transactionId: null, createdAt: new Date(),
+  }), { dateEAT: (r) => r.dateEAT });
+
+  private dailyRevenueSummary = new MemTable<DailyRevenueSummary>(() => ({
+    totalSuperAdminRevenue: "0.00", totalAdminRevenue: "0.00", totalGamesPlayed: 0,
+    totalPlayersRegistered: 0, createdAt: new Date(), updatedAt: new Date(),
+  }), { date: (d) => d.date });
+
+  private employeeProfitMargins = new MemTable<EmployeeProfitMargin>(() => ({
+    profitMargin: "20.00", createdAt: new Date(),
+  }), { employeeShop: (m) => `${m.employeeId}:${m.shopId}` });
+
+  private cartelas = new MemTable<Cartela>(() => ({
+    isHardcoded: false, isActive: true, isBooked: false, bookedBy: null, collectorId: null,
+    markedAt: null, gameId: null, createdAt: new Date(), updatedAt: new Date(),
+  }), {
+    shopId: (c) => c.shopId,
+    shopNumber: (c) => `${c.shopId}:${c.cartelaNumber}`,
+    collectorId: (c) => c.collectorId,
+  });
+
+  private customCartelas = new MemTable<CustomCartela>(() => ({
+    isActive: true, createdAt: new Date(),
+  }), { shopNumber: (c) => `${c.shopId}:${c.cartelaNumber}`, shopId: (c) => c.shopId });
+
+  // User methods
+  async getUser(id: number): Promise<User | undefined> {
+    return this.users.get(id);
+  }
+
+  async getUserByUsername(username: string): Promise<User | undefined> {
+    return this.users.first("username", username);
+  }
+
+  async getUserByAccountNumber(accountNumber: string): Promise<User | undefined> {
+    return this.users.first("accountNumber", accountNumber);
+  }
+
+  async createUser(insertUser: InsertUser): Promise<User> {
+    if (this.users.first("username", insertUser.username)) {
+      throw new Error(`duplicate key value violates unique constraint "users_username_unique"`);
+    }
+    return this.users.insert(insertUser as Partial<User>);
+  }
+
+  async updateUser(id: number, updates: Partial<InsertUser>): Promise<User | undefined> {
+    return this.users.update(id, updates as Partial<User>);
+  }
+
+  async deleteUser(id: number): Promise<boolean> {
+    return this.users.delete(id);
+  }
+
+  async getUsersByShop(shopId: number): Promise<User[]> {
+    return this.users.find("shopId", shopId);
+  }
+
+  async getUserByShopId(shopId: number): Promise<User | undefined> {
+    return this.users.find("shopId", shopId).find((u) => u.role === 'admin');
+  }
+
+  async updateUserBalance(id: number, balance: string): Promise<User | undefined> {
+    return this.users.update(id, { creditBalance: balance });
+  }
+
+  async getUsers(): Promise<User[]> {
+    return this.users.all();
+  }
+
+  // Shop methods
+  async getShop(id: number): Promise<Shop | undefined> {
+    return this.shops.get(id);
+  }
+
+  async getShops(): Promise<Shop[]> {
+    return this.shops.all().sort(byDesc((s) => s.createdAt));
+  }
+
+  async createShop(insertShop: InsertShop): Promise<Shop> {
+    return this.shops.insert(insertShop as Partial<Shop>);
+  }
+
+  async updateShop(id: number, updates: Partial<InsertShop>): Promise<Shop | undefined> {
+    return this.shops.update(id, updates as Partial<Shop>);
+  }
+
+  async getShopsByAdmin(adminId: number): Promise<Shop[]> {
+    return this.shops.find("adminId", adminId);
+  }
+
+  // Game methods
+  async getGame(id: number): Promise<Game | undefined> {
+    return this.games.get(id);
+  }
+
+  async getGamesByShop(shopId: number): Promise<Game[]> {
+    return this.games.find("shopId", shopId).sort(byDesc((g) => g.createdAt));
+  }
+
+  async getActiveGameByEmployee(employeeId: number): Promise<Game | undefined> {
+    return this.games.find("employeeId", employeeId)
+      .filter((g) => ['waiting', 'pending', 'active'].includes(g.status))
+      .sort(byDesc((g) => g.id))[0];
+  }
+
+  async getActiveGameByShop(shopId: number): Promise<Game | undefined> {
+    return this.games.find("shopId", shopId)
+      .filter((g) => ['waiting', 'pending', 'active', 'paused'].includes(g.status))
+      .sort(byDesc((g) => g.id))[0];
+  }
+
+  async getRecentGamesByShop(shopId: number, hoursBack: number = 1): Promise<Game[]> {
+    const cutoff = Date.now() - hoursBack * 60 * 60 * 1000;
+    return this.games.find("shopId", shopId)
+      .filter((g) => time(g.createdAt) >= cutoff)
+      .sort(byDesc((g) => g.id));
+  }
+
+  async getRecentCompletedGame(shopId: number): Promise<Game | undefined> {
+    return this.games.find("shopId", shopId)
+      .filter((g) => g.status === 'completed')
+      .sort(byDesc((g) => g.completedAt))[0];
+  }
+
+  async createGame(insertGame: InsertGame): Promise<Game> {
+    return this.games.insert({ ...insertGame, drawSeed: newDrawSeed() } as Partial<Game>);
+  }
+
+  async updateGame(id: number, updates: Partial<InsertGame> & { drawSeed?: string }): Promise<Game | undefined> {
+    return this.games.update(id, updates as Partial<Game>);
+  }
+
+  async updateGameStatus(gameId: number, status: string): Promise<Game> {
+    return this.games.update(gameId, { status, startedAt: status === 'active' ? new Date() : undefined });
+  }
+
+  async updateGameNumbers(gameId: number, calledNumbers: string[]): Promise<Game> {
+    const currentGame = this.games.get(gameId);
+    if (currentGame && currentGame.status === 'paused' && calledNumbers.length > 0) {
+      throw new Error('Cannot add numbers to paused game');
+    }
+    return this.games.update(gameId, { calledNumbers });
+  }
+
+  async updateGamePrizePool(gameId: number, additionalAmount: number): Promise<Game> {
+    const currentGame = this.games.get(gameId);
+    if (!currentGame) throw new Error('Game not found');
+    const prizePool = (parseFloat(currentGame.prizePool) + additionalAmount).toString();
+    return this.games.update(gameId, { prizePool });
+  }
+
+  async completeGame(gameId: number, winnerId: number, prizeAmount: string): Promise<Game> {
+    return this.games.update(gameId, { status: 'completed', winnerId, completedAt: new Date() });
+  }
+
+  // Game player methods
+  async getGamePlayers(gameId: number): Promise<GamePlayer[]> {
+    return this.gamePlayers.find("gameId", gameId).sort(byDesc((p) => p.registeredAt));
+  }
+
+  async createGamePlayer(insertPlayer: InsertGamePlayer): Promise<GamePlayer> {
+    return this.gamePlayers.insert(insertPlayer as Partial<GamePlayer>);
+  }
+
+  async addGamePlayer(insertPlayer: InsertGamePlayer): Promise<GamePlayer> {
+    return this.createGamePlayer(insertPlayer);
+  }
+
+  async getGamePlayerCount(gameId: number): Promise<number> {
+    return this.gamePlayers.find("gameId", gameId).length;
+  }
+
+  async updateGamePlayer(id: number, updates: Partial<InsertGamePlayer>): Promise<GamePlayer | undefined> {
+    return this.gamePlayers.update(id, updates as Partial<GamePlayer>);
+  }
+
+  async removeGamePlayer(id: number): Promise<boolean> {
+    return this.gamePlayers.delete(id);
+  }
+
+  // Transaction methods
+  async createTransaction(insertTransaction: InsertTransaction): Promise<Transaction> {
+    return this.transactions.insert(insertTransaction as Partial<Transaction>);
+  }
+
+  async getTransactionsByShop(shopId: number, startDate?: Date, endDate?: Date): Promise<Transaction[]> {
+    return this.transactions.find("shopId", shopId)
+      .filter((t) => inRange(t.createdAt, startDate, endDate))
+      .sort(byDesc((t) => t.createdAt));
+  }
+
+  async getTransactionsByEmployee(employeeId: number, startDate?: Date, endDate?: Date): Promise<Transaction[]> {
+    return this.transactions.find("employeeId", employeeId)
+      .filter((t) => inRange(t.createdAt, startDate, endDate))
+      .sort(byDesc((t) => t.createdAt));
+  }
+
+  // Commission methods
+  async createCommissionPayment(insertPayment: InsertCommissionPayment): Promise<CommissionPayment> {
+    return this.commissionPayments.insert(insertPayment as Partial<CommissionPayment>);
+  }
+
+  async getCommissionPayments(shopId: number): Promise<CommissionPayment[]> {
+    return this.commissionPayments.find("shopId", shopId).sort(byDesc((c) => c.paidAt));
+  }
+
+  // Game history methods
+  async createGameHistory(insertHistory: InsertGameHistory): Promise<GameHistory> {
+    return this.gameHistory.insert(insertHistory as Partial<GameHistory>);
+  }
+
+  async recordGameHistory(insertHistory: InsertGameHistory): Promise<GameHistory> {
+    return this.createGameHistory(insertHistory);
+  }
+
+  private withWinnerDetails(history: GameHistory) {
+    const game = this.games.get(history.gameId);
+    const winner = game?.winnerId ? this.gamePlayers.get(game.winnerId) : undefined;
+    return {
+      id: history.id,
+      gameId: history.gameId,
+      shopId: history.shopId,
+      employeeId: history.employeeId,
+      totalCollected: history.totalCollected,
+      prizeAmount: history.prizeAmount,
+      adminProfit: history.adminProfit,
+      superAdminCommission: history.superAdminCommission,
+      playerCount: history.playerCount,
+      winnerName: winner?.playerName ?? null,
+      completedAt: history.completedAt,
+      winnerId: game?.winnerId ?? null,
+      winningCartela: history.winningCartela,
+    };
+  }
+
+  async getGameHistory(shopId: number, startDate?: Date, endDate?: Date): Promise<any[]> {
+    return this.gameHistory.find("shopId", shopId)
+      .filter((h) => inRange(h.completedAt, startDate, endDate))
+      .sort(byDesc((h) => h.completedAt))
+      .map((h) => this.withWinnerDetails(h));
+  }
+
+  async getEmployeeGameHistory(employeeId: number, startDate?: Date, endDate?: Date): Promise<any[]> {
+    return this.gameHistory.find("employeeId", employeeId)
+      .filter((h) => inRange(h.completedAt, startDate, endDate))
+      .sort(byDesc((h) => h.completedAt))
+      .map((h) => this.withWinnerDetails(h));
+  }
+
+  // Analytics methods
+  async getShopStats(shopId: number, startDate?: Date, endDate?: Date) {
+    const history = this.gameHistory.find("shopId", shopId)
+      .filter((h) => inRange(h.completedAt, startDate, endDate));
+    const shopGames = this.games.find("shopId", shopId);
+    const totalGames = shopGames.filter((g) => inRange(g.createdAt, startDate, endDate)).length;
+    const totalPlayers = shopGames.reduce((total, g) => total + this.gamePlayers.find("gameId", g.id)
+      .filter((p) => inRange(p.registeredAt, startDate, endDate)).length, 0);
+
+    return {
+      totalRevenue: history.length > 0 ? sumAmounts(history.map((h) => h.totalCollected)).toFixed(2) : "0",
+      totalGames,
+      totalPlayers,
+    };
+  }
+
+  async getEmployeeStats(employeeId: number, startDate?: Date, endDate?: Date) {
+    const entryFees = this.transactions.find("employeeId", employeeId)
+      .filter((t) => t.type === 'entry_fee' && inRange(t.createdAt, startDate, endDate));
+    const employeeGames = this.games.find("employeeId", employeeId);
+    const gamesCompleted = employeeGames
+      .filter((g) => g.status === 'completed' && inRange(g.createdAt, startDate, endDate)).length;
+    const playersRegistered = employeeGames.reduce((total, g) => total + this.gamePlayers.find("gameId", g.id)
+      .filter((p) => inRange(p.registeredAt, startDate, endDate)).length, 0);
+
+    return {
+      totalCollections: entryFees.length > 0 ? sumAmounts(entryFees.map((t) => t.amount)).toFixed(2) : "0",
+      gamesCompleted,
+      playersRegistered,
+    };
+  }
+
+  // Credit system methods
+  async getCreditBalance(adminId: number): Promise<string> {
+    return this.users.get(adminId)?.creditBalance || "0.00";
+  }
+
+  async updateCreditBalance(adminId: number, amount: string, operation: 'add' | 'subtract'): Promise<void> {
+    const currentAmount = parseFloat(await this.getCreditBalance(adminId));
+    const changeAmount = parseFloat(amount);
+    const newBalance = operation === 'add' ? currentAmount + changeAmount : currentAmount - changeAmount;
+    this.users.update(adminId, { creditBalance: newBalance.toFixed(2) });
+  }
+
+  async createCreditTransfer(transferData: { fromAdminId: number; toAdminId: number; amount: string; description?: string }): Promise<CreditTransfer> {
+    await this.updateCreditBalance(transferData.fromAdminId, transferData.amount, 'subtract');
+    await this.updateCreditBalance(transferData.toAdminId, transferData.amount, 'add');
+    return this.creditTransfers.insert({
+      fromAdminId: transferData.fromAdminId,
+      toAdminId: transferData.toAdminId,
+      amount: transferData.amount,
+      description: transferData.description || '',
+      status: 'completed',
+    });
+  }
+
+  async getCreditTransfers(adminId: number): Promise<any[]> {
+    const transfers = new Map<number, CreditTransfer>();
+    for (const t of this.creditTransfers.find("fromAdminId", adminId)) transfers.set(t.id, t);
+    for (const t of this.creditTransfers.find("toAdminId", adminId)) transfers.set(t.id, t);
+
+    const adminSummary = (id: number) => {
+      const user = this.users.get(id);
+      return user ? { name: user.name, username: user.username, accountNumber: user.accountNumber } : undefined;
+    };
+
+    return Array.from(transfers.values())
+      .sort(byDesc((t) => t.createdAt))
+      .map((transfer) => ({
+        ...transfer,
+        fromAdmin: adminSummary(transfer.fromAdminId),
+        toAdmin: adminSummary(transfer.toAdminId),
+      }));
+  }
+
+  async createCreditLoad(load: InsertCreditLoad): Promise<CreditLoad> {
+    return this.creditLoads.insert(load as Partial<CreditLoad>);
+  }
+
+  async getCreditLoads(adminId?: number, status?: string): Promise<CreditLoad[]> {
+    const loads = adminId ? this.creditLoads.find("adminId", adminId) : this.creditLoads.all();
+    return loads
+      .filter((l) => !status || l.status === status)
+      .sort(byDesc((l) => l.requestedAt))
+      .map((load) => {
+        const admin = this.users.get(load.adminId);
+        return {
+          ...load,
+          admin: admin
+            ? { id: admin.id, name: admin.name, username: admin.username, accountNumber: admin.accountNumber }
+            : null,
+        };
+      });
+  }
+
+  async processCreditLoad(loadId: number, status: 'confirmed' | 'rejected', processedBy: number): Promise<CreditLoad> {
+    const load = this.creditLoads.get(loadId);
+    if (!load) {
+      throw new Error('Credit load not found');
+    }
+
+    const updatedLoad = this.creditLoads.update(loadId, { status, processedAt: new Date(), processedBy });
+
+    if (status === 'confirmed') {
+      await this.updateCreditBalance(load.adminId, load.amount, 'add');
+      const admin = await this.getUser(load.adminId);
+
+      await this.createTransaction({
+        type: 'credit_load',
+        amount: load.amount,
+        description: `Credit loaded via ${load.paymentMethod}`,
+        referenceId: load.referenceNumber,
+        adminId: load.adminId,
+        shopId: admin?.shopId || null,
+        employeeId: null,
+        gameId: null,
+        fromUserId: null,
+        toUserId: load.adminId,
+      });
+
+      if (admin && admin.referredBy) {
+        const commissionRate = "3.00";
+        await this.createReferralCommission({
+          referrerId: admin.referredBy,
+          referredId: load.adminId,
+          sourceType: 'credit_load',
+          sourceId: loadId,
+          sourceAmount: load.amount,
+          commissionRate,
+          commissionAmount: this.calculateReferralCommission(load.amount, commissionRate),
+          status: 'pending',
+        });
+      }
+    }
+
+    return updatedLoad;
+  }
+
+  // Profit sharing and referral methods
+  async calculateProfitSharing(gameAmount: string, shopId: number) {
+    const shop = this.shops.get(shopId);
+    if (!shop) {
+      throw new Error('Shop not found');
+    }
+
+    const totalAmount = parseFloat(gameAmount);
+    const adminProfit = (totalAmount * parseFloat(shop.profitMargin)) / 100;
+    const superAdminCommission = (adminProfit * parseFloat(shop.superAdminCommission)) / 100;
+    const result: { adminProfit: string; superAdminCommission: string; prizeAmount: string; referralBonus?: string } = {
+      adminProfit: adminProfit.toFixed(2),
+      superAdminCommission: superAdminCommission.toFixed(2),
+      prizeAmount: (totalAmount - adminProfit).toFixed(2),
+    };
+
+    const admin = shop.adminId ? this.users.get(shop.adminId) : undefined;
+    if (admin?.referredBy) {
+      result.referralBonus = ((adminProfit * parseFloat(shop.referralCommission)) / 100).toFixed(2);
+    }
+
+    return result;
+  }
+
+  async processGameProfits(gameId: number, totalCollected: string): Promise<void> {
+    const game = this.games.get(gameId);
+    if (!game) return;
+    const shop = this.shops.get(game.shopId);
+    if (!shop) return;
+    const admin = shop.adminId ? this.users.get(shop.adminId) : undefined;
+    if (!admin) return;
+
+    const profits = await this.calculateProfitSharing(totalCollected, game.shopId);
+    await this.updateCreditBalance(admin.id, profits.superAdminCommission, 'subtract');
+
+    await this.createTransaction({
+      gameId,
+      shopId: game.shopId,
+      employeeId: game.employeeId,
+      adminId: admin.id,
+      type: 'game_collection',
+      amount: totalCollected,
+      description: `Game ${gameId} collection by employee`,
+    });
+
+    const commissionTransaction = await this.createTransaction({
+      gameId,
+      shopId: game.shopId,
+      employeeId: null,
+      adminId: admin.id,
+      type: 'super_admin_commission',
+      amount: `-${profits.superAdminCommission}`,
+      description: `Super admin commission deducted for game ${gameId}`,
+    });
+
+    await this.createSuperAdminRevenue({
+      adminId: admin.id,
+      adminName: admin.name || admin.username,
+      shopId: game.shopId,
+      shopName: shop.name,
+      gameId,
+      transactionId: commissionTransaction.id,
+      revenueType: 'game_commission',
+      amount: profits.superAdminCommission,
+      commissionRate: admin.commissionRate || "15.00",
+      sourceAmount: totalCollected,
+      description: `Game commission from ${admin.name || admin.username} - Game ${gameId}`,
+      dateEAT: this.getCurrentEATDate(),
+    });
+
+    if (profits.referralBonus && admin.referredBy) {
+      await this.updateCreditBalance(admin.referredBy, profits.referralBonus, 'add');
+      await this.createTransaction({
+        gameId,
+        shopId: null,
+        employeeId: null,
+        adminId: admin.referredBy,
+        type: 'referral_bonus',
+        amount: profits.referralBonus,
+        description: `Referral bonus for game ${gameId}`,
+      });
+    }
+  }
+
+  async generateAccountNumber(): Promise<string> {
+    const timestamp = Date.now().toString().slice(-6);
+    const random = Math.floor(Math.random() * 1000).toString().padStart(3, '0');
+    return `BGO${timestamp}${random}`;
+  }
+
+  async getAdminsByReferrer(referrerId: number): Promise<User[]> {
+    return this.users.find("referredBy", referrerId).filter((u) => u.role === 'admin');
+  }
+
+  // Referral commission methods
+  async createReferralCommission(commission: InsertReferralCommission): Promise<ReferralCommission> {
+    return this.referralCommissions.insert(commission as Partial<ReferralCommission>);
+  }
+
+  async getReferralCommissions(referrerId: number): Promise<ReferralCommission[]> {
+    return this.referralCommissions.find("referrerId", referrerId);
+  }
+
+  async processReferralCommission(commissionId: number, action: 'withdraw' | 'convert_to_credit'): Promise<ReferralCommission> {
+    const status = action === 'withdraw' ? 'paid' : 'converted_to_credit';
+    return this.referralCommissions.update(commissionId, { status, processedAt: new Date() });
+  }
+
+  calculateReferralCommission(sourceAmount: string, commissionRate: string): string {
+    return (parseFloat(sourceAmount) * parseFloat(commissionRate) / 100).toFixed(2);
+  }
+
+  private pendingCommissions(referrerId: number): ReferralCommission[] {
+    return this.referralCommissions.find("referrerId", referrerId)
+      .filter((c) => c.status === 'pending')
+      .sort((a, b) => time(a.createdAt) - time(b.createdAt));
+  }
+
+  // Withdrawal and conversion methods
+  async createWithdrawalRequest(request: {
+    adminId: number;
+    amount: string;
+    bankAccount: string;
+    type: string;
+    status: string;
+  }): Promise<any> {
+    return this.withdrawalRequests.insert(request);
+  }
+
+  async getAllWithdrawalRequests(): Promise<any[]> {
+    return this.withdrawalRequests.all()
+      .sort(byDesc((w) => w.createdAt))
+      .map((w) => ({ ...w, adminName: this.users.get(w.adminId)?.name ?? null }));
+  }
+
+  async getWithdrawalRequestsByAdmin(adminId: number): Promise<any[]> {
+    return this.withdrawalRequests.find("adminId", adminId).sort(byDesc((w) => w.createdAt));
+  }
+
+  async approveWithdrawalRequest(requestId: number, processedBy: number): Promise<void> {
+    const request = this.withdrawalRequests.get(requestId);
+    if (!request || request.status !== 'pending') {
+      throw new Error('Invalid withdrawal request');
+    }
+
+    this.withdrawalRequests.update(requestId, { status: 'approved', processedAt: new Date(), processedBy });
+
+    if (request.type === 'credit_balance') {
+      await this.updateCreditBalance(request.adminId, request.amount, 'subtract');
+    } else if (request.type === 'referral_commission') {
+      let remainingAmount = parseFloat(request.amount);
+      for (const commission of this.pendingCommissions(request.adminId)) {
+        if (remainingAmount <= 0) break;
+
+        const commissionValue = parseFloat(commission.commissionAmount);
+        if (commissionValue <= remainingAmount) {
+          this.referralCommissions.update(commission.id, { status: 'paid', processedAt: new Date() });
+          remainingAmount -= commissionValue;
+        } else {
+          this.referralCommissions.update(commission.id, {
+            commissionAmount: remainingAmount.toFixed(2),
+            status: 'paid',
+            processedAt: new Date(),
+          });
+          this.referralCommissions.insert({
+            referrerId: commission.referrerId,
+            referredId: commission.referredId,
+            sourceType: commission.sourceType,
+            sourceId: commission.sourceId,
+            sourceAmount: commission.sourceAmount,
+            commissionRate: commission.commissionRate,
+            commissionAmount: (commissionValue - remainingAmount).toFixed(2),
+            status: 'pending',
+          });
+          remainingAmount = 0;
+        }
+      }
+    }
+  }
+
+  async rejectWithdrawalRequest(requestId: number, processedBy: number, rejectionReason: string): Promise<void> {
+    this.withdrawalRequests.update(requestId, { status: 'rejected', processedAt: new Date(), processedBy, rejectionReason });
+  }
+
+  async convertCommissionToCredit(adminId: number, amount: number): Promise<any> {
+    const commissions = this.pendingCommissions(adminId);
+    const totalPendingCommissions = commissions.reduce((total, c) => total + parseFloat(c.commissionAmount), 0);
+    if (amount > totalPendingCommissions) {
+      throw new Error('Insufficient commission balance');
+    }
+
+    const currentBalance = await this.getCreditBalance(adminId);
+    await this.updateCreditBalance(adminId, amount.toString(), 'add');
+
+    let remainingAmount = amount;
+    for (const commission of commissions) {
+      if (remainingAmount <= 0) break;
+
+      const commissionValue = parseFloat(commission.commissionAmount);
+      if (commissionValue <= remainingAmount) {
+        this.referralCommissions.update(commission.id, { status: 'converted_to_credit', processedAt: new Date() });
+        remainingAmount -= commissionValue;
+      } else {
+        this.referralCommissions.insert({
+          referrerId: commission.referrerId,
+          referredId: commission.referredId,
+          sourceType: commission.sourceType,
+          sourceId: commission.sourceId,
+          sourceAmount: commission.sourceAmount,
+          commissionRate: commission.commissionRate,
+          commissionAmount: remainingAmount.toFixed(2),
+          status: 'converted_to_credit',
+          createdAt: commission.createdAt,
+          processedAt: new Date(),
+        });
+        this.referralCommissions.update(commission.id, {
+          commissionAmount: (commissionValue - remainingAmount).toFixed(2),
+        });
+        remainingAmount = 0;
+      }
+    }
+
+    return {
+      success: true,
+      message: "Commission converted to credit successfully",
+      previousBalance: currentBalance,
+      newBalance: (parseFloat(currentBalance) + amount).toFixed(2),
+      convertedAmount: amount.toString(),
+    };
+  }
+
+  // Super Admin revenue tracking methods
+  async createSuperAdminRevenue(revenue: InsertSuperAdminRevenue): Promise<SuperAdminRevenue> {
+    return this.superAdminRevenues.insert(revenue as Partial<SuperAdminRevenue>);
+  }
+
+  async getSuperAdminRevenues(dateFrom?: string, dateTo?: string, adminId?: number): Promise<SuperAdminRevenue[]> {
+    return this.superAdminRevenues.all()
+      .filter((r) => (!dateFrom || r.dateEAT >= dateFrom) && (!dateTo || r.dateEAT <= dateTo))
+      .filter((r) => !adminId || r.adminId === adminId)
+      .sort(byDesc((r) => r.createdAt));
+  }
+
+  async getSuperAdminRevenuesByDate(date: string): Promise<SuperAdminRevenue[]> {
+    return this.superAdminRevenues.find("dateEAT", date).sort(byDesc((r) => r.createdAt));
+  }
+
+  async getTotalSuperAdminRevenue(dateFrom?: string, dateTo?: string): Promise<string> {
+    const revenues = await this.getSuperAdminRevenues(dateFrom, dateTo);
+    return revenues.length > 0 ? sumAmounts(revenues.map((r) => r.amount)).toFixed(2) : "0.00";
+  }
+
+  // Daily revenue summary methods
+  async createOrUpdateDailyRevenueSummary(summary: InsertDailyRevenueSummary): Promise<DailyRevenueSummary> {
+    const existing = this.dailyRevenueSummary.first("date", summary.date);
+    if (existing) {
+      return this.dailyRevenueSummary.update(existing.id, { ...summary, updatedAt: new Date() } as Partial<DailyRevenueSummary>);
+    }
+    return this.dailyRevenueSummary.insert(summary as Partial<DailyRevenueSummary>);
+  }
+
+  async getDailyRevenueSummary(date: string): Promise<DailyRevenueSummary | undefined> {
+    return this.dailyRevenueSummary.first("date", date);
+  }
+
+  async getDailyRevenueSummaries(dateFrom?: string, dateTo?: string): Promise<DailyRevenueSummary[]> {
+    return this.dailyRevenueSummary.all()
+      .filter((d) => (!dateFrom || d.date >= dateFrom) && (!dateTo || d.date <= dateTo))
+      .sort(byDesc((d) => d.date));
+  }
+
+  // EAT time zone utility methods
+  getCurrentEATDate(): string {
+    return toEATDate(new Date());
+  }
+
+  async performDailyReset(): Promise<void> {
+    const today = this.getCurrentEATDate();
+    const todaysGames = this.gameHistory.all().filter((h) => toEATDate(h.completedAt) === today);
+
+    await this.createOrUpdateDailyRevenueSummary({
+      date: today,
+      totalSuperAdminRevenue: await this.getTotalSuperAdminRevenue(today, today),
+      totalAdminRevenue: "0.00",
+      totalGamesPlayed: todaysGames.length,
+      totalPlayersRegistered: todaysGames.reduce((total, h) => total + h.playerCount, 0),
+    });
+  }
+
+  // Employee profit margin methods
+  async setEmployeeProfitMargin(margin: InsertEmployeeProfitMargin): Promise<EmployeeProfitMargin> {
+    const existing = this.employeeProfitMargins.first("employeeShop", `${margin.employeeId}:${margin.shopId}`);
+    if (existing) {
+      return this.employeeProfitMargins.update(existing.id, { profitMargin: margin.profitMargin });
+    }
+    return this.employeeProfitMargins.insert(margin as Partial<EmployeeProfitMargin>);
+  }
+
+  async getEmployeeProfitMarginsByAdmin(adminId: number): Promise<any[]> {
+    const shopIds = new Set(this.shops.find("adminId", adminId).map((s) => s.id));
+    return this.employeeProfitMargins.all()
+      .filter((m) => shopIds.has(m.shopId))
+      .map((m) => {
+        const employee = this.users.get(m.employeeId);
+        return {
+          id: m.id,
+          employeeId: m.employeeId,
+          shopId: m.shopId,
+          profitMargin: m.profitMargin,
+          employeeName: employee?.name ?? null,
+          employeeUsername: employee?.username ?? null,
+          shopName: this.shops.get(m.shopId)?.name ?? null,
+        };
+      });
+  }
+
+  async updateEmployeeProfitMargin(marginId: number, profitMargin: string, adminId: number): Promise<EmployeeProfitMargin> {
+    const margin = this.employeeProfitMargins.get(marginId);
+    if (!margin || this.shops.get(margin.shopId)?.adminId !== adminId) {
+      return undefined;
+    }
+    return this.employeeProfitMargins.update(marginId, { profitMargin });
+  }
+
+  async updateUserPassword(userId: number, hashedPassword: string): Promise<void> {
+    this.users.update(userId, { password: hashedPassword });
+  }
+
+  // Admin management methods for Super Admin
+  async getAdminUsers(): Promise<Array<User & { shopName?: string }>> {
+    return this.users.find("role", 'admin')
+      .sort(byDesc((u) => u.createdAt))
+      .map((u) => ({ ...u, shopName: u.shopId ? this.shops.get(u.shopId)?.name : undefined }));
+  }
+
+  async createAdminUser(adminData: any): Promise<User> {
+    const accountNumber = await this.generateAccountNumber();
+
+    const newShop = this.shops.insert({
+      name: adminData.shopName,
+      profitMargin: "20.00",
+      superAdminCommission: adminData.commissionRate || "15.00",
+      referralCommission: adminData.referralCommissionRate || "5.00",
+      isBlocked: false,
+      totalRevenue: "0.00",
+    });
+
+    const newAdmin = await this.createUser({
+      username: adminData.username,
+      password: adminData.password,
+      role: 'admin',
+      name: adminData.name,
+      email: adminData.email || `${adminData.username}@shop.local`,
+      shopId: newShop.id,
+      creditBalance: adminData.initialCredit || "0.00",
+      accountNumber,
+      referredBy: adminData.referredBy ? parseInt(adminData.referredBy) : null,
+      isBlocked: false,
+    });
+
+    this.shops.update(newShop.id, { adminId: newAdmin.id });
+
+    if (adminData.referredBy) {
+      this.referralCommissions.insert({
+        referrerId: parseInt(adminData.referredBy),
+        referredId: newAdmin.id,
+        sourceType: 'admin_signup',
+        sourceId: newAdmin.id,
+        sourceAmount: "0.00",
+        commissionRate: adminData.referralCommissionRate || "5.00",
+        commissionAmount: "0.00",
+        status: 'pending',
+      });
+    }
+
+    return { ...newAdmin, shopName: newShop.name } as User;
+  }
+
+  // Referral system methods for Super Admin
+  async getAllReferralCommissions(): Promise<any[]> {
+    return this.referralCommissions.all()
+      .sort(byDesc((c) => c.createdAt))
+      .map((c) => ({
+        id: c.id,
+        referrerId: c.referrerId,
+        referrerName: this.users.get(c.referrerId)?.name ?? null,
+        commissionAmount: c.commissionAmount,
+        sourceAmount: c.sourceAmount,
+        status: c.status,
+        createdAt: c.createdAt,
+        processedAt: c.processedAt,
+      }));
+  }
+
+  async getReferralSettings(): Promise<any> {
+    return {
+      referralCommissionRate: "5.00",
+      minimumPayoutAmount: "100.00",
+      autoApproveCommissions: false,
+    };
+  }
+
+  async updateReferralSettings(settings: any): Promise<void> {
+    console.log("Referral settings updated:", settings);
+  }
+
+  // Block/unblock employees based on admin status
+  private setEmployeesBlocked(shopId: number, isBlocked: boolean): void {
+    for (const user of this.users.find("shopId", shopId)) {
+      if (user.role === 'employee') this.users.update(user.id, { isBlocked });
+    }
+  }
+
+  async blockEmployeesByAdmin(adminId: number): Promise<void> {
+    const admin = this.users.get(adminId);
+    if (admin?.shopId) this.setEmployeesBlocked(admin.shopId, true);
+  }
+
+  async unblockEmployeesByAdmin(adminId: number): Promise<void> {
+    const admin = this.users.get(adminId);
+    if (admin?.shopId) this.setEmployeesBlocked(admin.shopId, false);
+  }
+
+  // Custom cartela methods
+  async getCustomCartelas(shopId: number): Promise<CustomCartela[]> {
+    return this.customCartelas.find("shopId", shopId).sort((a, b) => a.cartelaNumber - b.cartelaNumber);
+  }
+
+  async getCustomCartela(id: number): Promise<CustomCartela | undefined> {
+    return this.customCartelas.get(id);
+  }
+
+  async getCartelaByNumber(shopId: number, cartelaNumber: number): Promise<any | null> {
+    const cartela = this.cartelas.first("shopNumber", `${shopId}:${cartelaNumber}`);
+    if (cartela) {
+      const pattern = typeof cartela.pattern === 'string' ? JSON.parse(cartela.pattern) : cartela.pattern;
+      return { ...cartela, pattern, numbers: Array.isArray(pattern) ? pattern.flat() : [] };
+    }
+
+    const custom = this.customCartelas.first("shopNumber", `${shopId}:${cartelaNumber}`);
+    if (!custom) return null;
+    const pattern = typeof custom.pattern === 'string' ? JSON.parse(custom.pattern) : custom.pattern;
+    return { ...custom, pattern, numbers: pattern.flat() };
+  }
+
+  async createCustomCartela(cartela: InsertCustomCartela): Promise<CustomCartela> {
+    return this.customCartelas.insert(cartela as Partial<CustomCartela>);
+  }
+
+  async updateCustomCartela(id: number, updates: Partial<InsertCustomCartela>): Promise<CustomCartela | undefined> {
+    return this.customCartelas.update(id, updates as Partial<CustomCartela>);
+  }
+
+  async deleteCustomCartela(id: number): Promise<boolean> {
+    return this.customCartelas.delete(id);
+  }
+
+  // Unified cartela table methods
+  async getCartelasByShop(shopId: number): Promise<Cartela[]> {
+    return this.cartelas.find("shopId", shopId).sort((a, b) => a.cartelaNumber - b.cartelaNumber);
+  }
+
+  async getCartelas(shopId: number): Promise<Cartela[]> {
+    return this.getCartelasByShop(shopId);
+  }
+
+  async searchCartelas(shopId: number, { cartelaNumber, contains, after, limit }: CartelaSearchOptions): Promise<CartelaPage> {
+    const matches = (await this.getCartelasByShop(shopId))
+      .map((c) => ({ ...c, pattern: parsePattern(c.pattern) }))
+      .filter((c) =>
+        (cartelaNumber === undefined || c.cartelaNumber === cartelaNumber) &&
+        (contains === undefined || c.pattern.some((row) => row.includes(contains)))
+      );
+    const start = after === undefined ? 0 : matches.findIndex((c) => c.cartelaNumber > after);
+    const rest = start === -1 ? [] : matches.slice(start);
+    const items = rest.slice(0, limit);
+    return {
+      items,
+      total: matches.length,
+      nextCursor: rest.length > limit ? items[items.length - 1].cartelaNumber : null,
+    };
+  }
+
+  async getCartela(id: number): Promise<Cartela | undefined> {
+    return this.cartelas.get(id);
+  }
+
+  async getShopCartela(shopId: number, cartelaNumber: number): Promise<Cartela | undefined> {
+    return this.cartelas.first("shopNumber", `${shopId}:${cartelaNumber}`);
+  }
+
+  async createCartela(cartela: InsertCartela): Promise<Cartela> {
+    if (this.cartelas.first("shopNumber", `${cartela.shopId}:${cartela.cartelaNumber}`)) {
+      throw new Error(`duplicate key value violates unique constraint "cartelas_shop_id_cartela_number_unique"`);
+    }
+    return this.cartelas.insert(cartela as Partial<Cartela>);
+  }
+
+  async updateCartela(id: number, updates: Partial<InsertCartela> & { updatedAt?: Date }): Promise<Cartela | undefined> {
+    return this.cartelas.update(id, updates as Partial<Cartela>);
+  }
+
+  async deleteCartela(id: number): Promise<boolean> {
+    return this.cartelas.delete(id);
+  }
+
+  // Collector methods
+  async markCartelaByCollector(cartelaId: number, collectorId: number): Promise<void> {
+    const existing = this.cartelas.get(cartelaId);
+    if (existing && existing.bookedBy !== null) {
+      throw new Error('Cartela is already marked by an employee');
+    }
+    this.cartelas.update(cartelaId, { collectorId, markedAt: new Date(), updatedAt: new Date() });
+  }
+
+  async unmarkCartelaByCollector(cartelaId: number, collectorId: number): Promise<void> {
+    const existing = this.cartelas.get(cartelaId);
+    if (existing && existing.collectorId === collectorId) {
+      this.cartelas.update(cartelaId, { collectorId: null, markedAt: null, updatedAt: new Date() });
+    }
+  }
+
+  async unmarkAllCartelasByCollector(collectorId: number): Promise<void> {
+    for (const cartela of this.cartelas.find("collectorId", collectorId)) {
+      this.cartelas.update(cartela.id, { collectorId: null, markedAt: null, updatedAt: new Date() });
+    }
+  }
+
+  async resetShopCartelas(shopId: number): Promise<void> {
+    for (const cartela of this.cartelas.find("shopId", shopId)) {
+      this.cartelas.update(cartela.id, {
+        collectorId: null, markedAt: null, isBooked: false, bookedBy: null, gameId: null, updatedAt: new Date(),
+      });
+    }
+  }
+
+  async getCollectorStats(collectorId: number): Promise<any> {
+    const today = new Date(new Date().toISOString().split('T')[0]).getTime();
+    const marked = this.cartelas.find("collectorId", collectorId);
+
+    const collector = this.users.get(collectorId);
+    if (!collector?.shopId) {
+      return { totalMarked: 0, todayMarked: 0, availableCartelas: 0, bookedCartelas: 0 };
+    }
+
+    const shopCartelas = this.cartelas.find("shopId", collector.shopId);
+    return {
+      totalMarked: marked.length,
+      todayMarked: marked.filter((c) => time(c.markedAt) >= today).length,
+      availableCartelas: shopCartelas.filter((c) => !c.isBooked && c.collectorId === null).length,
+      bookedCartelas: shopCartelas.filter((c) => c.isBooked).length,
+    };
+  }
+
+  async getCollectorsByEmployee(employeeId: number): Promise<User[]> {
+    return this.users.find("supervisorId", employeeId).filter((u) => u.role === 'collector');
+  }
+
+  // Employee cartela marking methods
+  async markCartelaByEmployee(cartelaId: number, employeeId: number): Promise<void> {
+    const existing = this.cartelas.get(cartelaId);
+    if (existing && existing.collectorId !== null) {
+      throw new Error('Cartela is already marked by a collector');
+    }
+    this.cartelas.update(cartelaId, { bookedBy: employeeId, isBooked: true, updatedAt: new Date() });
+  }
+
+  async unmarkCartelaByEmployee(cartelaId: number, employeeId: number): Promise<void> {
+    const existing = this.cartelas.get(cartelaId);
+    if (existing && existing.bookedBy === employeeId) {
+      this.cartelas.update(cartelaId, { bookedBy: null, isBooked: false, updatedAt: new Date() });
+    }
+  }
+
+  // Game reset methods
+  async resetCartelasForShop(shopId: number): Promise<void> {
+    for (const cartela of this.cartelas.find("shopId", shopId)) {
+      this.cartelas.update(cartela.id, { isBooked: false, bookedBy: null, collectorId: null, updatedAt: new Date() });
+    }
+  }
+}
+
+/**
+ * Seeds the accounts needed to log in against an empty in-memory backend:
+ * one shop with a super admin, admin, employee and collector.
+ */
+export async function seedMemoryStorage(store: MemStorage): Promise<{ shopId: number; adminId: number }> {
+  const password = await bcrypt.hash(process.env.MEMORY_SEED_PASSWORD || "123456", 10);
+
+  const superAdmin = await store.createUser({
+    username: 'superadmin', password, role: 'super_admin', name: 'Super Admin', creditBalance: "500000.00",
+  });
+  const shop = await store.createShop({ name: 'Main Shop', profitMargin: "30.00" });
+  const admin = await store.createUser({
+    username: 'admin', password, role: 'admin', name: 'Administrator', shopId: shop.id,
+    creditBalance: "50000.00", accountNumber: await store.generateAccountNumber(),
+  });
+  await store.updateShop(shop.id, { adminId: admin.id });
+  const employee = await store.createUser({
+    username: 'employee', password, role: 'employee', name: 'Employee', shopId: shop.id,
+  });
+  await store.createUser({
+    username: 'collector', password, role: 'collector', name: 'Collector', shopId: shop.id,
+    supervisorId: employee.id,
+  });
+
+  console.log(`In-memory storage seeded: superadmin (id ${superAdmin.id}), admin, employee, collector`);
+  return { shopId: shop.id, adminId: admin.id };
+}
@@ -0,0 +1,251 @@
+import type { Request, Response, NextFunction } from "express";
+import { monitorEventLoopDelay, performance, type IntervalHistogram } from "perf_hooks";
+
+type Labels = Record<string, string | number>;
+
+const DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+
+function labelKey(labels: Labels): string {
+  const keys = Object.keys(labels);
+  if (keys.length === 0) return "";
+  return keys.sort().map((key) => `${key}="${String(labels[key]).replace(/["\\\n]/g, "_")}"`).join(",");
+}
+
+function withLabels(name: string, key: string, extra?: string): string {
+  const all = [key, extra].filter(Boolean).join(",");
+  return all ? `${name}{${all}}` : name;
+}
+
+interface Metric {
+  render(): string[];
+}
+
+class Counter implements Metric {
+  private values = new Map<string, number>();
+
+  constructor(readonly name: string, readonly help: string) {}
+
+  inc(labels: Labels = {}, amount = 1): void {
+    const key = labelKey(labels);
+    this.values.set(key, (this.values.get(key) ?? 0) + amount);
+  }
+
+  render(): string[] {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} counter`];
+    for (const [key, value] of this.values) lines.push(`${withLabels(this.name, key)} ${value}`);
+    return lines;
+  }
+}
+
+class Gauge implements Metric {
+  private values = new Map<string, number>();
+
+  constructor(readonly name: string, readonly help: string, private collect?: () => number) {}
+
+  set(value: number, labels: Labels = {}): void {
+    this.values.set(labelKey(labels), value);
+  }
+
+  inc(labels: Labels = {}, amount = 1): void {
+    const key = labelKey(labels);
+    this.values.set(key, (this.values.get(key) ?? 0) + amount);
+  }
+
+  dec(labels: Labels = {}, amount = 1): void {
+    this.inc(labels, -amount);
+  }
+
+  render(): string[] {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} gauge`];
+    if (this.collect) this.values.set("", this.collect());
+    for (const [key, value] of this.values) lines.push(`${withLabels(this.name, key)} ${value}`);
+    return lines;
+  }
+}
+
+class Histogram implements Metric {
+  private series = new Map<string, { counts: number[]; sum: number; count: number }>();
+
+  constructor(readonly name: string, readonly help: string, private buckets = DEFAULT_BUCKETS) {}
+
+  observe(value: number, labels: Labels = {}): void {
+    const key = labelKey(labels);
+    let entry = this.series.get(key);
+    if (!entry) {
+      entry = { counts: new Array(this.buckets.length).fill(0), sum: 0, count: 0 };
+      this.series.set(key, entry);
+    }
+    // Counts are stored per bucket and made cumulative only when rendered
+    let i = 0;
+    while (i < this.buckets.length && value > this.buckets[i]) i++;
+    if (i < this.buckets.length) entry.counts[i]++;
+    entry.sum += value;
+    entry.count++;
+  }
+
+  render(): string[] {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} histogram`];
+    for (const [key, entry] of this.series) {
+      let cumulative = 0;
+      this.buckets.forEach((bucket, i) => {
+        cumulative += entry.counts[i];
+        lines.push(`${withLabels(`${this.name}_bucket`, key, `le="${bucket}"`)} ${cumulative}`);
+      });
+      lines.push(`${withLabels(`${this.name}_bucket`, key, `le="+Inf"`)} ${entry.count}`);
+      lines.push(`${withLabels(`${this.name}_sum`, key)} ${entry.sum}`);
+      lines.push(`${withLabels(`${this.name}_count`, key)} ${entry.count}`);
+    }
+    return lines;
+  }
+}
+
+const registry: Metric[] = [];
+
+function register<T extends Metric>(metric: T): T {
+  registry.push(metric);
+  return metric;
+}
+
+// HTTP
+export const httpRequestsTotal = register(new Counter(
+  "http_requests_total", "HTTP requests by method, route pattern and status class"));
+export const httpRequestDuration = register(new Histogram(
+  "http_request_duration_seconds", "HTTP request latency by method and route pattern"));
+
+// Database
+export const dbQueriesTotal = register(new Counter(
+  "db_orm_queries_total", "Queries issued through Drizzle by statement type"));
+export const dbQueryDuration = register(new Histogram(
+  "db_query_duration_seconds", "Database round-trip latency by statement type",
+  [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5]));
+export const dbQueryErrors = register(new Counter(
+  "db_query_errors_total", "Failed database queries by statement type"));
+
+// WebSocket
+export const wsConnectionsTotal = register(new Counter(
+  "ws_connections_total", "WebSocket connections accepted"));
+export const wsConnectionsActive = register(new Gauge(
+  "ws_connections_active", "Currently open WebSocket connections"));
+export const wsBroadcastsTotal = register(new Counter(
+  "ws_broadcasts_total", "WebSocket broadcasts by message type"));
+export const wsMessagesSentTotal = register(new Counter(
+  "ws_messages_sent_total", "WebSocket frames sent to clients by message type"));
+
+// Process
+const eventLoopLag = register(new Gauge(
+  "nodejs_eventloop_lag_seconds", "Event loop delay since the previous scrape"));
+register(new Gauge("process_resident_memory_bytes", "Resident set size", () => process.memoryUsage().rss));
+register(new Gauge("process_uptime_seconds", "Process uptime", () => process.uptime()));
+
+// Only sample the event loop once someone has scraped, so idle servers pay nothing
+let loopDelay: IntervalHistogram | null = null;
+
+function collectEventLoopLag(): void {
+  if (!loopDelay) {
+    loopDelay = monitorEventLoopDelay({ resolution: 20 });
+    loopDelay.enable();
+    return;
+  }
+  if (loopDelay.count > 0) {
+    eventLoopLag.set(loopDelay.percentile(50) / 1e9, { quantile: "0.5" });
+    eventLoopLag.set(loopDelay.percentile(99) / 1e9, { quantile: "0.99" });
+    eventLoopLag.set(loopDelay.max / 1e9, { quantile: "1" });
+  }
+  loopDelay.reset();
+}
+
+export function renderMetrics(): string {
+  collectEventLoopLag();
+  return registry.flatMap((metric) => metric.render()).join("\n") + "\n";
+}
+
+export function statementType(sql: string): string {
+  const match = /^\s*(\w+)/.exec(sql);
+  return match ? match[1].toLowerCase() : "unknown";
+}
+
+/**
+ * Records request counts and latency keyed by the matched Express route
+ * pattern (e.g. /api/games/:id) rather than the raw path.
+ */
+export function metricsMiddleware(req: Request, res: Response, next: NextFunction) {
+  const start = performance.now();
+
+  res.on("finish", () => {
+    let route: string;
+    if (req.route?.path) {
+      route = `${req.baseUrl}${req.route.path}`;
+    } else if (req.originalUrl.startsWith("/api")) {
+      route = "unmatched";
+    } else {
+      route = "static";
+    }
+
+    const labels = { method: req.method, route };
+    httpRequestDuration.observe((performance.now() - start) / 1000, labels);
+    httpRequestsTotal.inc({ ...labels, status: `${Math.floor(res.statusCode / 100)}xx` });
+  });
+
+  next();
+}
+
+const LOOPBACK_ADDRESSES = new Set(["127.0.0.1", "::1", "::ffff:127.0.0.1"]);
+
+// A direct connection from this host. nginx also connects over loopback, so
+// proxied requests are told apart by the forwarding headers it adds.
+function isLocalRequest(req: Request): boolean {
+  return LOOPBACK_ADDRESSES.has(req.socket.remoteAddress ?? "")
+    && !req.headers["x-forwarded-for"] && !req.headers["x-real-ip"];
+}
+
+/**
+ * Serves the Prometheus text format. Set METRICS_TOKEN to require
+ * `Authorization: Bearer <token>` from the scraper; without it only direct
+ * requests from the host itself are answered.
+ */
+export function metricsHandler(req: Request, res: Response) {
+  const token = process.env.METRICS_TOKEN;
+  if (token && req.headers.authorization !== `Bearer ${token}`) {
+    return res.status(401).end();
+  }
+  if (!token && !isLocalRequest(req)) {
+    return res.status(403).end();
+  }
+  res.set("Content-Type", "text/plain; version=0.0.4; charset=utf-8");
+  res.send(renderMetrics());
+}
+
+/**
+ * Drizzle logger hook: counts ORM queries by statement type.
+ */
+export const drizzleMetricsLogger = {
+  logQuery(query: string, _params: unknown[]): void {
+    dbQueriesTotal.inc({ operation: statementType(query) });
+  },
+};
+
+/**
+ * Wraps pool.query so every round trip (ORM or raw SQL such as the
+ * session store) is timed. Drizzle's logger fires before execution and
+ * cannot measure latency on its own.
+ */
+export function instrumentPool<T extends { query: (...args: any[]) => any }>(pool: T): T {
+  const query = pool.query.bind(pool);
+  pool.query = ((...args: any[]) => {
+    const first = args[0];
+    const text = typeof first === "string" ? first : first?.text ?? "";
+    const operation = statementType(text);
+    const start = performance.now();
+    const record = () => dbQueryDuration.observe((performance.now() - start) / 1000, { operation });
+
+    const result = query(...args);
+    if (result && typeof result.then === "function") {
+      return result.then(
+        (value: unknown) => { record(); return value; },
+        (error: unknown) => { record(); dbQueryErrors.inc({ operation }); throw error; },
+      );
+    }
+    return result;
+  }) as T["query"];
+  return pool;
+}
@@ -0,0 +1,153 @@
+import mongoose, { type PipelineStage } from "mongoose";
+import { Game } from "@shared/mongodb-schema";
+
+// Reports group days in East Africa Time, matching the SQL path's dateEAT columns
+const EAT_TIMEZONE = "Africa/Addis_Ababa";
+
+// Completed-at window: from is inclusive, before is exclusive
+export interface DateRange {
+  from?: Date;
+  before?: Date;
+}
+
+function toObjectId(id: string | mongoose.Types.ObjectId): mongoose.Types.ObjectId {
+  return typeof id === "string" ? new mongoose.Types.ObjectId(id) : id;
+}
+
+// Leading $match shaped to use the { shopId, completedAt } index
+function completedGamesMatch(range: DateRange, shopId?: string | mongoose.Types.ObjectId): PipelineStage.Match {
+  const match: Record<string, any> = { status: "completed" };
+  if (shopId) {
+    match.shopId = toObjectId(shopId);
+  }
+  if (range.from || range.before) {
+    match.completedAt = {};
+    if (range.from) match.completedAt.$gte = range.from;
+    if (range.before) match.completedAt.$lt = range.before;
+  } else {
+    match.completedAt = { $exists: true };
+  }
+  return { $match: match };
+}
+
+// Collected amount per game: the sum of player entry fees
+const gameTotalsStage: PipelineStage.Project = {
+  $project: {
+    shopId: 1,
+    employeeId: 1,
+    completedAt: 1,
+    prizePool: 1,
+    playerCount: { $size: { $ifNull: ["$players", []] } },
+    collected: { $sum: "$players.entryFee" },
+  },
+};
+
+const totalsAccumulators = {
+  totalRevenue: { $sum: "$collected" },
+  totalPrizes: { $sum: "$prizePool" },
+  totalGames: { $sum: 1 },
+  totalPlayers: { $sum: "$playerCount" },
+};
+
+export async function getShopTotals(shopId: string, range: DateRange = {}) {
+  const [totals] = await Game.aggregate([
+    completedGamesMatch(range, shopId),
+    gameTotalsStage,
+    { $group: { _id: null, ...totalsAccumulators } },
+    { $project: { _id: 0 } },
+  ]);
+
+  return totals ?? { totalRevenue: 0, totalPrizes: 0, totalGames: 0, totalPlayers: 0 };
+}
+
+export async function getEmployeeTotals(shopId: string, range: DateRange = {}) {
+  return Game.aggregate([
+    completedGamesMatch(range, shopId),
+    gameTotalsStage,
+    { $group: { _id: "$employeeId", ...totalsAccumulators } },
+    {
+      $lookup: {
+        from: "users",
+        localField: "_id",
+        foreignField: "_id",
+        pipeline: [{ $project: { name: 1, username: 1 } }],
+        as: "employee",
+      },
+    },
+    { $unwind: { path: "$employee", preserveNullAndEmptyArrays: true } },
+    {
+      $project: {
+        _id: 0,
+        employeeId: "$_id",
+        employeeName: { $ifNull: ["$employee.name", "$employee.username"] },
+        totalRevenue: 1,
+        totalPrizes: 1,
+        totalGames: 1,
+        totalPlayers: 1,
+      },
+    },
+    { $sort: { totalRevenue: -1 } },
+  ]);
+}
+
+export async function getDailyTotals(shopId: string | undefined, range: DateRange = {}) {
+  return Game.aggregate([
+    completedGamesMatch(range, shopId),
+    gameTotalsStage,
+    {
+      $group: {
+        _id: { $dateToString: { format: "%Y-%m-%d", date: "$completedAt", timezone: EAT_TIMEZONE } },
+        ...totalsAccumulators,
+      },
+    },
+    { $project: { _id: 0, date: "$_id", totalRevenue: 1, totalPrizes: 1, totalGames: 1, totalPlayers: 1 } },
+    { $sort: { date: 1 } },
+  ]);
+}
+
+/**
+ * Per-shop revenue across all shops, with the admin profit and super admin
+ * commission derived from each shop's percentages the same way
+ * calculateProfitSharing does for the SQL backend.
+ */
+export async function getSuperAdminShopRevenue(range: DateRange = {}) {
+  return Game.aggregate([
+    completedGamesMatch(range),
+    gameTotalsStage,
+    { $group: { _id: "$shopId", ...totalsAccumulators } },
+    {
+      $lookup: {
+        from: "shops",
+        localField: "_id",
+        foreignField: "_id",
+        pipeline: [{ $project: { name: 1, adminId: 1, profitMargin: 1, superAdminCommission: 1 } }],
+        as: "shop",
+      },
+    },
+    { $unwind: { path: "$shop", preserveNullAndEmptyArrays: true } },
+    {
+      $addFields: {
+        adminProfit: {
+          $divide: [{ $multiply: ["$totalRevenue", { $ifNull: ["$shop.profitMargin", 0] }] }, 100],
+        },
+      },
+    },
+    {
+      $project: {
+        _id: 0,
+        shopId: "$_id",
+        shopName: "$shop.name",
+        adminId: "$shop.adminId",
+        totalRevenue: 1,
+        totalPrizes: 1,
+        totalGames: 1,
+        totalPlayers: 1,
+        adminProfit: 1,
+        superAdminCommission: {
+          $divide: [{ $multiply: ["$adminProfit", { $ifNull: ["$shop.superAdminCommission", 0] }] }, 100],
+        },
+      },
+    },
+    { $sort: { totalRevenue: -1 } },
+  ]);
+}
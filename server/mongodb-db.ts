@@ -2,18 +2,43 @@ import mongoose from 'mongoose';
 
 const MONGODB_URI = process.env.MONGODB_URI;
 
+// Driver pool settings, overridable per deployment
+const connectOptions: mongoose.ConnectOptions = {
+  maxPoolSize: Number(process.env.MONGODB_MAX_POOL_SIZE) || 50,
+  minPoolSize: Number(process.env.MONGODB_MIN_POOL_SIZE) || 5,
+  maxIdleTimeMS: 60000,
+  serverSelectionTimeoutMS: 5000,
+  socketTimeoutMS: 45000,
+};
+
+let connecting: Promise<typeof mongoose.connection> | null = null;
+
 export async function connectMongoDB() {
-  try {
-    if (!MONGODB_URI) {
-      throw new Error('MONGODB_URI environment variable is not set');
-    }
-    await mongoose.connect(MONGODB_URI);
-    console.log('🍃 Connected to MongoDB successfully');
+  // Routes and data setup both call this on startup; share one connection
+  if (mongoose.connection.readyState === 1) {
     return mongoose.connection;
-  } catch (error) {
-    console.error('❌ MongoDB connection error:', error);
-    throw error;
   }
+  if (connecting) {
+    return connecting;
+  }
+
+  connecting = (async () => {
+    try {
+      if (!MONGODB_URI) {
+        throw new Error('MONGODB_URI environment variable is not set');
+      }
+      await mongoose.connect(MONGODB_URI, connectOptions);
+      console.log('🍃 Connected to MongoDB successfully');
+      return mongoose.connection;
+    } catch (error) {
+      console.error('❌ MongoDB connection error:', error);
+      throw error;
+    } finally {
+      connecting = null;
+    }
+  })();
+
+  return connecting;
 }
 
-export { mongoose };
\ No newline at end of file
+export { mongoose };
@@ -1,7 +1,19 @@
 import type { Express, Request, Response } from "express";
 import bcrypt from "bcrypt";
+import mongoose from "mongoose";
 import { User, Shop, Game, Transaction, Cartela, CreditLoad } from "@shared/mongodb-schema";
 import { connectMongoDB } from "./mongodb-db";
+import {
+  getShopTotals, getEmployeeTotals, getDailyTotals, getSuperAdminShopRevenue, type DateRange
+} from "./mongodb-analytics";
+
+// Projections for hot read paths. Reads use .lean() so Mongoose skips
+// document hydration and returns plain objects.
+const USER_AUTH_FIELDS = "username password role name email isBlocked shopId creditBalance accountNumber commissionRate createdAt";
+const USER_PROFILE_FIELDS = "username role name email isBlocked shopId supervisorId creditBalance accountNumber referredBy commissionRate createdAt";
+const ADMIN_LIST_FIELDS = "username name email isBlocked shopId creditBalance accountNumber commissionRate createdAt";
+const SHOP_LIST_FIELDS = "name adminId profitMargin superAdminCommission referralCommission isBlocked totalRevenue createdAt";
+const GAME_LIST_FIELDS = "shopId employeeId status prizePool entryFee calledNumbers players winnerId winnerName startedAt completedAt createdAt";
 
 // Extend Express Request to include session
 declare module 'express-serve-static-core' {
@@ -10,6 +22,33 @@ declare module 'express-serve-static-core' {
   }
 }
 
+const EAT_OFFSET_MS = 3 * 60 * 60 * 1000;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Start of a YYYY-MM-DD calendar day in East Africa Time (UTC+3), or null
+function eatDayStart(value: string): Date | null {
+  if (!/^\d{4}-\d{2}-\d{2}$/.test(value)) return null;
+  const utcMidnight = new Date(`${value}T00:00:00Z`);
+  // Rejects impossible days like 2025-02-30, which Date rolls over
+  if (isNaN(utcMidnight.getTime()) || utcMidnight.toISOString().slice(0, 10) !== value) return null;
+  return new Date(utcMidnight.getTime() - EAT_OFFSET_MS);
+}
+
+// ?from=&to= as EAT calendar days, both inclusive, so the range runs from the
+// start of `from` to the start of the day after `to`; null when either is not a day
+function parseDateRange(query: Request["query"]): DateRange | null {
+  const range: DateRange = {};
+  for (const key of ["from", "to"] as const) {
+    const value = query[key];
+    if (typeof value !== "string" || !value) continue;
+    const start = eatDayStart(value);
+    if (!start) return null;
+    if (key === "from") range.from = start;
+    else range.before = new Date(start.getTime() + DAY_MS);
+  }
+  return range;
+}
+
 export function registerMongoDBRoutes(app: Express): void {
   // Initialize MongoDB connection
   connectMongoDB().catch(console.error);
@@ -20,7 +59,7 @@ export function registerMongoDBRoutes(app: Express): void {
       const { username, password } = req.body;
       console.log(`MongoDB - Database user lookup: ${username}`);
 
-      const user = await User.findOne({ username }).populate('shopId');
+      const user = await User.findOne({ username }).select(USER_AUTH_FIELDS).lean();
       
       if (!user) {
         console.log("MongoDB - Database user found: none");
@@ -41,7 +80,7 @@ export function registerMongoDBRoutes(app: Express): void {
         role: user.role,
         name: user.name,
         email: user.email,
-        shopId: user.shopId?._id,
+        shopId: user.shopId,
         creditBalance: user.creditBalance
       };
 
@@ -52,7 +91,7 @@ export function registerMongoDBRoutes(app: Express): void {
         name: user.name,
         email: user.email,
         isBlocked: user.isBlocked,
-        shopId: user.shopId?._id,
+        shopId: user.shopId,
         creditBalance: user.creditBalance.toString(),
         accountNumber: user.accountNumber,
         commissionRate: user.commissionRate.toString(),
@@ -72,7 +111,7 @@ export function registerMongoDBRoutes(app: Express): void {
         return res.status(401).json({ message: "Not authenticated" });
       }
 
-      const user = await User.findById(req.session.user.id).populate('shopId');
+      const user = await User.findById(req.session.user.id).select(USER_PROFILE_FIELDS).lean();
       if (!user) {
         return res.status(401).json({ message: "User not found" });
       }
@@ -84,7 +123,7 @@ export function registerMongoDBRoutes(app: Express): void {
         name: user.name,
         email: user.email,
         isBlocked: user.isBlocked,
-        shopId: user.shopId?._id,
+        shopId: user.shopId,
         supervisorId: user.supervisorId,
         creditBalance: user.creditBalance.toString(),
         accountNumber: user.accountNumber,
@@ -116,7 +155,10 @@ export function registerMongoDBRoutes(app: Express): void {
         return res.status(403).json({ message: "Super admin access required" });
       }
 
-      const admins = await User.find({ role: 'admin' }).populate('shopId');
+      const admins = await User.find({ role: 'admin' })
+        .select(ADMIN_LIST_FIELDS)
+        .populate({ path: 'shopId', select: 'name' })
+        .lean();
       
       const adminList = admins.map(admin => ({
         id: admin._id,
@@ -148,7 +190,7 @@ export function registerMongoDBRoutes(app: Express): void {
       const { username, password, name, email, shopName } = req.body;
 
       // Check if username already exists
-      const existingUser = await User.findOne({ username });
+      const existingUser = await User.exists({ username });
       if (existingUser) {
         return res.status(400).json({ message: "Username already exists" });
       }
@@ -205,7 +247,10 @@ export function registerMongoDBRoutes(app: Express): void {
   // Shop and game routes
   app.get("/api/mongodb/shops", async (req: Request, res: Response) => {
     try {
-      const shops = await Shop.find().populate('adminId', 'name username email');
+      const shops = await Shop.find()
+        .select(SHOP_LIST_FIELDS)
+        .populate({ path: 'adminId', select: 'name username email' })
+        .lean();
       res.json(shops);
     } catch (error) {
       console.error("MongoDB get shops error:", error);
@@ -216,7 +261,11 @@ export function registerMongoDBRoutes(app: Express): void {
   app.get("/api/mongodb/games/:shopId", async (req: Request, res: Response) => {
     try {
       const { shopId } = req.params;
-      const games = await Game.find({ shopId }).populate('employeeId', 'name username');
+      const games = await Game.find({ shopId })
+        .select(GAME_LIST_FIELDS)
+        .sort({ createdAt: -1 })
+        .populate({ path: 'employeeId', select: 'name username' })
+        .lean();
       res.json(games);
     } catch (error) {
       console.error("MongoDB get games error:", error);
@@ -224,12 +273,70 @@ export function registerMongoDBRoutes(app: Express): void {
     }
   });
 
+  // Analytics routes (aggregation pipelines, computed inside MongoDB)
+  app.get("/api/mongodb/analytics/shop/:shopId", async (req: Request, res: Response) => {
+    try {
+      const sessionUser = req.session.user;
+      if (!sessionUser) {
+        return res.status(401).json({ message: "Not authenticated" });
+      }
+
+      const { shopId } = req.params;
+      if (sessionUser.role !== 'super_admin' && String(sessionUser.shopId) !== shopId) {
+        return res.status(403).json({ message: "Access denied" });
+      }
+      if (!mongoose.isValidObjectId(shopId)) {
+        return res.status(400).json({ message: "Invalid shop id" });
+      }
+
+      const range = parseDateRange(req.query);
+      if (!range) {
+        return res.status(400).json({ message: "Invalid date range" });
+      }
+      const [totals, employees, daily] = await Promise.all([
+        getShopTotals(shopId, range),
+        getEmployeeTotals(shopId, range),
+        getDailyTotals(shopId, range)
+      ]);
+
+      res.json({ totals, employees, daily });
+    } catch (error) {
+      console.error("MongoDB shop analytics error:", error);
+      res.status(500).json({ message: "Internal server error" });
+    }
+  });
+
+  app.get("/api/mongodb/super-admin/revenue", async (req: Request, res: Response) => {
+    try {
+      if (!req.session.user || req.session.user.role !== 'super_admin') {
+        return res.status(403).json({ message: "Super admin access required" });
+      }
+
+      const range = parseDateRange(req.query);
+      if (!range) {
+        return res.status(400).json({ message: "Invalid date range" });
+      }
+      const [shops, daily] = await Promise.all([
+        getSuperAdminShopRevenue(range),
+        getDailyTotals(undefined, range)
+      ]);
+
+      const totalCommission = shops.reduce((total, shop) => total + shop.superAdminCommission, 0);
+      res.json({ shops, daily, totalCommission });
+    } catch (error) {
+      console.error("MongoDB super admin revenue error:", error);
+      res.status(500).json({ message: "Internal server error" });
+    }
+  });
+
   // Status endpoint
   app.get("/api/mongodb/status", async (req: Request, res: Response) => {
     try {
-      const userCount = await User.countDocuments();
-      const shopCount = await Shop.countDocuments();
-      const gameCount = await Game.countDocuments();
+      const [userCount, shopCount, gameCount] = await Promise.all([
+        User.estimatedDocumentCount(),
+        Shop.estimatedDocumentCount(),
+        Game.estimatedDocumentCount()
+      ]);
       
       res.json({
         status: "Connected to MongoDB",
@@ -7,7 +7,7 @@ export async function initializeMongoDBData() {
     await connectMongoDB();
     
     // Check if super admin already exists
-    const existingSuperAdmin = await User.findOne({ username: 'superadmin' });
+    const existingSuperAdmin = await User.exists({ username: 'superadmin' });
     if (existingSuperAdmin) {
       console.log('🍃 MongoDB: Super admin already exists');
       return;
@@ -97,18 +97,29 @@ export async function initializeMongoDBData() {
       ]
     ];
 
-    for (let i = 0; i < cartelaPatterns.length; i++) {
-      const cartela = new Cartela({
-        shopId: demoShop._id,
-        adminId: demoAdmin._id,
-        cartelaNumber: i + 1,
-        name: `Demo Cartela ${i + 1}`,
-        pattern: cartelaPatterns[i],
-        isHardcoded: true,
-        isActive: true
-      });
-      await cartela.save();
-    }
+    // Seed all cartelas in one round trip; upserts keep reruns idempotent
+    const now = new Date();
+    await Cartela.bulkWrite(
+      cartelaPatterns.map((pattern, i) => ({
+        updateOne: {
+          filter: { shopId: demoShop._id, cartelaNumber: i + 1 },
+          update: {
+            $setOnInsert: {
+              adminId: demoAdmin._id,
+              name: `Demo Cartela ${i + 1}`,
+              pattern,
+              isHardcoded: true,
+              isActive: true,
+              isBooked: false,
+              createdAt: now,
+              updatedAt: now
+            }
+          },
+          upsert: true
+        }
+      })),
+      { ordered: false }
+    );
 
     console.log('🍃 MongoDB: Initial data created successfully');
     console.log('🍃 MongoDB: Login credentials:');
@@ -0,0 +1,233 @@
+import type { Request, Response, NextFunction, RequestHandler } from "express";
+import type { IncomingMessage } from "http";
+import { WebSocket } from "ws";
+import { getLogger } from "./logger";
+import { wsBroadcastsTotal, wsMessagesSentTotal } from "./metrics";
+
+/**
+ * Topic subscriptions over the /game-ws socket.
+ *
+ * Clients send `{ type: "subscribe", topics: ["shop:3", "cartelas:3"] }` and
+ * receive `{ type: "invalidate", topic }` whenever data behind a topic
+ * changes, which they turn into React Query invalidations. Topics:
+ *
+ *   shop:<shopId>        games, stats and settings of a shop
+ *   game:<gameId>        a single game
+ *   cartelas:<shopId>    cartela bookings and markings of a shop
+ *   balance:<userId>     a user's credit balance
+ *
+ * Publishes for the same topic within one tick are coalesced into one frame.
+ */
+
+const realtimeLog = getLogger("realtime");
+
+interface SessionUser {
+  id: number;
+  role: string;
+  shopId?: number | null;
+}
+
+interface Subscriber {
+  user: SessionUser | null;
+  topics: Set<string>;
+}
+
+const subscribers = new Map<WebSocket, Subscriber>();
+const topicSockets = new Map<string, Set<WebSocket>>();
+const pendingTopics = new Set<string>();
+let flushScheduled = false;
+
+// Subscribing to a topic only reveals that something changed, but keep
+// tenants apart anyway: users may only follow their own shop and balance.
+function canSubscribe(user: SessionUser | null, topic: string): boolean {
+  if (!user) return false;
+  if (user.role === "super_admin") return true;
+
+  const [kind, id] = topic.split(":");
+  const numericId = Number(id);
+  switch (kind) {
+    case "shop":
+    case "cartelas":
+      return user.shopId != null && user.shopId === numericId;
+    case "balance":
+      return user.id === numericId;
+    case "game":
+      // Game ids are not secret and carry no data; membership is checked by the REST reads
+      return Number.isInteger(numericId);
+    default:
+      return false;
+  }
+}
+
+function subscribe(ws: WebSocket, subscriber: Subscriber, topics: unknown) {
+  if (!Array.isArray(topics)) return;
+  for (const topic of topics) {
+    if (typeof topic !== "string" || !canSubscribe(subscriber.user, topic)) continue;
+    subscriber.topics.add(topic);
+    let sockets = topicSockets.get(topic);
+    if (!sockets) {
+      sockets = new Set();
+      topicSockets.set(topic, sockets);
+    }
+    sockets.add(ws);
+  }
+}
+
+function unsubscribe(ws: WebSocket, subscriber: Subscriber, topics: Iterable<string>) {
+  for (const topic of topics) {
+    subscriber.topics.delete(topic);
+    const sockets = topicSockets.get(topic);
+    if (sockets) {
+      sockets.delete(ws);
+      if (sockets.size === 0) topicSockets.delete(topic);
+    }
+  }
+}
+
+function flush() {
+  flushScheduled = false;
+  for (const topic of pendingTopics) {
+    const sockets = topicSockets.get(topic);
+    if (!sockets) continue;
+
+    const message = JSON.stringify({ type: "invalidate", topic });
+    let sent = 0;
+    sockets.forEach((ws) => {
+      if (ws.readyState === WebSocket.OPEN) {
+        ws.send(message);
+        sent++;
+      }
+    });
+    wsBroadcastsTotal.inc({ type: "invalidate" });
+    wsMessagesSentTotal.inc({ type: "invalidate" }, sent);
+  }
+  pendingTopics.clear();
+}
+
+/**
+ * Notifies subscribers that data behind the given topics changed.
+ */
+export function publish(...topics: (string | null | undefined)[]) {
+  for (const topic of topics) {
+    if (topic && topicSockets.has(topic)) pendingTopics.add(topic);
+  }
+  if (pendingTopics.size > 0 && !flushScheduled) {
+    flushScheduled = true;
+    setImmediate(flush);
+  }
+}
+
+/**
+ * Registers a socket for topic subscriptions. The session is resolved
+ * once from the upgrade request's cookie.
+ */
+export function handleRealtimeConnection(ws: WebSocket, req: IncomingMessage, sessionParser?: RequestHandler) {
+  const subscriber: Subscriber = { user: null, topics: new Set() };
+  subscribers.set(ws, subscriber);
+
+  // Messages that arrive before the session is resolved are replayed afterwards
+  const queued: unknown[] = [];
+  let ready = false;
+
+  const handle = (message: any) => {
+    if (message?.type === "subscribe") {
+      subscribe(ws, subscriber, message.topics);
+    } else if (message?.type === "unsubscribe" && Array.isArray(message.topics)) {
+      unsubscribe(ws, subscriber, message.topics);
+    }
+  };
+
+  ws.on("message", (data) => {
+    let message: any;
+    try {
+      message = JSON.parse(data.toString());
+    } catch {
+      return;
+    }
+    if (ready) handle(message);
+    else queued.push(message);
+  });
+
+  ws.on("close", () => {
+    unsubscribe(ws, subscriber, [...subscriber.topics]);
+    subscribers.delete(ws);
+  });
+
+  const resolveSession = () => {
+    const session = (req as any).session;
+    subscriber.user = session?.user ?? null;
+    ready = true;
+    queued.splice(0).forEach(handle);
+  };
+
+  if (sessionParser) {
+    sessionParser(req as Request, {} as Response, (err?: unknown) => {
+      if (err) realtimeLog.warn("could not read session for websocket", { error: err });
+      resolveSession();
+    });
+  } else {
+    resolveSession();
+  }
+}
+
+// Topics touched by successful writes, keyed by route prefix. Runs after the
+// response is sent, so request latency is unaffected.
+const MUTATION_TOPICS: { match: RegExp; topics: (req: Request, user: SessionUser) => (string | null)[] }[] = [
+  {
+    match: /^\/api\/games/,
+    topics: (req, user) => {
+      const gameId = req.params.gameId ?? req.params.id;
+      return [`shop:${user.shopId}`, gameId ? `game:${gameId}` : null];
+    },
+  },
+  {
+    match: /^\/api\/(cartelas|collectors\/(mark|unmark)-cartela|employees\/(mark|unmark)-cartela)/,
+    topics: (req, user) => [`cartelas:${req.body?.shopId ?? user.shopId}`],
+  },
+  {
+    match: /^\/api\/(credit|admin\/credit-loads)/,
+    topics: (req, user) => [
+      `balance:${user.id}`,
+      req.body?.toAdminId ? `balance:${req.body.toAdminId}` : null,
+      `shop:${user.shopId}`,
+    ],
+  },
+  {
+    match: /^\/api\/shops\/:(id|shopId)/,
+    topics: (req) => [`shop:${req.params.id ?? req.params.shopId}`],
+  },
+  {
+    match: /^\/api\/employees\/(create-collector|collectors)/,
+    topics: (_req, user) => [`shop:${user.shopId}`],
+  },
+  {
+    // Shop and employee profit margins change the amounts dashboards show
+    match: /^\/api\/admin\/(system-settings|employee-profit-margins)/,
+    topics: (req, user) => [`shop:${req.body?.shopId ?? user.shopId}`],
+  },
+];
+
+/**
+ * Publishes topic invalidations after successful POST/PUT/PATCH/DELETE
+ * requests, based on the matched route pattern and the session user.
+ */
+export function publishOnMutation(req: Request, res: Response, next: NextFunction) {
+  if (req.method === "GET" || req.method === "HEAD" || req.method === "OPTIONS") {
+    return next();
+  }
+
+  res.on("finish", () => {
+    if (res.statusCode >= 400 || topicSockets.size === 0) return;
+    const user: SessionUser | undefined = (req as any).session?.user;
+    if (!user || !req.route?.path) return;
+
+    const route = `${req.baseUrl}${req.route.path}`;
+    for (const rule of MUTATION_TOPICS) {
+      if (rule.match.test(route)) {
+        publish(...rule.topics(req, user).filter((topic) => topic && !topic.endsWith(":undefined") && !topic.endsWith(":null")));
+      }
+    }
+  });
+
+  next();
+}
@@ -1,14 +1,21 @@
 // @ts-nocheck
 import type { Express, Request } from "express";
 import express from "express";
+import path from "path";
 import { createServer, type Server } from "http";
 import { WebSocketServer, WebSocket } from "ws";
 import session from "express-session";
 import { storage } from "./storage";
 import bcrypt from "bcrypt";
-import { insertUserSchema, insertShopSchema, insertGameSchema, insertGamePlayerSchema, insertTransactionSchema, insertEmployeeProfitMarginSchema, insertCustomCartelaSchema } from "@shared/schema";
+import { insertUserSchema, insertShopSchema, insertGameSchema, insertGamePlayerSchema, insertTransactionSchema, insertEmployeeProfitMarginSchema, insertCustomCartelaSchema, type Game } from "@shared/schema";
 import { z } from "zod";
 import { getFixedCartelaPattern as getFixedPattern, getCartelaNumbers } from "./fixed-cartelas";
+import { getLogger } from "./logger";
+import { staticAssets } from "./static-assets";
+import { handleRealtimeConnection } from "./realtime";
+import { LOOKAHEAD_WINDOW, hideDrawSeed, newDrawSeed, nextNumbersFor } from "./draw-order";
+import { findWinningLine, type WinResult } from "@shared/bingo-rules";
+import { wsBroadcastsTotal, wsConnectionsActive, wsConnectionsTotal, wsMessagesSentTotal } from "./metrics";
 
 // Extend Express Request to include session
 declare module 'express-serve-static-core' {
@@ -17,117 +24,55 @@ declare module 'express-serve-static-core' {
   }
 }
 
+const bingoLog = getLogger("bingo");
+const gameLog = getLogger("games");
+
 // WebSocket clients by game ID
 const gameClients = new Map<number, Set<WebSocket>>();
 
+// Send a message to every open socket watching a game
+function broadcastToGame(gameId: number, payload: { type: string; [key: string]: any }) {
+  const clients = gameClients.get(gameId);
+  if (!clients) return;
+
+  const message = JSON.stringify(payload, hideDrawSeed);
+  let sent = 0;
+  clients.forEach(client => {
+    if (client.readyState === WebSocket.OPEN) {
+      client.send(message);
+      sent++;
+    }
+  });
+  wsBroadcastsTotal.inc({ type: payload.type });
+  wsMessagesSentTotal.inc({ type: payload.type }, sent);
+}
+
+// Seed of a game's draw order; games created before seeds existed get one on
+// first use
+async function drawSeedFor(game: Game): Promise<string> {
+  if (game.drawSeed) return game.drawSeed;
+  const drawSeed = newDrawSeed();
+  await storage.updateGame(game.id, { drawSeed });
+  game.drawSeed = drawSeed;
+  return drawSeed;
+}
+
 // Fixed cartela patterns are now handled by imported functions from fixed-cartelas.ts
 
 // Helper function to check if cartela has bingo
-function checkBingoWin(cartelaPattern: number[][], calledNumbers: number[]): { isWinner: boolean; pattern?: string; winningCells?: number[] } {
-  const calledSet = new Set(calledNumbers);
-  
-  console.log('🔍 DETAILED BINGO CHECK:', {
-    pattern: cartelaPattern,
-    called: calledNumbers,
-    calledSet: Array.from(calledSet)
-  });
-  
-  // Check rows
-  for (let row = 0; row < 5; row++) {
-    let rowComplete = true;
-    let rowDetails = [];
-    for (let col = 0; col < 5; col++) {
-      const num = cartelaPattern[row][col];
-      const isMarked = (num === 0) || calledSet.has(num);
-      rowDetails.push({ num, isMarked, isFree: num === 0 });
-      if (num !== 0 && !calledSet.has(num)) {
-        rowComplete = false;
-      }
-    }
-    console.log(`Row ${row + 1}:`, { rowDetails, rowComplete });
-    if (rowComplete) {
-      console.log(`🎯 WINNER FOUND: Horizontal Row ${row + 1}`);
-      const winningCells = [];
-      for (let col = 0; col < 5; col++) {
-        winningCells.push(row * 5 + col);
-      }
-      return { isWinner: true, pattern: `Horizontal Row ${row + 1}`, winningCells };
-    }
-  }
-  
-  // Check columns
-  for (let col = 0; col < 5; col++) {
-    let colComplete = true;
-    let colDetails = [];
-    for (let row = 0; row < 5; row++) {
-      const num = cartelaPattern[row][col];
-      const isMarked = (num === 0) || calledSet.has(num);
-      colDetails.push({ num, isMarked, isFree: num === 0 });
-      if (num !== 0 && !calledSet.has(num)) {
-        colComplete = false;
-      }
-    }
-    console.log(`Column ${col + 1}:`, { colDetails, colComplete });
-    if (colComplete) {
-      const columnNames = ['B', 'I', 'N', 'G', 'O'];
-      console.log(`🎯 WINNER FOUND: Vertical Column ${columnNames[col]}`);
-      const winningCells = [];
-      for (let row = 0; row < 5; row++) {
-        winningCells.push(row * 5 + col);
-      }
-      return { isWinner: true, pattern: `Vertical Column ${columnNames[col]}`, winningCells };
-    }
-  }
-  
-  // Check diagonal 1 (top-left to bottom-right)
-  let diag1Complete = true;
-  let diag1Details = [];
-  for (let i = 0; i < 5; i++) {
-    const num = cartelaPattern[i][i];
-    const isMarked = (num === 0) || calledSet.has(num);
-    diag1Details.push({ num, isMarked, isFree: num === 0 });
-    if (num !== 0 && !calledSet.has(num)) {
-      diag1Complete = false;
-    }
-  }
-  console.log('Diagonal 1:', { diag1Details, diag1Complete });
-  if (diag1Complete) {
-    console.log('🎯 WINNER FOUND: Diagonal (Top-Left to Bottom-Right)');
-    const winningCells = [];
-    for (let i = 0; i < 5; i++) {
-      winningCells.push(i * 5 + i);
-    }
-    return { isWinner: true, pattern: 'Diagonal (Top-Left to Bottom-Right)', winningCells };
-  }
-  
-  // Check diagonal 2 (top-right to bottom-left)
-  let diag2Complete = true;
-  let diag2Details = [];
-  for (let i = 0; i < 5; i++) {
-    const num = cartelaPattern[i][4 - i];
-    const isMarked = (num === 0) || calledSet.has(num);
-    diag2Details.push({ num, isMarked, isFree: num === 0 });
-    if (num !== 0 && !calledSet.has(num)) {
-      diag2Complete = false;
-    }
-  }
-  console.log('Diagonal 2:', { diag2Details, diag2Complete });
-  if (diag2Complete) {
-    console.log('🎯 WINNER FOUND: Diagonal (Top-Right to Bottom-Left)');
-    const winningCells = [];
-    for (let i = 0; i < 5; i++) {
-      winningCells.push(i * 5 + (4 - i));
-    }
-    return { isWinner: true, pattern: 'Diagonal (Top-Right to Bottom-Left)', winningCells };
+function checkBingoWin(cartelaPattern: number[][], calledNumbers: number[]): WinResult {
+  const result = findWinningLine(cartelaPattern, calledNumbers);
+  if (result.isWinner) {
+    bingoLog.debug(`winner found: ${result.pattern}`, () => ({ pattern: cartelaPattern, called: calledNumbers }));
+  } else {
+    bingoLog.debug('no winner found', () => ({ pattern: cartelaPattern, called: calledNumbers }));
   }
-  
-  console.log('❌ NO WINNER FOUND');
-  return { isWinner: false, pattern: null };
+  return result;
 }
 
 export async function registerRoutes(app: Express): Promise<{ server: Server; wss: WebSocketServer }> {
   // Serve static files from attached_assets directory
-  app.use('/attached_assets', express.static('attached_assets'));
+  app.use('/attached_assets', staticAssets(path.resolve('attached_assets'), { defaultCacheControl: 'public, max-age=86400' }));
   
   // Authentication routes
   app.post("/api/auth/login", async (req, res) => {
@@ -512,21 +457,14 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
   app.patch("/api/games/:id", async (req, res) => {
     try {
       const id = parseInt(req.params.id);
-      const game = await storage.updateGame(id, req.body);
+      const { drawSeed, ...updates } = req.body;
+      const game = await storage.updateGame(id, updates);
       if (!game) {
         return res.status(404).json({ message: "Game not found" });
       }
 
       // Notify WebSocket clients about game update
-      const clients = gameClients.get(id);
-      if (clients) {
-        const message = JSON.stringify({ type: 'game_updated', game });
-        clients.forEach(client => {
-          if (client.readyState === WebSocket.OPEN) {
-            client.send(message);
-          }
-        });
-      }
+      broadcastToGame(id, { type: 'game_updated', game });
 
       res.json(game);
     } catch (error) {
@@ -586,15 +524,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       }
 
       // Notify WebSocket clients
-      const clients = gameClients.get(gameId);
-      if (clients) {
-        const message = JSON.stringify({ type: 'player_registered', player });
-        clients.forEach(client => {
-          if (client.readyState === WebSocket.OPEN) {
-            client.send(message);
-          }
-        });
-      }
+      broadcastToGame(gameId, { type: 'player_registered', player });
 
       res.json(player);
     } catch (error) {
@@ -616,15 +546,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       }
 
       // Notify WebSocket clients
-      const clients = gameClients.get(gameId);
-      if (clients) {
-        const message = JSON.stringify({ type: 'player_removed', playerId });
-        clients.forEach(client => {
-          if (client.readyState === WebSocket.OPEN) {
-            client.send(message);
-          }
-        });
-      }
+      broadcastToGame(gameId, { type: 'player_removed', playerId });
 
       res.json({ message: "Player removed" });
     } catch (error) {
@@ -646,15 +568,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       }
 
       // Notify WebSocket clients
-      const clients = gameClients.get(gameId);
-      if (clients) {
-        const message = JSON.stringify({ type: 'game_started', game });
-        clients.forEach(client => {
-          if (client.readyState === WebSocket.OPEN) {
-            client.send(message);
-          }
-        });
-      }
+      broadcastToGame(gameId, { type: 'game_started', game });
 
       res.json(game);
     } catch (error) {
@@ -676,15 +590,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       const updatedGame = await storage.updateGame(gameId, { calledNumbers });
 
       // Notify WebSocket clients
-      const clients = gameClients.get(gameId);
-      if (clients) {
-        const message = JSON.stringify({ type: 'number_called', number, calledNumbers });
-        clients.forEach(client => {
-          if (client.readyState === WebSocket.OPEN) {
-            client.send(message);
-          }
-        });
-      }
+      broadcastToGame(gameId, { type: 'number_called', number, calledNumbers });
 
       res.json({ number, calledNumbers });
     } catch (error) {
@@ -1347,6 +1253,13 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
   });
 
   wss.on('connection', (ws, req) => {
+    wsConnectionsTotal.inc();
+    wsConnectionsActive.inc();
+    ws.on('close', () => wsConnectionsActive.dec());
+
+    // Topic subscriptions for dashboard invalidation (see realtime.ts)
+    handleRealtimeConnection(ws, req, app.locals.sessionMiddleware);
+
     const url = new URL(req.url!, `http://${req.headers.host}`);
     const gameId = parseInt(url.searchParams.get('gameId') || '0');
 
@@ -1393,19 +1306,11 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
               await storage.updateGame(gameId, { calledNumbers });
               
               // Broadcast to all clients
-              const clients = gameClients.get(gameId);
-              if (clients) {
-                const response = JSON.stringify({ 
-                  type: 'number_called', 
-                  number: calledNumber, 
-                  calledNumbers 
-                });
-                clients.forEach(client => {
-                  if (client.readyState === WebSocket.OPEN) {
-                    client.send(response);
-                  }
-                });
-              }
+              broadcastToGame(gameId, { 
+                type: 'number_called', 
+                number: calledNumber, 
+                calledNumbers 
+              });
             }
           }
         } catch (error) {
@@ -2813,43 +2718,26 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
         return res.status(400).json({ message: "Game is paused" });
       }
 
-      // Generate next random number
+      // Next number of the game's draw order, the same one the caller screen
+      // would pick while offline
       const currentNumbers = game.calledNumbers || [];
-      const availableNumbers = [];
-      
-      // Generate all possible BINGO numbers (B1-B15, I16-I30, N31-N45, G46-G60, O61-O75)
-      for (let i = 1; i <= 75; i++) {
-        if (!currentNumbers.includes(i.toString())) {
-          availableNumbers.push(i);
-        }
-      }
+      const [newNumber] = nextNumbersFor(gameId, await drawSeedFor(game), currentNumbers, 1);
 
-      if (availableNumbers.length === 0) {
+      if (newNumber === undefined) {
         return res.status(400).json({ message: "All numbers have been called" });
       }
 
-      // Pick random number from available
-      const randomIndex = Math.floor(Math.random() * availableNumbers.length);
-      const newNumber = availableNumbers[randomIndex];
       const updatedNumbers = [...currentNumbers, newNumber.toString()];
       
       const updatedGame = await storage.updateGameNumbers(gameId, updatedNumbers);
       
       // Broadcast to WebSocket clients
-      const clients = gameClients.get(gameId);
-      if (clients) {
-        const message = JSON.stringify({
-          type: 'number_called',
-          gameId,
-          calledNumbers: updatedNumbers,
-          latestNumber: newNumber
-        });
-        clients.forEach(client => {
-          if (client.readyState === WebSocket.OPEN) {
-            client.send(message);
-          }
-        });
-      }
+      broadcastToGame(gameId, {
+        type: 'number_called',
+        gameId,
+        calledNumbers: updatedNumbers,
+        latestNumber: newNumber
+      });
 
       res.json({
         ...updatedGame,
@@ -2862,6 +2750,112 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
     }
   });
 
+  // Upcoming numbers of the draw order, cached by the caller screen so calls
+  // do not wait on the network and survive short outages
+  app.get("/api/games/:gameId/draw-ahead", async (req, res) => {
+    try {
+      const userId = (req.session as any)?.userId;
+      if (!userId) {
+        return res.status(401).json({ message: "Authentication required" });
+      }
+
+      const user = await storage.getUser(userId);
+      const gameId = parseInt(req.params.gameId);
+      const game = await storage.getGame(gameId);
+      if (!user || user.role !== 'employee' || !game || game.shopId !== user.shopId) {
+        return res.status(403).json({ message: "Employee access required" });
+      }
+
+      const calledNumbers = game.calledNumbers || [];
+      res.set('Cache-Control', 'no-store');
+      res.json({
+        gameId,
+        status: game.status,
+        calledNumbers: calledNumbers.map((n) => parseInt(n)),
+        upcoming: nextNumbersFor(gameId, await drawSeedFor(game), calledNumbers, LOOKAHEAD_WINDOW),
+      });
+    } catch (error) {
+      gameLog.error("draw-ahead failed", { error });
+      res.status(500).json({ message: "Failed to load draw order" });
+    }
+  });
+
+  // Sync calls made by the caller screen. Each event carries its 1-based
+  // position in the called list, so replays are acknowledged without being
+  // applied twice. A new call must be the draw order's next number; a
+  // mismatch or gap returns the server's list to adopt.
+  app.post("/api/games/:gameId/events", async (req, res) => {
+    try {
+      const userId = (req.session as any)?.userId;
+      if (!userId) {
+        return res.status(401).json({ message: "Authentication required" });
+      }
+
+      const user = await storage.getUser(userId);
+      const gameId = parseInt(req.params.gameId);
+      const game = await storage.getGame(gameId);
+      if (!user || user.role !== 'employee' || !game || game.shopId !== user.shopId) {
+        return res.status(403).json({ message: "Employee access required" });
+      }
+
+      const events = Array.isArray(req.body?.events) ? req.body.events : [];
+      const parsed: { seq: number; number: number }[] = [];
+      for (const event of events) {
+        const seq = Number(event?.seq);
+        const number = Number(event?.number);
+        if (!Number.isInteger(seq) || seq < 1 || !Number.isInteger(number) || number < 1 || number > 75) {
+          return res.status(400).json({ message: "Invalid event", event });
+        }
+        parsed.push({ seq, number });
+      }
+
+      const calledNumbers: string[] = [...(game.calledNumbers || [])];
+      const drawSeed = await drawSeedFor(game);
+      let conflict = false;
+
+      for (const { seq, number } of parsed.sort((a, b) => a.seq - b.seq)) {
+        if (seq <= calledNumbers.length) {
+          // Already applied (a retry) unless another device called a different number
+          if (parseInt(calledNumbers[seq - 1]) !== number) conflict = true;
+        } else if (
+          seq === calledNumbers.length + 1 &&
+          game.status === 'active' &&
+          // Only the draw order's next number; anything else would let the caller pick the draw
+          number === nextNumbersFor(gameId, drawSeed, calledNumbers, 1)[0]
+        ) {
+          calledNumbers.push(number.toString());
+        } else {
+          conflict = true;
+        }
+        if (conflict) break;
+      }
+
+      const applied = calledNumbers.length - (game.calledNumbers || []).length;
+      if (applied > 0) {
+        await storage.updateGameNumbers(gameId, calledNumbers);
+        broadcastToGame(gameId, {
+          type: 'number_called',
+          gameId,
+          calledNumbers,
+          latestNumber: parseInt(calledNumbers[calledNumbers.length - 1])
+        });
+      }
+      if (conflict) {
+        gameLog.warn('call sync conflict', { gameId, serverCount: calledNumbers.length, events: events.length });
+      }
+
+      res.status(conflict ? 409 : 200).json({
+        calledNumbers: calledNumbers.map((n) => parseInt(n)),
+        applied,
+        conflict,
+        upcoming: nextNumbersFor(gameId, drawSeed, calledNumbers, LOOKAHEAD_WINDOW),
+      });
+    } catch (error) {
+      gameLog.error("call sync failed", { error });
+      res.status(500).json({ message: "Failed to sync calls" });
+    }
+  });
+
   // Get game players
   app.get("/api/games/:gameId/players", async (req, res) => {
     try {
@@ -2895,15 +2889,17 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       const gameId = parseInt(req.params.gameId);
       const { cartelaNumber, calledNumbers } = req.body;
 
-      console.log(`Checking winner for cartela #${cartelaNumber} in shop ${user.shopId}`);
-      console.log(`Called numbers:`, calledNumbers);
+      bingoLog.debug(`checking winner for cartela #${cartelaNumber}`, () => ({
+        shopId: user.shopId,
+        gameId,
+        calledCount: calledNumbers?.length ?? 0
+      }));
 
       // Get the cartela pattern from database instead of static data
       const cartela = await storage.getCartelaByNumber(user.shopId!, cartelaNumber);
-      console.log(`Found cartela:`, cartela ? `ID ${cartela.id}, pattern: ${JSON.stringify(cartela.pattern)}` : 'Not found');
       
       if (!cartela) {
-        console.log(`Cartela #${cartelaNumber} not found in shop ${user.shopId}`);
+        bingoLog.info(`cartela #${cartelaNumber} not found`, { shopId: user.shopId, gameId });
         return res.status(404).json({ 
           message: "Cartela not found",
           cartelaNumber,
@@ -2914,7 +2910,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       const cartelaPattern = cartela.pattern;
       const winResult = checkBingoWin(cartelaPattern, calledNumbers);
       
-      console.log(`Winner check result for cartela #${cartelaNumber}:`, winResult);
+      bingoLog.debug(`winner check result for cartela #${cartelaNumber}`, () => ({ gameId, ...winResult }));
       
       res.json({ 
         cartelaNumber,
@@ -2927,8 +2923,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
           : `Cartela Number: ${cartelaNumber}\nNot a Winner`
       });
     } catch (error) {
-      console.error("Check winner error:", error);
-      console.error("Error stack:", error.stack);
+      bingoLog.error("check winner failed", { error });
       const { cartelaNumber } = req.body || {};
       res.status(500).json({ 
         message: "Failed to check winner",
@@ -3224,17 +3219,17 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       const gameId = parseInt(req.params.gameId);
       const { winnerCartelaNumber, totalPlayers, entryFeePerPlayer, allCartelaNumbers, calledNumbers } = req.body;
 
-      console.log('🎯 COMPREHENSIVE GAME RECORDING - Game ' + gameId + ', Winner ' + winnerCartelaNumber + ', Cartela ' + winnerCartelaNumber);
+      gameLog.debug('declare winner request', { gameId, winnerCartelaNumber });
 
       if (!winnerCartelaNumber) {
-        console.log('❌ No winnerCartelaNumber provided for game ' + gameId);
+        gameLog.warn('declare winner without cartela number', { gameId });
         return res.status(400).json({ message: "Winner cartela number is required" });
       }
 
       // Verify if this cartela is actually a winner using database data
       const cartela = await storage.getCartelaByNumber(user.shopId!, winnerCartelaNumber);
       if (!cartela) {
-        console.log('❌ CARTELA NOT FOUND:', { cartelaNumber: winnerCartelaNumber, shopId: user.shopId });
+        gameLog.warn('winner cartela not found', { gameId, cartelaNumber: winnerCartelaNumber, shopId: user.shopId });
         return res.status(404).json({ 
           message: "Cartela not found",
           cartelaNumber: winnerCartelaNumber
@@ -3245,7 +3240,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       const winResult = checkBingoWin(cartelaPattern, calledNumbers);
       
       if (!winResult.isWinner) {
-        console.log('❌ WINNER VERIFICATION FAILED:', { cartelaNumber: winnerCartelaNumber, winResult });
+        gameLog.warn('winner verification failed', { gameId, cartelaNumber: winnerCartelaNumber });
         return res.status(400).json({ 
           message: "This cartela is not a winner",
           cartelaNumber: winnerCartelaNumber,
@@ -3253,28 +3248,18 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
         });
       }
 
-      console.log('✅ WINNER VERIFIED - Game ' + gameId + ', Winner ' + winnerCartelaNumber + ', Pattern: ' + winResult.pattern);
-
       // Get existing players for this game to calculate accurate financial data
       const existingPlayers = await storage.getGamePlayers(gameId);
-      console.log('🔍 EXISTING PLAYERS IN GAME:', {
+      gameLog.debug('existing players', () => ({
         gameId,
-        playerCount: existingPlayers.length,
         players: existingPlayers.map(p => ({ id: p.id, cartelas: p.cartelaNumbers, fee: p.entryFee }))
-      });
+      }));
 
       // Use frontend-provided data for accurate calculations - prioritize actual data
       const totalCartelas = allCartelaNumbers ? allCartelaNumbers.length : (totalPlayers || 0);
       const actualEntryFee = parseFloat(entryFeePerPlayer?.toString() || '0');
       const totalCollected = totalCartelas * actualEntryFee;
       
-      console.log('📊 CORRECTED CALCULATION:', {
-        totalCartelas,
-        actualEntryFee,
-        totalCollected,
-        playerRecords: existingPlayers.length
-      });
-
       // Find or create winner player record
       let winnerPlayer = existingPlayers.find(p => p.cartelaNumbers.includes(winnerCartelaNumber));
       if (!winnerPlayer) {
@@ -3286,11 +3271,10 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
           entryFee: actualEntryFee.toString(),
           isWinner: true
         });
-        console.log('⚠️ Created new player record for winner - this should not happen in normal flow');
+        gameLog.warn('created missing player record for winner', { gameId, cartelaNumber: winnerCartelaNumber });
       } else {
         // Mark existing player as winner
         winnerPlayer.isWinner = true;
-        console.log('✅ Found existing player record for winner cartela #' + winnerCartelaNumber);
       }
       
       // Get shop data to fetch correct profit margin
@@ -3301,33 +3285,22 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       const superAdminCommissionRate = shop?.superAdminCommission ? parseFloat(shop.superAdminCommission) / 100 : 0.20;
       const superAdminCommission = adminProfit * superAdminCommissionRate;
 
-      console.log('💰 FINANCIAL CALCULATION:', {
-        totalCollected,
+      gameLog.debug('profit calculation', () => ({
+        gameId,
         totalCartelas,
-        entryFeePerPlayer: actualEntryFee.toString(),
-        allPlayerDetails: existingPlayers.map(p => ({
-          playerId: p.id,
-          playerName: p.playerName,
-          cartelaNumbers: p.cartelaNumbers,
-          amount: parseFloat(p.entryFee)
-        }))
-      });
-
-      console.log('🧮 PROFIT CALCULATIONS:', {
+        entryFee: actualEntryFee,
         totalCollected,
-        profitMargin: (shopProfitMargin * 100) + '%',
+        profitMargin: shopProfitMargin,
         adminProfit,
         prizeAmount,
-        superAdminCommissionRate: (superAdminCommissionRate * 100) + '%',
-        superAdminCommission,
-        calculationMethod: 'totalCollected * (1 - shopProfitMargin)'
-      });
+        superAdminCommissionRate,
+        superAdminCommission
+      }));
 
       // Update game status to completed
       await storage.updateGameStatus(gameId, 'completed');
 
       // Create comprehensive game history record
-      console.log('💾 CREATING COMPREHENSIVE GAME HISTORY RECORD...');
       const gameHistory = {
         gameId,
         shopId: user.shopId!,
@@ -3343,7 +3316,13 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
       };
 
       const historyRecord = await storage.recordGameHistory(gameHistory);
-      console.log('✅ GAME HISTORY CREATED:', { historyId: historyRecord.id, gameId, uniqueRecord: true });
+      gameLog.info('winner declared', {
+        gameId,
+        historyId: historyRecord.id,
+        cartelaNumber: winnerCartelaNumber,
+        pattern: winResult.pattern,
+        totalCollected: gameHistory.totalCollected
+      });
 
       // Note: Shop revenue tracking handled by game history record
 
@@ -3368,16 +3347,12 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
             description: `Game ${gameId} commission from ${user.name || 'Admin'}`,
             dateEAT: dateEAT
           });
-          console.log('✅ Super Admin revenue saved to database: ' + superAdminCommission.toFixed(2) + ' ETB from game ' + gameId);
+          gameLog.debug('super admin revenue saved', { gameId, amount: superAdminCommission.toFixed(2) });
         } catch (revenueError) {
-          console.error('❌ Failed to save super admin revenue:', revenueError);
+          gameLog.error('failed to save super admin revenue', { gameId, error: revenueError });
         }
       }
 
-      // Log super admin commission
-      console.log('✅ Super Admin revenue logged: ' + superAdminCommission.toFixed(2) + ' ETB from game ' + gameId);
-      console.log('✅ Super Admin revenue logged from game ' + gameId + ': ' + superAdminCommission + ' ETB');
-
       // Deduct the commission from admin's credit balance
       if (superAdminCommission > 0) {
         try {
@@ -3388,10 +3363,15 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
             const newBalance = Math.max(0, currentBalance - superAdminCommission);
             
             await storage.updateUserBalance(shopAdmin.id, newBalance.toFixed(2));
-            console.log(`💰 COMMISSION DEDUCTED: ${superAdminCommission.toFixed(2)} ETB from admin ${shopAdmin.name} (${currentBalance.toFixed(2)} → ${newBalance.toFixed(2)} ETB)`);
+            gameLog.info('commission deducted', {
+              gameId,
+              adminId: shopAdmin.id,
+              amount: superAdminCommission.toFixed(2),
+              balance: newBalance.toFixed(2)
+            });
           }
         } catch (balanceError) {
-          console.error('❌ Failed to deduct commission from admin balance:', balanceError);
+          gameLog.error('failed to deduct commission from admin balance', { gameId, error: balanceError });
         }
       }
 
@@ -3409,7 +3389,7 @@ export async function registerRoutes(app: Express): Promise<{ server: Server; ws
         cartelaNumber: winnerCartelaNumber
       });
     } catch (error) {
-      console.error("Declare winner error:", error);
+      gameLog.error("declare winner failed", { error });
       res.status(500).json({ message: "Failed to declare winner" });
     }
   });
@@ -0,0 +1,254 @@
+import session from "express-session";
+
+type SessionData = session.SessionData;
+type Callback<T = void> = (err?: any, result?: T) => void;
+
+export interface TouchEntry {
+  sid: string;
+  expire: Date;
+}
+
+export interface CachedSessionStoreOptions {
+  // Persistent store that keeps sessions alive across restarts (connect-pg-simple)
+  store: session.Store;
+  // Minimum time between persisted expiry updates for the same session
+  touchInterval?: number;
+  // How often pending touches are flushed to the persistent store
+  flushInterval?: number;
+  // Maximum number of touches written per flush batch
+  batchSize?: number;
+  // How long a cached session is trusted before it is re-read from the store
+  cacheTtl?: number;
+  // Upper bound on cached sessions; the least recently used are evicted first
+  maxEntries?: number;
+  // Optional bulk writer for expiry updates, falls back to store.touch per session
+  flushTouches?: (entries: TouchEntry[]) => Promise<void>;
+}
+
+interface CacheEntry {
+  // Serialized so request handlers never mutate the cached copy in place
+  data: string;
+  expires: number;
+  cachedAt: number;
+  persistedAt: number;
+}
+
+function getExpiry(sess: SessionData, fallbackMs: number): number {
+  const expires = sess?.cookie?.expires;
+  if (expires) {
+    return new Date(expires).getTime();
+  }
+  if (typeof sess?.cookie?.maxAge === "number") {
+    return Date.now() + sess.cookie.maxAge;
+  }
+  return Date.now() + fallbackMs;
+}
+
+/**
+ * In-process session cache in front of a persistent express-session store.
+ *
+ * Reads are served from memory, full writes go straight through to the
+ * backing store, and the expiry-only touches issued by `rolling: true` are
+ * coalesced so each session is persisted at most once per `touchInterval`.
+ * Pending touches are written in batches on a timer and on shutdown.
+ *
+ * The cache assumes a single app process per database; `cacheTtl` bounds how
+ * stale a session can be if another process writes to the same table.
+ */
+export class CachedSessionStore extends session.Store {
+  private readonly store: session.Store;
+  private readonly touchInterval: number;
+  private readonly batchSize: number;
+  private readonly cacheTtl: number;
+  private readonly maxEntries: number;
+  private readonly flushTouches?: (entries: TouchEntry[]) => Promise<void>;
+
+  private readonly cache = new Map<string, CacheEntry>();
+  private readonly pendingTouches = new Map<string, Date>();
+  private flushTimer: NodeJS.Timeout;
+  private flushing: Promise<void> | null = null;
+
+  constructor(options: CachedSessionStoreOptions) {
+    super();
+    this.store = options.store;
+    this.touchInterval = options.touchInterval ?? 5 * 60 * 1000;
+    this.batchSize = options.batchSize ?? 500;
+    this.cacheTtl = options.cacheTtl ?? 10 * 60 * 1000;
+    this.maxEntries = options.maxEntries ?? 10000;
+    this.flushTouches = options.flushTouches;
+
+    const flushInterval = options.flushInterval ?? 30 * 1000;
+    this.flushTimer = setInterval(() => {
+      this.sweepExpired();
+      this.flush().catch((err) => console.error("Session touch flush failed:", err));
+    }, flushInterval);
+    this.flushTimer.unref();
+  }
+
+  get(sid: string, callback: Callback<SessionData | null>): void {
+    const entry = this.cache.get(sid);
+    const now = Date.now();
+
+    if (entry && now - entry.cachedAt < this.cacheTtl) {
+      if (entry.expires <= now) {
+        this.destroy(sid, (err) => callback(err, null));
+        return;
+      }
+      // Refresh LRU position
+      this.cache.delete(sid);
+      this.cache.set(sid, entry);
+      callback(null, JSON.parse(entry.data));
+      return;
+    }
+
+    this.store.get(sid, (err, sess) => {
+      if (err) return callback(err);
+      if (!sess) {
+        this.evict(sid);
+        return callback(null, null);
+      }
+      this.remember(sid, sess, Date.now());
+      callback(null, sess);
+    });
+  }
+
+  set(sid: string, sess: SessionData, callback?: Callback): void {
+    this.store.set(sid, sess, (err) => {
+      if (err) {
+        this.evict(sid);
+        return callback?.(err);
+      }
+      this.pendingTouches.delete(sid);
+      this.remember(sid, sess, Date.now());
+      callback?.();
+    });
+  }
+
+  touch(sid: string, sess: SessionData, callback?: Callback): void {
+    const now = Date.now();
+    const expires = getExpiry(sess, this.touchInterval);
+    const entry = this.cache.get(sid);
+
+    if (!entry) {
+      // Unknown to this process, write through so the expiry is never lost
+      if (!this.store.touch) {
+        this.set(sid, sess, callback);
+        return;
+      }
+      this.store.touch(sid, sess, (err) => {
+        if (!err) this.remember(sid, sess, now);
+        callback?.(err);
+      });
+      return;
+    }
+
+    entry.expires = expires;
+    entry.data = JSON.stringify(sess);
+
+    if (now - entry.persistedAt >= this.touchInterval) {
+      this.pendingTouches.set(sid, new Date(expires));
+      if (this.pendingTouches.size >= this.batchSize) {
+        this.flush().catch((err) => console.error("Session touch flush failed:", err));
+      }
+    }
+    callback?.();
+  }
+
+  destroy(sid: string, callback?: Callback): void {
+    this.evict(sid);
+    this.store.destroy(sid, (err) => callback?.(err));
+  }
+
+  /**
+   * Writes all pending expiry touches to the persistent store in batches.
+   */
+  flush(): Promise<void> {
+    if (this.flushing) return this.flushing;
+    if (this.pendingTouches.size === 0) return Promise.resolve();
+
+    this.flushing = (async () => {
+      try {
+        while (this.pendingTouches.size > 0) {
+          const batch: TouchEntry[] = [];
+          for (const [sid, expire] of this.pendingTouches) {
+            batch.push({ sid, expire });
+            if (batch.length >= this.batchSize) break;
+          }
+          for (const { sid } of batch) {
+            this.pendingTouches.delete(sid);
+          }
+
+          try {
+            await this.writeTouches(batch);
+          } catch (error) {
+            // Re-queue so the next flush retries, unless a newer touch arrived
+            for (const { sid, expire } of batch) {
+              if (!this.pendingTouches.has(sid)) this.pendingTouches.set(sid, expire);
+            }
+            throw error;
+          }
+
+          const persistedAt = Date.now();
+          for (const { sid } of batch) {
+            const entry = this.cache.get(sid);
+            if (entry) entry.persistedAt = persistedAt;
+          }
+        }
+      } finally {
+        this.flushing = null;
+      }
+    })();
+
+    return this.flushing;
+  }
+
+  /**
+   * Stops the flush timer and persists any outstanding touches.
+   */
+  async close(): Promise<void> {
+    clearInterval(this.flushTimer);
+    await this.flush();
+  }
+
+  private async writeTouches(batch: TouchEntry[]): Promise<void> {
+    if (this.flushTouches) {
+      await this.flushTouches(batch);
+      return;
+    }
+
+    await Promise.all(batch.map(({ sid }) => new Promise<void>((resolve, reject) => {
+      const entry = this.cache.get(sid);
+      if (!entry || !this.store.touch) return resolve();
+      this.store.touch(sid, JSON.parse(entry.data), (err) => (err ? reject(err) : resolve()));
+    })));
+  }
+
+  private remember(sid: string, sess: SessionData, persistedAt: number): void {
+    this.cache.delete(sid);
+    this.cache.set(sid, {
+      data: JSON.stringify(sess),
+      expires: getExpiry(sess, this.cacheTtl),
+      cachedAt: Date.now(),
+      persistedAt,
+    });
+
+    while (this.cache.size > this.maxEntries) {
+      const oldest = this.cache.keys().next().value;
+      this.cache.delete(oldest);
+    }
+  }
+
+  private evict(sid: string): void {
+    this.cache.delete(sid);
+    this.pendingTouches.delete(sid);
+  }
+
+  private sweepExpired(): void {
+    const now = Date.now();
+    for (const [sid, entry] of this.cache) {
+      if (entry.expires <= now) {
+        this.evict(sid);
+      }
+    }
+  }
+}
@@ -0,0 +1,222 @@
+import express, { type Request, Response, NextFunction, RequestHandler } from "express";
+import crypto from "crypto";
+import fs from "fs";
+import path from "path";
+
+const IMMUTABLE = "public, max-age=31536000, immutable";
+const REVALIDATE = "no-cache";
+const SHORT_LIVED = "public, max-age=3600";
+
+// Vite chunks (index-3f2a9c1e.js), voice sprites (betty.3f2a9c1e.mp3) and the
+// content-addressed voice store (/voices/dist/5d41402ab1c3.webm)
+const HASHED_NAME = /[.-][0-9a-f]{8,}\.[a-z0-9]+$/i;
+const HASHED_DIRS = ["/assets/", "/voices/dist/"];
+
+const PRECOMPRESSED_TYPES: Record<string, string> = {
+  ".js": "application/javascript; charset=utf-8",
+  ".mjs": "application/javascript; charset=utf-8",
+  ".css": "text/css; charset=utf-8",
+  ".html": "text/html; charset=utf-8",
+  ".json": "application/json; charset=utf-8",
+  ".svg": "image/svg+xml",
+};
+
+const AUDIO_TYPES: Record<string, string> = {
+  ".mp3": "audio/mpeg",
+  ".wav": "audio/wav",
+  ".webm": "audio/webm",
+  ".ogg": "audio/ogg",
+  ".opus": "audio/ogg",
+};
+
+export interface StaticAssetOptions {
+  // Directories (relative to the root) loaded into memory at startup
+  warmDirs?: string[];
+  // Largest single file kept in the warm cache
+  warmMaxFileBytes?: number;
+  // Cache-Control for files that are neither hashed nor manifests
+  defaultCacheControl?: string;
+}
+
+interface WarmEntry {
+  body: Buffer;
+  type: string;
+  etag: string;
+  lastModified: string;
+}
+
+function cacheControlFor(urlPath: string, fallback: string): string {
+  const base = path.posix.basename(urlPath);
+  if (base === "index.html" || base.endsWith(".json")) {
+    return REVALIDATE;
+  }
+  if (HASHED_DIRS.some((dir) => urlPath.startsWith(dir)) || HASHED_NAME.test(base)) {
+    return IMMUTABLE;
+  }
+  return fallback;
+}
+
+function acceptedEncoding(req: Request): "br" | "gzip" | null {
+  const header = String(req.headers["accept-encoding"] || "");
+  if (/\bbr\b/.test(header)) return "br";
+  if (/\bgzip\b/.test(header)) return "gzip";
+  return null;
+}
+
+/**
+ * Parses a single "bytes=start-end" range. Returns null when the header is
+ * absent or uses multiple ranges, and "invalid" when it cannot be satisfied.
+ */
+function parseRange(header: string | undefined, size: number): { start: number; end: number } | null | "invalid" {
+  if (!header || !header.startsWith("bytes=") || header.includes(",")) return null;
+
+  const [startText, endText] = header.slice(6).split("-");
+  let start: number;
+  let end: number;
+  if (startText === "") {
+    // Suffix range: the last N bytes
+    const suffix = Number(endText);
+    if (!Number.isFinite(suffix) || suffix <= 0) return "invalid";
+    start = Math.max(0, size - suffix);
+    end = size - 1;
+  } else {
+    start = Number(startText);
+    end = endText === "" ? size - 1 : Math.min(Number(endText), size - 1);
+  }
+
+  if (!Number.isFinite(start) || !Number.isFinite(end) || start > end || start >= size) return "invalid";
+  return { start, end };
+}
+
+function loadWarmCache(root: string, dirs: string[], maxFileBytes: number): Map<string, WarmEntry> {
+  const cache = new Map<string, WarmEntry>();
+
+  for (const dir of dirs) {
+    const absolute = path.join(root, dir);
+    if (!fs.existsSync(absolute)) continue;
+
+    for (const name of fs.readdirSync(absolute)) {
+      const filePath = path.join(absolute, name);
+      const stat = fs.statSync(filePath);
+      if (!stat.isFile() || stat.size > maxFileBytes) continue;
+
+      const body = fs.readFileSync(filePath);
+      const ext = path.extname(name).toLowerCase();
+      cache.set(`/${dir}/${name}`.replace(/\/+/g, "/"), {
+        body,
+        type: AUDIO_TYPES[ext] || PRECOMPRESSED_TYPES[ext] || "application/octet-stream",
+        etag: `"${crypto.createHash("sha1").update(body).digest("base64url").slice(0, 16)}"`,
+        lastModified: stat.mtime.toUTCString(),
+      });
+    }
+  }
+
+  return cache;
+}
+
+function serveWarm(req: Request, res: Response, entry: WarmEntry, cacheControl: string) {
+  res.setHeader("Cache-Control", cacheControl);
+  res.setHeader("ETag", entry.etag);
+  res.setHeader("Last-Modified", entry.lastModified);
+  res.setHeader("Accept-Ranges", "bytes");
+  res.setHeader("Content-Type", entry.type);
+
+  if (req.headers["if-none-match"] === entry.etag) {
+    return res.status(304).end();
+  }
+
+  const size = entry.body.length;
+  const range = parseRange(req.headers.range, size);
+  if (range === "invalid") {
+    res.setHeader("Content-Range", `bytes */${size}`);
+    return res.status(416).end();
+  }
+  if (range) {
+    res.status(206);
+    res.setHeader("Content-Range", `bytes ${range.start}-${range.end}/${size}`);
+    res.setHeader("Content-Length", range.end - range.start + 1);
+    return req.method === "HEAD" ? res.end() : res.end(entry.body.subarray(range.start, range.end + 1));
+  }
+
+  res.setHeader("Content-Length", size);
+  return req.method === "HEAD" ? res.end() : res.end(entry.body);
+}
+
+/**
+ * Static file layer for the client build and the public/ audio tree.
+ *
+ * - Content-hashed files are served with `immutable`, manifests and
+ *   index.html are always revalidated.
+ * - JS, CSS, HTML, JSON and SVG are served from `.br`/`.gz` siblings
+ *   produced at build time when the client accepts them.
+ * - Small, hot directories (voices/common) are held in memory with
+ *   Range support; everything else streams from disk via express.static,
+ *   which handles Range and conditional requests itself.
+ */
+export function staticAssets(root: string, options: StaticAssetOptions = {}): RequestHandler {
+  const defaultCacheControl = options.defaultCacheControl ?? SHORT_LIVED;
+  const warm = loadWarmCache(root, options.warmDirs ?? [], options.warmMaxFileBytes ?? 512 * 1024);
+  // Existence of precompressed siblings never changes while the process runs
+  const variants = new Map<string, boolean>();
+
+  const hasVariant = (file: string): boolean => {
+    let exists = variants.get(file);
+    if (exists === undefined) {
+      exists = fs.existsSync(path.join(root, file));
+      variants.set(file, exists);
+    }
+    return exists;
+  };
+
+  const files = express.static(root, {
+    index: false,
+    setHeaders: (res, filePath) => {
+      const relative = "/" + path.relative(root, filePath).split(path.sep).join("/");
+      const original = relative.replace(/\.(br|gz)$/, "");
+      res.setHeader("Cache-Control", cacheControlFor(original, defaultCacheControl));
+
+      const ext = path.extname(original).toLowerCase();
+      if (original !== relative) {
+        res.setHeader("Content-Type", PRECOMPRESSED_TYPES[ext]);
+        res.setHeader("Content-Encoding", relative.endsWith(".br") ? "br" : "gzip");
+      } else if (AUDIO_TYPES[ext]) {
+        res.setHeader("Content-Type", AUDIO_TYPES[ext]);
+      }
+    },
+  });
+
+  return (req: Request, res: Response, next: NextFunction) => {
+    if (req.method !== "GET" && req.method !== "HEAD") {
+      return next();
+    }
+
+    let urlPath: string;
+    try {
+      urlPath = decodeURIComponent(req.path);
+    } catch {
+      return next();
+    }
+
+    if (urlPath.includes("..")) {
+      return files(req, res, next);
+    }
+
+    const entry = warm.get(urlPath);
+    if (entry) {
+      return serveWarm(req, res, entry, cacheControlFor(urlPath, defaultCacheControl));
+    }
+
+    const ext = path.extname(urlPath).toLowerCase();
+    if (PRECOMPRESSED_TYPES[ext]) {
+      res.vary("Accept-Encoding");
+      const encoding = acceptedEncoding(req);
+      const suffix = encoding === "br" ? ".br" : encoding === "gzip" ? ".gz" : null;
+      if (suffix && hasVariant(urlPath + suffix)) {
+        const query = req.url.slice(req.path.length);
+        req.url = req.path + suffix + query;
+      }
+    }
+
+    return files(req, res, next);
+  };
+}
@@ -3,6 +3,7 @@ import {
   creditTransfers, creditLoads, referralCommissions, withdrawalRequests,
   superAdminRevenues, dailyRevenueSummary, employeeProfitMargins,
   cartelas, customCartelas,
+  type Cartela, type InsertCartela,
   type User, type InsertUser, type Shop, type InsertShop, 
   type Game, type InsertGame, type GamePlayer, type InsertGamePlayer,
   type Transaction, type InsertTransaction, type CommissionPayment, type InsertCommissionPayment,
@@ -14,8 +15,28 @@ import {
   type EmployeeProfitMargin, type InsertEmployeeProfitMargin,
   type CustomCartela, type InsertCustomCartela
 } from "@shared/schema";
-import { db } from "./db";
-import { eq, and, or, desc, gte, lte, sum, count } from "drizzle-orm";
+import { db, isMemoryStorage } from "./db";
+import { MemStorage } from "./memory-storage";
+import { newDrawSeed } from "./draw-order";
+import { parsePattern } from "@shared/bingo-rules";
+import { eq, and, or, desc, gt, gte, lte, sum, count, sql } from "drizzle-orm";
+
+export interface CartelaSearchOptions {
+  // Exact cartela number
+  cartelaNumber?: number;
+  // Only cartelas whose pattern contains this number (1-75)
+  contains?: number;
+  // Keyset cursor: the last cartela number of the previous page
+  after?: number;
+  limit: number;
+}
+
+export interface CartelaPage {
+  items: Cartela[];
+  // Matches for the whole search, not just this page
+  total: number;
+  nextCursor: number | null;
+}
 
 export interface IStorage {
   // User methods
@@ -40,11 +61,12 @@ export interface IStorage {
   getGamesByShop(shopId: number): Promise<Game[]>;
   getActiveGameByEmployee(employeeId: number): Promise<Game | undefined>;
   createGame(game: InsertGame): Promise<Game>;
-  updateGame(id: number, updates: Partial<InsertGame>): Promise<Game | undefined>;
+  updateGame(id: number, updates: Partial<InsertGame> & { drawSeed?: string }): Promise<Game | undefined>;
   updateGameStatus(gameId: number, status: string): Promise<Game>;
   updateGameNumbers(gameId: number, calledNumbers: string[]): Promise<Game>;
   updateGamePrizePool(gameId: number, additionalAmount: number): Promise<Game>;
   completeGame(gameId: number, winnerId: number, prizeAmount: string): Promise<Game>;
+  getRecentCompletedGame(shopId: number): Promise<Game | undefined>;
   
   // Game Player methods
   getGamePlayers(gameId: number): Promise<GamePlayer[]>;
@@ -134,6 +156,15 @@ export interface IStorage {
   updateEmployeeProfitMargin(marginId: number, profitMargin: string, adminId: number): Promise<EmployeeProfitMargin>;
   updateUserPassword(userId: number, hashedPassword: string): Promise<void>;
   
+  // Cartela methods
+  getCartelasByShop(shopId: number): Promise<Cartela[]>;
+  searchCartelas(shopId: number, options: CartelaSearchOptions): Promise<CartelaPage>;
+  getCartela(id: number): Promise<Cartela | undefined>;
+  getShopCartela(shopId: number, cartelaNumber: number): Promise<Cartela | undefined>;
+  createCartela(cartela: InsertCartela): Promise<Cartela>;
+  updateCartela(id: number, updates: Partial<InsertCartela> & { updatedAt?: Date }): Promise<Cartela | undefined>;
+  deleteCartela(id: number): Promise<boolean>;
+
   // Collector methods
   markCartelaByCollector(cartelaId: number, collectorId: number): Promise<void>;
   unmarkCartelaByCollector(cartelaId: number, collectorId: number): Promise<void>;
@@ -292,11 +323,11 @@ export class DatabaseStorage implements IStorage {
   }
 
   async createGame(insertGame: InsertGame): Promise<Game> {
-    const [game] = await db.insert(games).values(insertGame).returning();
+    const [game] = await db.insert(games).values({ ...insertGame, drawSeed: newDrawSeed() }).returning();
     return game;
   }
 
-  async updateGame(id: number, updates: Partial<InsertGame>): Promise<Game | undefined> {
+  async updateGame(id: number, updates: Partial<InsertGame> & { drawSeed?: string }): Promise<Game | undefined> {
     const [game] = await db.update(games).set(updates).where(eq(games.id, id)).returning();
     return game || undefined;
   }
@@ -349,6 +380,14 @@ export class DatabaseStorage implements IStorage {
     return game;
   }
 
+  async getRecentCompletedGame(shopId: number): Promise<Game | undefined> {
+    const [game] = await db.select().from(games)
+      .where(and(eq(games.shopId, shopId), eq(games.status, 'completed')))
+      .orderBy(desc(games.completedAt))
+      .limit(1);
+    return game || undefined;
+  }
+
   async getGamePlayers(gameId: number): Promise<GamePlayer[]> {
     return await db.select().from(gamePlayers)
       .where(eq(gamePlayers.gameId, gameId))
@@ -1604,6 +1643,74 @@ export class DatabaseStorage implements IStorage {
     };
   }
 
+  // Unified cartela table methods
+  async getCartelasByShop(shopId: number): Promise<Cartela[]> {
+    return await db.select().from(cartelas)
+      .where(eq(cartelas.shopId, shopId))
+      .orderBy(cartelas.cartelaNumber);
+  }
+
+  async getCartelas(shopId: number): Promise<Cartela[]> {
+    return this.getCartelasByShop(shopId);
+  }
+
+  async searchCartelas(shopId: number, { cartelaNumber, contains, after, limit }: CartelaSearchOptions): Promise<CartelaPage> {
+    const filters = [eq(cartelas.shopId, shopId)];
+    if (cartelaNumber !== undefined) filters.push(eq(cartelas.cartelaNumber, cartelaNumber));
+    // jsonb containment matches the number in any row of the 5x5 pattern;
+    // rows not yet backfilled hold the pattern as a JSON string
+    if (contains !== undefined) {
+      filters.push(sql`(CASE WHEN jsonb_typeof(${cartelas.pattern}) = 'string' THEN (${cartelas.pattern} #>> '{}')::jsonb ELSE ${cartelas.pattern} END) @> ${JSON.stringify([[contains]])}::jsonb`);
+    }
+    const where = and(...filters);
+
+    // Keyset pagination over the (shop_id, cartela_number) unique index
+    const [rows, [{ total }]] = await Promise.all([
+      db.select().from(cartelas)
+        .where(after !== undefined ? and(where, gt(cartelas.cartelaNumber, after)) : where)
+        .orderBy(cartelas.cartelaNumber)
+        .limit(limit + 1),
+      db.select({ total: count() }).from(cartelas).where(where),
+    ]);
+
+    const items = rows.slice(0, limit).map((c) => ({ ...c, pattern: parsePattern(c.pattern) }));
+    return {
+      items,
+      total: Number(total),
+      nextCursor: rows.length > limit ? items[items.length - 1].cartelaNumber : null,
+    };
+  }
+
+  async getCartela(id: number): Promise<Cartela | undefined> {
+    const [cartela] = await db.select().from(cartelas).where(eq(cartelas.id, id));
+    return cartela || undefined;
+  }
+
+  async getShopCartela(shopId: number, cartelaNumber: number): Promise<Cartela | undefined> {
+    const [cartela] = await db.select().from(cartelas).where(
+      and(eq(cartelas.shopId, shopId), eq(cartelas.cartelaNumber, cartelaNumber))
+    ).limit(1);
+    return cartela || undefined;
+  }
+
+  async createCartela(cartela: InsertCartela): Promise<Cartela> {
+    const [created] = await db.insert(cartelas).values(cartela).returning();
+    return created;
+  }
+
+  async updateCartela(id: number, updates: Partial<InsertCartela> & { updatedAt?: Date }): Promise<Cartela | undefined> {
+    const [updated] = await db.update(cartelas)
+      .set(updates)
+      .where(eq(cartelas.id, id))
+      .returning();
+    return updated || undefined;
+  }
+
+  async deleteCartela(id: number): Promise<boolean> {
+    const deleted = await db.delete(cartelas).where(eq(cartelas.id, id)).returning({ id: cartelas.id });
+    return deleted.length > 0;
+  }
+
   async createCustomCartela(cartela: InsertCustomCartela): Promise<CustomCartela> {
     const [newCartela] = await db.insert(customCartelas).values(cartela).returning();
     return newCartela;
@@ -1788,4 +1895,16 @@ export class DatabaseStorage implements IStorage {
   }
 }
 
-export const storage = new DatabaseStorage();
+export const storage = isMemoryStorage ? new MemStorage() : new DatabaseStorage();
+
+/**
+ * Rewrites cartela patterns stored as JSON strings (older loader and
+ * cartela routes) as jsonb arrays, so containment searches match them.
+ */
+export async function backfillCartelaPatterns(): Promise<number> {
+  if (isMemoryStorage) return 0;
+  const result = await db.execute(
+    sql`UPDATE cartelas SET pattern = (pattern #>> '{}')::jsonb WHERE jsonb_typeof(pattern) = 'string'`
+  );
+  return result.rowCount ?? 0;
+}
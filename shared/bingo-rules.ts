@@ -0,0 +1,52 @@
+// Bingo rules shared by the server and the caller screen, so a winner
+// check made offline on the tablet gives the same answer as the server.
+
+export const COLUMN_NAMES = ['B', 'I', 'N', 'G', 'O'];
+
+// Winning lines as cell indexes (row * 5 + col), checked in this order
+export const WINNING_LINES: { pattern: string; cells: number[] }[] = [
+  ...[0, 1, 2, 3, 4].map(row => ({
+    pattern: `Horizontal Row ${row + 1}`,
+    cells: [0, 1, 2, 3, 4].map(col => row * 5 + col)
+  })),
+  ...[0, 1, 2, 3, 4].map(col => ({
+    pattern: `Vertical Column ${COLUMN_NAMES[col]}`,
+    cells: [0, 1, 2, 3, 4].map(row => row * 5 + col)
+  })),
+  { pattern: 'Diagonal (Top-Left to Bottom-Right)', cells: [0, 6, 12, 18, 24] },
+  { pattern: 'Diagonal (Top-Right to Bottom-Left)', cells: [4, 8, 12, 16, 20] },
+];
+
+/**
+ * A stored cartela pattern as a 5x5 array. Rows written by older releases
+ * hold it JSON-encoded as a string inside the jsonb column.
+ */
+export function parsePattern(pattern: unknown): number[][] {
+  const value = typeof pattern === 'string' ? JSON.parse(pattern) : pattern;
+  return Array.isArray(value) ? value : [];
+}
+
+export interface WinResult {
+  isWinner: boolean;
+  pattern?: string | null;
+  winningCells?: number[];
+}
+
+/**
+ * Checks a 5x5 cartela pattern (0 = free space) against the called numbers
+ * and returns the first complete line.
+ */
+export function findWinningLine(cartelaPattern: number[][], calledNumbers: Iterable<number>): WinResult {
+  const calledSet = new Set(calledNumbers);
+  const isMarked = (cell: number) => {
+    const num = cartelaPattern[Math.floor(cell / 5)][cell % 5];
+    return num === 0 || calledSet.has(num);
+  };
+
+  for (const line of WINNING_LINES) {
+    if (line.cells.every(isMarked)) {
+      return { isWinner: true, pattern: line.pattern, winningCells: [...line.cells] };
+    }
+  }
+  return { isWinner: false, pattern: null };
+}
@@ -195,15 +195,23 @@ const creditLoadSchema = new Schema<ICreditLoad>({
 });
 
 // Create indexes for better performance
-userSchema.index({ username: 1 });
-userSchema.index({ role: 1 });
-userSchema.index({ shopId: 1 });
+// username and accountNumber are already indexed through their unique constraints
+userSchema.index({ role: 1, createdAt: -1 });
+userSchema.index({ shopId: 1, role: 1 });
+userSchema.index({ supervisorId: 1, role: 1 });
 shopSchema.index({ adminId: 1 });
-gameSchema.index({ shopId: 1, status: 1 });
-gameSchema.index({ employeeId: 1 });
+gameSchema.index({ shopId: 1, status: 1, createdAt: -1 });
+gameSchema.index({ shopId: 1, createdAt: -1 });
+gameSchema.index({ employeeId: 1, status: 1, createdAt: -1 });
+// Analytics pipelines match on completed games by shop and completion time
+gameSchema.index({ shopId: 1, completedAt: -1 });
+gameSchema.index({ status: 1, completedAt: -1 });
 transactionSchema.index({ gameId: 1 });
-transactionSchema.index({ shopId: 1 });
+transactionSchema.index({ shopId: 1, createdAt: -1 });
+transactionSchema.index({ employeeId: 1, createdAt: -1 });
 cartelaSchema.index({ shopId: 1, cartelaNumber: 1 }, { unique: true });
+cartelaSchema.index({ shopId: 1, isActive: 1, cartelaNumber: 1 });
+cartelaSchema.index({ shopId: 1, isBooked: 1 });
 creditLoadSchema.index({ adminId: 1, status: 1 });
 
 // Export models
@@ -41,6 +41,7 @@ export const games = pgTable("games", {
   entryFee: decimal("entry_fee", { precision: 10, scale: 2 }).notNull(),
   calledNumbers: jsonb("called_numbers").$type<string[]>().default([]),
   winnerId: integer("winner_id").references(() => gamePlayers.id),
+  drawSeed: text("draw_seed"),
   startedAt: timestamp("started_at"),
   completedAt: timestamp("completed_at"),
   createdAt: timestamp("created_at").defaultNow(),
@@ -50,6 +50,7 @@ export const games = pgTable("games", {
   entryFee: decimal("entry_fee", { precision: 10, scale: 2 }).notNull(),
   calledNumbers: jsonb("called_numbers").$type<string[]>().default([]),
   winnerId: integer("winner_id").references(() => gamePlayers.id),
+  drawSeed: text("draw_seed"), // secret behind the game's draw order, never sent to clients
   startedAt: timestamp("started_at"),
   completedAt: timestamp("completed_at"),
   createdAt: timestamp("created_at").defaultNow(),
@@ -377,6 +378,7 @@ export const insertShopSchema = createInsertSchema(shops).omit({
 
 export const insertGameSchema = createInsertSchema(games).omit({
   id: true,
+  drawSeed: true,
   createdAt: true,
   startedAt: true,
   completedAt: true,
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Pack each voice directory under public/voices into one audio sprite.
+
+For every voice, all clips are decoded to mono PCM with ffmpeg, joined with a
+short silence between them and encoded once. The offsets are measured on the
+decoded samples, so they are exact regardless of the source encoding, and
+written to public/voices/sprites/manifest.json:
+
+    {"version": 1, "voices": {"betty": {"url": "/voices/sprites/betty.3f2a9c1e.mp3",
+                                        "clips": {"B1": {"start": 0.25, "duration": 0.91}, ...}}}}
+
+The client (client/src/lib/voice-sprites.ts) loads the sprite for the selected
+voice once and plays numbers by offset. Requires ffmpeg on PATH.
+
+    python3 tools/build_voice_sprites.py [--voices betty nati] [--bitrate 64k]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+
+VOICES_DIR = os.path.join("public", "voices")
+SPRITES_DIR = os.path.join(VOICES_DIR, "sprites")
+MANIFEST_PATH = os.path.join(SPRITES_DIR, "manifest.json")
+# Build outputs under VOICES_DIR (this tool's sprites, voice_pipeline.py's dist), not voices
+SKIP_DIRS = {"dist", "sprites"}
+
+SAMPLE_RATE = 24000
+BYTES_PER_SAMPLE = 2  # s16le mono
+# Silence around each clip so MP3 frame padding never bleeds into a neighbour
+GAP_SECONDS = 0.25
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".ogg", ".opus", ".m4a")
+# Lossless sources are preferred when a clip exists in several formats
+SOURCE_PRIORITY = {".wav": 0, ".ogg": 1, ".opus": 1, ".m4a": 2, ".mp3": 3}
+
+# "B1.mp3", "B 1.mp3", "B01.mp3", "B075.mp3" -> "B1" … "O75"
+NUMBER_CLIP = re.compile(r"^([BINGO])\s*0*(\d{1,2})$", re.IGNORECASE)
+
+
+def clip_name(stem):
+    """Normalize a file stem to its manifest key"""
+    match = NUMBER_CLIP.match(stem.strip())
+    if match:
+        return f"{match.group(1).upper()}{int(match.group(2))}"
+    return re.sub(r"\s+", "_", stem.strip().lower())
+
+
+def collect_clips(voice_dir):
+    """Map clip names to the best available source file in a voice directory"""
+    sources = {}
+    for filename in sorted(os.listdir(voice_dir)):
+        stem, ext = os.path.splitext(filename)
+        ext = ext.lower()
+        if ext not in AUDIO_EXTENSIONS:
+            continue
+        name = clip_name(stem)
+        current = sources.get(name)
+        if current is None or SOURCE_PRIORITY[ext] < SOURCE_PRIORITY[os.path.splitext(current)[1].lower()]:
+            sources[name] = os.path.join(voice_dir, filename)
+    return sources
+
+
+def decode_pcm(path):
+    """Decode any audio file to raw mono s16le PCM at SAMPLE_RATE"""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", path, "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg could not decode {path}: {result.stderr.decode(errors='replace').strip()}")
+    return result.stdout
+
+
+def encode_sprite(pcm, output_path, bitrate):
+    """Encode joined PCM to a single MP3"""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-y", "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-i", "-",
+         "-c:a", "libmp3lame", "-b:a", bitrate, output_path],
+        input=pcm,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg could not encode {output_path}: {result.stderr.decode(errors='replace').strip()}")
+
+
+def build_voice(voice, bitrate):
+    """Build the sprite for one voice and return its manifest entry"""
+    sources = collect_clips(os.path.join(VOICES_DIR, voice))
+    if not sources:
+        return None
+
+    gap = b"\x00" * int(GAP_SECONDS * SAMPLE_RATE) * BYTES_PER_SAMPLE
+    chunks = [gap]
+    clips = {}
+    offset = len(gap)
+
+    for name, path in sorted(sources.items()):
+        pcm = decode_pcm(path)
+        clips[name] = {
+            "start": round(offset / BYTES_PER_SAMPLE / SAMPLE_RATE, 4),
+            "duration": round(len(pcm) / BYTES_PER_SAMPLE / SAMPLE_RATE, 4),
+        }
+        chunks.extend([pcm, gap])
+        offset += len(pcm) + len(gap)
+
+    tmp_path = os.path.join(SPRITES_DIR, f"{voice}.tmp.mp3")
+    encode_sprite(b"".join(chunks), tmp_path, bitrate)
+
+    with open(tmp_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:8]
+    filename = f"{voice}.{digest}.mp3"
+    os.replace(tmp_path, os.path.join(SPRITES_DIR, filename))
+
+    # Remove sprites from earlier builds of this voice
+    for old in os.listdir(SPRITES_DIR):
+        if old.startswith(f"{voice}.") and old.endswith(".mp3") and old != filename:
+            os.remove(os.path.join(SPRITES_DIR, old))
+
+    return {"url": f"/voices/sprites/{filename}", "clips": clips}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build voice pack audio sprites")
+    parser.add_argument("--voices", nargs="*", help="voice directories to build (default: all)")
+    parser.add_argument("--bitrate", default="64k", help="MP3 bitrate for the sprites")
+    args = parser.parse_args()
+
+    if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode != 0:
+        print("❌ ffmpeg is required to build voice sprites")
+        return 1
+
+    os.makedirs(SPRITES_DIR, exist_ok=True)
+    manifest = {"version": 1, "voices": {}}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+
+    voices = args.voices or sorted(
+        name for name in os.listdir(VOICES_DIR)
+        if name not in SKIP_DIRS and os.path.isdir(os.path.join(VOICES_DIR, name))
+    )
+
+    for voice in voices:
+        entry = build_voice(voice, args.bitrate)
+        if entry is None:
+            print(f"⚠️  {voice}: no audio files, skipped")
+            manifest["voices"].pop(voice, None)
+            continue
+        manifest["voices"][voice] = entry
+        print(f"✅ {voice}: {len(entry['clips'])} clips -> {entry['url']}")
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"📄 Manifest written to {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env node
+// Prints the gzip size of every chunk in the client build, sums the critical
+// path of each route (entry chunk, the route's own chunk and everything they
+// import statically, plus CSS) and fails the build when a budget is exceeded.
+// Reads the Vite manifest, so `build.manifest` must stay enabled.
+//
+//   node tools/bundle-report.mjs [dist/public]
+import fs from "fs";
+import path from "path";
+import zlib from "zlib";
+
+// Gzipped KB allowed before a route's first render. The login page is what
+// every tablet loads cold; the caller screen follows straight after.
+const BUDGETS = {
+  login: { module: "index.html", maxKb: 150 },
+  employee: { module: "src/pages/employee-dashboard.tsx", maxKb: 300 },
+  collector: { module: "src/components/collector-dashboard.tsx", maxKb: 260 },
+};
+
+const root = path.resolve(process.argv[2] || "dist/public");
+const manifestPath = path.join(root, ".vite", "manifest.json");
+if (!fs.existsSync(manifestPath)) {
+  console.error(`No Vite manifest at ${manifestPath}; is build.manifest enabled?`);
+  process.exit(1);
+}
+const manifest = JSON.parse(fs.readFileSync(manifestPath, "utf8"));
+
+const gzipSizes = new Map();
+function gzipSize(file) {
+  let size = gzipSizes.get(file);
+  if (size === undefined) {
+    size = zlib.gzipSync(fs.readFileSync(path.join(root, file)), { level: 9 }).length;
+    gzipSizes.set(file, size);
+  }
+  return size;
+}
+
+// Files fetched before a manifest entry can render: its chunk, its CSS and
+// the same for every static import, recursively. Dynamic imports are excluded.
+function criticalFiles(key, files = new Set(), seen = new Set()) {
+  if (seen.has(key)) return files;
+  seen.add(key);
+  const chunk = manifest[key];
+  if (!chunk) return files;
+  files.add(chunk.file);
+  for (const css of chunk.css || []) files.add(css);
+  for (const imported of chunk.imports || []) criticalFiles(imported, files, seen);
+  return files;
+}
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+const entryKey = Object.keys(manifest).find((key) => manifest[key].isEntry);
+
+const chunks = Object.entries(manifest)
+  .map(([key, chunk]) => ({
+    name: chunk.src || key,
+    file: chunk.file,
+    raw: fs.statSync(path.join(root, chunk.file)).size,
+    gzip: gzipSize(chunk.file),
+    kind: chunk.isEntry ? "entry" : chunk.isDynamicEntry ? "route" : "shared",
+  }))
+  .sort((a, b) => b.gzip - a.gzip);
+
+console.log("Chunks (gzip):");
+for (const chunk of chunks) {
+  console.log(`  ${kb(chunk.gzip).padStart(10)}  ${kb(chunk.raw).padStart(10)} raw  ${chunk.kind.padEnd(6)}  ${chunk.file}  (${chunk.name})`);
+}
+
+let failed = false;
+const report = { chunks, routes: {} };
+
+console.log("\nCritical path per route (gzip):");
+for (const [route, { module, maxKb }] of Object.entries(BUDGETS)) {
+  if (!manifest[module]) {
+    console.warn(`  ${route}: ${module} is not a chunk in this build, skipping`);
+    continue;
+  }
+  const files = criticalFiles(module, criticalFiles(entryKey));
+  const total = [...files].reduce((sum, file) => sum + gzipSize(file), 0);
+  const over = total > maxKb * 1024;
+  failed ||= over;
+  report.routes[route] = { files: [...files], gzip: total, budget: maxKb * 1024 };
+  console.log(`  ${over ? "✗" : "✓"} ${route.padEnd(10)} ${kb(total).padStart(10)} / ${maxKb} KB  (${files.size} files)`);
+}
+
+fs.writeFileSync(path.join(root, "..", "bundle-report.json"), JSON.stringify(report, null, 2));
+
+if (failed) {
+  console.error("\nBundle budget exceeded. Move heavy imports behind a lazy route or raise the budget in tools/bundle-report.mjs.");
+  process.exit(1);
+}
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Generate and validate cartela sets.
+
+Generated sets follow the column ranges (B 1-15, I 16-30, N 31-45 around
+the free centre, G 46-60, O 61-75) and guarantee:
+
+  - no duplicate boards (each board is hashed by its 25 cells),
+  - bounded line sharing: at most --max-line-share boards contain the same
+    winning line as a set of numbers, since boards sharing a line always
+    win on the same call. By default the bound is the fewest the column
+    sizes allow plus 25%, which is one board per line until the set
+    outgrows the 1365 possible N columns,
+  - balanced numbers: column sets are dealt in whole cyclic orbits, which
+    use every number of the column equally often.
+
+Columns are dealt as NumPy arrays. Shared rows and diagonals are found by
+sorting line keys, and fixed by reshuffling the numbers within columns of
+the offending boards only. Duplicate boards are caught by hashing their
+25 cells. The output is the /api/cartelas/bulk-import format,
+one board per line with 25 values row by row and "free" in the centre.
+
+    python3 tools/generate_cartelas.py 10000 --out cartelas.txt
+    python3 tools/generate_cartelas.py 500 --after-fixed --out extra.txt    # numbered after FIXED_CARTELAS, no clashes with them
+    python3 tools/generate_cartelas.py --check cartelas.txt
+    python3 tools/generate_cartelas.py --check-fixed
+
+--check reports range errors, duplicates, shared lines and number balance
+for an existing set, and exits 1 when a board is invalid or duplicated.
+Requires numpy.
+"""
+import argparse
+import itertools
+import math
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from simulate_games import LINES, MAX_NUMBER, load_bulk_file, load_fixed_cartelas  # noqa: E402
+
+FREE = 12
+COLUMN_SIZE = 15
+MAX_SKEW = 0.1
+LINE_SLACK = 1.25
+MAX_ROUNDS = 100
+RESHUFFLES = 32
+# Key space of each of the 12 lines, by LINES index; rows and diagonals through the
+# free centre are four numbers from B, I, G and O, so those lines can equal each other
+LINE_KINDS = (["row"] * 2 + ["row with free"] + ["row"] * 2
+              + ["column"] * 2 + ["N column"] + ["column"] * 2 + ["row with free"] * 2)
+POSSIBLE_LINES = {
+    "row": COLUMN_SIZE ** 5,
+    "row with free": COLUMN_SIZE ** 4,
+    "column": 4 * math.comb(COLUMN_SIZE, 5),
+    "N column": math.comb(COLUMN_SIZE, 4),
+}
+ROW_LINES = [i for i, kind in enumerate(LINE_KINDS) if kind.startswith("row")]
+COLUMN_CELLS = [[row * 5 + col for row in range(5) if row * 5 + col != FREE] for col in range(5)]
+
+
+def column_orbits(picks):
+    """Every set of `picks` offsets 0-14, grouped into orbits under adding 1 mod 15
+
+    The members of an orbit together use every offset equally often, so dealing
+    whole orbits keeps the numbers of a column balanced.
+    """
+    seen, orbits = set(), []
+    for combo in itertools.combinations(range(COLUMN_SIZE), picks):
+        orbit = []
+        while combo not in seen:
+            seen.add(combo)
+            orbit.append(combo)
+            combo = tuple(sorted((offset + 1) % COLUMN_SIZE for offset in combo))
+        if orbit:
+            orbits.append(np.array(orbit))
+    return orbits
+
+
+def deal_column(rng, count, picks, taken=()):
+    """`count` distinct-as-possible sets of `picks` offsets, skipping `taken` sets until all others are used"""
+    orbits, dealt, rounds = column_orbits(picks), [], 0
+    while sum(map(len, dealt)) < count:
+        relabel = rng.permutation(COLUMN_SIZE)
+        deck = np.concatenate([relabel[orbits[i]] for i in rng.permutation(len(orbits))])
+        if rounds == 0 and taken:
+            deck = deck[[tuple(sorted(row)) not in taken for row in deck.tolist()]]
+        dealt.append(deck)
+        rounds += 1
+    sets = np.concatenate(dealt)[:count]
+    return rng.permuted(sets[rng.permutation(count)], axis=1)
+
+
+def column_offsets(cards, col):
+    cells = COLUMN_CELLS[col]
+    return cells, cards[:, cells].astype(np.int64) - col * COLUMN_SIZE - 1
+
+
+def line_keys(cards):
+    """One int64 per board and line identifying its set of numbers, so equal keys win on the same call"""
+    lines = np.sort(cards[:, LINES].astype(np.int64), axis=-1)
+    return lines @ ((MAX_NUMBER + 1) ** np.arange(5))
+
+
+def line_caps(total, max_share=None):
+    """Most boards allowed to share one line, by LINES index"""
+    caps = []
+    for kind in LINE_KINDS:
+        load = total * LINE_KINDS.count(kind) / POSSIBLE_LINES[kind]
+        if max_share is not None and max_share < math.ceil(load):
+            raise SystemExit(f"❌ {total} boards need at least {math.ceil(load)} per {kind} line "
+                             f"({POSSIBLE_LINES[kind]} possible); raise --max-line-share")
+        caps.append(max_share or max(1, math.ceil(load * LINE_SLACK)))
+    return caps
+
+
+def over_cap(cards, caps, lines):
+    """Boards holding a line (of `lines`) beyond its cap, or repeating an earlier board; earlier boards keep theirs"""
+    keys = line_keys(cards)[:, lines].ravel()
+    owners = np.repeat(np.arange(len(cards)), len(lines))
+    limits = np.tile(np.array(caps)[lines], len(cards))
+    order = np.lexsort((owners, keys))
+    keys, owners, limits = keys[order], owners[order], limits[order]
+    starts = np.r_[True, keys[1:] != keys[:-1]]
+    rank = np.arange(len(keys)) - np.maximum.accumulate(np.where(starts, np.arange(len(keys)), 0))
+    offending = np.zeros(len(cards), dtype=bool)
+    offending[owners[rank >= limits]] = True
+
+    seen = set()
+    for index, card in enumerate(cards):
+        digest = card.tobytes()
+        offending[index] |= digest in seen
+        seen.add(digest)
+    return offending
+
+
+def reshuffled(card, rng, count):
+    """`count` copies of a board, each with the numbers of every column in a new random order"""
+    copies = np.tile(card, (count, 1))
+    for cells in COLUMN_CELLS:
+        copies[:, cells] = rng.permuted(copies[:, cells], axis=1)
+    return copies
+
+
+def generate(count, rng, existing=None, max_share=None):
+    """`count` new boards that stay within the bounds together with `existing`
+
+    Column sets are dealt from the orbits, which bounds the column lines and
+    balances the numbers. Rows and diagonals depend only on the order of the
+    numbers within each column, so each board with a shared row or diagonal
+    gets its columns reshuffled until it has none.
+    """
+    existing = existing if existing is not None else np.zeros((0, 25), dtype=np.uint8)
+    caps = line_caps(count + len(existing), max_share)
+    cards = np.zeros((count, 25), dtype=np.uint8)
+    for col in range(5):
+        cells, used = column_offsets(existing, col)
+        sets = deal_column(rng, count, len(cells), {tuple(sorted(row)) for row in used.tolist()})
+        cards[:, cells] = sets + col * COLUMN_SIZE + 1
+
+    everything = np.concatenate([existing, cards])
+    offending = over_cap(everything, caps, ROW_LINES)
+    offending[:len(existing)] = False
+    row_caps = [caps[i] for i in ROW_LINES]
+    shared = Counter(key for row in line_keys(everything[~offending])[:, ROW_LINES].tolist() for key in row)
+    seen = {card.tobytes() for card in everything[~offending]}
+    for index in np.flatnonzero(offending[len(existing):]):
+        for _ in range(MAX_ROUNDS):
+            candidates = reshuffled(cards[index], rng, RESHUFFLES)
+            fits = ((candidate, keys) for candidate, keys in zip(candidates, line_keys(candidates)[:, ROW_LINES].tolist())
+                    if all(shared.get(key, 0) < cap for key, cap in zip(keys, row_caps)) and candidate.tobytes() not in seen)
+            fit = next(fits, None)
+            if fit:
+                cards[index], keys = fit
+                shared.update(keys)
+                seen.add(cards[index].tobytes())
+                break
+        else:
+            raise SystemExit(f"❌ Board {index + 1} still shares a row or diagonal; raise --max-line-share")
+    return cards
+
+
+def validate(ids, cards, max_share=None, skipped=0):
+    """Print a quality report; returns the number of hard errors (invalid or duplicate boards)"""
+    errors = skipped
+    lows = np.tile(np.arange(5) * COLUMN_SIZE + 1, 5)
+    in_range = (cards >= lows) & (cards < lows + COLUMN_SIZE)
+    in_range[:, FREE] = cards[:, FREE] == 0
+    numbers = np.sort(cards, axis=1)
+    repeated = ((numbers[:, 1:] == numbers[:, :-1]) & (numbers[:, 1:] > 0)).any(axis=1)
+    for board in ids[~in_range.all(axis=1)]:
+        print(f"❌ #{board}: a number is outside its column range or the centre is not free")
+    for board in ids[repeated]:
+        print(f"❌ #{board}: a number appears twice")
+    errors += int((~in_range.all(axis=1)).sum() + repeated.sum())
+
+    boards = {}
+    for board, card in zip(ids, cards):
+        boards.setdefault(card.tobytes(), []).append(int(board))
+    for copies in boards.values():
+        if len(copies) > 1:
+            print("❌ duplicate board: " + ", ".join(f"#{board}" for board in copies))
+            errors += len(copies) - 1
+
+    caps = line_caps(len(cards), max_share)
+    keys = line_keys(cards)
+    for kind in POSSIBLE_LINES:
+        columns = [i for i, name in enumerate(LINE_KINDS) if name == kind]
+        per_board = [set(row) for row in keys[:, columns].tolist()]
+        counts = Counter(key for row in per_board for key in row)
+        cap = caps[columns[0]]
+        most = max(counts.values())
+        over = sum(1 for n in counts.values() if n > cap)
+        icon = "⚠️ " if over else "✅"
+        print(f"{icon} {kind} lines: {len(counts)} distinct, up to {most} boards share one (bound {cap}), "
+              f"{over} over the bound")
+
+    frequency = np.bincount(cards.ravel(), minlength=MAX_NUMBER + 1)[1:].reshape(5, COLUMN_SIZE)
+    for col, counts in zip("BINGO", frequency):
+        skew = (counts.max() - counts.min()) / counts.mean()
+        icon = "⚠️ " if skew > MAX_SKEW else "✅"
+        print(f"{icon} {col}: each number on {counts.min()}-{counts.max()} boards (skew {100 * skew:.1f}%)")
+
+    print(f"{'❌' if errors else '✅'} {len(cards)} boards, {errors} invalid or duplicate")
+    return errors
+
+
+def write_bulk(path, ids, cards):
+    with open(path, "w") as f:
+        for board, card in zip(ids, cards.tolist()):
+            card[FREE] = "free"
+            f.write(f"{board}: {','.join(map(str, card))}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate or validate a cartela set")
+    parser.add_argument("count", type=int, nargs="?", help="boards to generate")
+    parser.add_argument("--out", help="bulk-import file to write")
+    parser.add_argument("--start", type=int, default=1, help="first board number")
+    parser.add_argument("--after-fixed", action="store_true",
+                        help="number the boards after FIXED_CARTELAS and keep the bounds together with them")
+    parser.add_argument("--max-line-share", type=int, help="most boards that may contain the same line")
+    parser.add_argument("--seed", type=int, help="random seed, for a reproducible set")
+    parser.add_argument("--check", metavar="FILE", help="validate a bulk-import file instead of generating")
+    parser.add_argument("--check-fixed", action="store_true", help="validate FIXED_CARTELAS")
+    args = parser.parse_args()
+
+    if args.check or args.check_fixed:
+        skipped = []
+        ids, cards = load_bulk_file(args.check, skipped) if args.check else load_fixed_cartelas()
+        return 1 if validate(ids, cards, args.max_line_share, len(skipped)) else 0
+
+    if not args.count or not args.out:
+        parser.error("give a board count and --out, or --check")
+    existing, start = None, args.start
+    if args.after_fixed:
+        fixed_ids, existing = load_fixed_cartelas()
+        start = int(fixed_ids.max()) + 1
+
+    began = time.perf_counter()
+    cards = generate(args.count, np.random.default_rng(args.seed), existing, args.max_line_share)
+    ids = np.arange(start, start + len(cards))
+    write_bulk(args.out, ids, cards)
+    print(f"🎱 {len(cards):,} boards #{start}-#{ids[-1]} in {time.perf_counter() - began:.2f}s -> {args.out}")
+    if existing is not None:
+        # Report on the combined set the shop will actually play with
+        ids, cards = np.concatenate([fixed_ids, ids]), np.concatenate([existing, cards])
+    validate(ids, cards, args.max_line_share)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
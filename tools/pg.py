@@ -0,0 +1,65 @@
+"""Postgres access shared by the command line tools.
+
+Uses psycopg (3) when it is installed and the psql client otherwise, so the
+tools run on a host that only has the database client.
+"""
+import datetime as dt
+import shutil
+import subprocess
+
+# Shops run on East Africa Time; date_eat columns and report days use it
+EAT = dt.timezone(dt.timedelta(hours=3))
+
+
+class Database:
+    """COPY and plain statements through psycopg, or the psql client when psycopg is missing"""
+
+    def __init__(self, url):
+        self.url = url
+        try:
+            import psycopg
+            self.psycopg = psycopg
+        except ImportError:
+            self.psycopg = None
+            if shutil.which("psql") is None:
+                raise SystemExit("❌ Needs psycopg (pip install psycopg) or the psql client")
+
+    def scalar(self, sql):
+        if self.psycopg:
+            with self.psycopg.connect(self.url) as conn:
+                return conn.execute(sql).fetchone()[0]
+        result = subprocess.run(["psql", self.url, "-XAtq", "-v", "ON_ERROR_STOP=1", "-c", sql],
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+
+    def execute(self, sql):
+        if self.psycopg:
+            with self.psycopg.connect(self.url) as conn:
+                conn.execute(sql)
+            return
+        subprocess.run(["psql", self.url, "-Xq", "-v", "ON_ERROR_STOP=1", "-c", sql], check=True)
+
+    def copy(self, table, columns, path):
+        """Bulk-load a COPY text file into the given columns of table"""
+        sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+        if self.psycopg:
+            with self.psycopg.connect(self.url) as conn:
+                conn.execute("SET synchronous_commit = off")
+                with conn.cursor().copy(sql) as copy, open(path, "rb") as f:
+                    while block := f.read(1 << 20):
+                        copy.write(block)
+            return
+        with open(path, "rb") as f:
+            subprocess.run(["psql", self.url, "-Xq", "-v", "ON_ERROR_STOP=1",
+                            "-c", "SET synchronous_commit = off", "-c", sql], stdin=f, check=True)
+
+    def copy_out(self, query, path):
+        """Write the rows of a query to path as CSV with a header line"""
+        sql = f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)"
+        with open(path, "wb") as f:
+            if self.psycopg:
+                with self.psycopg.connect(self.url) as conn, conn.cursor().copy(sql) as copy:
+                    for block in copy:
+                        f.write(block)
+                return
+            subprocess.run(["psql", self.url, "-Xq", "-v", "ON_ERROR_STOP=1", "-c", sql], stdout=f, check=True)
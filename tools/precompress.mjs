@@ -0,0 +1,46 @@
+#!/usr/bin/env node
+// Writes .br and .gz siblings for text assets in the client build so the
+// server can send them without compressing per request (server/static-assets.ts).
+//
+//   node tools/precompress.mjs [dist/public]
+import fs from "fs";
+import path from "path";
+import zlib from "zlib";
+
+const root = path.resolve(process.argv[2] || "dist/public");
+const extensions = new Set([".js", ".mjs", ".css", ".html", ".json", ".svg"]);
+// Below this size the compressed body plus headers is rarely smaller
+const minBytes = 1024;
+
+function* walk(dir) {
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) yield* walk(full);
+    else if (extensions.has(path.extname(entry.name))) yield full;
+  }
+}
+
+let original = 0;
+let brotli = 0;
+let count = 0;
+
+for (const file of walk(root)) {
+  const body = fs.readFileSync(file);
+  if (body.length < minBytes) continue;
+
+  const br = zlib.brotliCompressSync(body, {
+    params: {
+      [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+      [zlib.constants.BROTLI_PARAM_SIZE_HINT]: body.length,
+    },
+  });
+  const gz = zlib.gzipSync(body, { level: zlib.constants.Z_BEST_COMPRESSION });
+
+  fs.writeFileSync(`${file}.br`, br);
+  fs.writeFileSync(`${file}.gz`, gz);
+  original += body.length;
+  brotli += br.length;
+  count++;
+}
+
+console.log(`Precompressed ${count} files in ${root}: ${(original / 1024).toFixed(0)} KB -> ${(brotli / 1024).toFixed(0)} KB brotli`);
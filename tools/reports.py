@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Offline retail, summary and super admin revenue reports.
+
+`refresh` exports games, game_players, game_history, transactions and
+super_admin_revenues from Postgres with COPY ... TO STDOUT into a Parquet
+cache, one directory per table. The reports then read only the columns they
+need from the cache and aggregate with Arrow group-bys, so month-end
+reports over every shop take seconds instead of one query per game.
+
+Refreshes are incremental, and the cache itself is the watermark:
+  - append-only tables fetch ids above the cached maximum into a new part file,
+  - games also re-fetch the games that were still open when cached and any game
+    completed after the latest cached completed_at, then rewrite their file,
+  - shops and users are small and are copied whole.
+Rows younger than SETTLE are left for the next refresh, so a row whose id was
+taken by a transaction that had not committed yet is not skipped forever.
+Money is cached as integer cents.
+
+    python3 tools/reports.py refresh --database-url "$DATABASE_URL"
+    python3 tools/reports.py retail --from 2025-06-01 --to 2025-06-30             # per shop
+    python3 tools/reports.py retail --from 2025-06-01 --to 2025-06-30 --shop 3    # per game, like /api/reports/retail
+    python3 tools/reports.py summary --from 2025-06-01 --to 2025-06-30 --csv june.csv
+    python3 tools/reports.py revenue --from 2025-06-01 --to 2025-06-30 --refresh
+
+--from and --to are inclusive calendar days in EAT, the zone of date_eat.
+Requires pyarrow, and psycopg or the psql client for refresh.
+"""
+import argparse
+import datetime as dt
+import decimal
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from pg import EAT, Database  # noqa: E402
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(REPO_ROOT, ".report-cache")
+SETTLE = "5 minutes"
+MAX_PARTS = 32
+OPEN_STATUSES = ["waiting", "pending", "active"]
+
+INT, TEXT, TIME, MONEY = pa.int64(), pa.string(), pa.timestamp("us"), "money"
+# Cached columns per table; `since` is the creation time used to hold back unsettled rows
+TABLES = {
+    "games": {
+        "columns": {"id": INT, "shop_id": INT, "employee_id": INT, "status": TEXT, "prize_pool": MONEY,
+                    "entry_fee": MONEY, "started_at": TIME, "completed_at": TIME, "created_at": TIME},
+        "since": "created_at", "mutable": True,
+    },
+    "game_players": {
+        "columns": {"id": INT, "game_id": INT, "entry_fee": MONEY, "registered_at": TIME},
+        "since": "registered_at",
+    },
+    "game_history": {
+        "columns": {"id": INT, "game_id": INT, "shop_id": INT, "employee_id": INT, "total_collected": MONEY,
+                    "prize_amount": MONEY, "admin_profit": MONEY, "super_admin_commission": MONEY,
+                    "player_count": INT, "completed_at": TIME},
+        "since": "completed_at",
+    },
+    "transactions": {
+        "columns": {"id": INT, "game_id": INT, "shop_id": INT, "employee_id": INT, "admin_id": INT,
+                    "amount": MONEY, "type": TEXT, "created_at": TIME},
+        "since": "created_at",
+    },
+    "super_admin_revenues": {
+        "columns": {"id": INT, "admin_id": INT, "admin_name": TEXT, "shop_id": INT, "shop_name": TEXT,
+                    "game_id": INT, "revenue_type": TEXT, "amount": MONEY, "source_amount": MONEY,
+                    "created_at": TIME, "date_eat": TEXT},
+        "since": "created_at",
+    },
+    "shops": {"columns": {"id": INT, "name": TEXT, "admin_id": INT}, "snapshot": True},
+    "users": {"columns": {"id": INT, "name": TEXT, "role": TEXT, "shop_id": INT}, "snapshot": True},
+}
+
+
+class Cache:
+    """Parquet files under <root>/<table>/; files starting with a dot are ignored by readers"""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+
+    def path(self, table, *parts):
+        return os.path.join(self.root, table, *parts)
+
+    def parts(self, table):
+        directory = self.path(table)
+        return sorted(name for name in os.listdir(directory) if name.endswith(".parquet")) \
+            if os.path.isdir(directory) else []
+
+    def read(self, table, columns=None):
+        if not self.parts(table):
+            raise SystemExit(f"❌ No cached {table}; run: python3 tools/reports.py refresh")
+        return pq.read_table(self.path(table), columns=columns)
+
+    def write(self, table, data, name="data.parquet"):
+        """Atomically write one file of a table"""
+        os.makedirs(self.path(table), exist_ok=True)
+        temporary = self.path(table, f".{name}.tmp")
+        pq.write_table(data, temporary, compression="zstd")
+        os.replace(temporary, self.path(table, name))
+
+    def append(self, table, data):
+        parts = self.parts(table)
+        if len(parts) >= MAX_PARTS:
+            # Fold the parts into one file first so reads stay a handful of files
+            merged = self.read(table)
+            self.write(table, merged, "part-00000.parquet")
+            for name in parts[1:]:
+                os.remove(self.path(table, name))
+            parts = parts[:1]
+        number = int(parts[-1][5:10]) + 1 if parts else 0
+        self.write(table, data, f"part-{number:05d}.parquet")
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def delta_query(table, spec, cache):
+    """SELECT for the rows of `table` that the cache does not have yet"""
+    select = f"SELECT {', '.join(spec['columns'])} FROM {table}"
+    if spec.get("snapshot") or not cache.parts(table):
+        return select
+    cached = cache.read(table, ["id", "status", "completed_at"] if spec.get("mutable") else ["id"])
+    since = spec["since"]
+    settled = f"({since} IS NULL OR {since} < (now() AT TIME ZONE 'UTC') - interval '{SETTLE}')"
+    conditions = [f"(id > {pc.max(cached['id']).as_py() or 0} AND {settled})"]
+    if spec.get("mutable"):
+        still_open = pc.filter(cached["id"], pc.is_in(cached["status"], pa.array(OPEN_STATUSES)))
+        if len(still_open):
+            conditions.append(f"id = ANY('{{{','.join(map(str, still_open.to_pylist()))}}}'::int[])")
+        completed = pc.max(cached["completed_at"]).as_py()
+        if completed:
+            conditions.append(f"completed_at > '{completed.isoformat(sep=' ')}'")
+    return f"{select} WHERE {' OR '.join(conditions)}"
+
+
+def read_export(path, spec):
+    """A COPY CSV export as an Arrow table, money columns converted to cents"""
+    types = {name: pa.decimal128(12, 2) if kind == MONEY else kind for name, kind in spec["columns"].items()}
+    data = pcsv.read_csv(path, convert_options=pcsv.ConvertOptions(
+        column_types=types, strings_can_be_null=True, quoted_strings_can_be_null=False))
+    for name, kind in spec["columns"].items():
+        if kind == MONEY:
+            cents = pc.multiply(data[name], pa.scalar(decimal.Decimal(100), pa.decimal128(3, 0)))
+            data = data.set_column(data.schema.get_field_index(name), name, pc.cast(cents, pa.int64()))
+    return data
+
+
+def ingest(cache, table, spec, data):
+    """Merge freshly exported rows into the cache; returns the number of rows"""
+    rows = len(data)
+    if spec.get("snapshot"):
+        cache.write(table, data)
+    elif spec.get("mutable"):
+        if cache.parts(table):
+            cached = cache.read(table)
+            kept = cached.filter(pc.invert(pc.is_in(cached["id"], data["id"])))
+            data = pa.concat_tables([kept, data]).sort_by("id")
+        cache.write(table, data)
+    elif rows:
+        cache.append(table, data)
+    return rows
+
+
+def refresh(database_url, cache, full=False):
+    if not database_url:
+        raise SystemExit("❌ Set DATABASE_URL or pass --database-url")
+    if full:
+        cache.clear()
+    db = Database(database_url)
+    started = time.perf_counter()
+    workdir = tempfile.mkdtemp(prefix="bm-reports-")
+
+    def export(item):
+        table, spec = item
+        path = os.path.join(workdir, f"{table}.csv")
+        db.copy_out(delta_query(table, spec, cache), path)
+        return table, ingest(cache, table, spec, read_export(path, spec))
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for table, rows in pool.map(export, TABLES.items()):
+                print(f"📥 {table}: {rows:,} rows")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(f"✅ Cache refreshed in {time.perf_counter() - started:.1f}s")
+
+
+def day_bounds(first, last):
+    """Naive UTC bounds [start, end) of EAT calendar days first..last, matching the stored timestamps"""
+    def utc(day):
+        moment = dt.datetime.combine(day, dt.time(), EAT)
+        return moment.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return pa.scalar(utc(first), TIME), pa.scalar(utc(last + dt.timedelta(days=1)), TIME)
+
+
+def in_days(data, column, first, last):
+    start, end = day_bounds(first, last)
+    return data.filter(pc.and_(pc.greater_equal(data[column], start), pc.less(data[column], end)))
+
+
+def names(cache, table):
+    lookup = cache.read(table, ["id", "name"])
+    return dict(zip(lookup["id"].to_pylist(), lookup["name"].to_pylist()))
+
+
+def retail_report(cache, first, last, shop=None, sort=None, descending=False):
+    games = in_days(cache.read("games", ["id", "shop_id", "employee_id", "status", "prize_pool", "entry_fee",
+                                         "created_at"]), "created_at", first, last)
+    if shop is not None:
+        games = games.filter(pc.equal(games["shop_id"], shop))
+    players = cache.read("game_players", ["game_id"])
+    players = players.filter(pc.is_in(players["game_id"], games["id"]))
+    counts = players.group_by("game_id").aggregate([("game_id", "count")]).rename_columns(["game_id", "player_count"])
+    games = games.join(counts, "id", "game_id")
+
+    player_count = pc.fill_null(games["player_count"], 0)
+    prize_pool = pc.fill_null(games["prize_pool"], 0)
+    stake = pc.multiply(player_count, games["entry_fee"])
+    games = games.set_column(games.schema.get_field_index("player_count"), "player_count", player_count)
+    games = (games.append_column("stake", stake)
+             .append_column("claimed", pc.if_else(pc.equal(games["status"], "completed"), prize_pool, 0))
+             .append_column("net", pc.subtract(stake, prize_pool)))
+
+    order = "descending" if descending else "ascending"
+    if shop is not None:
+        employees = names(cache, "users")
+        games = games.sort_by([({"players": "player_count"}.get(sort, sort) or "created_at", order)])
+        columns = ["id", "created_at", "employee", "status", "player_count", "entry_fee", "stake", "claimed", "net"]
+        rows = [{**game, "employee": employees.get(game["employee_id"], "")} for game in games.to_pylist()]
+        return columns, rows
+
+    shops = names(cache, "shops")
+    totals = games.group_by("shop_id").aggregate([
+        ("id", "count"), ("player_count", "sum"), ("stake", "sum"), ("claimed", "sum"), ("net", "sum"),
+    ]).rename_columns(["shop_id", "games", "players", "stake", "claimed", "net"])
+    totals = totals.sort_by([(sort or "shop_id", order)])
+    columns = ["shop_id", "shop", "games", "players", "stake", "claimed", "net"]
+    return columns, [{**row, "shop": shops.get(row["shop_id"], "")} for row in totals.to_pylist()]
+
+
+def summary_report(cache, first, last, shop=None):
+    transactions = in_days(cache.read("transactions", ["shop_id", "type", "amount", "created_at"]),
+                           "created_at", first, last)
+    transactions = transactions.filter(pc.is_in(transactions["type"], pa.array(["entry_fee", "prize_payout"])))
+    if shop is not None:
+        transactions = transactions.filter(pc.equal(transactions["shop_id"], shop))
+    sums = transactions.group_by(["shop_id", "type"]).aggregate([("amount", "sum")])
+
+    shops = names(cache, "shops")
+    per_shop = {}
+    for row in sums.to_pylist():
+        entry = per_shop.setdefault(row["shop_id"], {"shop_id": row["shop_id"], "shop": shops.get(row["shop_id"], ""),
+                                                     "total_income": 0, "total_payout": 0})
+        entry["total_income" if row["type"] == "entry_fee" else "total_payout"] += row["amount_sum"]
+    rows = sorted(per_shop.values(), key=lambda row: row["shop_id"] or 0)
+    for row in rows:
+        row["net_balance"] = row["total_income"] - row["total_payout"]
+    return ["shop_id", "shop", "total_income", "total_payout", "net_balance"], rows
+
+
+def revenue_report(cache, first, last, admin=None):
+    revenues = cache.read("super_admin_revenues", ["admin_id", "admin_name", "revenue_type", "amount",
+                                                   "source_amount", "date_eat"])
+    revenues = revenues.filter(pc.and_(pc.greater_equal(revenues["date_eat"], first.isoformat()),
+                                       pc.less_equal(revenues["date_eat"], last.isoformat())))
+    if admin is not None:
+        revenues = revenues.filter(pc.equal(revenues["admin_id"], admin))
+    sums = revenues.group_by(["admin_id", "admin_name", "revenue_type"]).aggregate([
+        ("amount", "count"), ("source_amount", "sum"), ("amount", "sum"),
+    ]).rename_columns(["admin_id", "admin", "revenue_type", "entries", "source_amount", "amount"])
+    rows = sums.sort_by([("amount", "descending")]).to_pylist()
+    return ["admin_id", "admin", "revenue_type", "entries", "source_amount", "amount"], rows
+
+
+MONEY_COLUMNS = {"prize_pool", "entry_fee", "stake", "claimed", "net", "total_income", "total_payout",
+                 "net_balance", "source_amount", "amount"}
+# Columns that get a total line
+SUMMED = MONEY_COLUMNS - {"prize_pool", "entry_fee"} | {"games", "players", "player_count", "entries"}
+
+
+def cell(column, value):
+    if value is None:
+        return ""
+    if column in MONEY_COLUMNS:
+        return f"{value / 100:.2f}"
+    if isinstance(value, dt.datetime):
+        return value.replace(tzinfo=dt.timezone.utc).astimezone(EAT).strftime("%Y-%m-%d %H:%M")
+    return str(value)
+
+
+def print_report(title, columns, rows, limit):
+    totals = {column: sum(row[column] or 0 for row in rows) for column in columns if column in SUMMED}
+    table = [[cell(column, row[column]) for column in columns] for row in rows[:limit]]
+    table.append([cell(column, totals[column]) if column in totals else "" for column in columns])
+    table[-1][0] = "total"
+    widths = [max(len(column), *(len(line[i]) for line in table)) for i, column in enumerate(columns)]
+    print(f"📊 {title}")
+    print("  ".join(column.rjust(width) if column in SUMMED | MONEY_COLUMNS else column.ljust(width)
+                    for column, width in zip(columns, widths)))
+    for index, line in enumerate(table):
+        if index == len(table) - 1:
+            if len(rows) > limit:
+                print(f"... {len(rows) - limit:,} more rows")
+            print("  ".join("-" * width for width in widths))
+        print("  ".join(value.rjust(width) if column in SUMMED | MONEY_COLUMNS else value.ljust(width)
+                        for value, column, width in zip(line, columns, widths)))
+
+
+def write_csv(path, columns, rows):
+    data = {column: [cell(column, row[column]) for row in rows] for column in columns}
+    pcsv.write_csv(pa.table(data), path)
+    print(f"📝 Wrote {len(rows):,} rows to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline BingoMaster reports from a Parquet cache")
+    parser.add_argument("--cache", default=CACHE_DIR, help="cache directory (default: .report-cache)")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    refresh_parser = commands.add_parser("refresh", help="copy new rows from Postgres into the cache")
+    refresh_parser.add_argument("--full", action="store_true", help="drop the cache and export everything again")
+
+    for name, description in (("retail", "stake, claims and net per shop, or per game with --shop"),
+                              ("summary", "entry fee income and prize payouts per shop"),
+                              ("revenue", "super admin revenue per admin and type")):
+        report = commands.add_parser(name, help=description)
+        report.add_argument("--from", dest="first", type=dt.date.fromisoformat, required=True, help="YYYY-MM-DD")
+        report.add_argument("--to", dest="last", type=dt.date.fromisoformat, required=True, help="YYYY-MM-DD")
+        report.add_argument("--refresh", action="store_true", help="refresh the cache first")
+        report.add_argument("--csv", help="also write the rows to a CSV file")
+        report.add_argument("--limit", type=int, default=50, help="rows to print")
+        if name == "revenue":
+            report.add_argument("--admin", type=int)
+        else:
+            report.add_argument("--shop", type=int)
+        if name == "retail":
+            report.add_argument("--sort", choices=["stake", "net", "claimed", "players"])
+            report.add_argument("--desc", action="store_true")
+    args = parser.parse_args()
+
+    cache = Cache(args.cache)
+    if args.command == "refresh":
+        return refresh(args.database_url, cache, args.full)
+    if args.refresh:
+        refresh(args.database_url, cache)
+
+    started = time.perf_counter()
+    period = f"{args.first} to {args.last}"
+    if args.command == "retail":
+        columns, rows = retail_report(cache, args.first, args.last, args.shop, args.sort, args.desc)
+        title = f"Retail {period}" + (f", shop {args.shop}" if args.shop is not None else ", all shops")
+    elif args.command == "summary":
+        columns, rows = summary_report(cache, args.first, args.last, args.shop)
+        title = f"Summary {period}"
+    else:
+        columns, rows = revenue_report(cache, args.first, args.last, args.admin)
+        title = f"Super admin revenue {period}"
+    print_report(f"{title} ({time.perf_counter() - started:.2f}s)", columns, rows, args.limit)
+    if args.csv:
+        write_csv(args.csv, columns, rows)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""Monte Carlo simulator for a shop's cartela set.
+
+Plays millions of games with random draw orders and reports how many calls
+it takes until the first bingo, how often several cartelas complete a line
+on the same call, and how often each cartela wins. Shop admins can use it
+to pick a cartela count and profit margin before changing them on a live
+shop.
+
+Cartelas are an (n, 25) matrix of numbers in row-major order, 0 for the free
+space. A game is a random permutation assigning every number the draw it is
+called on, so a line is complete at the largest draw among its five cells
+and a cartela wins at the smallest of its twelve lines (the lines of
+shared/bingo-rules.ts). That turns a whole batch of games into a handful of
+NumPy gathers and reductions with no per-call loop. When the seats are a
+small share of a large set, only the seated cartelas are gathered, so a
+shop's 10k-card bulk import costs about as much per game as its players.
+Batches run on a thread
+pool with their own seeded generators, so --seed gives the same numbers on
+any machine regardless of --jobs.
+
+    python3 tools/simulate_games.py                              # FIXED_CARTELAS, every cartela playing
+    python3 tools/simulate_games.py --players 20 --games 2000000 --fee 20 --margin 20
+    python3 tools/simulate_games.py --cartelas shop-cartelas.txt --json report.json
+
+--cartelas takes a file in the /api/cartelas/bulk-import format, one
+cartela per line: "7: 3,18,33,49,62,...,free,..." (25 values, row by row).
+Requires numpy.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXED_CARTELAS_TS = os.path.join(REPO_ROOT, "server", "fixed-cartelas.ts")
+BATCH = 8192
+CELLS_PER_BATCH = 1 << 24
+MAX_NUMBER = 75
+COLUMNS = "BINGO"
+# The winning lines of shared/bingo-rules.ts as cell indexes (row * 5 + col)
+LINES = ([[row * 5 + col for col in range(5)] for row in range(5)]
+         + [[row * 5 + col for row in range(5)] for col in range(5)]
+         + [[0, 6, 12, 18, 24], [4, 8, 12, 16, 20]])
+
+
+def load_fixed_cartelas(path=FIXED_CARTELAS_TS):
+    """FIXED_CARTELAS from the server as (board numbers, (n, 25) matrix)"""
+    with open(path) as f:
+        source = f.read()
+    start = source.index("[", source.index("FIXED_CARTELAS"))
+    boards = json.loads(source[start:source.index("\n];", start) + 2])
+    ids, cards = [], []
+    for board in boards:
+        columns = [[0 if value == "FREE" else value for value in board[letter]] for letter in COLUMNS]
+        ids.append(board["Board"])
+        cards.append([columns[col][row] for row in range(5) for col in range(5)])
+    return np.array(ids), np.array(cards, dtype=np.uint8)
+
+
+def load_bulk_file(path, skipped=None):
+    """Cartelas in the bulk-import format; invalid lines are reported (and added to `skipped`) and left out like the server does"""
+    ids, cards = [], []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            number, sep, values = line.strip().partition(":")
+            if not line.strip():
+                continue
+            values = [value.strip().lower() for value in values.split(",")]
+            try:
+                if not sep or len(values) != 25 or values[12] != "free":
+                    raise ValueError("need 25 values with 'free' in the centre")
+                card = [0 if i == 12 else int(value) for i, value in enumerate(values)]
+                if not all(1 <= value <= MAX_NUMBER for i, value in enumerate(card) if i != 12):
+                    raise ValueError(f"numbers must be 1-{MAX_NUMBER}")
+                ids.append(int(number))
+                cards.append(card)
+            except ValueError as e:
+                print(f"⚠️  {path}:{line_number}: skipped, {e}")
+                if skipped is not None:
+                    skipped.append(line_number)
+    if not cards:
+        raise SystemExit(f"❌ No valid cartelas in {path}")
+    return np.array(ids), np.array(cards, dtype=np.uint8)
+
+
+def win_draws(cells):
+    """Draw on which each cartela first completes a line, from the draw marking each cell: (25, ...) -> (...)"""
+    won = None
+    for line in LINES:
+        complete = np.maximum.reduce(cells[line])
+        won = complete if won is None else np.minimum(won, complete, out=won)
+    return won
+
+
+class Tally:
+    """Counts summed over batches"""
+
+    def __init__(self, cartelas, players):
+        self.games = 0
+        self.first_win = np.zeros(MAX_NUMBER + 1, dtype=np.int64)
+        self.winners = np.zeros(players + 1, dtype=np.int64)
+        self.played = np.zeros(cartelas, dtype=np.int64)
+        self.wins = np.zeros(cartelas, dtype=np.int64)
+        self.shares = np.zeros(cartelas, dtype=np.float64)
+
+    def add(self, other):
+        self.games += other.games
+        for name in ("first_win", "winners", "played", "wins", "shares"):
+            getattr(self, name).__iadd__(getattr(other, name))
+
+
+def gathers_all(count, players):
+    """Whether a game gathers every cartela and masks the empty seats, rather than gathering only the seated ones"""
+    return 8 * players > count
+
+
+def sample_seats(rng, count, players, games):
+    """(players, games) distinct cartela indexes per game, uniformly over the possible sets.
+    Draws with replacement and redraws the later copy of any repeat; labels are
+    exchangeable, so the set stays uniform. Meant for few seats out of many cartelas."""
+    seats = rng.integers(count, size=(games, players), dtype=np.int32 if count < 2**31 else np.int64)
+    rows = np.arange(games)
+    while True:
+        ranked = np.sort(seats[rows], axis=1)
+        rows = rows[(ranked[:, 1:] == ranked[:, :-1]).any(axis=1)]
+        if not len(rows):
+            return seats.T
+        picked = seats[rows]
+        order = picked.argsort(axis=1, kind="stable")
+        ranked = np.take_along_axis(picked, order, axis=1)
+        repeat = np.zeros(picked.shape, dtype=bool)
+        np.put_along_axis(repeat, order[:, 1:], ranked[:, 1:] == ranked[:, :-1], axis=1)
+        picked[repeat] = rng.integers(count, size=int(repeat.sum()), dtype=seats.dtype)
+        seats[rows] = picked
+
+
+def simulate_batch(cards, players, games, seed):
+    """Play `games` games of `players` random cartelas each"""
+    rng = np.random.default_rng(seed)
+    count = len(cards)
+    tally = Tally(count, players)
+    tally.games = games
+
+    # draw[g, n] is the call on which number n comes up in game g; the free space (0) is marked from the start
+    draw = np.zeros((games, MAX_NUMBER + 1), dtype=np.uint8)
+    draw[:, 1:] = rng.permuted(np.tile(np.arange(1, MAX_NUMBER + 1, dtype=np.uint8), (games, 1)), axis=1)
+
+    # Cell-major (25, cartelas, games) keeps every line check an elementwise op over contiguous rows
+    if gathers_all(count, players):
+        won_at = win_draws(draw.T[cards.T])
+        if players < count:
+            seated = rng.permuted(np.tile(np.arange(count) < players, (games, 1)), axis=1).T
+            won_at[~seated] = np.iinfo(won_at.dtype).max
+            tally.played += seated.sum(axis=1)
+        else:
+            tally.played += games
+        winners = won_at == won_at.min(axis=0)
+        per_game = winners.sum(axis=0)
+        tally.wins += winners.sum(axis=1)
+        tally.shares += winners @ (1.0 / per_game)
+    else:
+        # A small share of a large set: gather only the seated cartelas, (25, players, games)
+        seats = sample_seats(rng, count, players, games)
+        won_at = win_draws(draw[np.arange(games), cards.T[:, seats]])
+        winners = won_at == won_at.min(axis=0)
+        per_game = winners.sum(axis=0)
+        won = seats[winners]
+        tally.played += np.bincount(seats.ravel(), minlength=count)
+        tally.wins += np.bincount(won, minlength=count)
+        tally.shares += np.bincount(won, weights=np.broadcast_to(1.0 / per_game, winners.shape)[winners], minlength=count)
+
+    tally.first_win += np.bincount(won_at.min(axis=0), minlength=MAX_NUMBER + 1)
+    tally.winners += np.bincount(per_game, minlength=players + 1)
+    return tally
+
+
+def simulate(cards, players, games, seed, jobs):
+    # Size batches so a batch's gather stays near CELLS_PER_BATCH cells whatever the set size
+    width = len(cards) if gathers_all(len(cards), players) else players
+    batch = max(1, min(BATCH, CELLS_PER_BATCH // (25 * width)))
+    batches = [min(batch, games - start) for start in range(0, games, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    total = Tally(len(cards), players)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for tally in pool.map(lambda args: simulate_batch(cards, players, *args), zip(batches, seeds)):
+            total.add(tally)
+    return total
+
+
+def percentile(counts, q):
+    return int(np.searchsorted(np.cumsum(counts), q * counts.sum()))
+
+
+def summarize(tally, ids, players, fee=None, margin=None):
+    calls = np.arange(len(tally.first_win))
+    ties = tally.winners[2:].sum() / tally.games
+    def per_game_played(counts):
+        return np.divide(counts, tally.played, out=np.zeros(len(ids)), where=tally.played > 0)
+
+    summary = {
+        "games": tally.games,
+        "players": players,
+        "cartelas": len(ids),
+        "calls_to_first_win": {
+            "mean": round(float((calls * tally.first_win).sum() / tally.games), 3),
+            **{f"p{int(q * 100)}": percentile(tally.first_win, q) for q in (0.01, 0.1, 0.5, 0.9, 0.99)},
+            "min": int(calls[tally.first_win > 0].min()),
+            "max": int(calls[tally.first_win > 0].max()),
+            "histogram": {int(n): int(c) for n, c in zip(calls, tally.first_win) if c},
+        },
+        "tie_rate": round(float(ties), 6),
+        "winners_per_game": {int(n): int(c) for n, c in enumerate(tally.winners) if c},
+        "win_rate": {int(board): round(float(rate), 6) for board, rate in zip(ids, per_game_played(tally.wins))},
+        # Like win_rate, but a tie counts as the fraction of the prize the cartela gets
+        "prize_share": {int(board): round(float(share), 6) for board, share in zip(ids, per_game_played(tally.shares))},
+        "expected_win_rate": round(float(tally.winners @ np.arange(players + 1) / tally.games / players), 6),
+    }
+    if fee is not None and margin is not None:
+        pot = fee * players
+        prize = pot * (1 - margin / 100)
+        summary["payout"] = {
+            "pot": pot,
+            "prize": prize,
+            "admin_profit": pot - prize,
+            # Winners of a tied call split the prize
+            "mean_prize_per_winner": round(prize * tally.games / float(tally.winners @ np.arange(players + 1)), 2),
+            "split_rate": round(float(ties), 6),
+        }
+    return summary
+
+
+def print_summary(summary, seconds):
+    games = summary["games"]
+    first = summary["calls_to_first_win"]
+    print(f"🎲 {games:,} games, {summary['players']} of {summary['cartelas']} cartelas each, "
+          f"in {seconds:.2f}s ({games / seconds:,.0f} games/s)")
+    print(f"\nCalls to first bingo: mean {first['mean']:.1f}, median {first['p50']}, "
+          f"p10 {first['p10']}, p90 {first['p90']}, p99 {first['p99']}, range {first['min']}-{first['max']}")
+    histogram = first["histogram"]
+    peak = max(histogram.values())
+    for calls in range(first["p1"], first["p99"] + 1):
+        count = histogram.get(calls, 0)
+        print(f"  {calls:3d} {'█' * round(40 * count / peak):<40} {100 * count / games:5.2f}%")
+
+    print(f"\nWinners on the first winning call (ties {100 * summary['tie_rate']:.2f}%):")
+    for winners, count in summary["winners_per_game"].items():
+        print(f"  {winners:3d} {100 * count / games:8.3f}%")
+
+    rates = summary["win_rate"]
+    expected = summary["expected_win_rate"]
+    ranked = sorted(rates.items(), key=lambda item: item[1])
+    print(f"\nWin rate per game played (even would be {100 * expected:.2f}%):")
+    for label, part in (("luckiest", ranked[::-1][:5]), ("unluckiest", ranked[:5])):
+        print(f"  {label:<11} " + ", ".join(f"#{board} {100 * rate:.2f}%" for board, rate in part))
+    spread = max(rates.values()) / min(rates.values()) if min(rates.values()) else float("inf")
+    print(f"  best/worst  {spread:.2f}x")
+
+    if "payout" in summary:
+        payout = summary["payout"]
+        print(f"\n💰 Pot {payout['pot']:,.2f}, prize {payout['prize']:,.2f}, admin profit {payout['admin_profit']:,.2f}; "
+              f"split in {100 * payout['split_rate']:.2f}% of games, mean {payout['mean_prize_per_winner']:,.2f} per winner")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate bingo games for a cartela set")
+    parser.add_argument("--cartelas", help="bulk-import format file (default: FIXED_CARTELAS)")
+    parser.add_argument("--players", type=int, help="cartelas in each game, drawn at random from the set (default: all)")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--fee", type=float, help="entry fee, for the payout summary")
+    parser.add_argument("--margin", type=float, help="shop profit margin in percent, for the payout summary")
+    parser.add_argument("--json", help="also write the full results to this file")
+    args = parser.parse_args()
+
+    ids, cards = load_bulk_file(args.cartelas) if args.cartelas else load_fixed_cartelas()
+    players = args.players or len(cards)
+    if not 1 <= players <= len(cards):
+        raise SystemExit(f"❌ --players must be between 1 and {len(cards)}")
+    _, first_seen, copies = np.unique(cards, axis=0, return_index=True, return_counts=True)
+    for index in first_seen[copies > 1]:
+        print(f"⚠️  cartela #{ids[index]} appears {copies[first_seen == index][0]} times; copies always tie")
+
+    start = time.perf_counter()
+    tally = simulate(cards, players, args.games, args.seed, args.jobs)
+    summary = summarize(tally, ids, players, args.fee, args.margin)
+    print_summary(summary, time.perf_counter() - start)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"📝 Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Synthetic BingoMaster dataset for benchmarking.
+
+Generates shops with an admin, employees, collectors and cartelas, then
+days of play per employee: games, game_players, entry fee transactions,
+game_history and super_admin_revenues, plus weekly credit loads. Amounts
+follow the declare-winner route: the shop's profit margin splits the pot
+into admin profit and prize, and the super admin commission is taken from
+the admin profit.
+
+Rows are written once to COPY text files, then bulk-loaded with
+COPY ... FROM STDIN. Tables that only depend on rows that are already
+loaded go in parallel on separate connections. Ids continue from the
+current maximum of each table, and the sequences are moved past them at
+the end. The same --seed and --end-date give the same data every run.
+
+    python3 tools/synthetic_data.py --database-url "$DATABASE_URL" --shops 50 --days 730 --seed 7
+    python3 tools/synthetic_data.py --out /tmp/bm-data --shops 5    # files and load.sql only
+
+Loading uses psycopg (3) when it is installed and the psql client otherwise.
+Every generated account has the password 123456, like the in-memory seed.
+"""
+import argparse
+import datetime as dt
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from pg import EAT, Database  # noqa: E402
+
+# bcrypt of "123456" (cost 10)
+DEFAULT_PASSWORD_HASH = "$2b$10$abcdefghijklmnopqrstuuxD0vCwu/f2ahNVJLL35ZYA2xuiRyPH6"
+ENTRY_FEES = ["10.00", "20.00", "30.00", "50.00", "100.00"]
+PROFIT_MARGINS = [15, 20, 20, 25, 30]
+PLAYER_NAMES = ["Abebe", "Kebede", "Almaz", "Tigist", "Dawit", "Selam", "Yonas", "Hana", "Bereket", "Meron",
+                "Samuel", "Liya", "Elias", "Ruth", "Henok", "Sara", "Mulugeta", "Bethlehem", "Tewodros", "Eden"]
+COLUMN_RANGES = [(1, 15), (16, 30), (31, 45), (46, 60), (61, 75)]
+
+# Load order; each stage only references tables of earlier stages and loads in parallel
+TABLES = {
+    "shops": ["id", "name", "admin_id", "profit_margin", "super_admin_commission", "referral_commission",
+              "is_blocked", "created_at", "total_revenue"],
+    "users": ["id", "username", "password", "role", "name", "is_blocked", "shop_id", "supervisor_id",
+              "credit_balance", "account_number", "commission_rate", "created_at"],
+    "games": ["id", "shop_id", "employee_id", "status", "prize_pool", "entry_fee", "called_numbers",
+              "started_at", "completed_at", "created_at"],
+    "cartelas": ["id", "shop_id", "admin_id", "cartela_number", "name", "pattern", "is_hardcoded",
+                 "is_active", "is_booked", "created_at", "updated_at"],
+    "game_players": ["id", "game_id", "player_name", "cartela_numbers", "entry_fee", "registered_at"],
+    "game_history": ["id", "game_id", "shop_id", "employee_id", "total_collected", "prize_amount", "admin_profit",
+                     "super_admin_commission", "player_count", "winner_name", "winning_cartela", "completed_at"],
+    "transactions": ["id", "game_id", "shop_id", "employee_id", "admin_id", "amount", "type", "description",
+                     "to_user_id", "created_at"],
+    "super_admin_revenues": ["id", "admin_id", "admin_name", "shop_id", "shop_name", "game_id", "revenue_type",
+                             "amount", "commission_rate", "source_amount", "description", "created_at", "date_eat"],
+}
+STAGES = [["shops"], ["users"], ["games", "cartelas"],
+          ["game_players", "game_history", "transactions", "super_admin_revenues"]]
+
+
+def money(value):
+    return f"{value:.2f}"
+
+
+def stamp(moment):
+    # timestamp columns hold UTC without a zone, like the values node-postgres writes
+    return moment.astimezone(dt.timezone.utc).replace(tzinfo=None).isoformat(sep=" ")
+
+
+class Spool:
+    """Per-table COPY text files with running ids"""
+
+    def __init__(self, directory, first_ids):
+        self.directory = directory
+        self.next_id = {table: first_ids.get(table, 0) + 1 for table in TABLES}
+        self.counts = dict.fromkeys(TABLES, 0)
+        self.files = {table: open(self.path(table), "w", buffering=1 << 20) for table in TABLES}
+
+    def path(self, table):
+        return os.path.join(self.directory, f"{table}.copy")
+
+    def add(self, table, *values):
+        """Append a row (id first, assigned here) and return its id"""
+        row_id = self.next_id[table]
+        self.next_id[table] += 1
+        self.counts[table] += 1
+        fields = [str(row_id)]
+        for value in values:
+            fields.append("\\N" if value is None else value if isinstance(value, str) else str(value))
+        self.files[table].write("\t".join(fields) + "\n")
+        return row_id
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def cartela_pattern(rng):
+    """A valid 5x5 card: five distinct numbers per column range, free centre as 0"""
+    columns = [rng.sample(range(low, high + 1), 5) for low, high in COLUMN_RANGES]
+    columns[2][2] = 0
+    return [[columns[col][row] for col in range(5)] for row in range(5)]
+
+
+def daily_games(rng, mean, day):
+    busier = 1.3 if day.weekday() >= 5 else 1.0
+    return max(0, round(rng.gauss(mean * busier, mean * 0.3)))
+
+
+def generate(spool, args, rng):
+    start_day = args.end_date - dt.timedelta(days=args.days)
+    opened = dt.datetime.combine(start_day, dt.time(8), EAT)
+    cartelas_per_shop = max(args.cartelas, args.players * 3)
+
+    for s in range(args.shops):
+        margin = rng.choice(PROFIT_MARGINS)
+        commission = rng.choice([20, 25])
+        fee = rng.choice(ENTRY_FEES)
+        shop_name = f"Shop {s + 1:03d}"
+        shop_id = spool.add("shops", shop_name, None, money(margin), money(commission), "3.00", "f",
+                            stamp(opened), "0.00")
+
+        admin_name = f"Admin {s + 1:03d}"
+        admin_id = spool.add("users", f"shop{s + 1}_admin", args.password_hash, "admin", admin_name, "f",
+                             shop_id, None, money(rng.uniform(5000, 50000)), f"BM{shop_id:08d}",
+                             money(commission), stamp(opened))
+        employees = []
+        for e in range(args.employees):
+            employee_id = spool.add("users", f"shop{s + 1}_emp{e + 1}", args.password_hash, "employee",
+                                    f"Employee {s + 1}-{e + 1}", "f", shop_id, None, "0.00", None, "25.00",
+                                    stamp(opened))
+            employees.append(employee_id)
+            for c in range(args.collectors):
+                spool.add("users", f"shop{s + 1}_emp{e + 1}_col{c + 1}", args.password_hash, "collector",
+                          f"Collector {s + 1}-{e + 1}-{c + 1}", "f", shop_id, employee_id, "0.00", None,
+                          "25.00", stamp(opened))
+
+        for number in range(1, cartelas_per_shop + 1):
+            pattern = json.dumps(cartela_pattern(rng), separators=(",", ":"))
+            spool.add("cartelas", shop_id, admin_id, number, f"Cartela {number}", pattern, "f", "t", "f",
+                      stamp(opened), stamp(opened))
+
+        for day_offset in range(args.days):
+            day = start_day + dt.timedelta(days=day_offset)
+            if day_offset % 7 == 0:
+                loaded = dt.datetime.combine(day, dt.time(9), EAT)
+                amount = money(rng.choice([1000, 2000, 5000, 10000]))
+                spool.add("transactions", None, shop_id, None, admin_id, amount, "credit_load",
+                          "Credit load via telebirr", admin_id, stamp(loaded))
+            for employee_id in employees:
+                clock = dt.datetime.combine(day, dt.time(8), EAT) + dt.timedelta(minutes=rng.randint(0, 120))
+                for _ in range(daily_games(rng, args.games_per_day, day)):
+                    clock += dt.timedelta(minutes=rng.randint(3, 15))
+                    clock = play_game(spool, rng, args, clock, shop_id, shop_name, admin_id, admin_name,
+                                      employee_id, fee, margin, commission, cartelas_per_shop)
+        print(f"   shop {s + 1}/{args.shops}: {spool.counts['games']:,} games so far")
+
+
+def play_game(spool, rng, args, clock, shop_id, shop_name, admin_id, admin_name, employee_id, fee, margin,
+              commission, cartelas_per_shop):
+    """One game with its players, transactions, history and revenue; returns when it ended"""
+    fee_value = float(fee)
+    created = clock
+    if rng.random() < 0.03:
+        spool.add("games", shop_id, employee_id, "cancelled", "0.00", fee, "[]", None, None, stamp(created))
+        return clock
+
+    player_count = max(2, min(cartelas_per_shop, round(rng.gauss(args.players, args.players * 0.4))))
+    cards = rng.sample(range(1, cartelas_per_shop + 1), player_count)
+    started = created + dt.timedelta(minutes=rng.randint(2, 6))
+    called = rng.sample(range(1, 76), rng.randint(20, 50))
+    completed = started + dt.timedelta(seconds=len(called) * rng.randint(6, 10))
+
+    total = fee_value * player_count
+    admin_profit = total * margin / 100
+    prize = total - admin_profit
+    super_commission = admin_profit * commission / 100
+
+    game_id = spool.add("games", shop_id, employee_id, "completed", money(total), fee,
+                        json.dumps([str(n) for n in called]), stamp(started), stamp(completed), stamp(created))
+    for card in cards:
+        registered = created + dt.timedelta(seconds=rng.randint(0, 110))
+        name = f"Player {card}" if rng.random() < 0.7 else rng.choice(PLAYER_NAMES)
+        spool.add("game_players", game_id, name, f"[{card}]", fee, stamp(registered))
+        spool.add("transactions", game_id, shop_id, employee_id, None, fee, "entry_fee",
+                  f"Entry fee for {name}", None, stamp(registered))
+
+    winner = rng.choice(cards)
+    spool.add("game_history", game_id, shop_id, employee_id, money(total), money(prize), money(admin_profit),
+              money(super_commission), player_count, f"Player {winner}", f"#{winner}", stamp(completed))
+    spool.add("super_admin_revenues", admin_id, admin_name, shop_id, shop_name, game_id, "game_commission",
+              money(super_commission), money(commission), money(admin_profit),
+              f"Game {game_id} commission from {admin_name}", stamp(completed),
+              completed.astimezone(EAT).date().isoformat())
+    return completed
+
+
+def link_shop_admins(first_shop_id):
+    return (f"UPDATE shops s SET admin_id = u.id FROM users u "
+            f"WHERE u.shop_id = s.id AND u.role = 'admin' AND s.id > {first_shop_id}")
+
+
+def write_load_script(spool, first_ids):
+    """psql script that loads the spooled files in dependency order"""
+    lines = ["\\set ON_ERROR_STOP 1", "BEGIN;"]
+    for stage in STAGES:
+        for table in stage:
+            lines.append(f"\\copy {table} ({', '.join(TABLES[table])}) FROM '{spool.path(table)}'")
+        if stage == ["users"]:
+            lines.append(link_shop_admins(first_ids.get("shops", 0)) + ";")
+    for table in TABLES:
+        lines.append(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}));")
+    lines.append("COMMIT;")
+    with open(os.path.join(spool.directory, "load.sql"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def load(db, spool, first_ids):
+    total_rows = 0
+    started = time.monotonic()
+    for stage in STAGES:
+        def copy(table):
+            t = time.monotonic()
+            db.copy(table, TABLES[table], spool.path(table))
+            return table, time.monotonic() - t
+
+        with ThreadPoolExecutor(max_workers=len(stage)) as pool:
+            for table, seconds in pool.map(copy, stage):
+                rows = spool.counts[table]
+                total_rows += rows
+                print(f"   📥 {table:<22} {rows:>11,} rows {seconds:7.1f}s  {rows / max(seconds, 1e-6):>12,.0f} rows/s")
+        if stage == ["users"]:
+            db.execute(link_shop_admins(first_ids.get("shops", 0)))
+
+    for table in TABLES:
+        db.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))")
+    elapsed = time.monotonic() - started
+    print(f"✅ Loaded {total_rows:,} rows in {elapsed:.1f}s ({total_rows / max(elapsed, 1e-6) * 60:,.0f} rows/min)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and bulk-load a synthetic BingoMaster dataset")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--database-url", help="Postgres to load into")
+    target.add_argument("--out", help="only write COPY files and load.sql to this directory")
+    parser.add_argument("--seed", type=int, default=1, help="same seed, same data")
+    parser.add_argument("--shops", type=int, default=20)
+    parser.add_argument("--employees", type=int, default=3, help="per shop")
+    parser.add_argument("--collectors", type=int, default=2, help="per employee")
+    parser.add_argument("--cartelas", type=int, default=150, help="per shop")
+    parser.add_argument("--days", type=int, default=365, help="days of play history")
+    parser.add_argument("--end-date", type=dt.date.fromisoformat, default=dt.date.today(),
+                        help="last day of history, YYYY-MM-DD (default: today); fix it for reproducible runs")
+    parser.add_argument("--games-per-day", type=float, default=12, help="average per employee")
+    parser.add_argument("--players", type=int, default=10, help="average per game")
+    parser.add_argument("--password-hash", default=DEFAULT_PASSWORD_HASH, help="bcrypt hash for every account")
+    parser.add_argument("--keep-files", action="store_true", help="keep the COPY files after loading")
+    args = parser.parse_args()
+
+    db = Database(args.database_url) if args.database_url else None
+    first_ids = {table: int(db.scalar(f"SELECT coalesce(max(id), 0) FROM {table}")) for table in TABLES} if db else {}
+
+    directory = os.path.abspath(args.out) if args.out else tempfile.mkdtemp(prefix="bm-synthetic-")
+    os.makedirs(directory, exist_ok=True)
+    spool = Spool(directory, first_ids)
+    started = time.monotonic()
+    print(f"🎲 Generating seed {args.seed}: {args.shops} shops, {args.days} days")
+    try:
+        generate(spool, args, random.Random(args.seed))
+    finally:
+        spool.close()
+    rows = sum(spool.counts.values())
+    print(f"✅ Generated {rows:,} rows in {time.monotonic() - started:.1f}s")
+
+    if not db:
+        write_load_script(spool, first_ids)
+        # Without a database to ask, ids start at 1, so this is meant for an empty schema
+        print(f"📝 {directory}/load.sql loads them into an empty schema: psql \"$DATABASE_URL\" -f {directory}/load.sql")
+        return 0
+
+    try:
+        load(db, spool, first_ids)
+    finally:
+        if not args.keep_files:
+            shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
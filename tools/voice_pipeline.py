@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Offline voice asset pipeline for public/voices.
+
+Each clip is:
+  1. trimmed of leading and trailing silence,
+  2. loudness normalized (two-pass EBU R128, speech target),
+  3. transcoded to mono Opus (WebM) with an MP3 fallback,
+  4. stored once under public/voices/dist/ by content hash.
+
+Identical clips across voices, such as shared event prompts, end up as the
+same file. The manifest at public/voices/dist/manifest.json maps voice and
+clip name to the hashed URLs:
+
+    {"version": 1, "voices": {"betty": {"B1": {"opus": "/voices/dist/5d41402a.webm",
+                                               "mp3": "/voices/dist/7d793037.mp3",
+                                               "duration": 0.87}}}}
+
+With --drop-masters, the WAV masters are moved out of the served tree into
+voice-masters/<voice>/. Where a WAV has an MP3 twin, only the WAV is read.
+Results are cached by source hash, so re-runs only process changed clips.
+Requires ffmpeg and ffprobe on PATH; nothing is fetched from the network.
+
+    python3 tools/voice_pipeline.py [--voices arada betty] [--jobs 8] [--drop-masters]
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from build_voice_sprites import SKIP_DIRS, VOICES_DIR, collect_clips  # noqa: E402
+
+DIST_DIR = os.path.join(VOICES_DIR, "dist")
+MANIFEST_PATH = os.path.join(DIST_DIR, "manifest.json")
+MASTERS_DIR = "voice-masters"
+# Kept outside the served tree
+CACHE_PATH = os.path.join(MASTERS_DIR, ".pipeline-cache.json")
+
+SAMPLE_RATE = 24000
+LOUDNESS = {"I": -16, "TP": -1.5, "LRA": 11}
+TRIM = ("silenceremove=start_periods=1:start_threshold=-50dB:start_silence=0.05,"
+        "areverse,"
+        "silenceremove=start_periods=1:start_threshold=-50dB:start_silence=0.05,"
+        "areverse")
+OPUS_BITRATE = "24k"
+MP3_BITRATE = "48k"
+
+# Bump when the processing chain changes so cached results are rebuilt
+PIPELINE_VERSION = 1
+
+
+def run(args):
+    """Run a local tool and return its stderr, raising on failure"""
+    result = subprocess.run(args, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed: {result.stderr.strip()[-500:]}")
+    return result.stderr
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def measure_loudness(path):
+    """First loudnorm pass: measure the trimmed clip"""
+    target = f"I={LOUDNESS['I']}:TP={LOUDNESS['TP']}:LRA={LOUDNESS['LRA']}"
+    stderr = run(["ffmpeg", "-hide_banner", "-nostats", "-i", path,
+                  "-af", f"{TRIM},loudnorm={target}:print_format=json", "-f", "null", "-"])
+    stats = json.loads(stderr[stderr.rindex("{"):stderr.rindex("}") + 1])
+    return (f"{target}:measured_I={stats['input_i']}:measured_TP={stats['input_tp']}"
+            f":measured_LRA={stats['input_lra']}:measured_thresh={stats['input_thresh']}"
+            f":offset={stats['target_offset']}:linear=true")
+
+
+def duration_of(path):
+    """Duration in seconds as reported by ffprobe"""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+        capture_output=True, text=True,
+    )
+    return round(float(result.stdout.strip() or 0), 3)
+
+
+def store(tmp_path, ext):
+    """Move a processed file into the content-addressed store, returning its URL"""
+    name = f"{file_hash(tmp_path)[:12]}{ext}"
+    target = os.path.join(DIST_DIR, name)
+    if os.path.exists(target):
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, target)
+    return f"/voices/dist/{name}"
+
+
+def process_clip(source):
+    """Trim, normalize and transcode one source file"""
+    loudnorm = measure_loudness(source)
+    filters = f"{TRIM},loudnorm={loudnorm},aresample={SAMPLE_RATE}"
+
+    with tempfile.TemporaryDirectory(dir=DIST_DIR) as tmp:
+        opus_tmp = os.path.join(tmp, "clip.webm")
+        mp3_tmp = os.path.join(tmp, "clip.mp3")
+        run(["ffmpeg", "-v", "error", "-y", "-i", source, "-af", filters, "-ac", "1",
+             "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip", opus_tmp])
+        run(["ffmpeg", "-v", "error", "-y", "-i", source, "-af", filters, "-ac", "1",
+             "-c:a", "libmp3lame", "-b:a", MP3_BITRATE, mp3_tmp])
+        duration = duration_of(mp3_tmp)
+        return {"opus": store(opus_tmp, ".webm"), "mp3": store(mp3_tmp, ".mp3"), "duration": duration}
+
+
+def drop_masters(voice):
+    """Move WAV masters out of the served tree"""
+    voice_dir = os.path.join(VOICES_DIR, voice)
+    moved = 0
+    for filename in os.listdir(voice_dir):
+        if filename.lower().endswith(".wav"):
+            target_dir = os.path.join(MASTERS_DIR, voice)
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.move(os.path.join(voice_dir, filename), os.path.join(target_dir, filename))
+            moved += 1
+    return moved
+
+
+def tree_size(path, skip=()):
+    """Total bytes under a directory"""
+    total = 0
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in skip]
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalize, transcode and deduplicate voice clips")
+    parser.add_argument("--voices", nargs="*", help="voice directories to process (default: all)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 4, help="parallel ffmpeg processes")
+    parser.add_argument("--drop-masters", action="store_true",
+                        help=f"move WAV masters from the served tree into {MASTERS_DIR}/")
+    args = parser.parse_args()
+
+    for tool in ("ffmpeg", "ffprobe"):
+        if shutil.which(tool) is None:
+            print(f"❌ {tool} is required for the voice pipeline")
+            return 1
+
+    os.makedirs(DIST_DIR, exist_ok=True)
+    cache = {}
+    if os.path.exists(CACHE_PATH):
+        with open(CACHE_PATH) as f:
+            cache = json.load(f)
+    manifest = {"version": 1, "voices": {}}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+
+    voices = args.voices or sorted(
+        name for name in os.listdir(VOICES_DIR)
+        if name not in SKIP_DIRS and os.path.isdir(os.path.join(VOICES_DIR, name))
+    )
+    size_before = tree_size(VOICES_DIR, skip=SKIP_DIRS)
+
+    # Work out which sources are new or changed since the last run
+    jobs = []
+    for voice in voices:
+        sources = collect_clips(os.path.join(VOICES_DIR, voice))
+        # Masters moved out by an earlier --drop-masters run still take priority
+        masters_dir = os.path.join(MASTERS_DIR, voice)
+        if os.path.isdir(masters_dir):
+            sources.update(collect_clips(masters_dir))
+        for clip, source in sources.items():
+            key = f"{PIPELINE_VERSION}:{file_hash(source)}"
+            jobs.append((voice, clip, source, key))
+
+    pending = {key: source for _, _, source, key in jobs if key not in cache}
+    print(f"🎙️  {len(jobs)} clips in {len(voices)} voices, {len(pending)} to process")
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {key: executor.submit(process_clip, source) for key, source in pending.items()}
+        for key, future in futures.items():
+            try:
+                cache[key] = future.result()
+            except RuntimeError as error:
+                print(f"❌ {pending[key]}: {error}")
+
+    for voice in voices:
+        manifest["voices"][voice] = {
+            clip: cache[key] for v, clip, _, key in jobs if v == voice and key in cache
+        }
+
+    # Remove store entries that no manifest entry points at any more
+    referenced = {os.path.basename(entry[fmt])
+                  for clips in manifest["voices"].values() for entry in clips.values()
+                  for fmt in ("opus", "mp3")}
+    for filename in os.listdir(DIST_DIR):
+        if filename.endswith((".webm", ".mp3")) and filename not in referenced:
+            os.remove(os.path.join(DIST_DIR, filename))
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.makedirs(MASTERS_DIR, exist_ok=True)
+    with open(CACHE_PATH, "w") as f:
+        json.dump(cache, f)
+
+    if args.drop_masters:
+        moved = sum(drop_masters(voice) for voice in voices)
+        print(f"📦 Moved {moved} WAV masters to {MASTERS_DIR}/")
+
+    dist_size = tree_size(DIST_DIR)
+    print(f"📄 Manifest written to {MANIFEST_PATH}")
+    print(f"📉 Source tree {size_before / 1e6:.1f} MB -> processed clips {dist_size / 1e6:.1f} MB "
+          f"({len(referenced)} unique files)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,6 +27,16 @@ export default defineConfig({
   build: {
     outDir: path.resolve(import.meta.dirname, "dist/public"),
     emptyOutDir: true,
+    // Read by tools/bundle-report.mjs to enforce the critical-path budgets
+    manifest: true,
+    rollupOptions: {
+      output: {
+        // React rarely changes between releases; keep it in its own long-cached chunk
+        manualChunks: {
+          react: ["react", "react-dom", "scheduler"],
+        },
+      },
+    },
   },
   server: {
     fs: {